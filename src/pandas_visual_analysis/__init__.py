@@ -1,4 +1,7 @@
 from .data_source import DataSource
+from .rolling_data_source import RollingDataSource
+from .shared_data import SharedData
+from .link_registry import LinkRegistry
 from .layout import AnalysisLayout
 from .visual_analysis import VisualAnalysis
 
@@ -1,24 +1,131 @@
 import os
 import typing
+from contextlib import contextmanager
 from enum import Enum
 from blinker import Signal
 from pandas import DataFrame
+import numpy as np
 import pandas as pd
 
+import pandas_visual_analysis.utils.arrow_io as arrow_io
 import pandas_visual_analysis.utils.validation as validate
-from pandas_visual_analysis.utils.column_store import ColumnStore
+from pandas_visual_analysis.shared_data import SharedData
+from pandas_visual_analysis.utils.aggregates import BinCounts, Moments
+from pandas_visual_analysis.utils.backend import Backend
+from pandas_visual_analysis.utils.column_files import open_columns
+from pandas_visual_analysis.utils.crossfilter import Crossfilter
+from pandas_visual_analysis.utils.disk_cache import DiskCache
+from pandas_visual_analysis.utils.dispatch import Dispatcher
+from pandas_visual_analysis.utils.full_data import FullData
+from pandas_visual_analysis.utils.history import SelectionHistory
+from pandas_visual_analysis.utils.parallel_csv import read_csv_parallel
+from pandas_visual_analysis.utils.predicate import Between, IsIn, Predicate
+from pandas_visual_analysis.utils.reservoir import ReservoirSample
+from pandas_visual_analysis.utils.shared_frame import SharedFrame
+from pandas_visual_analysis.utils.sql_source import LazyFrame, SqlTable
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.util import cast_to_dtypes, get_running_loop
 
 
 class SelectionType(Enum):
     STANDARD = 1
     ADDITIVE = 2
     SUBTRACTIVE = 3
+    CROSSFILTER = 4
+
+
+class SelectionChange:
+    """
+    Describes a change of the selection in a :class:`DataSource`.
+    Besides the previous and the new selection, it carries the rows that were added to and removed from the
+    selection, so that observers can update their state incrementally instead of recomputing it from the full
+    selection.
+    """
+
+    def __init__(
+        self,
+        previous: Selection,
+        selection: Selection,
+        selection_type: SelectionType,
+        added: typing.Optional[Selection] = None,
+        removed: typing.Optional[Selection] = None,
+    ):
+        """
+
+        :param previous: The selection before the change.
+        :param selection: The selection after the change.
+        :param selection_type: The selection type that was used to combine the selections.
+        :param added: The rows added to the selection. Determined from the selections if omitted.
+        :param removed: The rows removed from the selection. Determined from the selections if omitted.
+        """
+        self.previous = previous
+        self.selection = selection
+        self.selection_type = selection_type
+        self.version: int = 0
+        self.key: int = 0
+        self._added = added
+        self._removed = removed
+
+    @property
+    def restored(self) -> bool:
+        """
+        The key of a selection is the version it was first notified with, which differs from the version of the
+        change if the selection was restored from the history.
+
+        :return: True iff the selection was restored with undo or redo.
+        """
+        return self.key != self.version
+
+    @property
+    def added(self) -> np.ndarray:
+        """
+
+        :return: Positions of the rows that were added to the selection in ascending order.
+        """
+        if self._added is None:
+            self._added = self.selection - self.previous
+        return self._added.positions
+
+    @property
+    def removed(self) -> np.ndarray:
+        """
+
+        :return: Positions of the rows that were removed from the selection in ascending order.
+        """
+        if self._removed is None:
+            self._removed = self.previous - self.selection
+        return self._removed.positions
+
+    @property
+    def previous_count(self) -> int:
+        """
+
+        :return: The number of selected rows before the change.
+        """
+        return self.previous.count
+
+    @property
+    def count(self) -> int:
+        """
+
+        :return: The number of selected rows after the change.
+        """
+        return self.selection.count
+
+    def __repr__(self) -> str:
+        return "SelectionChange(version=%d, %d -> %d rows)" % (
+            self.version,
+            self.previous_count,
+            self.count,
+        )
 
 
 class DataSource:
     """
     The DataSource object provides the data itself to the plots and also manages the brushing between the plots.
     If the plots observe the brushed_indices property of this class, they can react to any change in the data.
+    Observers of the on_selection_changed signal additionally receive a :class:`SelectionChange` describing which
+    rows were added to or removed from the selection.
     It is also possible to set the brushed_indices property to trigger the change in any instances that observe
     this property. In addition to the brushed indices, this class also provides the brushed data directly, which
     is cached to speed up subsequent access to the data.
@@ -26,92 +133,527 @@ class DataSource:
 
     def __init__(
         self,
-        df: DataFrame,
+        df: typing.Union[DataFrame, SharedData],
         categorical_columns: typing.Union[typing.List[str], None] = None,
         sample: typing.Union[float, int, None] = None,
         seed: typing.Union[int, None] = None,
+        keep_full_data: bool = False,
+        optimize_memory: bool = False,
+        cache: typing.Union[DiskCache, str, None] = None,
+        backend: typing.Union[Backend, str, None] = None,
         *args,
         **kwargs
     ):
         """
 
-        :param df: A pandas.DataFrame object.
+        :param df: A pandas.DataFrame object or a :class:`pandas_visual_analysis.shared_data.SharedData` object
+            shared with other DataSources, in which case the other parameters are set by the SharedData.
         :param categorical_columns: If given, specifies which columns are to be interpreted as categorical.
             Those columns have to include all columns of the DataFrame
             which have type `object`, `str`, `bool` or `category`.
             This means it can only add columns which do not have the aforementioned types.
         :param seed: Random seed used for sampling the data.
             Values can be any integer between 0 and 2**32 - 1 inclusive or None.
+        :param keep_full_data: If True and the data is sampled, widgets showing single points render the sample,
+            while aggregate widgets like histograms compute their statistics on the full data, see :attr:`full_data`.
+        :param optimize_memory: If True, the columns are converted to types using less memory before sampling:
+            object and string columns with repeated values to category, float64 to float32 if no value changes and
+            int64 to the smallest integer type holding all values. The number of bytes saved is available as
+            :attr:`memory_saved`.
+        :param cache: A :class:`pandas_visual_analysis.utils.disk_cache.DiskCache` or the path of its directory.
+            The indexes, profiles and bins of the columns are then stored on disk and loaded again when data with
+            the same contents is opened, e.g. when a notebook is re-run.
+        :param backend: The :class:`pandas_visual_analysis.utils.backend.Backend` computing the masks, counts and
+            statistics of the columns, or its name: "pandas" (default), "pyarrow" or "polars". The pyarrow and
+            polars backends use multi-threaded kernels and require the respective package.
         :param args: args for HasTraits superclass
         :param kwargs: kwargs for HasTraits superclass
 
         """
         super().__init__(*args, **kwargs)
-        validate.validate_data_frame(df)
-        validate.validate_sample(sample)
-        validate.validate_seed(seed)
-
-        self.selection_type = SelectionType.STANDARD
-        if sample is None:
-            self._df = df
+        if isinstance(df, SharedData):
+            if (
+                categorical_columns is not None
+                or sample is not None
+                or seed is not None
+                or keep_full_data
+                or optimize_memory
+                or cache is not None
+                or backend is not None
+            ):
+                raise ValueError(
+                    "The parameters of shared data have to be passed to the SharedData instead of the DataSource."
+                )
+            shared_data = df
         else:
-            if isinstance(sample, float):
-                if sample < 0.0 or sample > 1.0:
-                    raise ValueError(
-                        "Sample has to be between 0.0 and 1.0. Invalid value : %d"
-                        % sample
-                    )
-                self._df = df.sample(frac=sample, random_state=seed)
-            else:
-                if sample < 0 or sample > len(df):
-                    raise ValueError(
-                        "Sample has to be between 0 and the length of the DataFrame (%d). Invalid value: "
-                        "%d" % (len(df), sample)
-                    )
-                self._df = df.sample(n=sample, random_state=seed)
-        self.columns = list(self._df.columns.values)
-
-        self.column_store = ColumnStore(self._df, self.columns, categorical_columns)
+            shared_data = SharedData(
+                df,
+                categorical_columns,
+                sample,
+                seed,
+                keep_full_data,
+                optimize_memory,
+                cache,
+                backend,
+            )
+        # the data shared with other DataSources, which is never changed
+        self.shared_data = shared_data
+
+        self.optimize_memory = shared_data.optimize_memory
+        # bytes saved by optimize_memory
+        self.memory_saved = shared_data.memory_saved
+
+        self._selection_type = SelectionType.STANDARD
+        # the unsampled rows for aggregate widgets if keep_full_data is set
+        self.full_data: typing.Optional[FullData] = None
+        if shared_data.full_column_store is not None:
+            self.full_data = FullData(
+                shared_data.full_data,
+                shared_data.columns,
+                categorical_columns,
+                shared_data.sample_positions,
+                column_store=shared_data.full_column_store,
+            )
+        self._df = shared_data.data
+        self.columns = shared_data.columns
+
+        self.column_store = shared_data.column_store.view()
         self.numerical_columns = self.column_store.numerical_columns
         self.time_columns = self.column_store.time_columns
         self.categorical_columns = self.column_store.categorical_columns
 
-        if self.categorical_columns is not None:
-            self._df[self.categorical_columns].astype(dtype="category")
-
         self._length = len(self._df)
-        self._indices = set(range(self._length))
-        self._brushed_indices: typing.Set[int] = self._indices
+        self._all_selected = Selection.full(self._length)
+        self._selection: Selection = self._all_selected
+        self._notified_selection: Selection = self._selection
+        self._selection_version = 0
+        self._selection_key = 0
+        self.last_change: typing.Optional[SelectionChange] = None
+        self.history = SelectionHistory()
+        self.history.push(self._selection, self._selection_key)
+        # filters of the dimensions if the selection type is CROSSFILTER
+        self.crossfilter = Crossfilter(self._length)
+
+        # interval in seconds in which selection changes are combined into a single notification
+        self.coalesce_interval: typing.Optional[float] = None
+        self._batch_depth = 0
+        self._notification_pending = False
+        self._pending_change: typing.Optional[SelectionChange] = None
+        self._flush_handle = None
+
+        # decides how widgets are updated, they are updated synchronously if None
+        self.dispatcher: typing.Optional[Dispatcher] = None
 
         self.brushed_data_invalidated = True
         self._brushed_data = None
+        self._brushed_columns: typing.Tuple[Selection, typing.Dict] = (
+            self._selection,
+            {},
+        )
 
         self.on_indices_changed = Signal()
+        self.on_selection_changed = Signal()
+        self.on_rows_appended = Signal()
 
-        if len(self.columns) < 2:
-            raise ValueError(
-                "The passed DataFrame only has %d column, which is insufficient for analysis."
-                % len(self.columns)
-            )
+        # decides whether rows added with append are selected: True, False or a Predicate the rows have to fulfill
+        self.append_policy: typing.Union[bool, Predicate] = True
+        # running aggregates of numerical columns, which are kept up to date while rows are appended and evicted
+        # and are used by the widgets instead of scanning the column, see RollingDataSource
+        self.moments: typing.Dict[str, Moments] = {}
+        self.bin_counts: typing.Dict[str, BinCounts] = {}
 
         self.few_num_cols = len(self.numerical_columns) < 2
         self.few_cat_cols = len(self.categorical_columns) < 2
 
-    def notify_indices_changed(self):
+        # exact count, minimum and maximum of all rows of a file that was sampled while reading
+        self.file_summary: typing.Optional[DataFrame] = None
+        self.file_rows: typing.Optional[int] = None
+        # the shared memory the data is attached to, which has to be kept open while the data is used
+        self.shared_frame: typing.Optional[SharedFrame] = None
+
+    def notify_indices_changed(self, change: typing.Optional[SelectionChange] = None):
+        """
+        Notifies all observers that the selection has changed.
+        Receivers of on_indices_changed are called with this object as the sender, receivers of
+        on_selection_changed are additionally passed the change as the keyword argument `change`.
+
+        Inside of :meth:`batch` or if a :attr:`coalesce_interval` is set and an event loop is running,
+        the notification is deferred and observers receive a single change containing the net difference.
+
+        :param change: The change that led to the current selection.
+            If omitted, it is determined from the selection at the last notification.
+        :return: None
+        """
         # This has the effect that the cached value for brushed_data is being re-indexed once it is needed.
         self.brushed_data_invalidated = True
 
-        self.on_indices_changed.send(self)
+        if self._batch_depth > 0 or self._schedule_flush():
+            # a single deferred change can be sent as is, several ones are combined in flush
+            self._pending_change = None if self._notification_pending else change
+            self._notification_pending = True
+            return
+        self._send_change(change)
 
-    def reset_selection(self):
+    def flush(self):
+        """
+        Immediately sends a deferred notification of coalesced selection changes. Does nothing inside of
+        :meth:`batch` or if no notification is pending.
+
+        :return: None
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._batch_depth > 0 or not self._notification_pending:
+            return
+        change = self._pending_change
+        self._notification_pending = False
+        self._pending_change = None
+        if self._selection is self._notified_selection:
+            return  # the changes cancelled each other out
+        self._send_change(change)
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that defers all selection change notifications until the outermost batch exits.
+        Observers then receive a single notification with the net change of the selection.
+
+        .. code-block:: python
+
+            with ds.batch():
+                ds.brushed_indices = [1, 2, 3]
+                ds.selection_type = SelectionType.ADDITIVE
+                ds.brushed_indices = [4, 5]
+
+        :return: A context manager.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def _schedule_flush(self) -> bool:
+        """
+        Schedules a flush on the running event loop if changes should be coalesced.
+
+        :return: True iff the notification is deferred until the flush.
+        """
+        if not self.coalesce_interval:
+            return False
+        if self._flush_handle is None:
+            loop = get_running_loop()
+            if loop is None:
+                return False
+            self._flush_handle = loop.call_later(self.coalesce_interval, self.flush)
+        return True
+
+    def _send_change(
+        self,
+        change: typing.Optional[SelectionChange],
+        key: typing.Optional[int] = None,
+    ):
+        """
+        Sends the change to all observers and increases the selection version.
+
+        :param change: The change to send. If None, it is determined from the last notified selection.
+        :param key: The key of a selection restored from the history.
+            If None, the selection is new and is added to the history.
+        :return: None
+        """
+        if change is None:
+            change = SelectionChange(
+                self._notified_selection, self._selection, SelectionType.STANDARD
+            )
+        self._selection_version += 1
+        change.version = self._selection_version
+        if key is None:
+            key = self._selection_version
+            self.history.push(self._selection, key)
+        change.key = key
+        self._selection_key = key
+        self._notified_selection = self._selection
+        self.last_change = change
+
+        dispatcher = self.dispatcher
+        if dispatcher is None:
+            self.on_indices_changed.send(self)
+            self.on_selection_changed.send(self, change=change)
+            return
+        dispatcher.begin()
+        try:
+            self.on_indices_changed.send(self)
+            self.on_selection_changed.send(self, change=change)
+        finally:
+            dispatcher.dispatch()
+
+    def undo(self) -> bool:
+        """
+        Restores the previous selection from the :attr:`history`. Pending notifications are sent before.
+
+        :return: True iff a previous selection was restored.
+        """
+        self.flush()
+        return self._restore(self.history.undo())
+
+    def redo(self) -> bool:
+        """
+        Restores the selection that was undone last from the :attr:`history`.
+
+        :return: True iff a selection was restored.
+        """
+        self.flush()
+        return self._restore(self.history.redo())
+
+    def _restore(self, step: typing.Optional[typing.Tuple[Selection, int]]) -> bool:
+        """
+        Sets a selection of the history and notifies the observers.
+
+        :param step: The selection and its key or None.
+        :return: True iff a selection was restored.
+        """
+        if step is None:
+            return False
+        selection, key = step
+        self._selection = selection
+        if self._selection_type == SelectionType.CROSSFILTER:
+            # the filters of the restored selection are unknown, so it becomes a single filter
+            self.crossfilter.clear()
+            self.crossfilter.filter(None, selection)
+        if self.full_data is not None:
+            self.full_data.restore(
+                selection, self._selection_type == SelectionType.CROSSFILTER
+            )
+        self.brushed_data_invalidated = True
+        change = SelectionChange(
+            self._notified_selection, selection, SelectionType.STANDARD
+        )
+        self._send_change(change, key)
+        return True
+
+    def reset_selection(self, dimension=None):
         """
         Reset all the indices to the original state, that is all indices are selected.
+        If the selection type is CROSSFILTER and a dimension is given, only the filter of that dimension is removed.
 
+        :param dimension: The dimension, usually a widget, whose filter should be removed.
         :return: None
         """
-        self._brushed_indices = self._indices
+        if self._selection_type == SelectionType.CROSSFILTER:
+            if dimension is not None:
+                self._filter(dimension, self._all_selected)
+                return
+            self.crossfilter.clear()
+        if self.full_data is not None:
+            self.full_data.reset()
+        self._selection = self._all_selected
         self.notify_indices_changed()
 
+    def brush(
+        self,
+        indices: typing.Union[typing.Iterable[int], np.ndarray, Selection],
+        dimension=None,
+        predicate: typing.Optional[Predicate] = None,
+    ):
+        """
+        Brushes rows according to the current selection type.
+        If the selection type is CROSSFILTER, the rows replace the filter of the given dimension and the selection
+        becomes the intersection of the filters of all dimensions. Otherwise this is the same as setting
+        :attr:`brushed_indices`.
+
+        :param indices: indices of data points that should be brushed.
+        :param dimension: The dimension, usually the widget, that brushed the rows.
+        :param predicate: The predicate describing the brushed rows, e.g. the ranges of a box selection.
+            It translates the brush to the :attr:`full_data` if the full data is kept for a sample.
+        :return: None
+        """
+        selection = Selection.from_indices(indices, self._length)
+        if self._selection_type == SelectionType.CROSSFILTER:
+            self._filter(dimension, selection, predicate)
+        else:
+            self._brush(selection, predicate)
+
+    def selection_for(self, dimension) -> Selection:
+        """
+        If the selection type is CROSSFILTER, a dimension displays the rows passing the filters of all other
+        dimensions. Otherwise this is the current selection.
+
+        :param dimension: The dimension, usually a widget.
+        :return: The selection the dimension should display.
+        """
+        if self._selection_type == SelectionType.CROSSFILTER and (
+            self.crossfilter.has_filter(dimension)
+        ):
+            return self.crossfilter.selection_excluding(dimension)
+        return self._selection
+
+    def _filter(
+        self,
+        dimension,
+        selection: Selection,
+        predicate: typing.Optional[Predicate] = None,
+    ):
+        """
+        Replaces the filter of a dimension and notifies the observers of the rows that entered or left the
+        selection of all filters.
+
+        :param dimension: The dimension owning the filter.
+        :param selection: The rows passing the new filter.
+        :param predicate: The predicate describing the rows passing the new filter or None.
+        :return: None
+        """
+        previous = self._selection
+        added, removed = self.crossfilter.filter(dimension, selection)
+        self._selection = self.crossfilter.selection()
+        if self.full_data is not None:
+            self.full_data.filter(
+                dimension, self.full_data.translate(selection, predicate)
+            )
+        change = SelectionChange(
+            previous,
+            self._selection,
+            SelectionType.CROSSFILTER,
+            Selection.from_indices(added, self._length),
+            Selection.from_indices(removed, self._length),
+        )
+        self.notify_indices_changed(change)
+
+    def append(
+        self,
+        df_chunk: DataFrame,
+        policy: typing.Union[bool, Predicate, None] = None,
+    ):
+        """
+        Appends rows to the data, e.g. rows produced by a live process.
+        Observers of the on_rows_appended signal receive only the new rows and the number of rows evicted from
+        the beginning of the data, which is always 0 here, so that widgets can extend their plots instead of
+        rebuilding them. Afterwards the extended selection is notified like any other selection change.
+        The selection history is cleared, since it refers to fewer rows.
+        If the :attr:`full_data` is kept for a sample, the rows are appended to both the sample and the full data.
+        With optimize_memory, the appended columns are converted to the compact types of the data where no value is
+        lost, e.g. if all values of a category column are known categories.
+
+        :param df_chunk: DataFrame with the same columns as the data.
+        :param policy: Whether the new rows are selected: True, False or a
+            :class:`pandas_visual_analysis.utils.predicate.Predicate` the selected rows have to fulfill.
+            Defaults to :attr:`append_policy`.
+        :return: None
+        """
+        validate.validate_data_frame(df_chunk, name="df_chunk")
+        if len(df_chunk) == 0:
+            return
+        self.flush()
+        if self.optimize_memory:
+            df_chunk = cast_to_dtypes(df_chunk, dict(self._df.dtypes))
+        self._df = self.column_store.append(df_chunk)
+        policy = self.append_policy if policy is None else policy
+        if self.full_data is not None:
+            self.full_data.append(
+                df_chunk, policy, self._selection_type == SelectionType.CROSSFILTER
+            )
+        self._rows_appended(len(df_chunk), 0, policy)
+
+    def _rows_appended(
+        self, count: int, evicted: int, policy: typing.Union[bool, Predicate, None]
+    ):
+        """
+        Updates the selection after rows were appended to the data and notifies the observers.
+        The selection is remapped by removing the evicted rows and extending it by the appended rows.
+
+        :param count: The number of rows appended at the end of the data.
+        :param evicted: The number of rows removed from the beginning of the data.
+        :param policy: Whether the new rows are selected, see :meth:`append`.
+        :return: None
+        """
+        self._length = len(self._df)
+        self._all_selected = Selection.full(self._length)
+        start = self._length - count
+
+        policy = self.append_policy if policy is None else policy
+        if isinstance(policy, Predicate):
+            new_rows = self.where(policy).mask[start:]
+        else:
+            new_rows = np.full(count, bool(policy))
+        previous = self._notified_selection.drop_first(evicted).extend(
+            np.zeros(count, dtype=bool)
+        )
+        self._notified_selection = previous
+        self._selection = self._selection.drop_first(evicted).extend(new_rows)
+        self.crossfilter = Crossfilter(self._length)
+        if self._selection_type == SelectionType.CROSSFILTER:
+            self.crossfilter.filter(None, self._selection)
+        self.history.clear()
+        self.brushed_data_invalidated = True
+        self._brushed_columns = (self._selection, {})
+
+        self.on_rows_appended.send(self, rows=self._df.iloc[start:], evicted=evicted)
+        change = SelectionChange(
+            previous,
+            self._selection,
+            SelectionType.STANDARD,
+            Selection.empty(start).extend(new_rows),
+            Selection.empty(self._length),
+        )
+        self._send_change(change)
+
+    def where(self, predicate: Predicate) -> Selection:
+        """
+        Evaluates a predicate without changing the current selection.
+
+        :param predicate: The predicate, e.g. a :class:`pandas_visual_analysis.utils.predicate.Between`
+            or a combination of predicates.
+        :return: Selection of all rows fulfilling the predicate.
+        """
+        return predicate.evaluate(self)
+
+    def select_where(
+        self, column_or_predicate: typing.Union[str, Predicate], lo=None, hi=None
+    ):
+        """
+        Brushes all rows fulfilling a predicate according to the current selection type.
+        If a column name is given, all rows with a value of that column between lo and hi, both inclusive,
+        are brushed. The rows are found with a binary search on the sorted index of the column.
+
+        :param column_or_predicate: Name of a numerical or time based column or a predicate.
+        :param lo: The lower bound of the range if a column name is given. None if the range is not bounded below.
+        :param hi: The upper bound of the range if a column name is given. None if the range is not bounded above.
+        :return: None
+        """
+        if isinstance(column_or_predicate, Predicate):
+            predicate = column_or_predicate
+        else:
+            predicate = Between(column_or_predicate, lo, hi)
+        self.brush(self.where(predicate), predicate=predicate)
+
+    def rows_for_category(self, column: str, values) -> Selection:
+        """
+        Finds all rows with one of the given categories with the inverted index of the column,
+        without scanning the column. Use :meth:`select_where` with a
+        :class:`pandas_visual_analysis.utils.predicate.IsIn` predicate to brush them.
+
+        :param column: Name of a categorical column.
+        :param values: A category or an iterable of categories. Values that are not categories are ignored.
+        :return: Selection of all rows with one of the categories.
+        """
+        return self.where(IsIn(column, values))
+
+    def category_counts(
+        self, column: str, selection: typing.Optional[Selection] = None
+    ) -> pd.Series:
+        """
+        Counts the rows per category of a categorical column with its inverted index.
+        Unlike :meth:`pandas.Series.value_counts`, the counts are in the order of the categories and include
+        categories without rows.
+
+        :param column: Name of a categorical column.
+        :param selection: Only rows in this selection are counted. If None, all rows are counted.
+        :return: The number of rows per category, indexed by the categories.
+        """
+        return self.column_store.value_counts(column, selection)
+
     @property
     def len(self) -> int:
         """
@@ -127,61 +669,246 @@ class DataSource:
         """
         return self._length
 
+    @property
+    def selection_type(self) -> SelectionType:
+        """
+
+        :return: The way new brushes are combined with the current selection.
+        """
+        return self._selection_type
+
+    @selection_type.setter
+    def selection_type(self, selection_type: SelectionType):
+        """
+        Changes the selection type. When switching to CROSSFILTER, the current selection becomes the first filter,
+        when switching from CROSSFILTER, the filters are removed but the selection is kept.
+
+        :param selection_type: The new selection type.
+        """
+        if selection_type == self._selection_type:
+            return
+        self.crossfilter.clear()
+        if selection_type == SelectionType.CROSSFILTER:
+            self.crossfilter.filter(None, self._selection)
+        if self.full_data is not None:
+            self.full_data.crossfilter.clear()
+            if selection_type == SelectionType.CROSSFILTER:
+                self.full_data.crossfilter.filter(None, self.full_data.selection)
+        self._selection_type = selection_type
+
+    @property
+    def selection(self) -> Selection:
+        """
+        Widgets should prefer the mask, positions and count accessors of the selection over
+        :attr:`brushed_indices`, since they do not need any conversion.
+
+        :return: The currently selected rows as a :class:`pandas_visual_analysis.utils.selection.Selection`.
+        """
+        return self._selection
+
+    @property
+    def selection_version(self) -> int:
+        """
+        The version is increased with every notification of a selection change and can be used as a cache key.
+
+        :return: The version of the current selection.
+        """
+        return self._selection_version
+
+    @property
+    def selection_key(self) -> int:
+        """
+        Identifies the current selection: it is the :attr:`selection_version` the selection was first notified
+        with and stays the same if the selection is restored with :meth:`undo` or :meth:`redo`.
+        Widgets can use it as the key for caching results computed for a selection.
+
+        :return: The key of the current selection.
+        """
+        return self._selection_key
+
     @property
     def brushed_indices(self) -> typing.Set[int]:
         """
 
         :return: The currently selected indices.
         """
-        return self._brushed_indices
+        return self._selection.indices
 
     @brushed_indices.setter
-    def brushed_indices(self, indices: typing.List[int]):
+    def brushed_indices(
+        self, indices: typing.Union[typing.Iterable[int], np.ndarray, Selection]
+    ):
         """
         Sets the specified indices as selection in the data according to the current selection type.
 
         :param indices: indices of data points that should be brushed.
         """
-        if self.selection_type == SelectionType.STANDARD:
-            self._brushed_indices = set(indices)
-        elif self.selection_type == SelectionType.ADDITIVE:
-            self._brushed_indices = self._brushed_indices.union(indices)
+        self._brush(Selection.from_indices(indices, self._length))
+
+    def _brush(
+        self, new_selection: Selection, predicate: typing.Optional[Predicate] = None
+    ):
+        """
+        Combines the brushed rows with the selection according to the current selection type.
+
+        :param new_selection: The brushed rows.
+        :param predicate: The predicate describing the brushed rows or None.
+        :return: None
+        """
+        if self.selection_type == SelectionType.CROSSFILTER:
+            self._filter(None, new_selection, predicate)
+            return
+        previous = self._selection
+        empty = Selection.empty(self._length)
+        if self.selection_type == SelectionType.ADDITIVE:
+            # only rows that are not yet selected have to be added
+            added = new_selection - previous
+            self._selection = previous | added
+            change = SelectionChange(
+                previous, self._selection, self.selection_type, added, empty
+            )
         elif self.selection_type == SelectionType.SUBTRACTIVE:
-            self._brushed_indices = self._brushed_indices.difference(indices)
+            removed = new_selection & previous
+            self._selection = previous - removed
+            change = SelectionChange(
+                previous, self._selection, self.selection_type, empty, removed
+            )
+        else:
+            self._selection = new_selection
+            change = SelectionChange(previous, self._selection, self.selection_type)
 
-        self.notify_indices_changed()
+        if self.full_data is not None:
+            full_data = self.full_data
+            if self.selection_type == SelectionType.STANDARD:
+                full_data.exact = True
+            brushed = full_data.translate(new_selection, predicate)
+            if self.selection_type == SelectionType.ADDITIVE:
+                full_data.selection = full_data.selection | brushed
+            elif self.selection_type == SelectionType.SUBTRACTIVE:
+                full_data.selection = full_data.selection - brushed
+            else:
+                full_data.selection = brushed
+        self.notify_indices_changed(change)
 
     @property
     def brushed_data(self) -> DataFrame:
         """
         Only determines brushed data if it was invalidated by new selected indices.
         This gives more efficiency if only the brushed indices are needed and not the brushed data.
+        Rows are in ascending order of their position in the data. If all rows are selected, the data itself
+        is returned without copying it.
+        Prefer :meth:`brushed_column` or :meth:`brushed_columns` if only some columns are needed.
 
         :return: The selected data corresponding to the indices.
         """
         if self.brushed_data_invalidated:
-            self._brushed_data = self._df.iloc[list(self._brushed_indices), :]
+            if self._selection.count == self._length:
+                self._brushed_data = self.data
+            elif isinstance(self._df, LazyFrame) or self._df.columns.is_unique:
+                self._brushed_data = DataFrame(
+                    self.brushed_columns(self.columns),
+                    index=self._df.index[self._selection.positions],
+                    columns=self.columns,
+                )
+            else:
+                self._brushed_data = self._df.iloc[self._selection.positions, :]
             self.brushed_data_invalidated = False
         return self._brushed_data
 
+    def brushed_column(
+        self, name, selection: typing.Optional[Selection] = None
+    ) -> typing.Any:
+        """
+        Gathers the selected values of a single column in ascending row order.
+        The values are cached until the selection changes, so that several widgets showing the same column
+        only gather it once. If all rows are selected, the values of the column are returned without copying.
+        The returned array must not be modified.
+
+        :param name: The name of the column.
+        :param selection: The selection to gather the values for. Defaults to the current selection.
+            Values for other selections than the current one are not cached.
+        :raises KeyError: if the column is not present in the data.
+        :return: A numpy array, or a pandas extension array for extension dtypes like `category`,
+            containing the selected values of the column.
+        """
+        if selection is None:
+            selection = self._selection
+        # the cache is replaced as a whole, so that it cannot contain values of different selections
+        cached_selection, cache = self._brushed_columns
+        if cached_selection is not selection:
+            if selection is not self._selection:
+                return self._gather_column(name, selection)
+            cache = {}
+            self._brushed_columns = (selection, cache)
+        if name not in cache:
+            cache[name] = self._gather_column(name, selection)
+        return cache[name]
+
+    def brushed_columns(
+        self, names: typing.List, selection: typing.Optional[Selection] = None
+    ) -> typing.Dict[typing.Any, typing.Any]:
+        """
+        Gathers the selected values of several columns. See :meth:`brushed_column`.
+
+        :param names: The names of the columns.
+        :param selection: The selection to gather the values for. Defaults to the current selection.
+        :raises KeyError: if a column is not present in the data.
+        :return: A dictionary mapping each column name to its selected values.
+        """
+        return {name: self.brushed_column(name, selection) for name in names}
+
+    def _gather_column(self, name, selection: Selection) -> typing.Any:
+        return self.column_store.gather(name, selection)
+
     @property
     def indices(self) -> typing.Set[int]:
         """
 
-        :return: All indices of the data frame. This is a list from 0 to len-1.
+        :return: All indices of the data frame. This is a set from 0 to len-1.
         """
-        return self._indices
+        return self._all_selected.indices
 
     @property
     def data(self) -> DataFrame:
         """
+        For data opened with :meth:`read_sql`, all columns that are not loaded yet are loaded first.
+        Use :meth:`column` to load only a single column.
 
         :return: The DataFrame for this :class:`pandas_visual_analysis.data_source.DataSource` object.
         """
+        if isinstance(self._df, LazyFrame):
+            return self._df.to_frame()
         return self._df
 
+    def column(self, name) -> pd.Series:
+        """
+        Returns a column of the data. For data opened with :meth:`read_sql`, only this column is loaded if it was
+        not loaded before.
+
+        :param name: The name of the column.
+        :raises KeyError: if the column is not present in the data.
+        :return: The column.
+        """
+        return self.column_store.column(name)
+
+    @property
+    def aggregates(self) -> typing.Union["DataSource", FullData]:
+        """
+        The rows aggregate widgets like histograms compute their statistics on. Both the data source and the full
+        data provide ``data``, ``len``, ``column_store``, ``selection``, ``selection_for`` and ``brushed_column``.
+
+        :return: The :attr:`full_data` if the full data is kept for a sample, otherwise this data source.
+        """
+        return self if self.full_data is None else self.full_data
+
     @staticmethod
-    def read_csv(path: str, header: typing.Union[int, None] = 0):
+    def read_csv(
+        path: str,
+        header: typing.Union[int, None] = 0,
+        sample: typing.Union[float, int, None] = None,
+        seed: typing.Union[int, None] = None,
+        chunksize: int = 100000,
+    ):
         """
         Read a comma-separated values (csv) file into DataSource.
 
@@ -189,13 +916,61 @@ class DataSource:
             Valid URL schemes include http, ftp, s3, and file.
         :param header: Row (0-indexed) to use for the column labels of the parsed DataFrame.
             Use None if there is no header.
+        :param sample: If given, the file is read in chunks and only a sample of the rows is kept,
+            see :meth:`read_sampled`.
+        :param seed: Random seed used for sampling the rows.
+        :param chunksize: The number of rows read at once if the file is sampled.
         :return: The DataSource containing the data from the specified file.
         """
+        if sample is not None:
+            chunks = pd.read_csv(path, header=header, chunksize=chunksize)
+            return DataSource.read_sampled(chunks, sample, seed)
         df = pd.read_csv(path, header=header)
         return DataSource(df)
 
     @staticmethod
-    def read_tsv(path: str, header: typing.Union[int, None] = 0):
+    def read_csv_parallel(
+        path: str,
+        sep: str = ",",
+        header: typing.Union[int, None] = 0,
+        processes: typing.Union[int, None] = None,
+        chunk_bytes: int = 2 ** 26,
+        compression: typing.Union[str, None] = "infer",
+    ):
+        """
+        Read a large delimiter-separated values file into a DataSource by parsing chunks of lines in a process pool,
+        see :func:`pandas_visual_analysis.utils.parallel_csv.read_csv_parallel`. The types of the columns and the
+        categorical columns of the DataSource are inferred from the first rows, e.g. repeated strings are read as
+        category columns and dates as datetime columns.
+        Files compressed with gzip, bz2, xz or zstd are decompressed as a stream.
+
+        :param path: The path of the file.
+        :param sep: The delimiter of the columns.
+        :param header: Row (0-indexed) to use for the column labels of the parsed DataFrame.
+            Use None if there is no header.
+        :param processes: The number of processes parsing the chunks. Defaults to the number of CPUs.
+        :param chunk_bytes: The approximate size of a chunk in bytes.
+        :param compression: The compression of the file, which is inferred from the extension by default.
+        :return: The DataSource containing the data from the specified file.
+        """
+        df, schema = read_csv_parallel(
+            path,
+            sep=sep,
+            header=header,
+            processes=processes,
+            chunk_bytes=chunk_bytes,
+            compression=compression,
+        )
+        return DataSource(df, categorical_columns=schema.categorical_columns)
+
+    @staticmethod
+    def read_tsv(
+        path: str,
+        header: typing.Union[int, None] = 0,
+        sample: typing.Union[float, int, None] = None,
+        seed: typing.Union[int, None] = None,
+        chunksize: int = 100000,
+    ):
         """
         Read a tab-separated values (tsv) file into DataSource.
 
@@ -203,13 +978,27 @@ class DataSource:
             Valid URL schemes include http, ftp, s3, and file.
         :param header: Row (0-indexed) to use for the column labels of the parsed DataFrame.
             Use None if there is no header.
+        :param sample: If given, the file is read in chunks and only a sample of the rows is kept,
+            see :meth:`read_sampled`.
+        :param seed: Random seed used for sampling the rows.
+        :param chunksize: The number of rows read at once if the file is sampled.
         :return: The DataSource containing the data from the specified file.
         """
+        if sample is not None:
+            chunks = pd.read_table(path, header=header, chunksize=chunksize)
+            return DataSource.read_sampled(chunks, sample, seed)
         df = pd.read_table(path, header=header)
         return DataSource(df)
 
     @staticmethod
-    def read_json(path: str, orient: str):
+    def read_json(
+        path: str,
+        orient: str,
+        sample: typing.Union[float, int, None] = None,
+        seed: typing.Union[int, None] = None,
+        lines: bool = False,
+        chunksize: int = 100000,
+    ):
         """
          Read a json file into a DataSource.
 
@@ -217,16 +1006,187 @@ class DataSource:
             Valid URL schemes include http, ftp, s3, and file.
         :param orient: Indication of expected JSON string format produced by DataFrame.to_json()
             with a corresponding orient value.
+        :param sample: If given, only a sample of the rows is kept, see :meth:`read_sampled`.
+            Only files with one JSON object per line are read in chunks, other files are read as a whole.
+        :param seed: Random seed used for sampling the rows.
+        :param lines: Whether the file contains one JSON object per line.
+        :param chunksize: The number of lines read at once if the file is sampled.
+        :return: The DataSource containing the data from the specified file.
+        """
+        if sample is not None:
+            if lines:
+                chunks = pd.read_json(
+                    path, orient=orient, lines=True, chunksize=chunksize
+                )
+            else:
+                chunks = [pd.read_json(path, orient=orient)]
+            return DataSource.read_sampled(chunks, sample, seed)
+        df = pd.read_json(path, orient=orient, lines=lines)
+        return DataSource(df)
+
+    @staticmethod
+    def read_parquet(
+        path: str,
+        columns: typing.Union[typing.List[str], None] = None,
+        filters: typing.Union[Predicate, arrow_io.Filters, None] = None,
+        memory_map: bool = True,
+    ):
+        """
+        Read a Parquet file into a DataSource. Requires pyarrow.
+        Only the given columns are decoded and row groups without matching rows are skipped,
+        see :func:`pandas_visual_analysis.utils.arrow_io.read_parquet`.
+
+        :param path: The path of the file or of a directory of Parquet files.
+        :param columns: The columns to read. All columns are read if omitted.
+        :param filters: The rows to read, either as a predicate like in :meth:`select_where` or in the
+            disjunctive normal form of :func:`pyarrow.parquet.read_table`.
+        :param memory_map: Whether the file is memory-mapped instead of read into a buffer.
+        :return: The DataSource containing the data from the specified file.
+        """
+        df = arrow_io.read_parquet(
+            path, columns=columns, filters=filters, memory_map=memory_map
+        )
+        return DataSource(df)
+
+    @staticmethod
+    def read_feather(
+        path: str,
+        columns: typing.Union[typing.List[str], None] = None,
+        memory_map: bool = True,
+    ):
+        """
+        Read a Feather file into a DataSource. Requires pyarrow.
+
+        :param path: The path of the file.
+        :param columns: The columns to read. All columns are read if omitted.
+        :param memory_map: Whether the file is memory-mapped instead of read into a buffer.
+        :return: The DataSource containing the data from the specified file.
+        """
+        df = arrow_io.read_feather(path, columns=columns, memory_map=memory_map)
+        return DataSource(df)
+
+    @staticmethod
+    def read_arrow(
+        path: str,
+        columns: typing.Union[typing.List[str], None] = None,
+        memory_map: bool = True,
+    ):
+        """
+        Read an Arrow IPC file into a DataSource. Requires pyarrow.
+        The file is memory-mapped, so opening it does not read it and only the pages of the given columns are
+        read from the disk.
+
+        :param path: The path of the file.
+        :param columns: The columns to read, e.g. the ones shown by the widgets. All columns are read if omitted.
+        :param memory_map: Whether the file is memory-mapped instead of read into a buffer.
         :return: The DataSource containing the data from the specified file.
         """
-        df = pd.read_json(path, orient=orient)
+        df = arrow_io.read_arrow(path, columns=columns, memory_map=memory_map)
         return DataSource(df)
 
+    @staticmethod
+    def read_sql(
+        connection,
+        table_or_query: str,
+        columns: typing.Union[typing.List[str], None] = None,
+        *args,
+        **kwargs
+    ):
+        """
+        Opens a table or query of a database, e.g. a local SQLite or DuckDB file, as a DataSource whose columns
+        are loaded the first time they are accessed, e.g. when a widget shows them. Opening only queries the
+        columns, their types and the number of rows, and the minimum and maximum of columns that are not loaded
+        are computed by the database, see :class:`pandas_visual_analysis.utils.sql_source.SqlTable`.
+        The data cannot be sampled or converted to compact types, and appending rows loads all columns.
+
+        :param connection: A DB-API connection, e.g. of :mod:`sqlite3` or duckdb.
+        :param table_or_query: The name of a table or a SELECT query, which has to return its rows in a
+            deterministic order, e.g. with ORDER BY.
+        :param columns: The columns to use. Defaults to all columns of the table or query.
+        :param args: Arguments passed to the DataSource.
+        :param kwargs: Keyword arguments passed to the DataSource.
+        :return: The DataSource of the table or query.
+        """
+        table = SqlTable(connection, table_or_query, columns)
+        return DataSource(LazyFrame(table), *args, **kwargs)
+
+    @staticmethod
+    def read_mapped(directory: str, *args, **kwargs):
+        """
+        Opens columns written with :func:`pandas_visual_analysis.utils.column_files.write_columns` as a DataSource
+        whose columns are memory-mapped, so that the data can be larger than the memory. The indexes, histograms
+        and statistics of the columns are computed chunk by chunk, and only the pages of the columns being
+        accessed are held in memory. :attr:`brushed_data` copies the selected rows into memory, so widgets
+        showing single rows, like scatter plots, should only be used with selective brushes or a sample.
+
+        :param directory: The directory of the column files.
+        :param args: Arguments passed to the DataSource.
+        :param kwargs: Keyword arguments passed to the DataSource.
+        :return: The DataSource of the memory-mapped columns.
+        """
+        return DataSource(open_columns(directory), *args, **kwargs)
+
+    @staticmethod
+    def read_sampled(
+        chunks: typing.Iterable[DataFrame],
+        sample: typing.Union[float, int],
+        seed: typing.Union[int, None] = None,
+        *args,
+        **kwargs
+    ):
+        """
+        Reads a DataSource from chunks of rows, e.g. of a file larger than the memory, in a single pass.
+        Only a uniform sample of the rows is kept, so the memory is bounded by the size of the sample and of a
+        chunk instead of the size of the file, see :class:`pandas_visual_analysis.utils.reservoir.ReservoirSample`.
+        The exact count, minimum and maximum of all rows are available as :attr:`file_summary` and the number of
+        rows as :attr:`file_rows`.
+
+        :param chunks: Iterable of DataFrames with the same columns, e.g. a reader returned by
+            :func:`pandas.read_csv` with a chunksize.
+        :param sample: The number of rows in the sample or the fraction of rows between 0.0 and 1.0.
+        :param seed: Random seed used for sampling the rows, which makes the sample reproducible.
+        :param args: Arguments passed to the DataSource.
+        :param kwargs: Keyword arguments passed to the DataSource.
+        :return: The DataSource containing the sampled rows.
+        """
+        validate.validate_sample(sample)
+        validate.validate_seed(seed)
+        reservoir = ReservoirSample(sample, seed)
+        for chunk in chunks:
+            reservoir.add(chunk)
+        data_source = DataSource(reservoir.sample, *args, **kwargs)
+        data_source.file_summary = reservoir.summary()
+        data_source.file_rows = reservoir.rows
+        return data_source
+
+    @staticmethod
+    def attach(name: str, *args, **kwargs):
+        """
+        Creates a DataSource from columns published in shared memory by another process with
+        :meth:`pandas_visual_analysis.utils.shared_frame.SharedFrame.publish`, e.g. to load a large dataset once
+        for the kernels of several dashboard users on the same host. The data are read-only views of the shared
+        memory, while the selection and all caches are private to this process. Sampling the data or optimizing its
+        memory creates private copies of the affected columns. Closing the :attr:`shared_frame` is deferred until
+        the DataSource is released.
+
+        :param name: The name of the shared memory block.
+        :param args: Arguments passed to the DataSource.
+        :param kwargs: Keyword arguments passed to the DataSource.
+        :return: The DataSource attached to the shared memory, which is available as :attr:`shared_frame`.
+        """
+        shared_frame = SharedFrame.attach(name)
+        data_source = DataSource(shared_frame.data, *args, **kwargs)
+        data_source.shared_frame = shared_frame
+        return data_source
+
     @staticmethod
     def read(path: str, *args, **kwargs):
         """
         Reads the data specified by the path into a DataSource. Infers file type by extension.
-        Supported extensions are: .csv, .tsv and .json.
+        Supported extensions are: .csv, .tsv, .json, .parquet, .feather and .arrow. Pass sample and seed as
+        keyword arguments to sample the rows of text files while reading, and columns to read only some columns
+        of the binary formats. CSV and TSV files compressed with gzip, bz2, xz or zstd, e.g. .csv.gz, are read with
+        :meth:`read_csv_parallel`.
 
         :param path: Any valid string path is acceptable. The string could be a URL.
             Valid URL schemes include http, ftp, s3, and file.
@@ -235,11 +1195,24 @@ class DataSource:
         :return: The DataSource containing the data from the specified file.
         """
         filename, extension = os.path.splitext(path)
-        supported_extensions = {".csv", ".tsv", ".json"}
+        if extension in {".gz", ".bz2", ".xz", ".zst", ".zstd"}:
+            inner_extension = os.path.splitext(filename)[1]
+            if inner_extension in {".csv", ".tsv"}:
+                sep = "\t" if inner_extension == ".tsv" else ","
+                return DataSource.read_csv_parallel(path, sep, *args, **kwargs)
+        supported_extensions = {
+            ".csv",
+            ".tsv",
+            ".json",
+            ".parquet",
+            ".feather",
+            ".arrow",
+        }
         if extension not in supported_extensions:
             raise ValueError(
                 "The file extension %s is not supported. "
-                "Supported extensions are: .csv, .tsv, .json. "
+                "Supported extensions are: .csv, .tsv, .json, .parquet, .feather, .arrow. "
+                % extension
             )
 
         if extension == ".csv":
@@ -248,6 +1221,12 @@ class DataSource:
             return DataSource.read_tsv(path, *args, **kwargs)
         elif extension == ".json":
             return DataSource.read_json(path, *args, **kwargs)
+        elif extension == ".parquet":
+            return DataSource.read_parquet(path, *args, **kwargs)
+        elif extension == ".feather":
+            return DataSource.read_feather(path, *args, **kwargs)
+        elif extension == ".arrow":
+            return DataSource.read_arrow(path, *args, **kwargs)
 
     #  context manager
     def __enter__(self):
@@ -75,7 +75,12 @@ class AnalysisLayout:
         self.data_source = data_source
         self.row_height = row_height
         self.selection_type_widget = widgets.ToggleButtons(
-            options=[("Standard", "std"), ("Additive", "add"), ("Subtractive", "sub")],
+            options=[
+                ("Standard", "std"),
+                ("Additive", "add"),
+                ("Subtractive", "sub"),
+                ("Crossfilter", "cross"),
+            ],
             description="Selection Type:",
             disabled=False,
             button_style="",  # 'success', 'info', 'warning', 'danger' or ''
@@ -83,12 +88,30 @@ class AnalysisLayout:
                 "Replaces selection",
                 "Adds selected points to selection",
                 "Removes selected points from selection",
+                "Every plot filters its own dimension, the selection is the intersection of all filters",
             ],
             style={"description_width": "initial"},
         )
         self.selection_type_widget.add_class("layout-" + self._id)
         self.selection_type_widget.observe(self._selection_type_changed, "value")
 
+        self.undo_button = widgets.Button(
+            description="Undo",
+            icon="undo",
+            tooltip="Restores the previous selection",
+            layout=widgets.Layout(width="90px"),
+        )
+        self.redo_button = widgets.Button(
+            description="Redo",
+            icon="repeat",
+            tooltip="Restores the selection that was undone",
+            layout=widgets.Layout(width="90px"),
+        )
+        self.undo_button.on_click(self._on_undo)
+        self.redo_button.on_click(self._on_redo)
+        self._update_history_buttons()
+        self.data_source.on_indices_changed.connect(self._on_indices_changed)
+
     def build(self) -> widgets.Widget:
         """
         Generates widgets from layout and returns the root widget for this layout.
@@ -97,7 +120,11 @@ class AnalysisLayout:
         :return: self.root_widget
         """
         wcr = WidgetClassRegistry()
-        rows = [self.selection_type_widget]  # first row is the selection type widget
+        rows = [
+            widgets.HBox(
+                [self.selection_type_widget, self.undo_button, self.redo_button]
+            )
+        ]  # first row contains the selection type and history widgets
         for r, row in enumerate(self.layout_spec):
             row_widgets = []
             if isinstance(self.row_height, int):
@@ -146,3 +173,18 @@ class AnalysisLayout:
             self.data_source.selection_type = SelectionType.ADDITIVE
         elif value == "sub":
             self.data_source.selection_type = SelectionType.SUBTRACTIVE
+        elif value == "cross":
+            self.data_source.selection_type = SelectionType.CROSSFILTER
+
+    def _on_undo(self, button):
+        self.data_source.undo()
+
+    def _on_redo(self, button):
+        self.data_source.redo()
+
+    def _on_indices_changed(self, sender):
+        self._update_history_buttons()
+
+    def _update_history_buttons(self):
+        self.undo_button.disabled = not self.data_source.history.can_undo
+        self.redo_button.disabled = not self.data_source.history.can_redo
@@ -0,0 +1,208 @@
+import typing
+
+from pandas_visual_analysis.data_source import DataSource, SelectionType
+from pandas_visual_analysis.utils.join_index import JoinIndex, factorize_keys
+from pandas_visual_analysis.utils.selection import Selection
+
+
+class Link:
+    """
+    Connects the rows of two DataSources with equal values in their key columns, like a join of their data.
+    The keys of both DataSources are factorized once into a :class:`pandas_visual_analysis.utils.join_index.JoinIndex`
+    per side, so translating a selection to the other DataSource costs O(k + m) for k selected and m matching
+    rows instead of merging the data on every brush. Rows with a missing key are never linked.
+    """
+
+    def __init__(
+        self,
+        left: DataSource,
+        right: DataSource,
+        left_on: typing.Union[str, typing.List[str]],
+        right_on: typing.Union[str, typing.List[str], None] = None,
+    ):
+        """
+
+        :param left: The first DataSource.
+        :param right: The second DataSource.
+        :param left_on: The key column or columns of the left DataSource.
+        :param right_on: The key column or columns of the right DataSource. Defaults to left_on.
+        """
+        if left is right:
+            raise ValueError("A DataSource cannot be linked with itself.")
+        left_on = [left_on] if isinstance(left_on, str) else list(left_on)
+        if right_on is None:
+            right_on = left_on
+        elif isinstance(right_on, str):
+            right_on = [right_on]
+        else:
+            right_on = list(right_on)
+        if len(left_on) != len(right_on) or len(left_on) == 0:
+            raise ValueError(
+                "Both DataSources have to be linked on the same number of key columns."
+            )
+        for ds, columns in ((left, left_on), (right, right_on)):
+            for col in columns:
+                if col not in ds.columns:
+                    raise ValueError("Invalid key column: %s" % str(col))
+        self.left = left
+        self.right = right
+        self.left_on = left_on
+        self.right_on = right_on
+        self.left_index: JoinIndex
+        self.right_index: JoinIndex
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Builds the join indexes of both DataSources again, e.g. after rows were appended to one of them.
+
+        :return: None
+        """
+        left_codes, right_codes, num_keys = factorize_keys(
+            [self.left.column(col) for col in self.left_on],
+            [self.right.column(col) for col in self.right_on],
+        )
+        self.left_index = JoinIndex(left_codes, num_keys)
+        self.right_index = JoinIndex(right_codes, num_keys)
+
+    def other(self, ds: DataSource) -> DataSource:
+        """
+
+        :param ds: One of the linked DataSources.
+        :return: The other linked DataSource.
+        """
+        if ds is self.left:
+            return self.right
+        if ds is self.right:
+            return self.left
+        raise ValueError("The DataSource is not part of this link.")
+
+    def propagate(self, source: DataSource, selection: Selection) -> Selection:
+        """
+        Translates a selection of one DataSource to the rows of the other DataSource with the same keys.
+
+        :param source: One of the linked DataSources.
+        :param selection: Rows of the source.
+        :return: The rows of the other DataSource sharing a key with a selected row.
+        """
+        if source is self.left:
+            from_index, to_index = self.left_index, self.right_index
+        elif source is self.right:
+            from_index, to_index = self.right_index, self.left_index
+        else:
+            raise ValueError("The DataSource is not part of this link.")
+        return to_index.selection(from_index.keys(selection))
+
+    def __repr__(self) -> str:
+        return "Link(%s -> %s)" % (str(self.left_on), str(self.right_on))
+
+
+class LinkRegistry:
+    """
+    Links the selections of several DataSources, e.g. one of orders and one of customers.
+    When the selection of a DataSource changes, every linked DataSource brushes the rows sharing a key with the
+    selected rows, using the :class:`Link` as the dimension of the brush. With the selection type CROSSFILTER,
+    the link is a filter of its own, which combines with the filters of the widgets. Selecting all rows removes
+    the filter of the link again. Changes propagate along chains of links, but never back to the DataSource
+    they came from.
+
+    The DataSources only hold weak references to the registry, so it has to be kept in a variable for as long as
+    the links should be active.
+    """
+
+    def __init__(self):
+        self.links: typing.List[Link] = []
+        # DataSources whose selection change is currently propagated
+        self._active: typing.Set[DataSource] = set()
+        # the selection a deferred notification of a target will carry and the link it came from
+        self._echoes: typing.Dict[DataSource, typing.Tuple[Selection, Link]] = {}
+
+    def link(
+        self,
+        left: DataSource,
+        right: DataSource,
+        left_on: typing.Union[str, typing.List[str]],
+        right_on: typing.Union[str, typing.List[str], None] = None,
+    ) -> Link:
+        """
+        Links two DataSources on their key columns.
+
+        .. code-block:: python
+
+            registry = LinkRegistry()
+            registry.link(orders, customers, "customer_id", "id")
+
+        :param left: The first DataSource.
+        :param right: The second DataSource.
+        :param left_on: The key column or columns of the left DataSource.
+        :param right_on: The key column or columns of the right DataSource. Defaults to left_on.
+        :return: The link, which can be removed again with :meth:`unlink`.
+        """
+        link = Link(left, right, left_on, right_on)
+        for ds in (left, right):
+            ds.on_selection_changed.connect(self._selection_changed)
+            ds.on_rows_appended.connect(self._rows_appended)
+        self.links.append(link)
+        return link
+
+    def unlink(self, link: Link):
+        """
+        Removes a link and the filters it set in DataSources with the selection type CROSSFILTER.
+
+        :param link: A link of this registry.
+        :return: None
+        """
+        if link not in self.links:
+            raise ValueError("The link is not part of this registry.")
+        self.links.remove(link)
+        for ds in (link.left, link.right):
+            self._echoes.pop(ds, None)
+            if len(self.links_of(ds)) == 0:
+                ds.on_selection_changed.disconnect(self._selection_changed)
+                ds.on_rows_appended.disconnect(self._rows_appended)
+            if ds.selection_type == SelectionType.CROSSFILTER and (
+                ds.crossfilter.has_filter(link)
+            ):
+                ds.reset_selection(dimension=link)
+
+    def links_of(self, ds: DataSource) -> typing.List[Link]:
+        """
+
+        :param ds: A DataSource.
+        :return: All links of the DataSource.
+        """
+        return [link for link in self.links if link.left is ds or link.right is ds]
+
+    def _selection_changed(self, sender: DataSource, change=None):
+        echo = self._echoes.pop(sender, None)
+        # a deferred notification of a propagated selection is not sent back through its link
+        origin = echo[1] if echo is not None and echo[0] is change.selection else None
+        if sender in self._active:
+            return
+        self._active.add(sender)
+        try:
+            for link in self.links_of(sender):
+                target = link.other(sender)
+                if link is not origin and target not in self._active:
+                    self._propagate(link, sender, target)
+        finally:
+            self._active.discard(sender)
+
+    def _propagate(self, link: Link, source: DataSource, target: DataSource):
+        """
+        Brushes the rows of the target that share a key with the rows of the source the link should display.
+        """
+        selection = source.selection_for(link)
+        if selection.count == selection.len:
+            target.reset_selection(dimension=link)
+        else:
+            target.brush(link.propagate(source, selection), dimension=link)
+        if target.last_change is None or target.last_change.selection is not (
+            target.selection
+        ):
+            self._echoes[target] = (target.selection, link)
+
+    def _rows_appended(self, sender: DataSource, rows=None, evicted=0):
+        # the selection change following the append is propagated with the new indexes
+        for link in self.links_of(sender):
+            link.rebuild()
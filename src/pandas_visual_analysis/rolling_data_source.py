@@ -0,0 +1,138 @@
+import typing
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+import pandas_visual_analysis.utils.validation as validate
+from pandas_visual_analysis.data_source import DataSource
+from pandas_visual_analysis.utils.aggregates import BinCounts, Moments
+from pandas_visual_analysis.utils.predicate import Predicate
+from pandas_visual_analysis.utils.ring_buffer import RingBuffer
+
+
+class RollingDataSource(DataSource):
+    """
+    A DataSource that only keeps the last rows of a stream of rows, e.g. for monitoring a live process.
+    Rows are stored in preallocated ring buffer columns, so the memory stays constant no matter how many rows are
+    appended. Rows are evicted once there are more than max_rows rows or, if a time column and a window are given,
+    once they are older than the window relative to the newest row.
+    When rows are evicted, the selection is remapped to the remaining rows instead of being rebuilt, and the
+    running aggregates of the numerical columns are updated by subtracting the evicted rows. The histograms count
+    all rows with the running bin counts and the brush summary takes the mean of all rows from the running moments.
+    """
+
+    def __init__(
+        self,
+        df: DataFrame,
+        max_rows: int,
+        time_column: typing.Optional[str] = None,
+        window: typing.Union[str, pd.Timedelta, None] = None,
+        bins: int = 20,
+        categorical_columns: typing.Union[typing.List[str], None] = None,
+    ):
+        """
+
+        :param df: DataFrame with the initial rows. Only the rows inside the window are kept.
+        :param max_rows: The maximum number of rows kept, which is also the capacity of the ring buffer.
+        :param time_column: Name of a time column whose values increase with every appended row.
+        :param window: Rows older than this duration relative to the newest row are evicted, e.g. "10min".
+        :param bins: The number of bins of the running histograms, whose edges are determined by the initial rows.
+        :param categorical_columns: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        """
+        validate.validate_data_frame(df)
+        if (time_column is None) != (window is None):
+            raise ValueError(
+                "A time window needs both the time column and the duration of the window."
+            )
+        if time_column is not None and time_column not in df.columns:
+            raise ValueError(
+                "The time column has to be present in the DataFrame. Invalid column: %s"
+                % str(time_column)
+            )
+        if time_column is not None and (
+            time_column in (categorical_columns or [])
+            or df[[time_column]]
+            .select_dtypes(include=["datetime", "timedelta", "datetimetz"])
+            .empty
+        ):
+            raise ValueError(
+                "The time column has to be a time based column. Invalid column: %s"
+                % str(time_column)
+            )
+        self.time_column = time_column
+        self.window = None if window is None else pd.Timedelta(window)
+        self._buffer = RingBuffer(df, max_rows)
+        self._buffer.pop_front(self._expired_count())
+
+        super().__init__(self._buffer.to_frame(), categorical_columns)
+
+        for col in self.numerical_columns:
+            values = self._buffer.column(col)
+            self.moments[col] = Moments(values)
+            finite = pd.Series(values, dtype="float64").dropna().values
+            edges = (
+                np.histogram_bin_edges(finite, bins=bins)
+                if len(finite) > 0
+                else np.linspace(0.0, 1.0, bins + 1)
+            )
+            self.bin_counts[col] = BinCounts(edges, values)
+
+    @property
+    def max_rows(self) -> int:
+        """
+
+        :return: The maximum number of rows kept.
+        """
+        return self._buffer.capacity
+
+    def append(
+        self,
+        df_chunk: DataFrame,
+        policy: typing.Union[bool, Predicate, None] = None,
+    ):
+        """
+        Appends rows and evicts the rows that are no longer inside the window.
+        Observers of the on_rows_appended signal receive the new rows and the number of evicted rows.
+        If the chunk has more rows than max_rows, only its last rows are appended.
+
+        :param df_chunk: DataFrame with the same columns as the data.
+        :param policy: Whether the new rows are selected, see :meth:`DataSource.append`.
+        :return: None
+        """
+        validate.validate_data_frame(df_chunk, name="df_chunk")
+        if list(df_chunk.columns.values) != self.columns:
+            raise ValueError(
+                "Appended rows have to have the same columns as the data. Expected: %s, got: %s"
+                % (str(self.columns), str(list(df_chunk.columns.values)))
+            )
+        if len(df_chunk) == 0:
+            return
+        self.flush()
+        old_length = len(self._buffer)
+        df_chunk = df_chunk.iloc[max(len(df_chunk) - self.max_rows, 0) :]
+        evicted = [self._buffer.append(df_chunk)]
+        evicted.append(self._buffer.pop_front(self._expired_count()))
+        for col in self.numerical_columns:
+            self.moments[col].add(df_chunk[col].values)
+            self.bin_counts[col].add(df_chunk[col].values)
+            for values in evicted:
+                self.moments[col].remove(values[col])
+                self.bin_counts[col].remove(values[col])
+
+        count = min(len(df_chunk), len(self._buffer))
+        # the frame consists of views of the buffer, so its cost does not depend on the number of rows
+        self._df = self._buffer.to_frame()
+        self.column_store.set_data(self._df)
+        self._rows_appended(count, old_length - (len(self._buffer) - count), policy)
+
+    def _expired_count(self) -> int:
+        """
+
+        :return: The number of rows at the beginning of the buffer that are older than the window.
+        """
+        if self.window is None or len(self._buffer) == 0:
+            return 0
+        times = self._buffer.column(self.time_column)
+        # the times increase, so the first row inside the window is found with a binary search
+        return int(np.searchsorted(times, times[-1] - self.window.to_timedelta64()))
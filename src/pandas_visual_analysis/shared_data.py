@@ -0,0 +1,138 @@
+import typing
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+import pandas_visual_analysis.utils.validation as validate
+from pandas_visual_analysis.utils.backend import Backend, get_backend
+from pandas_visual_analysis.utils.column_store import ColumnStore
+from pandas_visual_analysis.utils.disk_cache import DiskCache
+from pandas_visual_analysis.utils.sql_source import LazyFrame
+from pandas_visual_analysis.utils.util import (
+    compact_dtypes,
+    read_only_view,
+    set_read_only,
+)
+
+
+class SharedData:
+    """
+    The data of a :class:`pandas_visual_analysis.data_source.DataSource` without any selection state, which can be
+    shared by many DataSources, e.g. one per session of a dashboard server. The data is converted, sampled and
+    indexed once, while every DataSource keeps its own selection, history and caches of brushed data.
+    The shared data is never changed: a DataSource appending rows continues with a private copy of the column store,
+    which still shares the unchanged rows. To ensure this, the data and the full data are read-only views of the
+    passed DataFrame, which stays writeable, and the arrays of the indexes are read-only.
+    """
+
+    def __init__(
+        self,
+        df: DataFrame,
+        categorical_columns: typing.Union[typing.List[str], None] = None,
+        sample: typing.Union[float, int, None] = None,
+        seed: typing.Union[int, None] = None,
+        keep_full_data: bool = False,
+        optimize_memory: bool = False,
+        cache: typing.Union[DiskCache, str, None] = None,
+        backend: typing.Union[Backend, str, None] = None,
+    ):
+        """
+
+        :param df: A pandas.DataFrame object.
+        :param categorical_columns: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        :param sample: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        :param seed: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        :param keep_full_data: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        :param optimize_memory: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        :param cache: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        :param backend: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        """
+        if not isinstance(df, LazyFrame):
+            validate.validate_data_frame(df)
+        validate.validate_sample(sample)
+        validate.validate_seed(seed)
+        if isinstance(cache, str):
+            cache = DiskCache(cache)
+        elif cache is not None and not isinstance(cache, DiskCache):
+            raise TypeError(
+                "The cache has to be a DiskCache, the path of its directory or None."
+            )
+        self.cache: typing.Optional[DiskCache] = cache
+        self.backend: Backend = get_backend(backend)
+        if isinstance(df, LazyFrame) and (sample is not None or optimize_memory):
+            raise ValueError(
+                "Lazily loaded data can neither be sampled nor converted to compact types."
+            )
+
+        if isinstance(df, DataFrame):
+            df = read_only_view(df)
+
+        self.optimize_memory = optimize_memory
+        # bytes saved by optimize_memory
+        self.memory_saved = 0
+        if optimize_memory:
+            memory_before = df.memory_usage(deep=True).sum()
+            df = compact_dtypes(df)
+            self.memory_saved = int(memory_before - df.memory_usage(deep=True).sum())
+
+        # the position in df of each sampled row and, if keep_full_data is set, the unsampled data
+        self.sample_positions: typing.Optional[np.ndarray] = None
+        self.full_data: typing.Optional[DataFrame] = None
+        self.full_column_store: typing.Optional[ColumnStore] = None
+        if sample is None:
+            self.data = df
+        else:
+            # sampling the positions draws the same rows as sampling the DataFrame
+            positions = pd.Series(np.arange(len(df)))
+            if isinstance(sample, float):
+                if sample < 0.0 or sample > 1.0:
+                    raise ValueError(
+                        "Sample has to be between 0.0 and 1.0. Invalid value : %d"
+                        % sample
+                    )
+                positions = positions.sample(frac=sample, random_state=seed).values
+            else:
+                if sample < 0 or sample > len(df):
+                    raise ValueError(
+                        "Sample has to be between 0 and the length of the DataFrame (%d). Invalid value: "
+                        "%d" % (len(df), sample)
+                    )
+                positions = positions.sample(n=sample, random_state=seed).values
+            self.data = df.iloc[positions]
+            self.sample_positions = positions
+            if keep_full_data:
+                self.full_data = df
+                self.full_column_store = ColumnStore(
+                    df,
+                    list(df.columns.values),
+                    categorical_columns,
+                    cache,
+                    self.backend,
+                )
+        if isinstance(self.data, LazyFrame):
+            self.columns = list(self.data.table.columns)
+        else:
+            self.columns = list(self.data.columns.values)
+
+        self.column_store = ColumnStore(
+            self.data, self.columns, categorical_columns, cache, self.backend
+        )
+
+        if len(self.columns) < 2:
+            raise ValueError(
+                "The passed DataFrame only has %d column, which is insufficient for analysis."
+                % len(self.columns)
+            )
+
+        self.column_store.set_read_only()
+        if self.full_column_store is not None:
+            self.full_column_store.set_read_only()
+        set_read_only(self.sample_positions)
+
+    def __len__(self):
+        """
+
+        :return: The number of rows of the (sampled) data.
+        """
+        return len(self.data)
@@ -0,0 +1,160 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+class Moments:
+    """
+    Count, mean and variance of a numerical column that can be updated incrementally by adding new values and
+    subtracting removed values, without looking at the other values of the column. Missing values are ignored.
+    The mean and the sum of squared deviations from the mean are kept instead of the sums of the values and their
+    squares, and batches are merged and removed with the formulas of Chan et al., so the variance stays accurate
+    for values with a large offset, e.g. timestamps, and over streams of any length.
+    """
+
+    def __init__(self, values: typing.Optional[np.ndarray] = None):
+        """
+
+        :param values: The initial values.
+        """
+        self.count = 0
+        self._mean = 0.0
+        # the sum of squared deviations from the mean
+        self.m2 = 0.0
+        if values is not None:
+            self.add(values)
+
+    def add(self, values: np.ndarray):
+        """
+
+        :param values: Values to include.
+        :return: None
+        """
+        count, mean, m2 = Moments._batch(values)
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def remove(self, values: np.ndarray):
+        """
+
+        :param values: Values that were included before and have to be excluded again.
+        :return: None
+        """
+        count, mean, m2 = Moments._batch(values)
+        if count == 0:
+            return
+        remaining = self.count - count
+        if remaining <= 0:
+            self.count, self._mean, self.m2 = 0, 0.0, 0.0
+            return
+        # the inverse of the merge in add
+        remaining_mean = self._mean + (self._mean - mean) * count / remaining
+        delta = mean - remaining_mean
+        self.m2 -= m2 + delta * delta * remaining * count / self.count
+        self.m2 = max(self.m2, 0.0)  # avoid negative values caused by rounding errors
+        self._mean = remaining_mean
+        self.count = remaining
+
+    @property
+    def mean(self) -> float:
+        """
+
+        :return: The mean of the values or NaN if there are no values.
+        """
+        return self._mean if self.count > 0 else np.nan
+
+    @property
+    def var(self) -> float:
+        """
+
+        :return: The sample variance of the values or NaN if there are less than two values.
+        """
+        if self.count < 2:
+            return np.nan
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        """
+
+        :return: The sample standard deviation of the values or NaN if there are less than two values.
+        """
+        return float(np.sqrt(self.var))
+
+    @staticmethod
+    def _batch(values: np.ndarray) -> typing.Tuple[int, float, float]:
+        """
+
+        :return: The count, mean and sum of squared deviations of the valid values.
+        """
+        values = _valid_floats(values)
+        if len(values) == 0:
+            return 0, 0.0, 0.0
+        mean = float(values.mean())
+        deviations = values - mean
+        return len(values), mean, float(np.dot(deviations, deviations))
+
+
+class BinCounts:
+    """
+    Histogram of a numerical column with fixed bins that can be updated incrementally by adding new values and
+    subtracting removed values. Values outside of the bins are counted in the first or last bin.
+    Missing values are ignored.
+    """
+
+    def __init__(self, edges: np.ndarray, values: typing.Optional[np.ndarray] = None):
+        """
+
+        :param edges: The increasing edges of the bins, one more than the number of bins.
+        :param values: The initial values.
+        """
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if len(self.edges) < 2:
+            raise ValueError("At least two bin edges are needed.")
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        if values is not None:
+            self.add(values)
+
+    def add(self, values: np.ndarray):
+        """
+
+        :param values: Values to include.
+        :return: None
+        """
+        self.counts += self._count(values)
+
+    def remove(self, values: np.ndarray):
+        """
+
+        :param values: Values that were included before and have to be excluded again.
+        :return: None
+        """
+        self.counts -= self._count(values)
+
+    def _count(self, values: np.ndarray) -> np.ndarray:
+        values = _valid_floats(values)
+        bins = np.clip(
+            np.searchsorted(self.edges, values, side="right") - 1,
+            0,
+            len(self.counts) - 1,
+        )
+        return np.bincount(bins, minlength=len(self.counts))
+
+
+def _valid_floats(values) -> np.ndarray:
+    """
+
+    :param values: Numerical values, possibly with missing values.
+    :return: The values that are not missing as float array.
+    """
+    values = np.asarray(values)
+    if values.dtype == object:  # e.g. nullable integers
+        values = pd.to_numeric(values, errors="coerce")
+    values = np.asarray(values, dtype=np.float64)
+    return values[~np.isnan(values)]
@@ -0,0 +1,145 @@
+import itertools
+import typing
+
+from pandas import DataFrame
+
+from pandas_visual_analysis.utils.column_index import CategoryIndex
+from pandas_visual_analysis.utils.predicate import And, Between, IsIn, Or, Predicate
+
+# a filter in disjunctive normal form as accepted by pyarrow: a list of conjunctions of (column, op, value)
+Filters = typing.List[typing.List[typing.Tuple[str, str, typing.Any]]]
+
+
+def read_parquet(
+    path: str,
+    columns: typing.Optional[typing.List[str]] = None,
+    filters: typing.Union[Predicate, Filters, None] = None,
+    memory_map: bool = True,
+) -> DataFrame:
+    """
+    Reads a Parquet file with pyarrow. Only the given columns are decoded, and row groups whose statistics show
+    that none of their rows fulfill the filters are skipped without being read.
+
+    :param path: The path of the file or of a directory of Parquet files.
+    :param columns: The columns to read. All columns are read if omitted.
+    :param filters: The rows to read, either as a predicate of :class:`pandas_visual_analysis.utils.predicate.Between`
+        and :class:`pandas_visual_analysis.utils.predicate.IsIn` combined with ``&`` and ``|``, or in the
+        disjunctive normal form of :func:`pyarrow.parquet.read_table`.
+    :param memory_map: Whether a local file is memory-mapped instead of read into a buffer.
+    :return: The DataFrame of the read rows and columns.
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    if isinstance(filters, Predicate):
+        filters = to_filters(filters)
+    table = pq.read_table(path, columns=columns, filters=filters, memory_map=memory_map)
+    return _to_pandas(table)
+
+
+def read_feather(
+    path: str,
+    columns: typing.Optional[typing.List[str]] = None,
+    memory_map: bool = True,
+) -> DataFrame:
+    """
+    Reads a Feather file with pyarrow. Version 2 Feather files are Arrow IPC files, which are memory-mapped, so
+    only the pages of the given columns are read from the disk.
+
+    :param path: The path of the file.
+    :param columns: The columns to read. All columns are read if omitted.
+    :param memory_map: Whether the file is memory-mapped instead of read into a buffer.
+    :return: The DataFrame of the read columns.
+    """
+    _pyarrow()
+    import pyarrow.feather as feather
+
+    table = feather.read_table(path, columns=columns, memory_map=memory_map)
+    return _to_pandas(table)
+
+
+def read_arrow(
+    path: str,
+    columns: typing.Optional[typing.List[str]] = None,
+    memory_map: bool = True,
+) -> DataFrame:
+    """
+    Reads an Arrow IPC file or stream with pyarrow. The file is memory-mapped, so opening it only reads its
+    schema and the pages of the given columns are read from the disk when they are converted.
+
+    :param path: The path of the file.
+    :param columns: The columns to read. All columns are read if omitted.
+    :param memory_map: Whether the file is memory-mapped instead of read into a buffer.
+    :return: The DataFrame of the read columns.
+    """
+    pa = _pyarrow()
+    import pyarrow.ipc as ipc
+
+    source = pa.memory_map(path, "r") if memory_map else pa.OSFile(path, "rb")
+    try:
+        table = ipc.open_file(source).read_all()
+    except (
+        pa.ArrowInvalid
+    ):  # not the file format, but the stream format without a footer
+        source.seek(0)
+        table = ipc.open_stream(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return _to_pandas(table)
+
+
+def to_filters(predicate: Predicate) -> typing.Optional[Filters]:
+    """
+    Converts a predicate to the filters of :func:`pyarrow.parquet.read_table`.
+
+    :param predicate: A predicate of :class:`pandas_visual_analysis.utils.predicate.Between` and
+        :class:`pandas_visual_analysis.utils.predicate.IsIn`, combined with ``&`` and ``|``.
+    :raises ValueError: if the predicate contains other predicates, e.g. a negation.
+    :return: The filters in disjunctive normal form, or None if the predicate is fulfilled by all rows.
+    """
+    conjunctions = _conjunctions(predicate)
+    if any(len(conjunction) == 0 for conjunction in conjunctions):
+        return None
+    return conjunctions
+
+
+def _conjunctions(predicate: Predicate) -> Filters:
+    if isinstance(predicate, Between):
+        conjunction = []
+        if predicate.lo is not None:
+            conjunction.append((predicate.column, ">=", predicate.lo))
+        if predicate.hi is not None:
+            conjunction.append((predicate.column, "<=", predicate.hi))
+        return [conjunction]
+    if isinstance(predicate, IsIn):
+        values = CategoryIndex._as_list(predicate.values)
+        return [[(predicate.column, "in", values)]]
+    if isinstance(predicate, Or):
+        return [c for p in predicate.predicates for c in _conjunctions(p)]
+    if isinstance(predicate, And):
+        # distributes the conjunction over the disjunctions of its parts
+        parts = [_conjunctions(p) for p in predicate.predicates]
+        return [
+            [condition for c in combination for condition in c]
+            for combination in itertools.product(*parts)
+        ]
+    raise ValueError(
+        "The predicate %r cannot be used to filter the rows while reading." % predicate
+    )
+
+
+def _to_pandas(table) -> DataFrame:
+    # split blocks avoid consolidating the columns into copies, so columns without missing values can stay views
+    # of the memory-mapped file
+    return table.to_pandas(split_blocks=True)
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Reading Parquet, Feather and Arrow files requires pyarrow, "
+            "which can be installed with: pip install pyarrow"
+        )
+    return pyarrow
@@ -0,0 +1,306 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+# the statistics of pandas.Series.describe for numerical columns
+_DESCRIBE_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+class Backend:
+    """
+    Computes the masks, gathered values, counts and statistics of the columns of a
+    :class:`pandas_visual_analysis.utils.column_store.ColumnStore`. This backend uses numpy and pandas, while
+    :class:`ArrowBackend` and :class:`PolarsBackend` use the multi-threaded kernels of pyarrow and polars.
+    All methods take and return numpy arrays and pandas objects, so a backend can override any subset of them.
+
+    The sorted and inverted indexes of the columns answer range and category queries without scanning the
+    columns, so backends are used for the scans of memory-mapped columns, for counting the rows of a selection
+    per bin or category, for gathering the selected values of a column and for describing them.
+    """
+
+    name = "pandas"
+
+    def range_mask(self, values: np.ndarray, lo=None, hi=None) -> np.ndarray:
+        """
+
+        :param values: The values, e.g. a chunk of a column. Times have to be datetime64 or timedelta64 values.
+        :param lo: The lower bound, comparable with the values. None if the range is not bounded below.
+        :param hi: The upper bound, comparable with the values. None if the range is not bounded above.
+        :return: Boolean mask of the values between lo and hi, both inclusive. Missing values never match.
+        """
+        # comparisons with NaN and NaT are False
+        mask = ~pd.isna(values) if lo is None else values >= lo
+        if hi is not None:
+            mask &= values <= hi
+        return mask
+
+    def isin_mask(self, codes: np.ndarray, selected: typing.List[int]) -> np.ndarray:
+        """
+
+        :param codes: The category codes of the rows.
+        :param selected: The codes to match.
+        :return: Boolean mask of the rows with one of the selected codes.
+        """
+        return np.isin(codes, selected)
+
+    def count(
+        self,
+        codes: np.ndarray,
+        length: int,
+        positions: typing.Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Counts the rows per code like :func:`numpy.bincount`, e.g. per category or per bin of a histogram.
+
+        :param codes: The codes of the rows, negative for missing values.
+        :param length: The number of codes.
+        :param positions: Only the rows at these positions are counted. Defaults to all rows.
+        :return: The number of rows of every code from 0 to length - 1.
+        """
+        if positions is not None:
+            codes = codes[positions]
+        return np.bincount(codes[codes >= 0], minlength=length)
+
+    def take(self, values, positions: np.ndarray) -> typing.Any:
+        """
+
+        :param values: A numpy array or a pandas extension array.
+        :param positions: The positions of the values to gather.
+        :return: The values at the positions, of the same type as the values.
+        """
+        return values[positions]
+
+    def describe(
+        self, series: pd.Series, positions: typing.Optional[np.ndarray] = None
+    ) -> pd.Series:
+        """
+        Computes the statistics of :meth:`pandas.Series.describe`.
+
+        :param series: The column.
+        :param positions: Only the rows at these positions are described. Defaults to all rows.
+        :return: The statistics indexed by their names.
+        """
+        if positions is not None:
+            series = series.iloc[positions]
+        return series.describe()
+
+    @staticmethod
+    def _is_numpy(values, kinds: str) -> bool:
+        return isinstance(values, np.ndarray) and values.dtype.kind in kinds
+
+    @staticmethod
+    def _describe_result(name, count: int, statistics: typing.List) -> pd.Series:
+        if count == 0:
+            statistics = [np.nan] * 7
+        statistics = [np.nan if value is None else value for value in statistics]
+        return pd.Series(
+            [float(count)] + [float(value) for value in statistics],
+            index=_DESCRIBE_INDEX,
+            name=name,
+        )
+
+
+class ArrowBackend(Backend):
+    """
+    Computes the masks, counts and statistics with :mod:`pyarrow.compute`. Numerical and time based numpy arrays
+    are wrapped without copying their values. Other types, e.g. category columns, are processed by
+    :class:`Backend`. Requires pyarrow.
+    """
+
+    name = "pyarrow"
+
+    def __init__(self):
+        try:
+            import pyarrow
+            import pyarrow.compute
+        except ImportError:
+            raise ImportError(
+                "The pyarrow backend requires pyarrow, which can be installed with: pip install pyarrow"
+            )
+        self.pa = pyarrow
+        self.pc = pyarrow.compute
+
+    def range_mask(self, values: np.ndarray, lo=None, hi=None) -> np.ndarray:
+        if not Backend._is_numpy(values, "iufmM"):
+            return super().range_mask(values, lo, hi)
+        # NaN and NaT become nulls, which never match
+        array = self.pa.array(values, from_pandas=True)
+        mask = self.pc.is_valid(array)
+        if lo is not None:
+            mask = self.pc.and_(mask, self.pc.greater_equal(array, self.pa.scalar(lo)))
+        if hi is not None:
+            mask = self.pc.and_(mask, self.pc.less_equal(array, self.pa.scalar(hi)))
+        return self.pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+
+    def isin_mask(self, codes: np.ndarray, selected: typing.List[int]) -> np.ndarray:
+        array = self.pa.array(codes)
+        value_set = self.pa.array(selected, type=array.type)
+        return self.pc.is_in(array, value_set=value_set).to_numpy(zero_copy_only=False)
+
+    def count(
+        self,
+        codes: np.ndarray,
+        length: int,
+        positions: typing.Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        array = self.pa.array(codes)
+        if positions is not None:
+            array = array.take(self.pa.array(positions))
+        counts = self.pc.value_counts(array)
+        values = counts.field("values").to_numpy(zero_copy_only=False)
+        result = np.zeros(length, dtype=np.int64)
+        valid = values >= 0
+        result[values[valid]] = counts.field("counts").to_numpy(zero_copy_only=False)[
+            valid
+        ]
+        return result
+
+    def take(self, values, positions: np.ndarray) -> typing.Any:
+        if not Backend._is_numpy(values, "biufmM"):
+            return super().take(values, positions)
+        array = self.pa.array(values).take(self.pa.array(positions))
+        return array.to_numpy(zero_copy_only=False).astype(values.dtype, copy=False)
+
+    def describe(
+        self, series: pd.Series, positions: typing.Optional[np.ndarray] = None
+    ) -> pd.Series:
+        values = series.values
+        if not Backend._is_numpy(values, "iuf"):
+            return super().describe(series, positions)
+        array = self.pa.array(values, from_pandas=True)
+        if positions is not None:
+            array = array.take(self.pa.array(positions))
+        count = self.pc.count(array).as_py()
+        if count == 0:
+            return Backend._describe_result(series.name, 0, [])
+        min_max = self.pc.min_max(array)
+        quartiles = self.pc.quantile(
+            array, q=[0.25, 0.5, 0.75], interpolation="linear"
+        ).to_pylist()
+        return Backend._describe_result(
+            series.name,
+            count,
+            [
+                self.pc.mean(array).as_py(),
+                self.pc.stddev(array, ddof=1).as_py() if count > 1 else None,
+                min_max["min"].as_py(),
+                *quartiles,
+                min_max["max"].as_py(),
+            ],
+        )
+
+
+class PolarsBackend(Backend):
+    """
+    Computes the masks, counts and statistics with polars. Numerical and time based numpy arrays are converted to
+    polars series, which does not copy most numerical types. Other types, e.g. category columns, are processed by
+    :class:`Backend`. Requires polars.
+    """
+
+    name = "polars"
+
+    def __init__(self):
+        try:
+            import polars
+        except ImportError:
+            raise ImportError(
+                "The polars backend requires polars, which can be installed with: pip install polars"
+            )
+        self.pl = polars
+
+    def range_mask(self, values: np.ndarray, lo=None, hi=None) -> np.ndarray:
+        if not Backend._is_numpy(values, "iufmM"):
+            return super().range_mask(values, lo, hi)
+        if values.dtype.kind in "mM":
+            # compared as integers, where NaT is the smallest integer
+            missing = np.iinfo(np.int64).min
+            values = values.view(np.int64)
+            lo = None if lo is None else np.int64(lo.view(np.int64))
+            hi = None if hi is None else np.int64(hi.view(np.int64))
+            series = self.pl.Series(values)
+            mask = series != missing
+        else:
+            series = self.pl.Series(values, nan_to_null=True)
+            mask = series.is_not_null()
+        if lo is not None:
+            mask = mask & (series >= lo)
+        if hi is not None:
+            mask = mask & (series <= hi)
+        return mask.fill_null(False).to_numpy()
+
+    def isin_mask(self, codes: np.ndarray, selected: typing.List[int]) -> np.ndarray:
+        return self.pl.Series(codes).is_in(selected).to_numpy()
+
+    def count(
+        self,
+        codes: np.ndarray,
+        length: int,
+        positions: typing.Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        series = self.pl.Series(codes)
+        if positions is not None:
+            series = series.gather(positions)
+        counts = series.filter(series >= 0).value_counts()
+        result = np.zeros(length, dtype=np.int64)
+        result[counts[:, 0].to_numpy()] = counts[:, 1].to_numpy()
+        return result
+
+    def take(self, values, positions: np.ndarray) -> typing.Any:
+        if not Backend._is_numpy(values, "biuf"):
+            return super().take(values, positions)
+        return self.pl.Series(values).gather(positions).to_numpy()
+
+    def describe(
+        self, series: pd.Series, positions: typing.Optional[np.ndarray] = None
+    ) -> pd.Series:
+        values = series.values
+        if not Backend._is_numpy(values, "iuf"):
+            return super().describe(series, positions)
+        column = self.pl.Series(values, nan_to_null=True)
+        if positions is not None:
+            column = column.gather(positions)
+        column = column.drop_nulls()
+        count = len(column)
+        if count == 0:
+            return Backend._describe_result(series.name, 0, [])
+        quartiles = [
+            column.quantile(q, interpolation="linear") for q in [0.25, 0.5, 0.75]
+        ]
+        return Backend._describe_result(
+            series.name,
+            count,
+            [
+                column.mean(),
+                column.std(ddof=1) if count > 1 else None,
+                column.min(),
+                *quartiles,
+                column.max(),
+            ],
+        )
+
+
+def get_backend(backend: typing.Union[Backend, str, None]) -> Backend:
+    """
+
+    :param backend: A backend, the name of a backend, i.e. "pandas", "pyarrow" or "polars", or None for the
+        default backend using pandas.
+    :return: The backend.
+    """
+    if backend is None:
+        return Backend()
+    if isinstance(backend, Backend):
+        return backend
+    if isinstance(backend, str):
+        backends = {
+            Backend.name: Backend,
+            ArrowBackend.name: ArrowBackend,
+            PolarsBackend.name: PolarsBackend,
+        }
+        if backend not in backends:
+            raise ValueError(
+                "Unknown backend: %s. Supported backends are: pandas, pyarrow, polars."
+                % backend
+            )
+        return backends[backend]()
+    raise TypeError("The backend has to be a Backend, the name of a backend or None.")
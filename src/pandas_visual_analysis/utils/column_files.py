@@ -0,0 +1,217 @@
+import mmap
+import os
+import pickle
+import typing
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import (
+    is_categorical_dtype,
+    is_datetime64tz_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+# the description of the columns, stored next to one file of raw values per column
+_META_FILE = "columns.pkl"
+
+
+def write_columns(
+    directory: str, data: typing.Union[DataFrame, typing.Iterable[DataFrame]]
+) -> int:
+    """
+    Writes the columns of a DataFrame, or of a sequence of DataFrames with the same columns, to a directory with
+    one file of raw values per column, which can be memory-mapped with :func:`open_columns`. Since the DataFrames
+    are appended one after the other, data larger than the memory can be written in chunks, e.g. as read by
+    :func:`pandas.read_csv` with chunksize.
+
+    Columns of strings and category columns are stored as category codes, whose categories are collected from
+    all chunks. Datetimes with a time zone are stored as UTC times.
+
+    :param directory: The directory, which is created if it does not exist. Existing column files are replaced.
+    :param data: A DataFrame or an iterable of DataFrames with the same columns and types.
+    :raises TypeError: if a column has a type that cannot be stored as raw values, e.g. a nullable integer type.
+    :return: The number of written rows.
+    """
+    chunks = [data] if isinstance(data, DataFrame) else data
+    os.makedirs(directory, exist_ok=True)
+    columns: typing.Optional[typing.List[_ColumnFile]] = None
+    length = 0
+    for df in chunks:
+        if columns is None:
+            if not df.columns.is_unique:
+                raise ValueError("The names of the columns have to be unique.")
+            columns = [
+                _ColumnFile.create(directory, i, name, df[name])
+                for i, name in enumerate(df.columns)
+            ]
+        elif list(df.columns) != [column.name for column in columns]:
+            raise ValueError(
+                "All chunks have to have the same columns. Expected: %s, got: %s"
+                % (str([column.name for column in columns]), str(list(df.columns)))
+            )
+        for column in columns:
+            column.append(df[column.name])
+        length += len(df)
+    if columns is None:
+        raise ValueError("There is no data to write.")
+    for column in columns:
+        column.close(length)
+    with open(os.path.join(directory, _META_FILE), "wb") as f:
+        pickle.dump(
+            dict(length=length, columns=[column.meta for column in columns]),
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    return length
+
+
+def open_columns(directory: str) -> DataFrame:
+    """
+    Opens the columns written by :func:`write_columns` as a DataFrame whose columns are read-only
+    :class:`numpy.memmap` arrays. Opening reads no values, and the pages of a column are only read from the disk
+    when they are accessed, so the data can be larger than the memory. The operating system keeps recently
+    read pages in memory and drops them if the memory is needed.
+
+    Operations that copy the data, like sorting or consolidating the columns, e.g. with ``df.values``, load the
+    columns into memory. A :class:`pandas_visual_analysis.data_source.DataSource` of the DataFrame computes its
+    indexes, histograms and statistics chunk by chunk instead.
+
+    :param directory: The directory of the column files.
+    :return: The DataFrame of the memory-mapped columns.
+    """
+    with open(os.path.join(directory, _META_FILE), "rb") as f:
+        meta = pickle.load(f)
+    length = meta["length"]
+    columns = []
+    for column in meta["columns"]:
+        dtype = np.dtype(column["dtype"])
+        if length == 0:  # empty files cannot be mapped
+            values = np.empty(0, dtype=dtype)
+        else:
+            values = np.memmap(
+                os.path.join(directory, column["file"]),
+                dtype=dtype,
+                mode="r",
+                shape=(length,),
+            )
+        if column["categories"] is not None:
+            values = pd.Categorical.from_codes(values, categories=column["categories"])
+        elif column["tz"] is not None:
+            values = pd.arrays.DatetimeArray(
+                values, dtype=pd.DatetimeTZDtype(tz=column["tz"]), copy=False
+            )
+        columns.append(pd.Series(values, name=column["name"], copy=False))
+    if len(columns) == 0:
+        return DataFrame(index=pd.RangeIndex(length))
+    # concatenated without copying, since the constructor of DataFrame would consolidate the columns into a copy
+    return pd.concat(columns, axis=1, copy=False)
+
+
+def is_memory_mapped(series: pd.Series) -> bool:
+    """
+
+    :param series: A column.
+    :return: True iff the values of the column are a view of a memory-mapped file, e.g. opened by
+        :func:`open_columns`.
+    """
+    if is_categorical_dtype(series.dtype):
+        values = series.cat.codes.values
+    else:
+        values = series.values
+    # copies of a memmap are memmap objects as well, only views lead to the mapped file
+    while isinstance(values, np.ndarray):
+        values = values.base
+    return isinstance(values, mmap.mmap)
+
+
+class _ColumnFile:
+    """
+    The file of a column while it is written.
+    """
+
+    def __init__(self, path: str, name, meta: dict):
+        self.path = path
+        self.name = name
+        self.meta = meta
+        self.dtype = np.dtype(meta["dtype"])
+        # the categories of a string or category column, extended by every chunk
+        self.categories: typing.Optional[pd.Index] = None
+        if meta["categories"] is not None:
+            self.categories = pd.Index([])
+        self.file = open(path, "wb")
+
+    @staticmethod
+    def create(directory: str, i: int, name, series: pd.Series) -> "_ColumnFile":
+        dtype = series.dtype
+        meta = dict(name=name, file="%d.bin" % i, dtype=None, categories=None, tz=None)
+        if (
+            is_categorical_dtype(dtype)
+            or is_object_dtype(dtype)
+            or is_string_dtype(dtype)
+        ):
+            meta["dtype"] = "int32"
+            meta["categories"] = []
+        elif is_datetime64tz_dtype(dtype):
+            meta["dtype"] = "datetime64[ns]"
+            meta["tz"] = dtype.tz
+        elif isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+            meta["dtype"] = dtype.str
+        else:
+            raise TypeError(
+                "Columns of type %s cannot be stored as raw values. Invalid column: %s"
+                % (str(dtype), str(name))
+            )
+        return _ColumnFile(os.path.join(directory, meta["file"]), name, meta)
+
+    def append(self, series: pd.Series):
+        if self.categories is not None:
+            if is_categorical_dtype(series.dtype):
+                values = series.astype(object)
+                new = series.cat.categories
+            else:
+                values = series
+                new = pd.Index(pd.unique(series.dropna()), dtype=object)
+            new = new.difference(self.categories, sort=False)
+            if len(self.categories) == 0:
+                self.categories = new
+            elif len(new) > 0:
+                self.categories = self.categories.append(new)
+            values = self.categories.get_indexer(values)
+        elif self.meta["tz"] is not None:
+            if not is_datetime64tz_dtype(series.dtype):
+                self._raise_type(series)
+            values = series.dt.tz_convert("UTC").dt.tz_localize(None).values
+        else:
+            values = series.values
+            if not isinstance(values, np.ndarray) or not np.can_cast(
+                values.dtype, self.dtype
+            ):
+                self._raise_type(series)
+        np.ascontiguousarray(values, dtype=self.dtype).tofile(self.file)
+
+    def close(self, length: int):
+        self.file.close()
+        if self.categories is None:
+            return
+        self.meta["categories"] = self.categories
+        # the codes are stored with the smallest type pandas uses for the number of categories, so that they
+        # are not copied when the column is opened
+        dtype = pd.Categorical.from_codes([], categories=self.categories).codes.dtype
+        if dtype != self.dtype and length > 0:
+            codes = np.memmap(self.path, dtype=self.dtype, mode="r", shape=(length,))
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "wb") as f:
+                for start in range(0, length, 2 ** 20):
+                    codes[start : start + 2 ** 20].astype(dtype).tofile(f)
+            del codes
+            os.replace(temp_path, self.path)
+        self.meta["dtype"] = np.dtype(dtype).str
+
+    def _raise_type(self, series: pd.Series):
+        self.file.close()
+        raise TypeError(
+            "All chunks have to have the same types. Expected %s for column %s, got: %s"
+            % (str(self.dtype), str(self.name), str(series.dtype))
+        )
@@ -0,0 +1,369 @@
+import typing
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_categorical_dtype,
+    is_datetime64_any_dtype,
+    is_datetime64tz_dtype,
+    is_timedelta64_dtype,
+)
+
+from pandas_visual_analysis.utils.backend import Backend
+from pandas_visual_analysis.utils.selection import Selection
+
+
+class SortedIndex:
+    """
+    Index of a numerical or time based column that stores the row positions sorted by their values.
+    Rows with values in a range are found with a binary search in O(log n + k) for k matching rows,
+    instead of comparing every value of the column. Missing values never match a range.
+    """
+
+    def __init__(self, series: pd.Series):
+        """
+
+        :param series: The column to build the index for.
+        """
+        self.dtype = series.dtype
+        self.tz = series.dt.tz if is_datetime64tz_dtype(series.dtype) else None
+        values = SortedIndex._comparable_values(series)
+        self.len = len(values)
+        # missing values are sorted to the end
+        self.order: np.ndarray = np.argsort(values, kind="mergesort")
+        self.sorted_values: np.ndarray = values[self.order]
+        self.num_valid = self.len - int(series.isna().sum())
+
+    def range_positions(self, lo=None, hi=None) -> np.ndarray:
+        """
+        Finds all rows with values between lo and hi, both inclusive.
+
+        :param lo: The lower bound of the range. None if the range is not bounded below.
+        :param hi: The upper bound of the range. None if the range is not bounded above.
+        :return: The positions of the matching rows in ascending order of their values.
+        """
+        valid = self.sorted_values[: self.num_valid]
+        start = 0 if lo is None else np.searchsorted(valid, self._bound(lo), "left")
+        end = (
+            self.num_valid
+            if hi is None
+            else np.searchsorted(valid, self._bound(hi), "right")
+        )
+        return self.order[start:end]
+
+    def range_selection(self, lo=None, hi=None) -> Selection:
+        """
+        Finds all rows with values between lo and hi, both inclusive.
+
+        :param lo: The lower bound of the range. None if the range is not bounded below.
+        :param hi: The upper bound of the range. None if the range is not bounded above.
+        :return: The selection of matching rows.
+        """
+        return Selection.from_indices(self.range_positions(lo, hi), self.len)
+
+    def range_count(self, lo=None, hi=None) -> int:
+        """
+
+        :param lo: The lower bound of the range. None if the range is not bounded below.
+        :param hi: The upper bound of the range. None if the range is not bounded above.
+        :return: The number of rows with values between lo and hi, both inclusive.
+        """
+        return len(self.range_positions(lo, hi))
+
+    @property
+    def min(self):
+        """
+
+        :return: The smallest value of the column or None if all values are missing.
+        """
+        return self.sorted_values[0] if self.num_valid > 0 else None
+
+    @property
+    def max(self):
+        """
+
+        :return: The largest value of the column or None if all values are missing.
+        """
+        return self.sorted_values[self.num_valid - 1] if self.num_valid > 0 else None
+
+    def _bound(self, value):
+        """
+        Converts a bound of a range to a value that can be compared with the sorted values.
+
+        :param value: The bound, e.g. a number, string or timestamp.
+        :return: The comparable value.
+        """
+        if is_datetime64_any_dtype(self.dtype):
+            timestamp = pd.Timestamp(value)
+            if self.tz is not None:
+                if timestamp.tz is None:
+                    timestamp = timestamp.tz_localize(self.tz)
+                timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+            elif timestamp.tz is not None:
+                timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+            return timestamp.to_datetime64()
+        if is_timedelta64_dtype(self.dtype):
+            return pd.Timedelta(value).to_timedelta64()
+        return value
+
+    @staticmethod
+    def _comparable_values(series: pd.Series) -> np.ndarray:
+        if is_datetime64_any_dtype(series.dtype):
+            if is_datetime64tz_dtype(series.dtype):
+                series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+            return series.to_numpy(dtype="datetime64[ns]")
+        if is_timedelta64_dtype(series.dtype):
+            return series.to_numpy(dtype="timedelta64[ns]")
+        if not isinstance(series.dtype, np.dtype):  # nullable extension types
+            return series.to_numpy(dtype="float64", na_value=np.nan)
+        return series.to_numpy()
+
+
+class CategoryIndex:
+    """
+    Inverted index of a categorical column that maps every category to the sorted positions of its rows.
+    It is built once from the category codes of the column, so the rows of a set of categories are found without
+    scanning the column and the number of rows per category is known without counting them again.
+    Missing values do not belong to any category.
+    """
+
+    def __init__(self, series: pd.Series):
+        """
+
+        :param series: The column to build the index for.
+        """
+        if is_categorical_dtype(series.dtype):
+            codes = series.cat.codes.to_numpy()
+            categories = series.cat.categories
+        else:
+            codes, categories = pd.factorize(series)
+        self.categories: pd.Index = pd.Index(categories)
+        self.len = len(codes)
+        self.codes: np.ndarray = codes.astype(np.intp)
+        valid = self.codes >= 0
+        self.counts: np.ndarray = np.bincount(
+            self.codes[valid], minlength=len(self.categories)
+        )
+        # the stable sort keeps the positions of each category in ascending order, missing values come first
+        self.order: np.ndarray = np.argsort(self.codes, kind="mergesort")
+        self.offsets: np.ndarray = np.concatenate(([0], np.cumsum(self.counts))) + (
+            self.len - int(np.count_nonzero(valid))
+        )
+
+    def positions(self, value) -> np.ndarray:
+        """
+
+        :param value: A category of the column.
+        :return: The sorted positions of all rows with this category. Empty if the value is not a category.
+        """
+        code = self._code(value)
+        if code is None:
+            return self.order[:0]
+        return self.order[self.offsets[code] : self.offsets[code + 1]]
+
+    def selection(self, values) -> Selection:
+        """
+
+        :param values: A category or an iterable of categories of the column.
+        :return: Selection of all rows with one of the categories. Values that are not categories are ignored.
+        """
+        parts = [self.positions(value) for value in CategoryIndex._as_list(values)]
+        return Selection.from_indices(
+            np.concatenate(parts) if parts else self.order[:0], self.len
+        )
+
+    def count(self, values) -> int:
+        """
+
+        :param values: A category or an iterable of categories of the column.
+        :return: The number of rows with one of the categories.
+        """
+        codes = [self._code(value) for value in CategoryIndex._as_list(values)]
+        return int(sum(self.counts[code] for code in codes if code is not None))
+
+    def value_counts(self, selection: typing.Optional[Selection] = None) -> pd.Series:
+        """
+        Counts the rows per category like :meth:`pandas.Series.value_counts`, but in the order of the categories
+        and including categories without rows.
+
+        :param selection: Only rows in this selection are counted. If None, all rows are counted.
+        :return: The number of rows per category, indexed by the categories.
+        """
+        if selection is None or selection.count == self.len:
+            counts = self.counts
+        else:
+            codes = self.codes[selection.positions]
+            counts = np.bincount(codes[codes >= 0], minlength=len(self.categories))
+        return pd.Series(counts, index=self.categories)
+
+    def _code(self, value) -> typing.Optional[int]:
+        try:
+            code = self.categories.get_loc(value)
+        except (KeyError, TypeError):
+            return None
+        return code if isinstance(code, (int, np.integer)) else None
+
+    @staticmethod
+    def _as_list(values) -> list:
+        if isinstance(values, (str, bytes)) or not isinstance(values, typing.Iterable):
+            return [values]
+        return list(values)
+
+
+class RangeScan(SortedIndex):
+    """
+    Answers the range queries of a :class:`SortedIndex` for a memory-mapped column by comparing the values
+    chunk by chunk instead of sorting them, so that no memory proportional to the column is allocated except for
+    the resulting selection. Each query reads the whole column.
+    """
+
+    def __init__(
+        self,
+        series: pd.Series,
+        chunk_rows: int = 2 ** 20,
+        backend: typing.Optional[Backend] = None,
+    ):
+        """
+
+        :param series: The column to scan.
+        :param chunk_rows: The number of values compared at once.
+        :param backend: The backend comparing the values. Defaults to numpy.
+        """
+        self.backend = backend if backend is not None else Backend()
+        self.dtype = series.dtype
+        self.tz = series.dt.tz if is_datetime64tz_dtype(series.dtype) else None
+        self.len = len(series)
+        self.series = series
+        self.chunk_rows = chunk_rows
+        self._min = None
+        self._max = None
+        self.num_valid = 0
+        for values in self._chunks():
+            values = values[~pd.isna(values)]
+            if len(values) == 0:
+                continue
+            self.num_valid += len(values)
+            lo, hi = values.min(), values.max()
+            self._min = lo if self._min is None else min(self._min, lo)
+            self._max = hi if self._max is None else max(self._max, hi)
+
+    def range_positions(self, lo=None, hi=None) -> np.ndarray:
+        """
+        Finds all rows with values between lo and hi, both inclusive.
+
+        :param lo: The lower bound of the range. None if the range is not bounded below.
+        :param hi: The upper bound of the range. None if the range is not bounded above.
+        :return: The positions of the matching rows in ascending order.
+        """
+        return np.flatnonzero(self._range_mask(lo, hi))
+
+    def range_selection(self, lo=None, hi=None) -> Selection:
+        return Selection.from_mask(self._range_mask(lo, hi))
+
+    def range_count(self, lo=None, hi=None) -> int:
+        return int(np.count_nonzero(self._range_mask(lo, hi)))
+
+    @property
+    def min(self):
+        return self._min
+
+    @property
+    def max(self):
+        return self._max
+
+    def _range_mask(self, lo, hi) -> np.ndarray:
+        mask = np.empty(self.len, dtype=bool)
+        lo = None if lo is None else self._bound(lo)
+        hi = None if hi is None else self._bound(hi)
+        start = 0
+        for values in self._chunks():
+            end = start + len(values)
+            mask[start:end] = self.backend.range_mask(values, lo, hi)
+            start = end
+        return mask
+
+    def _chunks(self) -> typing.Iterator[np.ndarray]:
+        for start in range(0, self.len, self.chunk_rows):
+            yield SortedIndex._comparable_values(
+                self.series.iloc[start : start + self.chunk_rows]
+            )
+
+
+class CategoryScan(CategoryIndex):
+    """
+    Answers the queries of a :class:`CategoryIndex` for a memory-mapped column by scanning its category codes
+    chunk by chunk instead of storing the positions of every category. Only the number of rows per category is
+    kept, so counting all rows is free, while finding the rows of categories reads the whole column.
+    """
+
+    def __init__(
+        self,
+        series: pd.Series,
+        chunk_rows: int = 2 ** 20,
+        backend: typing.Optional[Backend] = None,
+    ):
+        """
+
+        :param series: The column to scan.
+        :param chunk_rows: The number of values read at once.
+        :param backend: The backend matching and counting the codes. Defaults to numpy.
+        """
+        self.backend = backend if backend is not None else Backend()
+        self.series = series
+        self.len = len(series)
+        self.chunk_rows = chunk_rows
+        if is_categorical_dtype(series.dtype):
+            self.categories: pd.Index = pd.Index(series.cat.categories)
+        else:
+            # in the order of their first occurrence like pandas.factorize
+            categories = pd.Index([])
+            for start in range(0, self.len, chunk_rows):
+                chunk = series.iloc[start : start + chunk_rows]
+                new = pd.Index(pd.unique(chunk.dropna()))
+                new = new.difference(categories, sort=False)
+                categories = new if len(categories) == 0 else categories.append(new)
+            self.categories = categories
+        self.counts: np.ndarray = np.zeros(len(self.categories), dtype=np.int64)
+        for _, codes in self._chunks():
+            self.counts += self.backend.count(codes, len(self.categories))
+
+    def positions(self, value) -> np.ndarray:
+        code = self._code(value)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(
+            [start + np.flatnonzero(codes == code) for start, codes in self._chunks()]
+            + [np.empty(0, dtype=np.intp)]
+        )
+
+    def selection(self, values) -> Selection:
+        codes = [self._code(value) for value in CategoryIndex._as_list(values)]
+        codes = [code for code in codes if code is not None]
+        if len(codes) == 0:
+            return Selection.empty(self.len)
+        mask = np.empty(self.len, dtype=bool)
+        for start, chunk in self._chunks():
+            mask[start : start + len(chunk)] = self.backend.isin_mask(chunk, codes)
+        return Selection.from_mask(mask)
+
+    def value_counts(self, selection: typing.Optional[Selection] = None) -> pd.Series:
+        if selection is None or selection.count == self.len:
+            counts = self.counts
+        elif selection.is_sparse:
+            codes = self._codes(self.series.iloc[selection.positions])
+            counts = self.backend.count(codes, len(self.categories))
+        else:
+            counts = np.zeros(len(self.categories), dtype=np.int64)
+            for start, codes in self._chunks():
+                codes = codes[selection.mask[start : start + len(codes)]]
+                counts += self.backend.count(codes, len(self.categories))
+        return pd.Series(counts, index=self.categories)
+
+    def _chunks(self) -> typing.Iterator[typing.Tuple[int, np.ndarray]]:
+        for start in range(0, self.len, self.chunk_rows):
+            yield start, self._codes(self.series.iloc[start : start + self.chunk_rows])
+
+    def _codes(self, series: pd.Series) -> np.ndarray:
+        if is_categorical_dtype(series.dtype):
+            return series.cat.codes.to_numpy().astype(np.intp)
+        return self.categories.get_indexer(series)
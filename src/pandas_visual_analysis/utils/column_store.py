@@ -1,4 +1,30 @@
-from typing import List
+import copy
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_categorical_dtype,
+    is_datetime64_any_dtype,
+    is_datetime64tz_dtype,
+    is_timedelta64_dtype,
+)
+
+from pandas_visual_analysis.utils.backend import Backend
+from pandas_visual_analysis.utils.column_files import is_memory_mapped
+from pandas_visual_analysis.utils.column_index import (
+    CategoryIndex,
+    CategoryScan,
+    RangeScan,
+    SortedIndex,
+)
+from pandas_visual_analysis.utils.disk_cache import DiskCache, fingerprint
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.sql_source import LazyFrame
+from pandas_visual_analysis.utils.util import set_read_only
+
+# the number of bins of the histogram the quartiles of memory-mapped columns are estimated from
+_QUANTILE_BINS = 2 ** 12
 
 
 class ColumnIterator:
@@ -33,11 +59,34 @@ class ColumnStore:
     Determines the different column types from a DataFrame and provides access to the columns.
     With the various 'next' methods, the column names can be iterated with the call returning a different element
     each time until the end is reached and the first column name is returned again.
+    The indexes, profiles and bins of the columns are computed on first access. With a :class:`DiskCache`, they are
+    loaded from the cache if a column with the same contents was seen before, until rows are appended.
+
+    Memory-mapped columns, e.g. opened with :func:`pandas_visual_analysis.utils.column_files.open_columns`, are
+    never loaded into memory as a whole. Their indexes scan the column instead of sorting it, and their
+    histograms and statistics are computed chunk by chunk.
+
+    The scans, counts and statistics are computed by a :class:`pandas_visual_analysis.utils.backend.Backend`,
+    which uses pandas by default.
     """
 
-    def __init__(self, df, columns, categorical_columns):
+    # the number of rows of a memory-mapped column processed at once
+    chunk_rows = 2 ** 20
+
+    def __init__(
+        self,
+        df,
+        columns,
+        categorical_columns,
+        cache: Optional[DiskCache] = None,
+        backend: Optional[Backend] = None,
+    ):
         self._df = df
         self.columns = columns
+        self.cache = cache
+        self.backend = backend if backend is not None else Backend()
+        # the types of lazily loaded columns are known without loading them
+        typed = df.table.prototype if isinstance(df, LazyFrame) else df
         if isinstance(categorical_columns, list):
             if not set(categorical_columns).issubset(set(self.columns)):
                 raise ValueError(
@@ -46,7 +95,7 @@ class ColumnStore:
                 )
             self.categorical_columns = categorical_columns
             diff = set(
-                self._df.select_dtypes(
+                typed.select_dtypes(
                     exclude=["number", "datetime", "timedelta", "datetimetz"]
                 ).columns.values
             ).difference(set(self.categorical_columns))
@@ -57,7 +106,7 @@ class ColumnStore:
                     % str(list(diff))
                 )
             time_cols = list(
-                self._df.select_dtypes(
+                typed.select_dtypes(
                     include=["datetime", "timedelta", "datetimetz"]
                 ).columns.values
             )
@@ -71,17 +120,17 @@ class ColumnStore:
             )
         elif categorical_columns is None:
             self.categorical_columns = list(
-                self._df.select_dtypes(
+                typed.select_dtypes(
                     exclude=["number", "datetime", "timedelta", "datetimetz"]
                 ).columns.values
             )
             self.time_columns = list(
-                self._df.select_dtypes(
+                typed.select_dtypes(
                     include=["datetime", "timedelta", "datetimetz"]
                 ).columns.values
             )
             self.numerical_columns = list(
-                self._df.select_dtypes(include=["number"]).columns.values
+                typed.select_dtypes(include=["number"]).columns.values
             )
         else:
             raise TypeError(
@@ -89,6 +138,52 @@ class ColumnStore:
                 "with None."
             )
 
+        self._create_iterators()
+
+        self._sorted_indexes: Dict[str, SortedIndex] = {}
+        self._category_indexes: Dict[str, CategoryIndex] = {}
+        self._profiles: Dict[str, pd.Series] = {}
+        self._summaries: Dict[str, pd.Series] = {}
+        self._bins: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = {}
+        self._fingerprints: Dict[str, Optional[str]] = {}
+        # whether the data and the indexes are shared and therefore read-only
+        self.read_only = False
+
+    def view(self) -> "ColumnStore":
+        """
+        Creates a ColumnStore sharing the data and the indexes of the columns with this one, but with its own
+        column iterators. Indexes built by either of them are available to both, while appending rows to one of
+        them does not change the other, since the data is replaced instead of modified.
+        Both stores become :meth:`read_only`.
+
+        :return: The new ColumnStore.
+        """
+        self.set_read_only()
+        store = copy.copy(self)
+        store._create_iterators()
+        return store
+
+    def set_read_only(self):
+        """
+        Makes the arrays of the data, the indexes, profiles and bins read-only, including those built later,
+        so that they can be shared safely. Rows can still be appended, which replaces the data with a private copy.
+
+        :return: None
+        """
+        self.read_only = True
+        if isinstance(self._df, pd.DataFrame):
+            set_read_only(self._df)
+        for artifacts in (
+            self._sorted_indexes,
+            self._category_indexes,
+            self._profiles,
+            self._summaries,
+            self._bins,
+        ):
+            for artifact in artifacts.values():
+                set_read_only(artifact)
+
+    def _create_iterators(self):
         self.numerical_iterator = ColumnIterator(self.numerical_columns)
         self.categorical_iterator = ColumnIterator(self.categorical_columns)
         self.time_iterator = ColumnIterator(self.time_columns)
@@ -103,6 +198,496 @@ class ColumnStore:
             self.time_columns + self.numerical_columns + self.categorical_columns
         )
 
+    def sorted_index(self, column: str) -> SortedIndex:
+        """
+        Returns the index of a numerical or time based column, which is built on first access and cached afterwards.
+
+        :param column: Name of the column.
+        :return: The sorted index of the column.
+        """
+        index = self._sorted_indexes.get(column)
+        if index is None:
+            if column not in self.numerical_columns and column not in self.time_columns:
+                raise ValueError(
+                    "Sorted indexes can only be built for numerical or time based columns. Invalid column: %s"
+                    % str(column)
+                )
+            if self.is_mapped(column):
+                index = RangeScan(self._df[column], self.chunk_rows, self.backend)
+            else:
+                index = self._cached(
+                    "sorted_index", column, lambda: SortedIndex(self._df[column])
+                )
+            self._shared(index)
+            self._sorted_indexes[column] = index
+        return index
+
+    def category_index(self, column: str) -> CategoryIndex:
+        """
+        Returns the inverted index of a categorical column, which is built on first access and cached afterwards.
+
+        :param column: Name of the column.
+        :return: The category index of the column.
+        """
+        index = self._category_indexes.get(column)
+        if index is None:
+            if column not in self.categorical_columns:
+                raise ValueError(
+                    "Category indexes can only be built for categorical columns. Invalid column: %s"
+                    % str(column)
+                )
+            if self.is_mapped(column):
+                index = CategoryScan(self._df[column], self.chunk_rows, self.backend)
+            else:
+                index = self._cached(
+                    "category_index", column, lambda: CategoryIndex(self._df[column])
+                )
+            self._shared(index)
+            self._category_indexes[column] = index
+        return index
+
+    def profile(self, column: str, selection: Optional[Selection] = None) -> pd.Series:
+        """
+        Returns the summary statistics of a column like :meth:`pandas.Series.describe`, e.g. the mean, quartiles,
+        minimum and maximum of a numerical column, which are computed on first access and cached afterwards.
+        For a memory-mapped numerical column, they are computed chunk by chunk and the quartiles are estimated
+        from a histogram of 4096 bins.
+
+        :param column: Name of the column.
+        :param selection: Only the rows of this selection are described, which is not cached. Defaults to all rows.
+        :return: The statistics indexed by their names.
+        """
+        if column not in self.columns:
+            raise ValueError("Invalid column: %s" % str(column))
+        if selection is not None and selection.count != selection.len:
+            if self.is_mapped(column) and column in self.numerical_columns:
+                return self._scanned_profile(column, selection)
+            return self.backend.describe(self._df[column], selection.positions)
+        profile = self._profiles.get(column)
+        if profile is None:
+            if self.is_mapped(column) and column in self.numerical_columns:
+                profile = self._scanned_profile(column)
+            else:
+                profile = self._cached(
+                    "profile", column, lambda: self.backend.describe(self._df[column])
+                )
+            self._shared(profile)
+            self._profiles[column] = profile
+        return profile
+
+    def summary(self, column: str) -> pd.Series:
+        """
+        Returns the number of values, the minimum and the maximum of a numerical or time based column, which are
+        computed on first access and cached afterwards. For a :class:`LazyFrame`, they are computed by the
+        database if the column is not loaded.
+
+        :param column: Name of the column.
+        :return: The count, min and max of the column.
+        """
+        summary = self._summaries.get(column)
+        if summary is None:
+            if column not in self.numerical_columns and column not in self.time_columns:
+                raise ValueError(
+                    "Summaries can only be computed for numerical or time based columns. Invalid column: %s"
+                    % str(column)
+                )
+            if isinstance(self._df, LazyFrame) and (
+                column not in self._df.loaded_columns
+            ):
+                summary = self._df.table.summary(column)
+            elif self.is_mapped(column):
+                chunks = list(self._chunks(self._df[column]))
+                summary = pd.Series(
+                    [
+                        sum(chunk.count() for chunk in chunks),
+                        pd.Series([chunk.min() for chunk in chunks]).min(),
+                        pd.Series([chunk.max() for chunk in chunks]).max(),
+                    ],
+                    index=["count", "min", "max"],
+                    name=column,
+                )
+            else:
+                series = self._df[column]
+                summary = pd.Series(
+                    [series.count(), series.min(), series.max()],
+                    index=["count", "min", "max"],
+                    name=column,
+                )
+            self._shared(summary)
+            self._summaries[column] = summary
+        return summary
+
+    def bins(self, column: str, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Divides the range of a numerical or time based column into bins of equal width like
+        :func:`numpy.histogram_bin_edges` and assigns every row to its bin, which is computed on first access and
+        cached afterwards. The rows of a selection are then counted per bin with :func:`numpy.bincount`.
+        Times are converted to nanoseconds, ignoring the time zone.
+
+        :param column: Name of the column.
+        :param bins: The number of bins.
+        :return: The edges of the bins and the bin of every row, which is -1 for missing values.
+        """
+        result = self._bins.get((column, bins))
+        if result is None:
+            if column not in self.numerical_columns and column not in self.time_columns:
+                raise ValueError(
+                    "Bins can only be computed for numerical or time based columns. Invalid column: %s"
+                    % str(column)
+                )
+            result = self._cached(
+                "bins%d" % bins,
+                column,
+                lambda: ColumnStore._assign_bins(self._df[column], bins),
+            )
+            self._shared(result)
+            self._bins[(column, bins)] = result
+        return result
+
+    def bin_counts(
+        self, column: str, bins: int, selection: Optional[Selection] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Counts the rows per bin of a numerical or time based column with the bins of :meth:`bins`.
+        The rows of a memory-mapped column are assigned to their bins chunk by chunk instead of storing the bin
+        of every row.
+
+        :param column: Name of the column.
+        :param bins: The number of bins.
+        :param selection: Only the rows of this selection are counted. Defaults to all rows.
+        :return: The edges of the bins and the number of rows per bin.
+        """
+        if not self.is_mapped(column):
+            edges, assignments = self.bins(column, bins)
+            positions = None if selection is None else selection.positions
+            return edges, self.backend.count(assignments, bins, positions)
+        summary = self.summary(column)
+        lo, hi = ColumnStore.as_numbers(pd.Series([summary["min"], summary["max"]]))
+        edges = (
+            np.histogram_bin_edges(np.array([lo, hi]), bins=bins)
+            if summary["count"] > 0
+            else np.linspace(0.0, 1.0, bins + 1)
+        )
+        counts = np.zeros(bins, dtype=np.int64)
+        for numbers in self._selected_numbers(column, selection):
+            counts += self.backend.count(
+                ColumnStore._bin_of(edges, numbers, bins), bins
+            )
+        return edges, counts
+
+    def value_counts(
+        self, column: str, selection: Optional[Selection] = None
+    ) -> pd.Series:
+        """
+        Counts the rows per category of a categorical column with its inverted index, see
+        :meth:`pandas_visual_analysis.utils.column_index.CategoryIndex.value_counts`.
+
+        :param column: Name of the column.
+        :param selection: Only rows in this selection are counted. Defaults to all rows.
+        :return: The number of rows per category, indexed by the categories.
+        """
+        index = self.category_index(column)
+        if (
+            isinstance(index, CategoryScan)
+            or selection is None
+            or selection.count == selection.len
+        ):
+            return index.value_counts(selection)
+        counts = self.backend.count(
+            index.codes, len(index.categories), selection.positions
+        )
+        return pd.Series(counts, index=index.categories)
+
+    def column(self, column: str) -> pd.Series:
+        """
+
+        :param column: Name of the column.
+        :return: The column, which is loaded first if the data is a :class:`LazyFrame` and it is not loaded yet.
+        """
+        return self._df[column]
+
+    def gather(self, column: str, selection: Selection) -> Any:
+        """
+        Gathers the values of the selected rows of a column in ascending row order.
+
+        :param column: Name of the column.
+        :param selection: The selected rows.
+        :return: A numpy array, or a pandas extension array for extension dtypes like `category`, containing the
+            selected values. If all rows are selected, the values of the column are returned without copying.
+        """
+        values = self._df[column].values
+        if selection.count != len(values):
+            values = self.backend.take(values, selection.positions)
+        return values
+
+    def is_mapped(self, column: str) -> bool:
+        """
+
+        :param column: Name of the column.
+        :return: True iff the column is memory-mapped, so that it is processed chunk by chunk.
+        """
+        if isinstance(self._df, LazyFrame):
+            return False
+        return is_memory_mapped(self._df[column])
+
+    def append(self, df_chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Appends rows to the stored DataFrame. The column types are kept and the indexes of the columns are
+        rebuilt on their next access. New values of category columns are added to their categories.
+        If the stored DataFrame has a RangeIndex, the appended rows continue it instead of keeping their labels.
+
+        :param df_chunk: DataFrame with the same columns as the stored DataFrame.
+        :return: The DataFrame including the appended rows.
+        """
+        df = self._df
+        if isinstance(df, LazyFrame):  # loads all columns in their order
+            df = df.to_frame()
+        if list(df_chunk.columns.values) != list(df.columns.values):
+            raise ValueError(
+                "Appended rows have to have the same columns as the data. Expected: %s, got: %s"
+                % (
+                    str(list(df.columns.values)),
+                    str(list(df_chunk.columns.values)),
+                )
+            )
+        df, df_chunk = ColumnStore._union_categories(df, df_chunk)
+        if isinstance(df.index, pd.RangeIndex):
+            start = df.index.start + len(df) * df.index.step
+            df_chunk = df_chunk.set_index(
+                pd.RangeIndex(
+                    start, start + len(df_chunk) * df.index.step, df.index.step
+                )
+            )
+        self.set_data(pd.concat([df, df_chunk]))
+        return self._df
+
+    @staticmethod
+    def _union_categories(
+        df: pd.DataFrame, df_chunk: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Converts the columns of the rows to append to the types of the category columns, whose categories are
+        extended by new values, so that concatenating both keeps the types.
+
+        :param df: The stored DataFrame.
+        :param df_chunk: The rows to append with the same columns.
+        :return: Both DataFrames with the same categories, without modifying the given ones.
+        """
+        categorical = [
+            column for column, dtype in df.dtypes.items() if is_categorical_dtype(dtype)
+        ]
+        if len(categorical) == 0:
+            return df, df_chunk
+        df, df_chunk = df.copy(deep=False), df_chunk.copy(deep=False)
+        for column in categorical:
+            dtype = df[column].dtype
+            values = df_chunk[column]
+            if is_categorical_dtype(values.dtype):
+                new = values.cat.categories
+            else:
+                new = pd.Index(values.dropna().unique())
+            new = new.difference(dtype.categories, sort=False)
+            if len(new) > 0:
+                dtype = pd.CategoricalDtype(
+                    dtype.categories.append(new), ordered=dtype.ordered
+                )
+                df[column] = df[column].cat.set_categories(dtype.categories)
+            df_chunk[column] = values.astype(dtype)
+        return df, df_chunk
+        df, df_chunk = df.copy(deep=False), df_chunk.copy(deep=False)
+        for i in categorical:
+            dtype = df.dtypes.iloc[i]
+            values = df_chunk.iloc[:, i]
+            if is_categorical_dtype(values.dtype):
+                new = values.cat.categories
+            else:
+                new = pd.Index(values.dropna().unique())
+            new = new.difference(dtype.categories, sort=False)
+            if len(new) > 0:
+                dtype = pd.CategoricalDtype(
+                    dtype.categories.append(new), ordered=dtype.ordered
+                )
+                df.isetitem(i, df.iloc[:, i].cat.set_categories(dtype.categories))
+            df_chunk.isetitem(i, values.astype(dtype))
+        return df, df_chunk
+
+    def set_data(self, df: pd.DataFrame):
+        """
+        Replaces the stored DataFrame with one with the same columns, e.g. after rows were added or removed.
+        The column types are kept and the indexes of the columns are rebuilt on their next access.
+
+        :param df: The new DataFrame.
+        :return: None
+        """
+        self._df = df
+        self._sorted_indexes = {}
+        self._category_indexes = {}
+        self._profiles = {}
+        self._summaries = {}
+        self._bins = {}
+        self._fingerprints = {}
+        # changed data is rarely opened again, so its artifacts are not cached on disk
+        self.cache = None
+        # the new data belongs to this store only
+        self.read_only = False
+
+    def _shared(self, artifact: Any):
+        """
+        Makes an artifact built for shared data read-only like the artifacts built before.
+        """
+        if self.read_only:
+            set_read_only(artifact)
+
+    def _cached(self, kind: str, column: str, build: Callable[[], Any]) -> Any:
+        """
+        Loads an artifact derived from a column from the disk cache or builds it and stores it in the cache.
+
+        :param kind: The kind of artifact.
+        :param column: Name of the column.
+        :param build: Computes the artifact.
+        :return: The artifact.
+        """
+        if self.cache is None:
+            return build()
+        if column not in self._fingerprints:
+            self._fingerprints[column] = fingerprint(self._df[column])
+        column_fingerprint = self._fingerprints[column]
+        if column_fingerprint is None:  # the values cannot be hashed
+            return build()
+        key = DiskCache.key(kind, column_fingerprint)
+        artifact = self.cache.get(key)
+        if artifact is None:
+            artifact = build()
+            self.cache.put(key, artifact)
+        return artifact
+
+    @staticmethod
+    def _assign_bins(series: pd.Series, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        numbers = ColumnStore.as_numbers(series)
+        valid = ~np.isnan(numbers)
+        edges = (
+            np.histogram_bin_edges(numbers[valid], bins=bins)
+            if valid.any()
+            else np.linspace(0.0, 1.0, bins + 1)
+        )
+        assignments = np.full(
+            len(numbers), -1, dtype=np.int16 if bins < 2 ** 15 else np.int32
+        )
+        # the last bin includes its right edge like in numpy.histogram
+        assignments[valid] = ColumnStore._bin_of(edges, numbers[valid], bins)
+        return edges, assignments
+
+    @staticmethod
+    def _bin_of(edges: np.ndarray, numbers: np.ndarray, bins: int) -> np.ndarray:
+        # the last bin includes its right edge like in numpy.histogram
+        return np.clip(np.searchsorted(edges, numbers, side="right") - 1, 0, bins - 1)
+
+    def _chunks(self, series: pd.Series) -> Iterator[pd.Series]:
+        for start in range(0, len(series), self.chunk_rows):
+            yield series.iloc[start : start + self.chunk_rows]
+
+    def _selected_numbers(
+        self, column: str, selection: Optional[Selection] = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Converts the values of the selected rows of a column to floats with :meth:`as_numbers` chunk by chunk.
+
+        :param column: Name of the column.
+        :param selection: The selected rows. Defaults to all rows.
+        :return: Iterator of the chunks of values without missing values.
+        """
+        series = self._df[column]
+        if selection is not None and selection.is_sparse:
+            positions = selection.positions
+            chunks = (
+                ColumnStore.as_numbers(
+                    series.iloc[positions[start : start + self.chunk_rows]]
+                )
+                for start in range(0, len(positions), self.chunk_rows)
+            )
+        else:
+            chunks = (ColumnStore.as_numbers(chunk) for chunk in self._chunks(series))
+            if selection is not None:
+                mask = selection.mask
+                chunks = (
+                    numbers[mask[start : start + len(numbers)]]
+                    for start, numbers in zip(
+                        range(0, len(series), self.chunk_rows), chunks
+                    )
+                )
+        for numbers in chunks:
+            yield numbers[~np.isnan(numbers)]
+
+    def _scanned_profile(
+        self, column: str, selection: Optional[Selection] = None
+    ) -> pd.Series:
+        """
+        Computes the statistics of :meth:`pandas.Series.describe` for a numerical column in two passes over its
+        chunks: the count, mean, variance, minimum and maximum are combined from the chunks in the first pass, and
+        the quartiles are interpolated from a histogram of the values in the second one.
+        """
+        count, mean, squares = 0, 0.0, 0.0
+        lo, hi = np.inf, -np.inf
+        for numbers in self._selected_numbers(column, selection):
+            if len(numbers) == 0:
+                continue
+            # combines the mean and the sum of squared differences of the chunk with the previous ones
+            chunk_mean = numbers.mean()
+            chunk_squares = float(np.sum((numbers - chunk_mean) ** 2))
+            delta = chunk_mean - mean
+            total = count + len(numbers)
+            mean += delta * len(numbers) / total
+            squares += chunk_squares + delta * delta * count * len(numbers) / total
+            count = total
+            lo, hi = min(lo, numbers.min()), max(hi, numbers.max())
+        quartiles = [np.nan] * 3
+        if count > 0:
+            edges = np.linspace(lo, hi, _QUANTILE_BINS + 1)
+            counts = np.zeros(_QUANTILE_BINS, dtype=np.int64)
+            for numbers in self._selected_numbers(column, selection):
+                counts += np.bincount(
+                    ColumnStore._bin_of(edges, numbers, _QUANTILE_BINS),
+                    minlength=_QUANTILE_BINS,
+                )
+            cumulative = np.cumsum(counts)
+            for i, q in enumerate([0.25, 0.5, 0.75]):
+                # the position of the quantile in the sorted values, as interpolated by pandas
+                rank = q * (count - 1)
+                b = int(np.searchsorted(cumulative, rank, side="right"))
+                fraction = (rank - (cumulative[b] - counts[b]) + 0.5) / counts[b]
+                value = edges[b] + fraction * (edges[b + 1] - edges[b])
+                quartiles[i] = float(np.clip(value, lo, hi))
+        return pd.Series(
+            [
+                float(count),
+                mean if count > 0 else np.nan,
+                np.sqrt(squares / (count - 1)) if count > 1 else np.nan,
+                lo if count > 0 else np.nan,
+                *quartiles,
+                hi if count > 0 else np.nan,
+            ],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            name=column,
+        )
+
+    @staticmethod
+    def as_numbers(values) -> np.ndarray:
+        """
+        Converts the values of a numerical or time based column to floats, e.g. to compute their histogram.
+        Times are converted to nanoseconds, ignoring the time zone.
+
+        :param values: The values.
+        :return: The values as float array, which is NaN for missing values.
+        """
+        series = pd.Series(values)
+        if is_datetime64tz_dtype(series):
+            series = series.dt.tz_localize(None)
+        if is_datetime64_any_dtype(series) or is_timedelta64_dtype(series):
+            numbers = series.values.astype(np.int64).astype(np.float64)
+            numbers[series.isna().values] = np.nan
+            return numbers
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
     def next_numerical(self) -> str:
         """
         Iterates over the numerical columns and only returns numerical column names.
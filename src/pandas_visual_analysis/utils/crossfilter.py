@@ -0,0 +1,166 @@
+import typing
+
+import numpy as np
+
+from pandas_visual_analysis.utils.selection import Selection
+
+
+class Crossfilter:
+    """
+    Incremental engine for crossfiltering, in the style of the crossfilter library.
+    Every dimension, e.g. a widget, owns a filter and a row is selected if it passes the filters of all dimensions.
+    For every row a bitset stores the dimensions whose filter the row fails, so changing the filter of one
+    dimension only updates the bits of the rows that enter or leave that filter, and the selection of all filters
+    is updated with the rows that enter or leave it. The rows passing all filters except the one of a dimension
+    are cached until the filter of another dimension changes.
+    A dimension only occupies one of the bits while its filter is active.
+    """
+
+    max_dimensions = 32
+
+    def __init__(self, length: int):
+        """
+
+        :param length: The number of rows that are filtered.
+        """
+        self.len = length
+        # bit d is set iff the row is filtered out by the dimension with bit d
+        self._filtered = np.zeros(length, dtype=np.uint32)
+        self._bits: typing.Dict[typing.Any, int] = {}
+        self._filters: typing.Dict[typing.Any, Selection] = {}
+        # the rows passing all filters
+        self._selection = Selection.full(length)
+        # the rows passing all filters except the one of a dimension
+        self._excluding: typing.Dict[typing.Any, Selection] = {}
+
+    def filter(
+        self, dimension, selection: Selection
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Replaces the filter of a dimension. A selection of all rows removes the filter.
+
+        :param dimension: The dimension owning the filter. Any hashable object, e.g. a widget.
+        :param selection: The rows passing the new filter.
+        :raises ValueError: if a new filter would exceed :attr:`max_dimensions` active filters.
+        :return: The positions of rows added to and removed from the selection of all filters.
+        """
+        if selection.len != self.len:
+            raise ValueError(
+                "The selection has length %d, but %d was expected."
+                % (selection.len, self.len)
+            )
+        entered, left = Crossfilter._changes(self._filters.get(dimension), selection)
+
+        full = selection.count == self.len
+        if dimension not in self._bits:
+            if full:
+                return entered[:0], left[:0]
+            if len(self._bits) >= self.max_dimensions:
+                raise ValueError(
+                    "At most %d filters can be active at the same time."
+                    % self.max_dimensions
+                )
+            free = set(range(self.max_dimensions)).difference(self._bits.values())
+            self._bits[dimension] = min(free)
+        bit = np.uint32(1 << self._bits[dimension])
+
+        removed = left[self._filtered[left] == 0]
+        self._filtered[left] |= bit
+        self._filtered[entered] &= ~bit
+        added = entered[self._filtered[entered] == 0]
+
+        if full:
+            del self._bits[dimension]
+            del self._filters[dimension]
+        else:
+            self._filters[dimension] = selection
+        self._selection = self._selection.update(added, removed)
+        # only the rows excluding the filter of this dimension stay the same
+        own = self._excluding.get(dimension)
+        self._excluding = {} if own is None or full else {dimension: own}
+        return added, removed
+
+    def clear(self):
+        """
+        Removes all filters.
+
+        :return: None
+        """
+        self._filtered[:] = 0
+        self._bits = {}
+        self._filters = {}
+        self._selection = Selection.full(self.len)
+        self._excluding = {}
+
+    def has_filter(self, dimension) -> bool:
+        """
+
+        :param dimension: A dimension.
+        :return: True iff the dimension has an active filter.
+        """
+        return dimension in self._filters
+
+    def filter_of(self, dimension) -> Selection:
+        """
+
+        :param dimension: A dimension.
+        :return: The rows passing the filter of the dimension, all rows if it has no filter.
+        """
+        return self._filters.get(dimension, Selection.full(self.len))
+
+    @property
+    def dimensions(self) -> typing.List[typing.Any]:
+        """
+
+        :return: All dimensions with an active filter.
+        """
+        return list(self._filters.keys())
+
+    def selection(self) -> Selection:
+        """
+
+        :return: The rows passing all filters.
+        """
+        return self._selection
+
+    def selection_excluding(self, dimension) -> Selection:
+        """
+        Dimensions display the rows passing all filters except their own,
+        so that their own filter can still be changed with all rows it could contain.
+
+        :param dimension: The dimension whose filter is ignored.
+        :return: The rows passing all filters except the one of the dimension.
+        """
+        if dimension not in self._bits:
+            return self._selection
+        selection = self._excluding.get(dimension)
+        if selection is None:
+            bit = np.uint32(1 << self._bits[dimension])
+            selection = Selection.from_mask((self._filtered & ~bit) == 0)
+            self._excluding[dimension] = selection
+        return selection
+
+    @staticmethod
+    def _changes(
+        previous: typing.Optional[Selection], selection: Selection
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the rows entering and leaving a filter. Sparse filters are compared by their positions, so only
+        the rows of both filters are visited.
+
+        :param previous: The previous filter or None if all rows passed.
+        :param selection: The new filter.
+        :return: The positions of the rows entering and leaving the filter.
+        """
+        if previous is None:
+            left = np.flatnonzero(~selection.mask)
+            return left[:0], left
+        if previous.is_sparse and selection.is_sparse:
+            before, after = previous.positions, selection.positions
+            return (
+                np.setdiff1d(after, before, assume_unique=True),
+                np.setdiff1d(before, after, assume_unique=True),
+            )
+        changed = np.flatnonzero(previous.mask != selection.mask)
+        passing = selection.mask[changed]
+        return changed[passing], changed[~passing]
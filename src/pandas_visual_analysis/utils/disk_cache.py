@@ -0,0 +1,176 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import typing
+
+import pandas as pd
+from pandas.api.types import is_categorical_dtype
+
+# part of every key, increased whenever the format of a cached artifact changes
+_FORMAT_VERSION = 1
+
+
+def fingerprint(series: pd.Series) -> typing.Optional[str]:
+    """
+    Computes a fingerprint of the contents of a column with the vectorized hashing of pandas, which is much faster
+    than the computations cached with it, like sorting the column.
+
+    :param series: The column.
+    :return: A hex string identifying the name, type and values of the column, or None if the values cannot be
+        hashed, e.g. lists. The type of a categorical column includes the order of its categories, which
+        determines the codes of the values.
+    """
+    try:
+        hashes = pd.util.hash_pandas_object(series, index=False).values
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((series.name, str(series.dtype), len(series))).encode())
+    if is_categorical_dtype(series.dtype):
+        categories = series.dtype.categories
+        digest.update(repr((str(categories.dtype), series.dtype.ordered)).encode())
+        digest.update(
+            pd.util.hash_pandas_object(categories, index=False).values.tobytes()
+        )
+    digest.update(hashes.tobytes())
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Persists artifacts derived from the data in a local directory, e.g. the indexes and profiles of columns,
+    so that opening the same data again, e.g. when a notebook is re-run, loads them instead of computing them.
+    The artifacts are stored as pickle files named by their key. If the files exceed the maximum size,
+    the least recently used ones are removed.
+    """
+
+    def __init__(
+        self, directory: typing.Optional[str] = None, max_bytes: int = 2 ** 30
+    ):
+        """
+
+        :param directory: The directory of the cache, which is created if it does not exist.
+            Defaults to ~/.cache/pandas_visual_analysis.
+        :param max_bytes: The maximum size of all cached files in bytes. Defaults to 1 GiB.
+        """
+        if directory is None:
+            directory = os.path.join(
+                os.path.expanduser("~"), ".cache", "pandas_visual_analysis"
+            )
+        if max_bytes < 0:
+            raise ValueError(
+                "The maximum size of the cache has to be at least 0. Invalid value: %d"
+                % max_bytes
+            )
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(kind: str, column_fingerprint: str) -> str:
+        """
+
+        :param kind: The kind of artifact, e.g. "sorted_index".
+        :param column_fingerprint: The fingerprint of the column the artifact is derived from.
+        :return: The key of the artifact.
+        """
+        return "%s-v%d-%s" % (kind, _FORMAT_VERSION, column_fingerprint)
+
+    def get(self, key: str) -> typing.Any:
+        """
+        Loads an artifact and marks it as recently used.
+
+        :param key: The key of the artifact.
+        :return: The artifact or None if it is not cached.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            self._remove(path)  # e.g. a file written by an incompatible version
+            return None
+        return value
+
+    def put(self, key: str, value: typing.Any):
+        """
+        Stores an artifact and removes the least recently used artifacts if the cache exceeds its maximum size.
+        Artifacts larger than the maximum size are not stored.
+
+        :param key: The key of the artifact.
+        :param value: The artifact, which has to be picklable.
+        :return: None
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        # written to a temporary file first, so that other processes never read a partial file
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            self._remove(temp_path)
+            return
+        self._evict()
+
+    def clear(self):
+        """
+        Removes all artifacts.
+
+        :return: None
+        """
+        for path, _, _ in self._entries():
+            self._remove(path)
+
+    @property
+    def size(self) -> int:
+        """
+
+        :return: The size of all cached files in bytes.
+        """
+        return sum(size for _, _, size in self._entries())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _entries(self) -> typing.List[typing.Tuple[str, float, int]]:
+        """
+
+        :return: The path, the time of the last use and the size of every cached file.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pkl"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,343 @@
+import asyncio
+import math
+import threading
+import typing
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import numpy as np
+
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.util import get_running_loop
+
+
+class Dispatcher:
+    """
+    A dispatcher decides when and where the updates of widgets are computed and applied after the selection of a
+    :class:`pandas_visual_analysis.data_source.DataSource` changed.
+    Widgets submit their updates while the data source notifies them and the data source calls :meth:`begin` before
+    and :meth:`dispatch` after the notification. This base class updates the widgets synchronously.
+    """
+
+    def begin(self):
+        """
+        Called by the data source before widgets are notified of a selection change.
+
+        :return: None
+        """
+        pass
+
+    def submit(self, widget, selection: Selection, version: int):
+        """
+        Schedules the update of a widget for a selection.
+
+        :param widget: The widget to update, which has to implement compute_brush_update and apply_brush_update
+            like :class:`pandas_visual_analysis.widgets.base_widget.BaseWidget`.
+        :param selection: The selection to display.
+        :param version: The selection version of the data source belonging to the selection.
+        :return: None
+        """
+        widget.apply_brush_update(widget.compute_brush_update(selection))
+
+    def dispatch(self):
+        """
+        Called by the data source after all widgets were notified of a selection change.
+
+        :return: None
+        """
+        pass
+
+
+class AsyncDispatcher(Dispatcher):
+    """
+    Updates widgets asynchronously on the running event loop of the kernel, so that a slow widget does not block
+    the kernel while the selection is changed.
+    The computation of a widget update runs in an executor, while the result is applied to the widget on the event
+    loop. Only the latest selection of a widget is displayed: submitting a newer selection cancels the pending
+    update of that widget and results of selections that are no longer current are dropped.
+    If no event loop is running, widgets are updated synchronously.
+    """
+
+    def __init__(self, executor: typing.Optional[Executor] = None):
+        """
+
+        :param executor: Executor for computing the widget updates. Defaults to the executor of the event loop.
+        """
+        self.executor = executor
+        self._tasks: typing.Dict[typing.Any, asyncio.Future] = {}
+
+    def submit(self, widget, selection: Selection, version: int):
+        loop = get_running_loop()
+        if loop is None:
+            super().submit(widget, selection, version)
+            return
+        self.cancel(widget)
+        task = loop.create_task(self._update(loop, widget, selection, version))
+        task.add_done_callback(lambda t: self._on_done(widget, t))
+        self._tasks[widget] = task
+
+    def cancel(self, widget=None):
+        """
+        Cancels pending updates.
+
+        :param widget: The widget whose update should be cancelled. If None, all updates are cancelled.
+        :return: None
+        """
+        widgets = list(self._tasks.keys()) if widget is None else [widget]
+        for w in widgets:
+            task = self._tasks.pop(w, None)
+            if task is not None and not task.done():
+                task.cancel()
+
+    @property
+    def pending(self) -> int:
+        """
+
+        :return: The number of widget updates that have not finished yet.
+        """
+        return sum(1 for task in self._tasks.values() if not task.done())
+
+    async def _update(self, loop, widget, selection: Selection, version: int):
+        result = await loop.run_in_executor(
+            self.executor, widget.compute_brush_update, selection
+        )
+        if version != widget.data_source.selection_version:
+            return  # a newer selection exists, so the result must not be displayed
+        widget.apply_brush_update(result)
+
+    def _on_done(self, widget, task: asyncio.Future):
+        if self._tasks.get(widget) is task:
+            del self._tasks[widget]
+        if not task.cancelled():
+            task.result()  # errors of the update are reported by the event loop
+
+
+class StratifiedSample:
+    """
+    Nested stratified samples of the rows of a data source. The rows are split into strata of consecutive rows and
+    every stratum contributes the same fraction of its rows to a sample, so that even small samples cover the whole
+    data. A sample of a larger fraction contains all rows of the samples of smaller fractions.
+    """
+
+    # the keys of the rows are quantized to 16 bits to keep the memory low for large data
+    _resolution = 2 ** 16
+
+    def __init__(
+        self, length: int, strata_size: int = 256, seed: typing.Optional[int] = None
+    ):
+        """
+
+        :param length: The number of rows.
+        :param strata_size: The number of consecutive rows in a stratum.
+        :param seed: Random seed used for drawing the samples.
+        """
+        self.len = length
+        rng = np.random.RandomState(seed)
+        num_strata = -(-length // strata_size)
+        keys = np.empty(num_strata * strata_size, dtype=np.uint16)
+        # the keys are computed for chunks of strata to limit the temporary memory
+        chunk = max(2 ** 20 // strata_size, 1)
+        for start in range(0, num_strata, chunk):
+            shape = (min(chunk, num_strata - start), strata_size)
+            # each row of a stratum gets a distinct key, the rows with keys below a fraction form the sample
+            ranks = rng.random_sample(shape).argsort(axis=1).argsort(axis=1)
+            chunk_keys = (ranks + rng.random_sample(shape)) / strata_size
+            keys[start * strata_size : (start + shape[0]) * strata_size] = (
+                chunk_keys.ravel() * self._resolution
+            )
+        self._keys = keys[:length]
+
+    def sample(self, fraction: float) -> Selection:
+        """
+
+        :param fraction: The fraction of rows in the sample between 0.0 and 1.0.
+        :return: The rows of the sample.
+        """
+        if fraction >= 1.0:
+            return Selection.full(self.len)
+        return Selection.from_mask(self._keys < fraction * self._resolution)
+
+
+class ProgressiveDispatcher(AsyncDispatcher):
+    """
+    Updates progressive widgets in several steps on the running event loop: a first estimate is computed from a
+    small stratified sample of the rows and then refined with larger samples until the full data is processed.
+    A refinement is only displayed if it changes the view materially, i.e. if its
+    :meth:`pandas_visual_analysis.widgets.base_widget.BaseWidget.refinement_distance` to the displayed result is
+    at least :attr:`min_change`. The widgets show the fraction of processed rows in their header.
+    Widgets that are not progressive are updated like with :class:`AsyncDispatcher`.
+    """
+
+    def __init__(
+        self,
+        initial_rows: int = 100000,
+        growth: float = 10.0,
+        min_change: float = 0.01,
+        executor: typing.Optional[Executor] = None,
+        seed: typing.Optional[int] = None,
+    ):
+        """
+
+        :param initial_rows: The number of rows of the first sample, which should be small enough to be processed
+            within about 100 ms.
+        :param growth: The factor by which the sample grows in each step.
+        :param min_change: The minimal refinement distance of a result to be displayed.
+        :param executor: Executor for computing the widget updates. Defaults to the executor of the event loop.
+        :param seed: Random seed used for drawing the samples.
+        """
+        super().__init__(executor)
+        if initial_rows < 1 or growth <= 1.0:
+            raise ValueError(
+                "The initial sample needs at least one row and has to grow in each step."
+            )
+        self.initial_rows = initial_rows
+        self.growth = growth
+        self.min_change = min_change
+        self.seed = seed
+        self._samples: typing.Dict[int, StratifiedSample] = {}
+        # the samples are drawn in the executor, possibly for several widgets at once
+        self._samples_lock = threading.Lock()
+
+    def fractions(self, length: int) -> typing.List[float]:
+        """
+
+        :param length: The number of rows.
+        :return: The fractions of the rows in the samples before the full data is processed.
+        """
+        fractions = []
+        fraction = self.initial_rows / max(length, 1)
+        while fraction < 1.0:
+            fractions.append(fraction)
+            fraction *= self.growth
+        return fractions
+
+    def sample(self, length: int, fraction: float) -> Selection:
+        """
+
+        :param length: The number of rows.
+        :param fraction: The fraction of rows in the sample.
+        :return: A stratified sample of the rows, see :class:`StratifiedSample`.
+        """
+        with self._samples_lock:
+            if length not in self._samples:
+                self._samples = {length: StratifiedSample(length, seed=self.seed)}
+            samples = self._samples[length]
+        return samples.sample(fraction)
+
+    async def _update(self, loop, widget, selection: Selection, version: int):
+        displayed = None
+        if getattr(widget, "progressive", False):
+            for fraction in self.fractions(selection.len):
+                # drawing the sample sorts keys of all rows, which must not block the event loop
+                sample = await loop.run_in_executor(
+                    self.executor, self.sample, selection.len, fraction
+                )
+                if version != widget.data_source.selection_version:
+                    return
+                result = await loop.run_in_executor(
+                    self.executor, widget.compute_sampled_update, selection, sample
+                )
+                if version != widget.data_source.selection_version:
+                    return
+                if self._changed(widget, displayed, result):
+                    widget.apply_sampled_update(result)
+                    displayed = result
+                widget.show_progress(sample.count / max(selection.len, 1))
+        result = await loop.run_in_executor(
+            self.executor, widget.compute_brush_update, selection
+        )
+        if version != widget.data_source.selection_version:
+            return
+        if self._changed(widget, displayed, result):
+            widget.apply_brush_update(result)
+        elif hasattr(widget, "remember_brush_update"):
+            widget.remember_brush_update(result)
+        if displayed is not None:
+            widget.show_progress(1.0)
+
+    def _changed(self, widget, displayed, result) -> bool:
+        if displayed is None:
+            return True
+        distance = widget.refinement_distance(displayed, result)
+        return math.isnan(distance) or distance >= self.min_change
+
+
+class ParallelDispatcher(Dispatcher):
+    """
+    Computes the updates of all widgets that are notified of a selection change concurrently in a thread pool.
+    Most of the computations are done by numpy and pandas, which release the GIL, so the time to update all widgets
+    is close to the time of the slowest widget.
+    Once all computations are finished, the results are applied to the widgets in the thread of the data source,
+    in the order of the widgets in the layout.
+    """
+
+    def __init__(
+        self,
+        max_workers: typing.Optional[int] = None,
+        executor: typing.Optional[Executor] = None,
+    ):
+        """
+
+        :param max_workers: The number of threads used if no executor is given.
+            Defaults to the default of :class:`concurrent.futures.ThreadPoolExecutor`.
+        :param executor: Executor for computing the widget updates.
+        """
+        self.executor = (
+            executor
+            if executor is not None
+            else ThreadPoolExecutor(max_workers=max_workers)
+        )
+        self._depth = 0
+        self._queue: typing.List[typing.Tuple[typing.Any, Selection]] = []
+
+    def begin(self):
+        self._depth += 1
+
+    def submit(self, widget, selection: Selection, version: int):
+        if self._depth == 0:  # not called during a notification of the data source
+            super().submit(widget, selection, version)
+            return
+        # only the latest selection of a widget has to be computed
+        self._queue = [(w, s) for w, s in self._queue if w is not widget]
+        self._queue.append((widget, selection))
+
+    def dispatch(self):
+        """
+        Computes all submitted updates concurrently and applies them once all of them are finished.
+        If a computation raises an error, the other updates are applied before the first error is raised again.
+
+        :return: None
+        """
+        self._depth = max(self._depth - 1, 0)
+        if self._depth > 0 or len(self._queue) == 0:
+            return
+        queue, self._queue = self._queue, []
+        futures = [
+            self.executor.submit(widget.compute_brush_update, selection)
+            for widget, selection in queue
+        ]
+        order = sorted(
+            range(len(queue)),
+            key=lambda i: (
+                getattr(queue[i][0], "row", 0),
+                getattr(queue[i][0], "index", 0),
+                i,
+            ),
+        )
+        error = None
+        for i in order:
+            try:
+                result = futures[i].result()
+            except Exception as e:
+                error = error or e
+                continue
+            queue[i][0].apply_brush_update(result)
+        if error is not None:
+            raise error
+
+    def shutdown(self):
+        """
+        Shuts down the executor of this dispatcher.
+
+        :return: None
+        """
+        self.executor.shutdown(wait=False)
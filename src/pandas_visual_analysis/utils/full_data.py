@@ -0,0 +1,210 @@
+import typing
+
+import numpy as np
+from pandas import DataFrame, Series
+
+from pandas_visual_analysis.utils.column_store import ColumnStore
+from pandas_visual_analysis.utils.crossfilter import Crossfilter
+from pandas_visual_analysis.utils.predicate import Predicate
+from pandas_visual_analysis.utils.selection import Selection
+
+
+class FullData:
+    """
+    The unsampled rows of a :class:`pandas_visual_analysis.data_source.DataSource` that displays a sample.
+    Widgets showing single points render the sample, while aggregate widgets like histograms compute their
+    statistics on the full data.
+    Brushes on the sample are translated to the full data by evaluating the predicate describing the brush,
+    e.g. the ranges of a box selection. Brushes without a predicate select the rows of the sample only,
+    in which case the selection of the full data is no longer :attr:`exact`.
+    """
+
+    def __init__(
+        self,
+        df: DataFrame,
+        columns: typing.List,
+        categorical_columns: typing.Union[typing.List[str], None],
+        sample_positions: np.ndarray,
+        column_store: typing.Optional[ColumnStore] = None,
+    ):
+        """
+
+        :param df: The full DataFrame.
+        :param columns: The columns of the data.
+        :param categorical_columns: See :class:`pandas_visual_analysis.data_source.DataSource`.
+        :param sample_positions: The position in the full data of each row of the sample.
+        :param column_store: A column store of df shared with other FullData objects, see
+            :class:`pandas_visual_analysis.shared_data.SharedData`. If omitted, a new column store is created.
+        """
+        self._df = df
+        if column_store is None:
+            self.column_store = ColumnStore(df, columns, categorical_columns)
+        else:
+            self.column_store = column_store.view()
+        self.sample_positions = np.asarray(sample_positions, dtype=np.int64)
+        self._length = len(df)
+        self.selection = Selection.full(self._length)
+        # filters of the dimensions if the selection type is CROSSFILTER
+        self.crossfilter = Crossfilter(self._length)
+        # whether the selection was determined by predicates only
+        self.exact = True
+
+    @property
+    def data(self) -> DataFrame:
+        """
+
+        :return: The full DataFrame.
+        """
+        return self._df
+
+    def column(self, name) -> Series:
+        """
+
+        :param name: The name of the column.
+        :return: The column of the full data.
+        """
+        return self.column_store.column(name)
+
+    @property
+    def len(self) -> int:
+        """
+
+        :return: The length of the full DataFrame.
+        """
+        return self._length
+
+    def __len__(self):
+        """
+
+        :return: The length of the full DataFrame.
+        """
+        return self._length
+
+    def from_sample(self, selection: Selection) -> Selection:
+        """
+        Translates a selection of the sample to the rows of the full data it was drawn from.
+        Selecting all or none of the sample selects all or none of the full data.
+
+        :param selection: A selection of the rows of the sample.
+        :return: The selection of the full data.
+        """
+        if selection.count == selection.len:
+            return Selection.full(self._length)
+        return Selection.from_indices(
+            self.sample_positions[selection.positions], self._length
+        )
+
+    def translate(
+        self, selection: Selection, predicate: typing.Optional[Predicate]
+    ) -> Selection:
+        """
+
+        :param selection: The brushed rows of the sample.
+        :param predicate: The predicate describing the brush or None.
+        :return: The brushed rows of the full data.
+        """
+        if predicate is None:
+            if 0 < selection.count < selection.len:
+                self.exact = False
+            return self.from_sample(selection)
+        return predicate.evaluate(self)
+
+    def filter(self, dimension, selection: Selection):
+        """
+        Replaces the filter of a dimension if the selection type is CROSSFILTER.
+
+        :param dimension: The dimension owning the filter.
+        :param selection: The rows of the full data passing the new filter.
+        :return: None
+        """
+        self.crossfilter.filter(dimension, selection)
+        self.selection = self.crossfilter.selection()
+
+    def reset(self):
+        """
+        Selects all rows and removes all filters.
+
+        :return: None
+        """
+        self.crossfilter.clear()
+        self.selection = Selection.full(self._length)
+        self.exact = True
+
+    def restore(self, selection: Selection, crossfilter: bool):
+        """
+        Restores a selection of the sample from the history, whose predicates are unknown.
+
+        :param selection: The restored selection of the sample.
+        :param crossfilter: Whether the selection type is CROSSFILTER.
+        :return: None
+        """
+        self.selection = self.translate(selection, None)
+        self.crossfilter.clear()
+        if crossfilter:
+            self.crossfilter.filter(None, self.selection)
+
+    def selection_for(self, dimension) -> Selection:
+        """
+        See :meth:`pandas_visual_analysis.data_source.DataSource.selection_for`.
+
+        :param dimension: The dimension, usually a widget.
+        :return: The selection of the full data the dimension should display.
+        """
+        if self.crossfilter.has_filter(dimension):
+            return self.crossfilter.selection_excluding(dimension)
+        return self.selection
+
+    def append(
+        self,
+        df_chunk: DataFrame,
+        policy: typing.Union[bool, Predicate],
+        crossfilter: bool,
+    ):
+        """
+        Appends rows to the full data. All appended rows are also appended to the sample.
+
+        :param df_chunk: DataFrame with the same columns as the data.
+        :param policy: Whether the new rows are selected: True, False or a predicate.
+        :param crossfilter: Whether the selection type is CROSSFILTER.
+        :return: None
+        """
+        start = self._length
+        self._df = self.column_store.append(df_chunk)
+        self._length = len(self._df)
+        self.sample_positions = np.concatenate(
+            (self.sample_positions, np.arange(start, self._length, dtype=np.int64))
+        )
+        if isinstance(policy, Predicate):
+            new_rows = policy.evaluate(self).mask[start:]
+        else:
+            new_rows = np.full(len(df_chunk), bool(policy))
+        self.selection = self.selection.extend(new_rows)
+        self.crossfilter = Crossfilter(self._length)
+        if crossfilter:
+            self.crossfilter.filter(None, self.selection)
+
+    def brushed_column(
+        self, name, selection: typing.Optional[Selection] = None
+    ) -> typing.Any:
+        """
+        Gathers the selected values of a single column of the full data in ascending row order.
+
+        :param name: The name of the column.
+        :param selection: The selection to gather the values for. Defaults to the current selection.
+        :return: A numpy array or a pandas extension array containing the selected values of the column.
+        """
+        if selection is None:
+            selection = self.selection
+        return self.column_store.gather(name, selection)
+
+    def brushed_columns(
+        self, names: typing.List, selection: typing.Optional[Selection] = None
+    ) -> typing.Dict[typing.Any, typing.Any]:
+        """
+        Gathers the selected values of several columns of the full data. See :meth:`brushed_column`.
+
+        :param names: The names of the columns.
+        :param selection: The selection to gather the values for. Defaults to the current selection.
+        :return: A dictionary mapping each column name to its selected values.
+        """
+        return {name: self.brushed_column(name, selection) for name in names}
@@ -0,0 +1,140 @@
+import typing
+
+from pandas_visual_analysis.utils.selection import CompressedSelection, Selection
+
+
+class SelectionHistory:
+    """
+    Bounded history of selections that supports undo and redo.
+    Each step is stored as a :class:`pandas_visual_analysis.utils.selection.CompressedSelection` together with a
+    key identifying the selection, which is the selection version it was first notified with.
+    The oldest steps are discarded once the number of steps or the memory used by them exceeds the limits.
+    """
+
+    def __init__(self, max_steps: int = 100, max_bytes: int = 64 * 1024 * 1024):
+        """
+
+        :param max_steps: The maximum number of steps kept in the history, including the current one.
+        :param max_bytes: The maximum number of bytes used by the compressed selections of all steps.
+            The current step is always kept, even if it exceeds this value.
+        """
+        if max_steps < 1:
+            raise ValueError(
+                "The history has to keep at least one step. Invalid value: %d"
+                % max_steps
+            )
+        if max_bytes < 0:
+            raise ValueError(
+                "The memory budget of the history cannot be negative. Invalid value: %d"
+                % max_bytes
+            )
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self._steps: typing.List[typing.Tuple[CompressedSelection, int]] = []
+        self._position = -1
+
+    def push(self, selection: Selection, key: int):
+        """
+        Adds a new step after the current one. All steps that could be restored with :meth:`redo` are discarded.
+
+        :param selection: The selection of the new step.
+        :param key: The key identifying the selection.
+        :return: None
+        """
+        del self._steps[self._position + 1 :]
+        self._steps.append((selection.compress(), key))
+        self._position = len(self._steps) - 1
+        while len(self._steps) > 1 and (
+            len(self._steps) > self.max_steps or self.nbytes > self.max_bytes
+        ):
+            del self._steps[0]
+            self._position -= 1
+
+    def undo(self) -> typing.Optional[typing.Tuple[Selection, int]]:
+        """
+        Moves to the previous step.
+
+        :return: The selection and key of the previous step or None if there is no previous step.
+        """
+        if not self.can_undo:
+            return None
+        self._position -= 1
+        return self.current
+
+    def redo(self) -> typing.Optional[typing.Tuple[Selection, int]]:
+        """
+        Moves to the next step, which was undone before.
+
+        :return: The selection and key of the next step or None if there is no next step.
+        """
+        if not self.can_redo:
+            return None
+        self._position += 1
+        return self.current
+
+    def clear(self):
+        """
+        Removes all steps from the history.
+
+        :return: None
+        """
+        self._steps = []
+        self._position = -1
+
+    @property
+    def current(self) -> typing.Optional[typing.Tuple[Selection, int]]:
+        """
+
+        :return: The selection and key of the current step or None if the history is empty.
+        """
+        if self._position < 0:
+            return None
+        compressed, key = self._steps[self._position]
+        return compressed.decompress(), key
+
+    @property
+    def can_undo(self) -> bool:
+        """
+
+        :return: True iff there is a step before the current one.
+        """
+        return self._position > 0
+
+    @property
+    def can_redo(self) -> bool:
+        """
+
+        :return: True iff there is a step after the current one.
+        """
+        return self._position < len(self._steps) - 1
+
+    @property
+    def position(self) -> int:
+        """
+
+        :return: Index of the current step.
+        """
+        return self._position
+
+    @property
+    def keys(self) -> typing.List[int]:
+        """
+
+        :return: The keys of all steps from the oldest to the newest step.
+        """
+        return [key for _, key in self._steps]
+
+    @property
+    def nbytes(self) -> int:
+        """
+
+        :return: The number of bytes used by the compressed selections of all steps.
+        """
+        return sum(compressed.nbytes for compressed, _ in self._steps)
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of steps in the history.
+        """
+        return len(self._steps)
@@ -0,0 +1,103 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from pandas_visual_analysis.utils.selection import Selection
+
+
+class JoinIndex:
+    """
+    Index from the key codes of a table to its rows in compressed sparse row (CSR) format: the rows are stored
+    sorted by their key code and the offsets mark where the rows of each code start. The rows of k keys are
+    found in O(k + m) for m matching rows, so a selection is translated through a join without merging the tables.
+    """
+
+    def __init__(self, codes: np.ndarray, num_keys: int):
+        """
+
+        :param codes: The key code of every row between 0 and num_keys - 1, negative for missing keys.
+        :param num_keys: The number of key codes.
+        """
+        self.codes: np.ndarray = codes
+        self.len = len(codes)
+        self.num_keys = num_keys
+        valid = codes >= 0
+        valid_codes = codes[valid]
+        # the rows of code c are positions[offsets[c] : offsets[c + 1]]
+        self.offsets: np.ndarray = np.zeros(num_keys + 1, dtype=np.int64)
+        np.cumsum(np.bincount(valid_codes, minlength=num_keys), out=self.offsets[1:])
+        self.positions: np.ndarray = np.flatnonzero(valid)[
+            np.argsort(valid_codes, kind="stable")
+        ]
+
+    def keys(self, selection: Selection) -> np.ndarray:
+        """
+
+        :param selection: Rows of the table.
+        :return: The distinct key codes of the rows in ascending order. Missing keys are omitted.
+        """
+        codes = self.codes[selection.positions]
+        return np.unique(codes[codes >= 0])
+
+    def rows(self, keys: np.ndarray) -> np.ndarray:
+        """
+
+        :param keys: Distinct key codes.
+        :return: The positions of all rows with one of the keys, grouped by key.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        starts = self.offsets[keys]
+        lengths = self.offsets[keys + 1] - starts
+        ends = np.cumsum(lengths)
+        # the ranges of the keys are concatenated without a loop: the i-th gathered row of a key is starts + i
+        gathered = np.repeat(starts - ends + lengths, lengths) + np.arange(
+            ends[-1] if len(ends) > 0 else 0
+        )
+        return self.positions[gathered]
+
+    def selection(self, keys: np.ndarray) -> Selection:
+        """
+
+        :param keys: Distinct key codes.
+        :return: The selection of all rows with one of the keys.
+        """
+        return Selection.from_indices(self.rows(keys), self.len)
+
+
+def factorize_keys(
+    left: typing.List[pd.Series], right: typing.List[pd.Series]
+) -> typing.Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Assigns the same code to equal keys of two tables, where a key can consist of several columns.
+    Rows with a missing value in any key column get the code -1, so they never join.
+
+    :param left: The key columns of the left table.
+    :param right: The key columns of the right table, in the same order.
+    :return: The key codes of the left rows, the key codes of the right rows and the number of codes.
+    """
+    if len(left) != len(right) or len(left) == 0:
+        raise ValueError(
+            "Both tables have to be joined on the same number of key columns."
+        )
+    num_left = len(left[0])
+    codes: typing.Optional[np.ndarray] = None
+    num_keys = 0
+    for left_column, right_column in zip(left, right):
+        if left_column.dtype != right_column.dtype:
+            # e.g. integer keys in a float column with missing values
+            left_column = left_column.astype(object)
+            right_column = right_column.astype(object)
+        values = pd.concat([left_column, right_column], ignore_index=True)
+        column_codes, uniques = pd.factorize(values)
+        column_codes = column_codes.astype(np.int64)
+        if codes is None:
+            codes, num_keys = column_codes, len(uniques)
+            continue
+        # the pairs of codes are numbered again, so that the combined codes stay small
+        valid = (codes >= 0) & (column_codes >= 0)
+        combined = codes[valid] * len(uniques) + column_codes[valid]
+        codes = np.full(len(values), -1, dtype=np.int64)
+        codes[valid], uniques = pd.factorize(combined)
+        num_keys = len(uniques)
+    return codes[:num_left], codes[num_left:], num_keys
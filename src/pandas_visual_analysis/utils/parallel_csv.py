@@ -0,0 +1,303 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import typing
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    union_categoricals,
+)
+
+from pandas_visual_analysis.utils.util import is_date_strings
+
+# compressions inferred from the file extension
+_COMPRESSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+
+class CsvSchema:
+    """
+    The types of the columns of a CSV file, which are inferred from a prefix of the file with :meth:`infer` and
+    applied to every chunk of the file, so that all chunks are parsed to the same types.
+
+    Columns with strings become category columns if they repeat their values, or datetime columns if all values
+    are dates. Integer columns with only a few distinct values, e.g. the number of cylinders of a car, are
+    added to the categorical columns as well.
+    """
+
+    def __init__(
+        self,
+        columns: typing.List[typing.Any],
+        dtypes: typing.Dict[typing.Any, typing.Any],
+        date_columns: typing.List[typing.Any],
+        categorical_columns: typing.List[typing.Any],
+        sep: str = ",",
+    ):
+        """
+
+        :param columns: The names of all columns in the order of the file.
+        :param dtypes: The type each column is parsed to. Columns not included are inferred per chunk.
+        :param date_columns: The columns converted to datetimes, values that are not dates become NaT.
+        :param categorical_columns: The categorical columns of a
+            :class:`pandas_visual_analysis.data_source.DataSource` of the data.
+        :param sep: The delimiter of the columns.
+        """
+        self.columns = columns
+        self.dtypes = dtypes
+        self.date_columns = date_columns
+        self.categorical_columns = categorical_columns
+        self.sep = sep
+
+    @staticmethod
+    def infer(df: DataFrame, sep: str = ",", max_categories: int = 10) -> "CsvSchema":
+        """
+        Infers the schema from the first rows of a file.
+
+        :param df: The first rows of the file as parsed by :func:`pandas.read_csv`.
+        :param sep: The delimiter of the columns.
+        :param max_categories: The maximum number of distinct values of an integer column that is categorical.
+        :return: The schema of the file.
+        """
+        dtypes = {}
+        date_columns = []
+        categorical_columns = []
+        for col in df.columns:
+            series = df[col]
+            dtype = series.dtype
+            if is_float_dtype(dtype):
+                dtypes[col] = "float64"
+            elif is_integer_dtype(dtype):
+                # not fixed, since a later chunk with missing values is parsed to floats
+                distinct = series.nunique()
+                if distinct <= max_categories and distinct <= len(series) // 2:
+                    categorical_columns.append(col)
+            elif is_bool_dtype(dtype):
+                categorical_columns.append(col)
+            elif is_object_dtype(dtype):
+                if is_date_strings(series):
+                    dtypes[col] = "object"
+                    date_columns.append(col)
+                    continue
+                # categories only save memory if values are repeated
+                repeated = series.nunique() <= len(series) // 2
+                dtypes[col] = "category" if repeated else "object"
+                categorical_columns.append(col)
+        return CsvSchema(
+            list(df.columns), dtypes, date_columns, categorical_columns, sep
+        )
+
+    def parse(self, data: bytes) -> DataFrame:
+        """
+        Parses complete lines of the file without the header.
+
+        :param data: The lines.
+        :return: The DataFrame of the lines with the types of the schema.
+        """
+        if not data.strip():
+            dtypes = {col: self.dtypes.get(col, "float64") for col in self.columns}
+            dtypes.update({col: "datetime64[ns]" for col in self.date_columns})
+            return DataFrame(
+                {col: pd.Series(dtype=dtypes[col]) for col in self.columns},
+                columns=self.columns,
+            )
+        df = pd.read_csv(
+            io.BytesIO(data),
+            sep=self.sep,
+            header=None,
+            names=self.columns,
+            dtype=self.dtypes,
+        )
+        for col in self.date_columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+        return df
+
+    def concat(self, chunks: typing.List[DataFrame]) -> DataFrame:
+        """
+        Concatenates the parsed chunks of a file, where category columns get the categories of all chunks.
+
+        :param chunks: The chunks in the order of the file.
+        :return: The DataFrame of the whole file.
+        """
+        if len(chunks) == 0:
+            return self.parse(b"")
+        for col in self.columns:
+            if self.dtypes.get(col) == "category":
+                categories = union_categoricals(
+                    [chunk[col] for chunk in chunks]
+                ).categories
+                for chunk in chunks:
+                    chunk[col] = chunk[col].cat.set_categories(categories)
+        return pd.concat(chunks, ignore_index=True)
+
+
+def read_csv_parallel(
+    path: str,
+    sep: str = ",",
+    header: typing.Union[int, None] = 0,
+    processes: typing.Optional[int] = None,
+    executor: typing.Optional[Executor] = None,
+    chunk_bytes: int = 2 ** 26,
+    sample_rows: int = 10000,
+    compression: typing.Optional[str] = "infer",
+) -> typing.Tuple[DataFrame, CsvSchema]:
+    """
+    Reads a CSV file by splitting it into chunks of complete lines, which are parsed in parallel by a process pool.
+    The types of the columns are inferred from the first rows with :meth:`CsvSchema.infer` and applied to all
+    chunks. Compressed files are decompressed as a stream and their chunks are parsed while the rest of the file
+    is decompressed. Values must not contain line breaks, even if they are quoted.
+
+    :param path: The path of the file.
+    :param sep: The delimiter of the columns.
+    :param header: Row (0-indexed) to use for the column labels. Use None if there is no header.
+    :param processes: The number of processes parsing the chunks. Defaults to the number of CPUs.
+        With a single process, the chunks are parsed in this process.
+    :param executor: Executor parsing the chunks instead of a new process pool.
+    :param chunk_bytes: The approximate size of a chunk in bytes.
+    :param sample_rows: The number of rows the schema is inferred from.
+    :param compression: One of "gzip", "bz2", "xz" and "zstd", None for an uncompressed file or "infer" to infer
+        it from the extension. Reading zstd files requires the zstandard package.
+    :return: The DataFrame of the file and its schema.
+    """
+    if chunk_bytes < 1:
+        raise ValueError(
+            "The size of the chunks has to be at least 1. Invalid value: %d"
+            % chunk_bytes
+        )
+    if compression == "infer":
+        compression = _COMPRESSIONS.get(os.path.splitext(path)[1].lower())
+    skipped_lines = 0 if header is None else header + 1
+
+    with _open(path, compression) as f:
+        prefix = pd.read_csv(f, sep=sep, header=header, nrows=sample_rows)
+    schema = CsvSchema.infer(prefix, sep)
+
+    if compression is None:
+        with open(path, "rb") as f:
+            for _ in range(skipped_lines):
+                f.readline()
+            ranges = _line_ranges(
+                f, f.tell(), os.fstat(f.fileno()).st_size, chunk_bytes
+            )
+        tasks = ((_parse_range, path, start, end, schema) for start, end in ranges)
+        return schema.concat(_run(tasks, processes, executor)), schema
+
+    def blocks():
+        with _open(path, compression) as stream:
+            for _ in range(skipped_lines):
+                stream.readline()
+            for block in _line_blocks(stream, chunk_bytes):
+                yield schema.parse, block
+
+    return schema.concat(_run(blocks(), processes, executor)), schema
+
+
+def _parse_range(path: str, start: int, end: int, schema: CsvSchema) -> DataFrame:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return schema.parse(f.read(end - start))
+
+
+def _line_ranges(
+    f: typing.BinaryIO, start: int, end: int, chunk_bytes: int
+) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Splits the bytes from start to end of a file into ranges ending at line breaks.
+
+    :return: The start and end position of each range.
+    """
+    ranges = []
+    while start < end:
+        f.seek(min(start + chunk_bytes, end))
+        f.readline()  # continues to the end of the line
+        stop = min(f.tell(), end)
+        if stop <= start:
+            break
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _line_blocks(stream: typing.BinaryIO, chunk_bytes: int) -> typing.Iterator[bytes]:
+    """
+    Reads a stream in blocks of complete lines.
+
+    :return: Iterator of the blocks.
+    """
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            return
+        if not block.endswith(b"\n"):
+            block += stream.readline()
+        yield block
+
+
+def _run(
+    tasks: typing.Iterable[typing.Tuple[typing.Any, ...]],
+    processes: typing.Optional[int],
+    executor: typing.Optional[Executor],
+) -> typing.List[DataFrame]:
+    """
+    Runs the tasks, each a function and its arguments, and returns their results in order. At most twice as many
+    tasks as workers are submitted at once, so that a stream is not read faster than it is parsed.
+    """
+    workers = processes or os.cpu_count() or 1
+    if executor is None and workers == 1:
+        return [task[0](*task[1:]) for task in tasks]
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    results = []
+    pending = deque()
+    try:
+        for task in tasks:
+            pending.append(executor.submit(*task))
+            if len(pending) >= 2 * workers:
+                results.append(pending.popleft().result())
+        while pending:
+            results.append(pending.popleft().result())
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+    return results
+
+
+def _open(path: str, compression: typing.Optional[str]) -> typing.BinaryIO:
+    if compression is None:
+        return open(path, "rb")
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "bz2":
+        return bz2.open(path, "rb")
+    if compression == "xz":
+        return lzma.open(path, "rb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Reading zstd compressed files requires zstandard, "
+                "which can be installed with: pip install zstandard"
+            )
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return io.BufferedReader(reader)
+    raise ValueError(
+        "The compression %s is not supported. "
+        "Supported compressions are: gzip, bz2, xz, zstd." % compression
+    )
@@ -0,0 +1,201 @@
+import typing
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from pandas_visual_analysis.utils.selection import Selection
+
+
+class Predicate(ABC):
+    """
+    A condition on the rows of a :class:`pandas_visual_analysis.data_source.DataSource` that can be evaluated to
+    the selection of all rows fulfilling it.
+    Predicates can be combined with ``&`` (and), ``|`` (or) and ``~`` (not).
+    """
+
+    @abstractmethod
+    def evaluate(self, data_source) -> Selection:
+        """
+        Evaluates the predicate.
+
+        :param data_source: The data source the predicate is evaluated on.
+        :return: Selection of all rows fulfilling the predicate.
+        """
+        raise NotImplementedError
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return And(self, other)
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return Or(self, other)
+
+    def __invert__(self) -> "Predicate":
+        return Not(self)
+
+
+class Between(Predicate):
+    """
+    Selects all rows with a value of a numerical or time based column between lo and hi, both inclusive.
+    The rows are found with the sorted index of the column, see
+    :meth:`pandas_visual_analysis.utils.column_store.ColumnStore.sorted_index`.
+    """
+
+    def __init__(self, column: str, lo=None, hi=None):
+        """
+
+        :param column: Name of a numerical or time based column.
+        :param lo: The lower bound of the range. None if the range is not bounded below.
+        :param hi: The upper bound of the range. None if the range is not bounded above.
+        """
+        self.column = column
+        self.lo = lo
+        self.hi = hi
+
+    def evaluate(self, data_source) -> Selection:
+        index = data_source.column_store.sorted_index(self.column)
+        return index.range_selection(self.lo, self.hi)
+
+    def __repr__(self) -> str:
+        return "Between(%r, %r, %r)" % (self.column, self.lo, self.hi)
+
+
+class IsIn(Predicate):
+    """
+    Selects all rows with one of the given categories in a categorical column.
+    The rows are found with the inverted index of the column, see
+    :meth:`pandas_visual_analysis.utils.column_store.ColumnStore.category_index`.
+    """
+
+    def __init__(self, column: str, values):
+        """
+
+        :param column: Name of a categorical column.
+        :param values: A category or an iterable of categories.
+        """
+        self.column = column
+        self.values = values
+
+    def evaluate(self, data_source) -> Selection:
+        return data_source.column_store.category_index(self.column).selection(
+            self.values
+        )
+
+    def __repr__(self) -> str:
+        return "IsIn(%r, %r)" % (self.column, self.values)
+
+
+class InPolygon(Predicate):
+    """
+    Selects all rows whose values of two numerical columns lie inside a polygon, e.g. the lasso of a scatter plot.
+    Only the rows inside the bounding box of the polygon, which are found with the sorted indexes of both columns,
+    are tested with the even-odd rule.
+    """
+
+    def __init__(self, x_column: str, y_column: str, xs, ys):
+        """
+
+        :param x_column: Name of the numerical column of the x coordinates.
+        :param y_column: Name of the numerical column of the y coordinates.
+        :param xs: The x coordinates of the vertices of the polygon.
+        :param ys: The y coordinates of the vertices of the polygon.
+        """
+        self.x_column = x_column
+        self.y_column = y_column
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        if len(self.xs) != len(self.ys):
+            raise ValueError(
+                "The polygon needs the same number of x and y coordinates."
+            )
+
+    def evaluate(self, data_source) -> Selection:
+        if len(self.xs) < 3:
+            return Selection.empty(data_source.len)
+        candidates = (
+            Between(self.x_column, self.xs.min(), self.xs.max()).evaluate(data_source)
+            & Between(self.y_column, self.ys.min(), self.ys.max()).evaluate(data_source)
+        ).positions
+        x = InPolygon._floats(
+            data_source.column_store.column(self.x_column).iloc[candidates]
+        )
+        y = InPolygon._floats(
+            data_source.column_store.column(self.y_column).iloc[candidates]
+        )
+        inside = np.zeros(len(candidates), dtype=bool)
+        # a point is inside if a ray to its right crosses an odd number of edges
+        for x0, y0, x1, y1 in zip(
+            self.xs, self.ys, np.roll(self.xs, -1), np.roll(self.ys, -1)
+        ):
+            if y0 == y1:
+                continue
+            crosses = (y0 > y) != (y1 > y)
+            inside ^= crosses & (x < x0 + (y - y0) * (x1 - x0) / (y1 - y0))
+        return Selection.from_indices(candidates[inside], data_source.len)
+
+    @staticmethod
+    def _floats(series) -> np.ndarray:
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def __repr__(self) -> str:
+        return "InPolygon(%r, %r, %d vertices)" % (
+            self.x_column,
+            self.y_column,
+            len(self.xs),
+        )
+
+
+class And(Predicate):
+    """
+    Selects all rows fulfilling all of the given predicates.
+    """
+
+    def __init__(self, *predicates: Predicate):
+        if len(predicates) == 0:
+            raise ValueError("At least one predicate has to be combined.")
+        self.predicates: typing.List[Predicate] = list(predicates)
+
+    def evaluate(self, data_source) -> Selection:
+        selection = self.predicates[0].evaluate(data_source)
+        for predicate in self.predicates[1:]:
+            if selection.count == 0:
+                break
+            selection = selection & predicate.evaluate(data_source)
+        return selection
+
+    def __repr__(self) -> str:
+        return "And(%s)" % ", ".join(repr(p) for p in self.predicates)
+
+
+class Or(Predicate):
+    """
+    Selects all rows fulfilling at least one of the given predicates.
+    """
+
+    def __init__(self, *predicates: Predicate):
+        if len(predicates) == 0:
+            raise ValueError("At least one predicate has to be combined.")
+        self.predicates: typing.List[Predicate] = list(predicates)
+
+    def evaluate(self, data_source) -> Selection:
+        selection = self.predicates[0].evaluate(data_source)
+        for predicate in self.predicates[1:]:
+            selection = selection | predicate.evaluate(data_source)
+        return selection
+
+    def __repr__(self) -> str:
+        return "Or(%s)" % ", ".join(repr(p) for p in self.predicates)
+
+
+class Not(Predicate):
+    """
+    Selects all rows not fulfilling the given predicate.
+    """
+
+    def __init__(self, predicate: Predicate):
+        self.predicate = predicate
+
+    def evaluate(self, data_source) -> Selection:
+        return Selection.full(data_source.len) - self.predicate.evaluate(data_source)
+
+    def __repr__(self) -> str:
+        return "Not(%r)" % self.predicate
@@ -0,0 +1,135 @@
+import typing
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+class ReservoirSample:
+    """
+    Draws a uniform sample from a stream of DataFrame chunks in a single pass, e.g. the chunks of a file that does
+    not fit into memory. Only the sample and the current chunk are kept in memory.
+    An int size keeps a reservoir of that many rows, where every row of the stream has the same probability of
+    being in the sample. A float size keeps each row with that probability.
+    Besides the sample, the exact number of rows and the count, minimum and maximum of every column are computed
+    over the whole stream.
+    """
+
+    def __init__(
+        self, size: typing.Union[int, float], seed: typing.Optional[int] = None
+    ):
+        """
+
+        :param size: The number of rows in the sample or the fraction of rows between 0.0 and 1.0.
+        :param seed: Random seed used for drawing the sample, which makes the sample reproducible.
+        """
+        if isinstance(size, float):
+            if size < 0.0 or size > 1.0:
+                raise ValueError(
+                    "Sample has to be between 0.0 and 1.0. Invalid value : %f" % size
+                )
+        elif size < 0:
+            raise ValueError("Sample has to be at least 0. Invalid value: %d" % size)
+        self.size = size
+        self.rows = 0
+        self._rng = np.random.RandomState(seed)
+        self._sample: typing.Optional[DataFrame] = None
+        # the position of each sampled row in the stream
+        self._positions = np.empty(0, dtype=np.int64)
+        self._count: typing.Optional[pd.Series] = None
+        self._min: typing.Dict[typing.Any, typing.Any] = {}
+        self._max: typing.Dict[typing.Any, typing.Any] = {}
+
+    def add(self, chunk: DataFrame):
+        """
+        Adds the next chunk of the stream.
+
+        :param chunk: DataFrame with the same columns as the previous chunks.
+        :return: None
+        """
+        self._summarize(chunk)
+        start = self.rows
+        self.rows += len(chunk)
+        if self._sample is None:
+            self._sample = chunk.iloc[:0]
+        positions = start + np.arange(len(chunk))
+
+        if isinstance(self.size, float):
+            keep = np.flatnonzero(self._rng.random_sample(len(chunk)) < self.size)
+            self._append(chunk.iloc[keep], positions[keep])
+            return
+
+        # fill the reservoir with the first rows
+        free = max(self.size - len(self._sample), 0)
+        self._append(chunk.iloc[:free], positions[:free])
+        if free >= len(chunk):
+            return
+        # row i replaces a random slot with probability size / (i + 1), later rows overwrite earlier ones
+        positions = positions[free:]
+        slots = (self._rng.random_sample(len(positions)) * (positions + 1)).astype(
+            np.int64
+        )
+        replacing = np.flatnonzero(slots < self.size)
+        if len(replacing) == 0:
+            return
+        slots = slots[replacing]
+        last = len(slots) - 1 - np.unique(slots[::-1], return_index=True)[1]
+        replacing, slots = replacing[last], slots[last]
+        kept = np.ones(len(self._sample), dtype=bool)
+        kept[slots] = False
+        self._sample = self._sample.iloc[kept]
+        self._positions = self._positions[kept]
+        self._append(chunk.iloc[free + replacing], positions[replacing])
+
+    @property
+    def sample(self) -> DataFrame:
+        """
+
+        :return: The sampled rows in the order of the stream.
+        """
+        if self._sample is None:
+            raise ValueError("No rows were added to the sample.")
+        return self._sample.iloc[np.argsort(self._positions, kind="stable")]
+
+    def summary(self) -> DataFrame:
+        """
+
+        :return: DataFrame with the count of non-missing values, the minimum and the maximum of every column over
+            all rows of the stream. Minimum and maximum are None for columns whose values cannot be compared.
+        """
+        if self._count is None:
+            raise ValueError("No rows were added to the sample.")
+        columns = list(self._count.index)
+        return DataFrame(
+            [
+                list(self._count.values),
+                [self._min.get(col) for col in columns],
+                [self._max.get(col) for col in columns],
+            ],
+            index=["count", "min", "max"],
+            columns=columns,
+            dtype=object,
+        )
+
+    def _append(self, rows: DataFrame, positions: np.ndarray):
+        if len(rows) == 0:
+            return
+        self._sample = pd.concat([self._sample, rows])
+        self._positions = np.concatenate((self._positions, positions))
+
+    def _summarize(self, chunk: DataFrame):
+        count = chunk.count()
+        self._count = count if self._count is None else self._count + count
+        for i, col in enumerate(chunk.columns):
+            series = chunk.iloc[:, i].dropna()
+            if count.iloc[i] == 0:
+                continue
+            try:
+                chunk_min, chunk_max = series.min(), series.max()
+                if col in self._min:
+                    chunk_min = min(self._min[col], chunk_min)
+                    chunk_max = max(self._max[col], chunk_max)
+            except TypeError:  # e.g. mixed strings and numbers
+                self._min[col], self._max[col] = None, None
+                continue
+            self._min[col], self._max[col] = chunk_min, chunk_max
@@ -0,0 +1,210 @@
+import typing
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_categorical_dtype, is_datetime64tz_dtype
+
+
+class RingBuffer:
+    """
+    Stores the last rows of a DataFrame in preallocated numpy columns.
+    The columns have room for twice the capacity: rows are appended behind the newest row and evicted by moving
+    the start, so the rows are always contiguous and :meth:`to_frame` returns views of the columns instead of
+    copying them. Once the end of the columns is reached, the rows are moved to the beginning of new columns,
+    which happens at most once per capacity appended rows. Views returned before are never overwritten.
+    The memory used by the buffer stays constant no matter how many rows are appended.
+
+    Category columns are stored as their codes and columns with a time zone as UTC times.
+    """
+
+    def __init__(self, df: pd.DataFrame, capacity: int):
+        """
+
+        :param df: DataFrame with the initial rows, which also determines the columns and their types.
+            Only the last capacity rows are kept.
+        :param capacity: The maximum number of rows in the buffer.
+        """
+        if capacity < 1:
+            raise ValueError(
+                "The capacity of a ring buffer has to be at least 1. Invalid value: %d"
+                % capacity
+            )
+        self.capacity = capacity
+        self.columns = list(df.columns.values)
+        self.dtypes: typing.Dict[str, typing.Any] = dict(df.dtypes)
+        # the categories of the category columns, extended by appended rows until the rows are moved
+        self._categories: typing.Dict[str, pd.Index] = {
+            col: dtype.categories
+            for col, dtype in self.dtypes.items()
+            if is_categorical_dtype(dtype)
+        }
+        self._columns: typing.Dict[str, np.ndarray] = {
+            col: np.empty(2 * capacity, dtype=self._storage_dtype(col))
+            for col in self.columns
+        }
+        index_dtype = df.index.dtype
+        self._index = np.empty(
+            2 * capacity,
+            dtype=index_dtype if isinstance(index_dtype, np.dtype) else object,
+        )
+        self._start = 0
+        self._len = 0
+        self.append(df)
+
+    def append(self, df_chunk: pd.DataFrame) -> typing.Dict[str, typing.Any]:
+        """
+        Appends rows and evicts the oldest rows if the capacity is exceeded.
+        If the chunk has more rows than the capacity, only its last rows are appended.
+
+        :param df_chunk: DataFrame with the same columns as the buffer.
+        :return: The values of the evicted rows per column, see :meth:`column`.
+        """
+        df_chunk = df_chunk.iloc[max(len(df_chunk) - self.capacity, 0) :]
+        count = len(df_chunk)
+        evicted = self.pop_front(max(self._len + count - self.capacity, 0))
+        if self._start + self._len + count > 2 * self.capacity:
+            self._move()
+        end = self._start + self._len
+        for col in self.columns:
+            values = self._storage_values(col, df_chunk[col])
+            self._columns[col][end : end + count] = values
+        self._index[end : end + count] = df_chunk.index.values
+        self._len += count
+        return evicted
+
+    def pop_front(self, count: int) -> typing.Dict[str, typing.Any]:
+        """
+        Evicts the oldest rows.
+
+        :param count: The number of rows to evict.
+        :return: The values of the evicted rows per column, see :meth:`column`.
+        """
+        count = min(count, self._len)
+        evicted = {
+            col: self._values(col, self._start, self._start + count)
+            for col in self.columns
+        }
+        self._start += count
+        self._len -= count
+        return evicted
+
+    def column(self, col: str) -> typing.Any:
+        """
+
+        :param col: Name of a column.
+        :return: A view of the values of the column from the oldest to the newest row.
+            Category columns are returned as :class:`pandas.Categorical` and times with a time zone as UTC times.
+        """
+        return self._values(col, self._start, self._start + self._len)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Creates a DataFrame of the rows without copying the columns, so the cost does not depend on the number of
+        rows, except for columns of nullable extension types, which are converted.
+
+        :return: DataFrame with the rows of the buffer from the oldest to the newest row and the original types
+            of the columns.
+        """
+        start, end = self._start, self._start + self._len
+        index = pd.Index(self._index[start:end], dtype=self._index.dtype, copy=False)
+        columns = []
+        for col in self.columns:
+            values = self._values(col, start, end)
+            dtype = self.dtypes[col]
+            if is_datetime64tz_dtype(dtype):
+                values = pd.arrays.DatetimeArray(values, dtype=dtype, copy=False)
+            elif not is_categorical_dtype(dtype) and values.dtype != dtype:
+                values = pd.array(values, dtype=dtype)
+            columns.append(pd.Series(values, index=index, name=col, copy=False))
+        # concatenated without copying, since the constructor of DataFrame would consolidate the columns
+        return pd.concat(columns, axis=1, copy=False)
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of rows in the buffer.
+        """
+        return self._len
+
+    def _values(self, col: str, start: int, end: int) -> typing.Any:
+        values = self._columns[col][start:end]
+        if col in self._categories:
+            dtype = pd.CategoricalDtype(
+                self._categories[col], ordered=self.dtypes[col].ordered
+            )
+            return pd.Categorical.from_codes(values, dtype=dtype)
+        return values
+
+    def _move(self):
+        """
+        Moves the rows to the beginning of new columns and drops the categories that are no longer used.
+        """
+        start, end = self._start, self._start + self._len
+        for col in self.columns:
+            values = self._columns[col][start:end]
+            if col in self._categories:
+                values = self._drop_unused_categories(col, values)
+            self._columns[col] = np.empty(2 * self.capacity, dtype=values.dtype)
+            self._columns[col][: self._len] = values
+        index = np.empty(2 * self.capacity, dtype=self._index.dtype)
+        index[: self._len] = self._index[start:end]
+        self._index = index
+        self._start = 0
+
+    def _drop_unused_categories(self, col: str, codes: np.ndarray) -> np.ndarray:
+        categories = self._categories[col]
+        used = np.zeros(len(categories), dtype=bool)
+        used[codes[codes >= 0]] = True
+        if used.all():
+            return codes
+        new_codes = np.cumsum(used) - 1
+        self._categories[col] = categories[used]
+        return np.where(codes >= 0, new_codes[codes], -1).astype(
+            self._storage_dtype(col)
+        )
+
+    def _storage_dtype(self, col: str) -> np.dtype:
+        if col in self._categories:
+            # the type pandas uses for the codes, so that they are not converted by to_frame
+            return pd.Categorical.from_codes(
+                [], categories=self._categories[col]
+            ).codes.dtype
+        dtype = self.dtypes[col]
+        if is_datetime64tz_dtype(dtype):
+            return np.dtype("datetime64[ns]")
+        if isinstance(dtype, np.dtype):
+            return dtype
+        return np.dtype(object)
+
+    def _storage_values(self, col: str, series: pd.Series) -> np.ndarray:
+        if col in self._categories:
+            return self._codes(col, series)
+        if is_datetime64tz_dtype(series.dtype):
+            return series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+        if isinstance(series.dtype, np.dtype):
+            return series.to_numpy()
+        return series.to_numpy(dtype=object)
+
+    def _codes(self, col: str, series: pd.Series) -> np.ndarray:
+        """
+        Converts values to the codes of the stored categories, which are extended by new values.
+        """
+        if is_categorical_dtype(series.dtype):
+            new = series.cat.categories
+        else:
+            new = pd.Index(pd.unique(series.dropna()), dtype=object)
+        new = new.difference(self._categories[col], sort=False)
+        if len(new) > 0:
+            self._categories[col] = self._categories[col].append(new)
+            dtype = self._storage_dtype(col)
+            if dtype != self._columns[col].dtype:
+                # copied, so that views returned before keep their codes
+                self._columns[col] = self._columns[col].astype(dtype)
+        categories = self._categories[col]
+        if is_categorical_dtype(series.dtype):
+            mapping = categories.get_indexer(series.cat.categories)
+            codes = series.cat.codes.to_numpy()
+            if len(mapping) == 0:
+                return codes
+            return np.where(codes >= 0, mapping[codes], -1)
+        return categories.get_indexer(series)
@@ -0,0 +1,442 @@
+import typing
+import zlib
+
+import numpy as np
+
+
+class Selection:
+    """
+    An immutable set of selected row positions of a :class:`pandas_visual_analysis.data_source.DataSource`.
+    Large selections are stored as a numpy boolean mask while very small selections are stored as sorted
+    int32 positions, so that brushing on large data does not allocate a Python int for every selected row.
+    Combining selections is done with vectorized bitwise operations and always returns a new object.
+    """
+
+    # a selection is stored sparse if its positions need less memory than a packed bitmask of the same length
+    sparse_ratio = 1 / 32
+
+    def __init__(
+        self,
+        length: int,
+        mask: typing.Optional[np.ndarray] = None,
+        positions: typing.Optional[np.ndarray] = None,
+        count: typing.Optional[int] = None,
+    ):
+        """
+        Use one of the factory methods :meth:`full`, :meth:`empty`, :meth:`from_mask` or :meth:`from_indices`
+        instead of calling the constructor directly.
+
+        :param length: The number of rows the selection refers to.
+        :param mask: A boolean mask of the given length. Must not be modified afterwards.
+        :param positions: Sorted and unique row positions. Must not be modified afterwards.
+        :param count: The number of selected rows of the mask if it is known, so that they are not counted.
+        """
+        if (mask is None) == (positions is None):
+            raise ValueError("Exactly one of mask or positions has to be specified.")
+        self._length = length
+        self._mask = mask
+        self._positions = positions
+        if positions is not None:
+            count = len(positions)
+        elif count is None:
+            count = int(np.count_nonzero(mask))
+        self._count = count
+        self._indices: typing.Optional[typing.Set[int]] = None
+
+    @staticmethod
+    def full(length: int) -> "Selection":
+        """
+
+        :param length: The number of rows the selection refers to.
+        :return: A selection containing all rows.
+        """
+        return Selection._from_dense(np.ones(length, dtype=bool))
+
+    @staticmethod
+    def empty(length: int) -> "Selection":
+        """
+
+        :param length: The number of rows the selection refers to.
+        :return: A selection containing no rows.
+        """
+        return Selection._from_sparse(
+            length, np.empty(0, dtype=Selection._position_dtype(length))
+        )
+
+    @staticmethod
+    def from_mask(mask: np.ndarray) -> "Selection":
+        """
+
+        :param mask: A boolean array where True marks a selected row. The array is copied.
+        :return: The selection corresponding to the mask.
+        """
+        mask = np.array(mask, dtype=bool, copy=True)
+        if mask.ndim != 1:
+            raise ValueError("The mask of a selection has to be one-dimensional.")
+        return Selection._from_dense(mask)._compact()
+
+    @staticmethod
+    def from_indices(
+        indices: typing.Union[typing.Iterable[int], np.ndarray, "Selection"],
+        length: int,
+    ) -> "Selection":
+        """
+        Creates a selection from arbitrary row positions. Duplicates are removed and the order is irrelevant.
+
+        :param indices: Iterable of row positions between 0 and length - 1.
+        :param length: The number of rows the selection refers to.
+        :raises IndexError: if a position is out of bounds.
+        :return: The selection containing the given positions.
+        """
+        if isinstance(indices, Selection):
+            if indices.len != length:
+                raise ValueError(
+                    "The selection has length %d, but %d was expected."
+                    % (indices.len, length)
+                )
+            return indices
+        if isinstance(indices, (set, frozenset)) or not hasattr(indices, "__len__"):
+            indices = list(indices)
+        positions = np.asarray(indices, dtype=np.int64).ravel()
+        if len(positions) != 0 and (positions.min() < 0 or positions.max() >= length):
+            raise IndexError(
+                "Selected indices have to be between 0 and %d." % (length - 1)
+            )
+        if len(positions) <= length * Selection.sparse_ratio:
+            return Selection._from_sparse(
+                length, np.unique(positions).astype(Selection._position_dtype(length))
+            )
+        mask = np.zeros(length, dtype=bool)
+        mask[positions] = True
+        return Selection._from_dense(mask)._compact()
+
+    @property
+    def len(self) -> int:
+        """
+
+        :return: The number of rows the selection refers to, not the number of selected rows.
+        """
+        return self._length
+
+    @property
+    def count(self) -> int:
+        """
+
+        :return: The number of selected rows.
+        """
+        return self._count
+
+    @property
+    def is_sparse(self) -> bool:
+        """
+
+        :return: True iff the selection is stored as sorted positions instead of a mask.
+        """
+        return self._mask is None
+
+    @property
+    def mask(self) -> np.ndarray:
+        """
+
+        :return: Read-only boolean array of length :attr:`len` where True marks a selected row.
+        """
+        if self._mask is None:
+            mask = np.zeros(self._length, dtype=bool)
+            mask[self._positions] = True
+            mask.flags.writeable = False
+            self._mask = mask
+        return self._mask
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+
+        :return: Read-only array of the selected row positions in ascending order.
+        """
+        if self._positions is None:
+            positions = np.flatnonzero(self._mask).astype(
+                Selection._position_dtype(self._length)
+            )
+            positions.flags.writeable = False
+            self._positions = positions
+        return self._positions
+
+    @property
+    def packed(self) -> np.ndarray:
+        """
+
+        :return: The selection as a bitmask packed into uint8 values, using one bit per row.
+        """
+        return np.packbits(self.mask)
+
+    @property
+    def indices(self) -> typing.Set[int]:
+        """
+        This view is provided for backward compatibility and is computed once per selection.
+
+        :return: The selected row positions as a set of ints.
+        """
+        if self._indices is None:
+            self._indices = set(self.positions.tolist())
+        return self._indices
+
+    def extend(self, mask: np.ndarray) -> "Selection":
+        """
+        Appends rows to the selection, e.g. after rows were appended to the data.
+
+        :param mask: A boolean array where True marks a selected row among the appended rows.
+        :return: A selection referring to len + len(mask) rows.
+        """
+        mask = np.asarray(mask, dtype=bool).ravel()
+        length = self._length + len(mask)
+        if self.is_sparse:
+            positions = np.concatenate(
+                (
+                    self._positions.astype(np.int64),
+                    np.flatnonzero(mask) + self._length,
+                )
+            )
+            return Selection._from_sparse(length, positions)._compact()
+        return Selection._from_dense(np.concatenate((self._mask, mask)))._compact()
+
+    def drop_first(self, count: int) -> "Selection":
+        """
+        Removes the first rows from the selection, e.g. after they were evicted from the data.
+        The positions of the remaining rows are shifted accordingly.
+
+        :param count: The number of rows to remove.
+        :return: A selection referring to len - count rows.
+        """
+        count = min(max(count, 0), self._length)
+        if count == 0:
+            return self
+        length = self._length - count
+        if self.is_sparse:
+            positions = self._positions[np.searchsorted(self._positions, count) :]
+            return Selection._from_sparse(length, positions - count)._compact()
+        return Selection._from_dense(self._mask[count:].copy())._compact()
+
+    def update(self, added: np.ndarray, removed: np.ndarray) -> "Selection":
+        """
+        Adds and removes rows, e.g. the rows that entered and left a filter. Only the changed rows are visited,
+        except for copying the mask of a dense selection, since selections are immutable.
+
+        :param added: Positions of rows that are not selected yet.
+        :param removed: Positions of selected rows.
+        :return: A selection with the added rows and without the removed rows.
+        """
+        if len(added) == 0 and len(removed) == 0:
+            return self
+        if self.is_sparse:
+            positions = np.setdiff1d(self._positions, removed, assume_unique=True)
+            positions = np.union1d(positions, added)
+            return Selection._from_sparse(self._length, positions)._compact()
+        mask = self._mask.copy()
+        mask[added] = True
+        mask[removed] = False
+        mask.flags.writeable = False
+        count = self._count + len(added) - len(removed)
+        return Selection(self._length, mask=mask, count=count)._compact()
+
+    def compress(self) -> "CompressedSelection":
+        """
+        Compresses the selection for long-term storage, e.g. in the selection history.
+
+        :return: The compressed selection using the smallest of several encodings.
+        """
+        return CompressedSelection(self)
+
+    def union(self, other: "Selection") -> "Selection":
+        """
+
+        :param other: The selection to add.
+        :return: A selection containing the rows of both selections.
+        """
+        self._check_length(other)
+        if self.is_sparse and other.is_sparse:
+            return Selection._from_sparse(
+                self._length, np.union1d(self._positions, other._positions)
+            )._compact()
+        if other.is_sparse:
+            mask = self.mask.copy()
+            mask[other.positions] = True
+        elif self.is_sparse:
+            return other.union(self)
+        else:
+            mask = self.mask | other.mask
+        return Selection._from_dense(mask)
+
+    def difference(self, other: "Selection") -> "Selection":
+        """
+
+        :param other: The selection to remove.
+        :return: A selection containing the rows of this selection that are not in other.
+        """
+        self._check_length(other)
+        if self.is_sparse:
+            keep = ~other.mask[self._positions]
+            return Selection._from_sparse(self._length, self._positions[keep])
+        if other.is_sparse:
+            mask = self.mask.copy()
+            mask[other.positions] = False
+        else:
+            mask = self.mask & ~other.mask
+        return Selection._from_dense(mask)._compact()
+
+    def intersection(self, other: "Selection") -> "Selection":
+        """
+
+        :param other: The selection to intersect with.
+        :return: A selection containing the rows that are in both selections.
+        """
+        self._check_length(other)
+        if self.is_sparse:
+            return Selection._from_sparse(
+                self._length, self._positions[other.mask[self._positions]]
+            )
+        if other.is_sparse:
+            return other.intersection(self)
+        return Selection._from_dense(self.mask & other.mask)._compact()
+
+    def __or__(self, other: "Selection") -> "Selection":
+        return self.union(other)
+
+    def __sub__(self, other: "Selection") -> "Selection":
+        return self.difference(other)
+
+    def __and__(self, other: "Selection") -> "Selection":
+        return self.intersection(other)
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of selected rows.
+        """
+        return self._count
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self.positions.tolist())
+
+    def __contains__(self, item) -> bool:
+        if not isinstance(item, (int, np.integer)) or not 0 <= item < self._length:
+            return False
+        return bool(self.mask[item])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Selection):
+            return (
+                self._length == other._length
+                and self._count == other._count
+                and np.array_equal(self.positions, other.positions)
+            )
+        if isinstance(other, (set, frozenset)):
+            return self.indices == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "Selection(%d of %d rows)" % (self._count, self._length)
+
+    def _check_length(self, other: "Selection"):
+        if self._length != other._length:
+            raise ValueError(
+                "Selections of different lengths cannot be combined (%d and %d)."
+                % (self._length, other._length)
+            )
+
+    def _compact(self) -> "Selection":
+        """
+        Chooses sparse storage for small selections and a mask for all others.
+
+        :return: A selection with the same rows but possibly different storage.
+        """
+        use_sparse = self._count <= self._length * Selection.sparse_ratio
+        if use_sparse == self.is_sparse:
+            return self
+        if use_sparse:
+            return Selection._from_sparse(self._length, self.positions)
+        return Selection._from_dense(self.mask)
+
+    @staticmethod
+    def _from_dense(mask: np.ndarray) -> "Selection":
+        mask.flags.writeable = False
+        return Selection(len(mask), mask=mask)
+
+    @staticmethod
+    def _from_sparse(length: int, positions: np.ndarray) -> "Selection":
+        positions = positions.astype(Selection._position_dtype(length), copy=False)
+        positions.flags.writeable = False
+        return Selection(length, positions=positions)
+
+    @staticmethod
+    def _position_dtype(length: int):
+        return np.int32 if length <= np.iinfo(np.int32).max else np.int64
+
+
+class CompressedSelection:
+    """
+    Compact representation of a :class:`Selection`. The selection is either stored as its positions, as the
+    boundaries of its runs of selected rows (run-length encoding) or as a zlib compressed bitmask,
+    depending on which of the three needs the least memory.
+    """
+
+    POSITIONS = "positions"
+    RUNS = "runs"
+    PACKED = "packed"
+
+    def __init__(self, selection: Selection):
+        """
+
+        :param selection: The selection to compress.
+        """
+        self.len = selection.len
+        self.count = selection.count
+        dtype = Selection._position_dtype(selection.len)
+
+        candidates = [(CompressedSelection.POSITIONS, selection.positions)]
+        if not selection.is_sparse:
+            padded = np.concatenate(([False], selection.mask, [False]))
+            # start and end positions of runs of selected rows
+            runs = np.flatnonzero(padded[1:] != padded[:-1]).astype(dtype)
+            candidates.append((CompressedSelection.RUNS, runs))
+            packed = zlib.compress(np.packbits(selection.mask).tobytes(), 1)
+            candidates.append((CompressedSelection.PACKED, packed))
+        self.encoding, self._data = min(
+            candidates, key=lambda candidate: CompressedSelection._size(candidate[1])
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """
+
+        :return: The number of bytes needed to store the compressed selection.
+        """
+        return CompressedSelection._size(self._data)
+
+    def decompress(self) -> Selection:
+        """
+
+        :return: The selection that was compressed.
+        """
+        if self.encoding == CompressedSelection.POSITIONS:
+            return Selection._from_sparse(self.len, self._data.copy())._compact()
+        if self.encoding == CompressedSelection.RUNS:
+            delta = np.zeros(self.len + 1, dtype=np.int8)
+            delta[self._data[0::2]] = 1
+            delta[self._data[1::2]] = -1
+            mask = np.cumsum(delta[:-1], dtype=np.int8).astype(bool)
+        else:
+            packed = np.frombuffer(zlib.decompress(self._data), dtype=np.uint8)
+            mask = np.unpackbits(packed, count=self.len).astype(bool)
+        return Selection._from_dense(mask)._compact()
+
+    def __repr__(self) -> str:
+        return "CompressedSelection(%d of %d rows, %s, %d bytes)" % (
+            self.count,
+            self.len,
+            self.encoding,
+            self.nbytes,
+        )
+
+    @staticmethod
+    def _size(data) -> int:
+        return data.nbytes if isinstance(data, np.ndarray) else len(data)
@@ -0,0 +1,271 @@
+import gc
+import os
+import pickle
+import typing
+import weakref
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import (
+    is_categorical_dtype,
+    is_datetime64tz_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+# alignment of the columns in the shared memory block in bytes
+_ALIGNMENT = 64
+# the length of the pickled header is stored in the first bytes of the block
+_HEADER_LENGTH_BYTES = 8
+# names of the blocks published by this process, which are tracked by its resource tracker
+_published_names: typing.Set[str] = set()
+
+
+class SharedFrame:
+    """
+    A DataFrame whose columns are stored in a single block of shared memory, see :mod:`multiprocessing.shared_memory`.
+    One process publishes the data once with :meth:`publish` and other processes on the same host, e.g. the kernels
+    of several dashboard users, attach to it by name with :meth:`attach`. Attached processes get read-only numpy
+    views of the shared columns instead of copies.
+
+    Numerical, boolean, datetime and timedelta columns are shared as they are. Categorical columns are shared as
+    their codes, and object and string columns are published as categorical columns.
+    The names and types of the columns, the categories and the index are stored in a pickled header at the beginning
+    of the block, so only attach to blocks published by a trusted process.
+    Requires Python 3.8 or newer.
+
+    A DataSource created from the data, e.g. with :meth:`pandas_visual_analysis.data_source.DataSource.attach`,
+    keeps using the views of the columns after :meth:`close`. The shared memory is then closed once the last view
+    is released, i.e. once the DataSource and its widgets are garbage collected.
+    """
+
+    def __init__(self, shm, data: DataFrame, owner: bool, finalizer: weakref.finalize):
+        """
+        Use :meth:`publish` or :meth:`attach` instead.
+
+        :param shm: The SharedMemory object holding the columns.
+        :param data: The DataFrame of views of the shared columns.
+        :param owner: Whether the shared memory was created by this object.
+        :param finalizer: Closes the shared memory once no view of it is left.
+        """
+        self._shm = shm
+        self.data = data
+        self.owner = owner
+        self._finalizer = finalizer
+
+    @property
+    def name(self) -> str:
+        """
+
+        :return: The name other processes use to attach to the shared memory.
+        """
+        return self._shm.name
+
+    @property
+    def closed(self) -> bool:
+        """
+
+        :return: True iff the shared memory is closed in this process, which is deferred by :meth:`close` while
+            views of the columns are still used.
+        """
+        return self._shm.buf is None
+
+    @staticmethod
+    def publish(df: DataFrame, name: typing.Optional[str] = None) -> "SharedFrame":
+        """
+        Copies the columns of a DataFrame into a new block of shared memory.
+        The publishing process has to keep the returned object until all other processes have attached and has to
+        call :meth:`unlink` once the data is no longer needed.
+
+        :param df: The DataFrame to publish.
+        :param name: The name of the shared memory block. A unique name is chosen if omitted.
+        :return: The published data, whose :attr:`data` are views of the shared memory as well.
+        """
+        shared_memory = SharedFrame._shared_memory_module()
+
+        arrays = []
+        columns = []
+        offset = 0
+        for i, col in enumerate(df.columns):
+            values, dtype = SharedFrame._column_values(df.iloc[:, i], col)
+            offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+            columns.append((col, dtype, values.dtype.str, offset))
+            arrays.append(values)
+            offset += values.nbytes
+        index = None if isinstance(df.index, pd.RangeIndex) else df.index
+        header = pickle.dumps(
+            {"length": len(df), "columns": columns, "index": index},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        start = SharedFrame._data_start(len(header))
+
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=max(start + offset, 1)
+        )
+        shm.buf[:_HEADER_LENGTH_BYTES] = len(header).to_bytes(
+            _HEADER_LENGTH_BYTES, "little"
+        )
+        shm.buf[_HEADER_LENGTH_BYTES : _HEADER_LENGTH_BYTES + len(header)] = header
+        for (_, _, _, column_offset), values in zip(columns, arrays):
+            target = np.ndarray(
+                values.shape,
+                dtype=values.dtype,
+                buffer=shm.buf,
+                offset=start + column_offset,
+            )
+            target[:] = values
+        _published_names.add(shm.name)
+        data, finalizer = SharedFrame._read(shm)
+        return SharedFrame(shm, data, owner=True, finalizer=finalizer)
+
+    @staticmethod
+    def attach(name: str) -> "SharedFrame":
+        """
+        Attaches to a block of shared memory published with :meth:`publish`, e.g. by another process.
+        The attaching process has to keep the returned object as long as it uses the data.
+
+        :param name: The name of the shared memory block.
+        :return: The published data as read-only views of the shared memory.
+        """
+        shared_memory = SharedFrame._shared_memory_module()
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # before Python 3.13 every attached process tracks the block
+            shm = shared_memory.SharedMemory(name=name)
+            if shm.name not in _published_names:
+                SharedFrame._untrack(shm)
+        data, finalizer = SharedFrame._read(shm)
+        return SharedFrame(shm, data, owner=False, finalizer=finalizer)
+
+    def close(self):
+        """
+        Closes the access to the shared memory of this process and releases :attr:`data`.
+        If views of the columns are still used, e.g. by a DataSource created from the data, closing is deferred
+        until the last of them is released, since the memory cannot be unmapped before. See :attr:`closed`.
+
+        :return: None
+        """
+        # the finalizer closes the shared memory as soon as the last view is released, which may be this one
+        self.data = None
+        if self._finalizer.alive:
+            # views only referenced by cycles, e.g. of cached columns, are released as well
+            gc.collect()
+
+    def unlink(self):
+        """
+        Closes the access like :meth:`close` and requests the shared memory to be destroyed once all processes have
+        closed it. Only the publishing process can unlink the shared memory.
+
+        :return: None
+        """
+        if not self.owner:
+            raise ValueError(
+                "Only the process that published the shared memory can unlink it."
+            )
+        self.close()
+        self._shm.unlink()
+        _published_names.discard(self._shm.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+    @staticmethod
+    def _read(shm) -> typing.Tuple[DataFrame, weakref.finalize]:
+        """
+        Creates the views of the columns, which are all derived from one array of the whole block, so that the
+        shared memory is closed once that array and therefore the last view is garbage collected.
+
+        :param shm: The SharedMemory object holding the columns.
+        :return: The DataFrame of views of the columns and the finalizer closing the shared memory.
+        """
+        block = np.frombuffer(shm.buf, dtype=np.uint8)
+        block.setflags(write=False)
+        # the memoryview numpy keeps as the base of the block releases its buffer before its finalizers run,
+        # unlike the block itself, so the memory is no longer exported when it is closed
+        finalizer = weakref.finalize(block.base, shm.close)
+        # at exit the operating system releases the memory, even if views are still used
+        finalizer.atexit = False
+        header_length = int.from_bytes(block[:_HEADER_LENGTH_BYTES].tobytes(), "little")
+        header = pickle.loads(
+            block[_HEADER_LENGTH_BYTES : _HEADER_LENGTH_BYTES + header_length].tobytes()
+        )
+        start = SharedFrame._data_start(header_length)
+        length = header["length"]
+        data = {}
+        for col, dtype, storage, offset in header["columns"]:
+            storage = np.dtype(storage)
+            values = block[
+                start + offset : start + offset + length * storage.itemsize
+            ].view(storage)
+            if is_categorical_dtype(dtype):
+                values = pd.Categorical.from_codes(values, dtype=dtype)
+            elif is_datetime64tz_dtype(dtype):
+                values = pd.arrays.DatetimeArray(values, dtype=dtype, copy=False)
+            data[col] = values
+        index = header["index"]
+        if index is None:
+            index = pd.RangeIndex(length)
+        data = DataFrame(data, index=index, columns=list(data.keys()), copy=False)
+        return data, finalizer
+
+    @staticmethod
+    def _column_values(series: pd.Series, col) -> typing.Tuple[np.ndarray, typing.Any]:
+        """
+        Converts a column to the values stored in the shared memory.
+
+        :param series: The column.
+        :param col: The name of the column for error messages.
+        :return: A numpy array of the stored values and the type of the column.
+        """
+        dtype = series.dtype
+        if is_object_dtype(dtype) or (
+            is_string_dtype(dtype) and not is_categorical_dtype(dtype)
+        ):
+            try:
+                series = series.astype("category")
+            except TypeError:
+                raise TypeError(
+                    "The values of column %s cannot be published, since they are not hashable."
+                    % str(col)
+                )
+            dtype = series.dtype
+        if is_categorical_dtype(dtype):
+            return np.asarray(series.cat.codes.values), dtype
+        if is_datetime64tz_dtype(dtype):
+            return series.array.asi8.view("M8[ns]"), dtype
+        if isinstance(dtype, np.dtype):
+            return series.values, dtype
+        raise TypeError(
+            "Column %s has the type %s, which cannot be published in shared memory."
+            % (str(col), str(dtype))
+        )
+
+    @staticmethod
+    def _data_start(header_length: int) -> int:
+        return -(-(_HEADER_LENGTH_BYTES + header_length) // _ALIGNMENT) * _ALIGNMENT
+
+    @staticmethod
+    def _untrack(shm):
+        if os.name != "posix":
+            return
+        try:
+            from multiprocessing import resource_tracker
+        except ImportError:  # pragma: no cover
+            return
+        # the tracker would destroy the shared memory when this process exits
+        resource_tracker.unregister(getattr(shm, "_name", shm.name), "shared_memory")
+
+    @staticmethod
+    def _shared_memory_module():
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:  # pragma: no cover
+            raise ImportError("Sharing data in memory requires Python 3.8 or newer.")
+        return shared_memory
@@ -0,0 +1,215 @@
+import re
+import typing
+
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import is_hashable, is_object_dtype
+
+from pandas_visual_analysis.utils.util import is_date_strings
+
+# the number of rows fetched from the database at once
+_FETCH_ROWS = 100000
+
+
+class SqlTable:
+    """
+    A table or query of a database, e.g. a local SQLite or DuckDB file, whose columns are loaded on demand.
+    On creation, only the names and types of the columns, which are inferred from the first rows, and the number of
+    rows are queried. Columns of strings with dates are converted to datetimes. Aggregates like the minimum and
+    maximum of a column are computed by the database.
+
+    Tables are read in the order of their rowid if the database provides one. Queries have to return their rows
+    in a deterministic order, e.g. with ORDER BY, since every column is loaded by a separate query.
+    """
+
+    def __init__(
+        self,
+        connection,
+        table_or_query: str,
+        columns: typing.Optional[typing.List[str]] = None,
+        schema_rows: int = 1000,
+    ):
+        """
+
+        :param connection: A DB-API connection, e.g. of :mod:`sqlite3` or duckdb.
+        :param table_or_query: The name of a table or a SELECT query.
+        :param columns: The columns to use. Defaults to all columns of the table or query.
+        :param schema_rows: The number of rows the types of the columns are inferred from.
+        """
+        self.connection = connection
+        is_query = re.match(r"\s*(select|with)\b", table_or_query, re.IGNORECASE)
+        if is_query:
+            self._source = "(%s) AS pva_query" % table_or_query.strip().rstrip(";")
+        else:
+            self._source = _quote(table_or_query)
+        selected = "*" if columns is None else ", ".join(_quote(c) for c in columns)
+        prefix = self._query(
+            "SELECT %s FROM %s LIMIT %d" % (selected, self._source, schema_rows)
+        )
+        self.columns: typing.List[str] = list(prefix.columns)
+        # columns of strings with dates, e.g. in SQLite, which has no type for dates
+        self.date_columns: typing.List[str] = [
+            col
+            for col in self.columns
+            if is_object_dtype(prefix[col].dtype) and is_date_strings(prefix[col])
+        ]
+        # empty DataFrame with the inferred type of every column
+        self.prototype: DataFrame = prefix.iloc[:0].astype(
+            {col: "datetime64[ns]" for col in self.date_columns}
+        )
+        self.len = int(self._query("SELECT COUNT(*) FROM %s" % self._source).iloc[0, 0])
+        self._order = ""
+        if not is_query:
+            try:
+                self._query("SELECT rowid FROM %s LIMIT 0" % self._source)
+                self._order = " ORDER BY rowid"
+            except Exception:  # every driver raises its own error for unknown columns
+                pass
+
+    def load(self, columns: typing.List[str]) -> DataFrame:
+        """
+        Loads columns from the database.
+
+        :param columns: The names of the columns.
+        :return: DataFrame of the columns.
+        """
+        df = self._query(
+            "SELECT %s FROM %s%s"
+            % (", ".join(_quote(c) for c in columns), self._source, self._order)
+        )
+        if len(df) != self.len:
+            raise ValueError(
+                "The number of rows changed from %d to %d since the data was opened."
+                % (self.len, len(df))
+            )
+        for col in self.date_columns:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors="coerce")
+        return df
+
+    def summary(self, column: str) -> pd.Series:
+        """
+        Computes the number of values, the minimum and the maximum of a column in the database.
+
+        :param column: The name of the column.
+        :return: The count, min and max of the column.
+        """
+        if column not in self.columns:
+            raise ValueError("Invalid column: %s" % str(column))
+        quoted = _quote(column)
+        df = self._query(
+            "SELECT COUNT(%s), MIN(%s), MAX(%s) FROM %s"
+            % (quoted, quoted, quoted, self._source)
+        )
+        count, minimum, maximum = df.iloc[0]
+        if column in self.date_columns:
+            minimum, maximum = pd.to_datetime(minimum), pd.to_datetime(maximum)
+        return pd.Series(
+            [count, minimum, maximum], index=["count", "min", "max"], name=column
+        )
+
+    def _query(self, sql: str) -> DataFrame:
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql)
+            names = [description[0] for description in cursor.description]
+            chunks = []
+            while True:
+                rows = cursor.fetchmany(_FETCH_ROWS)
+                if not rows:
+                    break
+                chunks.append(DataFrame.from_records(rows, columns=names))
+        finally:
+            cursor.close()
+        if len(chunks) == 0:
+            return DataFrame(columns=names)
+        return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+
+class LazyFrame:
+    """
+    The columns of a :class:`SqlTable`, which are loaded from the database the first time they are accessed by
+    name, e.g. with ``lazy_frame[column]``, and kept afterwards. The columns, types and number of rows of all
+    columns are available as ``lazy_frame.table``. :meth:`to_frame` loads all columns into a regular DataFrame.
+    """
+
+    def __init__(self, table: SqlTable):
+        """
+
+        :param table: The table to load the columns from.
+        """
+        self.table = table
+        self._loaded = DataFrame(index=pd.RangeIndex(table.len))
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of rows of the table.
+        """
+        return self.table.len
+
+    @property
+    def index(self) -> pd.Index:
+        """
+
+        :return: The index of the rows, which are numbered from 0.
+        """
+        return self._loaded.index
+
+    @property
+    def loaded_columns(self) -> typing.List[typing.Any]:
+        """
+
+        :return: The names of the columns loaded so far, in the order they were loaded.
+        """
+        return list(self._loaded.columns)
+
+    def __getitem__(self, key) -> typing.Union[pd.Series, DataFrame]:
+        """
+        Loads columns like :meth:`load` and returns them like ``DataFrame.__getitem__``.
+
+        :param key: The name of a column or a list of names.
+        :raises KeyError: if a column is not a column of the table.
+        :return: A Series of the column or a DataFrame of the columns.
+        """
+        keys = key if isinstance(key, list) else [key]
+        for col in keys:
+            if not is_hashable(col) or col not in self.table.columns:
+                raise KeyError(col)
+        self.load(keys)
+        return self._loaded[key]
+
+    def load(self, columns: typing.List[typing.Any]):
+        """
+        Loads the columns that are not loaded yet.
+
+        :param columns: The names of the columns. Names that are not columns of the table are ignored.
+        :return: None
+        """
+        missing = [
+            col
+            for col in columns
+            if is_hashable(col)
+            and col in self.table.columns
+            and col not in self._loaded.columns
+        ]
+        if len(missing) == 0:
+            return
+        df = self.table.load(missing)
+        for col in missing:
+            self._loaded[col] = df[col].values
+
+    def to_frame(self) -> DataFrame:
+        """
+        Loads all columns that are not loaded yet.
+
+        :return: A DataFrame of all columns in the order of the table, which is kept for later calls.
+        """
+        self.load(self.table.columns)
+        if list(self._loaded.columns) != self.table.columns:
+            self._loaded = self._loaded[self.table.columns]
+        return self._loaded
+
+
+def _quote(identifier: str) -> str:
+    return '"%s"' % str(identifier).replace('"', '""')
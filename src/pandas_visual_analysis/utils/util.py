@@ -1,6 +1,16 @@
+import asyncio
 import time
 from collections import Counter
-from typing import Tuple
+from typing import Any, Dict, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_categorical_dtype,
+    is_datetime64_any_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
 
 
 def hex_to_rgb(hex_value: str) -> Tuple[int, int, int]:
@@ -53,6 +63,21 @@ def compare_lists(s, t):
     return len(s) == len(t) and Counter(s) == Counter(t)
 
 
+def get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Returns the running event loop, which is the loop of the kernel when called from a Jupyter notebook.
+
+    :return: The running asyncio event loop or None if no event loop is running.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:  # python 3.6
+        loop = asyncio.get_event_loop()
+        return loop if loop.is_running() else None
+    except RuntimeError:
+        return None
+
+
 class Singleton(type):
     _instances = {}
 
@@ -99,3 +124,170 @@ class Timer:
                 self.name, (self.end_time - self.start_time) * 1000.0
             )
         )
+
+
+def extend_values(values, new_values: pd.Series, evicted: int = 0) -> np.ndarray:
+    """
+    Appends values to the data array of a plotly trace, e.g. the x values of a scatter plot,
+    converting them like plotly converts a pandas Series.
+
+    :param values: The current values of the trace or None.
+    :param new_values: The values to append.
+    :param evicted: The number of values to remove from the beginning of the current values.
+    :return: Array with the remaining current values followed by the new values.
+    """
+    if is_datetime64_any_dtype(new_values.dtype):
+        new_values = new_values.dt.to_pydatetime()
+    new_values = np.asarray(new_values)
+    if values is None:
+        return new_values
+    return np.concatenate((np.asarray(values)[evicted:], new_values))
+
+
+def set_read_only(value: Any):
+    """
+    Makes the numpy arrays of a value read-only, so that data shared by several owners is not modified in place.
+    The value can be a numpy array, a pandas DataFrame, Series or extension array backed by numpy, a tuple or
+    list of them, or an object with such attributes like a column index. Other values are left unchanged.
+
+    :param value: The value whose arrays become read-only.
+    :return: None
+    """
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, pd.DataFrame):
+        for array in value._mgr.arrays:
+            set_read_only(array)
+    elif isinstance(value, (pd.Series, pd.Index)):
+        set_read_only(value.array)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            set_read_only(item)
+    elif isinstance(getattr(value, "_ndarray", None), np.ndarray):
+        # e.g. categoricals and times, whose codes or values are a numpy array
+        set_read_only(value._ndarray)
+    elif hasattr(value, "__dict__"):
+        for attribute in vars(value).values():
+            if isinstance(attribute, (np.ndarray, pd.Series, pd.DataFrame)):
+                set_read_only(attribute)
+
+
+def read_only_view(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Creates a DataFrame sharing the memory of the columns of a DataFrame through read-only views, so that the
+    data can be shared safely while the arrays of the given DataFrame stay writeable.
+
+    :param df: The DataFrame.
+    :return: A DataFrame with the same columns, index and values without copying them.
+    """
+    view = pd.DataFrame(
+        df._mgr.apply(
+            lambda values: values.view()
+            if isinstance(values, np.ndarray)
+            else values[:]
+        )
+    )
+    set_read_only(view)
+    return view
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the columns of a DataFrame to types using less memory where no value is lost: object and string
+    columns to category if they have at most half as many distinct values as rows, float64 columns to float32 if
+    every value is exactly representable as float32 and int64 columns to the smallest integer type holding all
+    values.
+
+    :param df: The DataFrame to convert.
+    :return: A DataFrame with the converted columns, which shares the unconverted columns with the given one.
+    """
+    result = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype
+        if is_object_dtype(dtype) or (
+            is_string_dtype(dtype) and not is_categorical_dtype(dtype)
+        ):
+            try:
+                # categories only save memory if values are repeated
+                if series.nunique() <= len(series) // 2:
+                    result[col] = series.astype("category")
+            except TypeError:  # unhashable values like lists
+                pass
+        elif dtype == np.float64:
+            if _is_float32_exact(series.values):
+                result[col] = series.astype(np.float32)
+        elif dtype == np.int64:
+            result[col] = pd.to_numeric(series, downcast="integer")
+    return result
+
+
+def cast_to_dtypes(df: pd.DataFrame, dtypes: Dict[Any, Any]) -> pd.DataFrame:
+    """
+    Converts the columns of a DataFrame to the given types where no value is lost, e.g. rows appended to a
+    DataFrame converted by :func:`compact_dtypes`. Other columns are kept and widened when the DataFrames are
+    concatenated.
+
+    :param df: The DataFrame to convert.
+    :param dtypes: The target type of each column.
+    :return: A DataFrame with the converted columns.
+    """
+    result = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        dtype = dtypes.get(col)
+        if dtype is None or series.dtype == dtype:
+            continue
+        if is_categorical_dtype(dtype):
+            known = series.isna() | series.isin(dtype.categories)
+            if known.all():
+                result[col] = series.astype(dtype)
+        elif dtype == np.float32 and series.dtype.kind in "iuf":
+            if _is_float32_exact(series.values):
+                result[col] = series.astype(np.float32)
+        elif (
+            isinstance(dtype, np.dtype)
+            and dtype.kind == "i"
+            and series.dtype.kind in "iu"
+        ):
+            info = np.iinfo(dtype)
+            if len(series) == 0 or (
+                series.min() >= info.min and series.max() <= info.max
+            ):
+                result[col] = series.astype(dtype)
+    return result
+
+
+def _is_float32_exact(values: np.ndarray) -> bool:
+    """
+
+    :param values: Integers or floats.
+    :return: True iff converting the values to float32 changes no value. NaN is kept as NaN.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        floats = values.astype(np.float64)
+        # integers beyond 2**53 already change as float64
+        if values.dtype.kind in "iu" and not np.array_equal(
+            floats.astype(values.dtype), values
+        ):
+            return False
+        narrowed = floats.astype(np.float32).astype(np.float64)
+    return bool(np.array_equal(narrowed, floats, equal_nan=True))
+
+
+def is_date_strings(series: pd.Series) -> bool:
+    """
+    Checks whether all values of a column of strings are dates, e.g. the values of a date column of a CSV file.
+
+    :param series: The column.
+    :return: True if all values that are not missing can be converted with :func:`pandas.to_datetime`.
+    """
+    values = series.dropna()
+    # without digits, words like month names would be parsed as dates as well
+    if len(values) == 0 or not values.astype(str).str.contains(r"\d").all():
+        return False
+    try:
+        pd.to_datetime(values)
+    except (ValueError, TypeError, OverflowError):
+        return False
+    return True
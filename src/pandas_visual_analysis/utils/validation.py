@@ -5,9 +5,17 @@ import pandas_visual_analysis  # import this way to prevent circular imports
 
 
 def validate_data(data, name="data"):
-    if not isinstance(data, (DataFrame, pandas_visual_analysis.DataSource)):
+    if not isinstance(
+        data,
+        (
+            DataFrame,
+            pandas_visual_analysis.DataSource,
+            pandas_visual_analysis.SharedData,
+        ),
+    ):
         raise TypeError(
-            "The %s parameter must be a Pandas DataFrame or a DataSource" % name
+            "The %s parameter must be a Pandas DataFrame, a DataSource or SharedData"
+            % name
         )
 
 
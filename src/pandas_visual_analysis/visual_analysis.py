@@ -5,6 +5,8 @@ from pandas import DataFrame
 
 from pandas_visual_analysis.data_source import DataSource
 from pandas_visual_analysis.layout import AnalysisLayout
+from pandas_visual_analysis.shared_data import SharedData
+from pandas_visual_analysis.utils.disk_cache import DiskCache
 from pandas_visual_analysis.utils.config import Config
 from pandas_visual_analysis.utils.util import hex_to_rgb
 import pandas_visual_analysis.utils.validation as validate
@@ -19,7 +21,7 @@ class VisualAnalysis:
 
     def __init__(
         self,
-        data: typing.Union[DataFrame, DataSource],
+        data: typing.Union[DataFrame, DataSource, SharedData],
         layout: typing.Union[str, typing.List[typing.List[str]]] = "default",
         categorical_columns: typing.Union[typing.List[str], None] = None,
         row_height: typing.Union[int, typing.List[int]] = 400,
@@ -28,10 +30,14 @@ class VisualAnalysis:
         deselect_color: typing.Union[str, typing.Tuple[int, int, int]] = "#8A8C93",
         alpha: float = 0.75,
         seed: typing.Union[int, None] = None,
+        keep_full_data: bool = False,
+        optimize_memory: bool = False,
+        cache: typing.Union[DiskCache, str, None] = None,
     ):
         """
 
-        :param data: A pandas.DataFrame object or a :class:`DataSource`.
+        :param data: A pandas.DataFrame object, a :class:`DataSource` or a :class:`SharedData` object, which
+            is shared with other VisualAnalysis objects, e.g. one per session of a dashboard server.
         :param layout: Layout specification name or explicit definition of widget names in rows.
             Those columns have to include all columns of the DataFrame
             which have type `object`, `str`, `bool` or `category`.
@@ -59,6 +65,15 @@ class VisualAnalysis:
         :param seed: Random seed used for sampling the data.
             Values can be any integer between 0 and 2**32 - 1 inclusive or None.
             Defaults to None.
+        :param keep_full_data: If True and the data is sampled, widgets showing single points render the sample,
+            while the histograms and the brush summary compute their statistics on the full data.
+            Defaults to False.
+        :param optimize_memory: If True, the columns of the DataFrame are converted to types using less memory,
+            see :class:`DataSource`.
+            Defaults to False.
+        :param cache: A :class:`pandas_visual_analysis.utils.disk_cache.DiskCache` or the path of its directory to
+            store the indexes and profiles of the columns on disk, see :class:`DataSource`.
+            Defaults to None.
         """
         super().__init__()
 
@@ -91,12 +106,15 @@ class VisualAnalysis:
         config["deselect_color"] = self.deselect_color
         config["color_scale"] = self.color_scale
 
-        if isinstance(data, DataFrame):
+        if isinstance(data, (DataFrame, SharedData)):
             self.data_source = DataSource(
                 df=data,
                 categorical_columns=categorical_columns,
                 sample=sample,
                 seed=seed,
+                keep_full_data=keep_full_data,
+                optimize_memory=optimize_memory,
+                cache=cache,
             )
         elif isinstance(data, DataSource):
             self.data_source = data
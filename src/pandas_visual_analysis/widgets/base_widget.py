@@ -1,13 +1,23 @@
 from abc import abstractmethod
+from collections import OrderedDict
 
 import ipywidgets as widgets
 
 from pandas_visual_analysis import DataSource
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.selection import Selection
 from pandas_visual_analysis.utils.validation import validate_data_source
 
 
 class BaseWidget:
+    # number of results of compute_brush_update kept by the widget, so that selections restored from the history
+    # can be displayed without computing them again
+    brush_update_cache_size = 0
+    # whether the widget computes aggregates, which use the full data if it is kept for a sample
+    aggregates_full_data = False
+    # whether the widget can estimate its update from a sample, see compute_sampled_update
+    progressive = False
+
     def __init__(
         self,
         data_source: DataSource,
@@ -33,6 +43,14 @@ class BaseWidget:
         self.index: int = index
         self.relative_size = relative_size
         self.max_height = max_height
+        self._brush_update_cache = OrderedDict()
+        self.progress = widgets.FloatProgress(
+            value=1.0,
+            min=0.0,
+            max=1.0,
+            description_tooltip="Fraction of the data processed",
+            layout=widgets.Layout(width="60px"),
+        )
 
     @abstractmethod
     def build(self) -> widgets.Widget:
@@ -86,28 +104,141 @@ class BaseWidget:
             widget.layout.border = "2px solid rgb(%d,%d,%d)" % Config().select_color
         return widget
 
-    @abstractmethod
     def observe_brush_indices_change(self, sender):
         """
         This method observes the changes in the brush selection.
         In order to actually observe changes it has to be registered in :meth:`set_observers`.
+        The update is split into :meth:`compute_brush_update` and :meth:`apply_brush_update`.
+        If the data source has a dispatcher, it decides when and where those are called,
+        otherwise the widget is updated immediately.
+        Widgets with a crossfilter filter display the rows passing the filters of all other widgets.
+        Widgets with :attr:`aggregates_full_data` receive the selection of
+        :attr:`pandas_visual_analysis.data_source.DataSource.aggregates`.
 
         :param sender: The instance that sent the signal.
         """
+        source = (
+            self.data_source.aggregates
+            if self.aggregates_full_data
+            else self.data_source
+        )
+        selection = source.selection_for(self)
+        key = self.data_source.selection_key
+        if selection is source.selection and key in self._brush_update_cache:
+            self._brush_update_cache.move_to_end(key)
+            self.apply_brush_update(self._brush_update_cache[key])
+            return
+
+        dispatcher = self.data_source.dispatcher
+        if dispatcher is None:
+            self.apply_brush_update(self.compute_brush_update(selection))
+        else:
+            dispatcher.submit(self, selection, self.data_source.selection_version)
+
+    @abstractmethod
+    def compute_brush_update(self, selection: Selection):
+        """
+        Computes everything that is needed to display a selection, without modifying any widgets.
+        This method can be called outside of the main thread and should only depend on the given selection
+        instead of the current selection of the data source.
+
+        :param selection: The selection to display.
+        :return: The result that is passed to :meth:`apply_brush_update`.
+        """
+        pass
+
+    @abstractmethod
+    def apply_brush_update(self, result):
+        """
+        Displays the result of :meth:`compute_brush_update` in the widget. Always called in the main thread.
+
+        :param result: The result of :meth:`compute_brush_update`.
+        """
         pass
 
+    def compute_sampled_update(self, selection: Selection, sample: Selection):
+        """
+        Estimates the result of :meth:`compute_brush_update` from the selected rows in a sample of all rows.
+        Only called for widgets that are :attr:`progressive`, e.g. by a
+        :class:`pandas_visual_analysis.utils.dispatch.ProgressiveDispatcher`.
+        By default the exact result of :meth:`compute_brush_update` is computed.
+
+        :param selection: The selection to display.
+        :param sample: A sample of all rows.
+        :return: The estimated result that is passed to :meth:`apply_sampled_update`.
+        """
+        return self.compute_brush_update(selection)
+
+    def apply_sampled_update(self, result):
+        """
+        Displays the result of :meth:`compute_sampled_update`. By default the same as :meth:`apply_brush_update`.
+
+        :param result: The result of :meth:`compute_sampled_update`.
+        """
+        self.apply_brush_update(result)
+
+    def refinement_distance(self, previous, result) -> float:
+        """
+        Measures how much the view changes if a refined result is displayed instead of the previous one.
+
+        :param previous: The displayed result.
+        :param result: The refined result.
+        :return: The relative change of the view, where 0.0 means that the view does not change.
+        """
+        return float("inf")
+
+    def show_progress(self, fraction: float):
+        """
+        Shows the fraction of the data that the displayed result was computed from.
+
+        :param fraction: The processed fraction between 0.0 and 1.0.
+        :return: None
+        """
+        self.progress.value = fraction
+        self.progress.bar_style = "" if fraction >= 1.0 else "info"
+
+    def remember_brush_update(self, result):
+        """
+        Stores the result of :meth:`compute_brush_update` for the current selection key of the data source,
+        if :attr:`brush_update_cache_size` is larger than 0. Should be called in :meth:`apply_brush_update` by
+        widgets whose results only depend on the selection.
+
+        :param result: The result that is displayed for the current selection.
+        :return: None
+        """
+        if self.brush_update_cache_size <= 0:
+            return
+        self._brush_update_cache[self.data_source.selection_key] = result
+        self._brush_update_cache.move_to_end(self.data_source.selection_key)
+        while len(self._brush_update_cache) > self.brush_update_cache_size:
+            self._brush_update_cache.popitem(last=False)
+
     def set_observers(self):
         """
         This method adds the necessary callbacks to trait changes.
         """
         self.data_source.on_indices_changed.connect(self.observe_brush_indices_change)
+        self.data_source.on_rows_appended.connect(self.observe_rows_appended)
+
+    def observe_rows_appended(self, sender, rows, evicted=0):
+        """
+        This method observes rows appended to the data source and is registered in :meth:`set_observers`.
+        Widgets extend their plots with the new rows only, the selection of the new rows is displayed by the
+        following call of :meth:`observe_brush_indices_change`.
+
+        :param sender: The instance that sent the signal.
+        :param rows: DataFrame with the appended rows.
+        :param evicted: The number of rows removed from the beginning of the data, e.g. by a rolling window.
+        """
+        self._brush_update_cache.clear()
 
     @abstractmethod
     def on_selection(self, trace, points, state):
         """
         This method implements the behaviour of changes in the selection of this plot.
         Should set the brushed indices property of :class:`pandas_visual_analysis.data_source.DataSource` in order
-        to propagate the change.
+        to propagate the change. Widgets that filter a dimension in crossfilter mode call
+        :meth:`pandas_visual_analysis.data_source.DataSource.brush` with themselves as the dimension instead.
 
         :param trace: The trace object which triggered the selection.
         :param points: The object containing the points in the 'point_inds' field.
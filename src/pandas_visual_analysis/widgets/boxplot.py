@@ -3,6 +3,8 @@ import plotly.graph_objects as go
 
 from pandas_visual_analysis import DataSource
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.util import extend_values
 from pandas_visual_analysis.widgets import BaseWidget, register_widget
 
 
@@ -56,7 +58,9 @@ class BoxPlotWidget(BaseWidget):
 
         self.trace, self.figure_widget = self._get_figure_widget()
 
-        self.figure_widget.data[0].selectedpoints = self.data_source.brushed_indices
+        self.figure_widget.data[0].selectedpoints = self.data_source.selection_for(
+            self
+        ).positions
         self.figure_widget.data[0].on_selection(callback=self.on_selection)
         self.figure_widget.data[0].on_deselect(callback=self.on_deselection)
         self.column_select.observe(handler=self._on_column_change, names="value")
@@ -75,10 +79,17 @@ class BoxPlotWidget(BaseWidget):
     def apply_size_constraints(self, widget):
         return super().apply_size_constraints(widget)
 
-    def observe_brush_indices_change(self, sender):
-        new_indices = self.data_source.brushed_indices
+    def compute_brush_update(self, selection: Selection):
+        return selection.positions
+
+    def apply_brush_update(self, result):
         # noinspection SpellCheckingInspection
-        self.figure_widget.data[0].selectedpoints = new_indices
+        self.figure_widget.data[0].selectedpoints = result
+
+    def observe_rows_appended(self, sender, rows, evicted=0):
+        super().observe_rows_appended(sender, rows, evicted)
+        trace = self.figure_widget.data[0]
+        trace.y = extend_values(trace.y, rows[self.column_select.value], evicted)
 
     def on_selection(self, trace, points, state):
         self.data_source.brushed_indices = points.point_inds
@@ -89,7 +100,7 @@ class BoxPlotWidget(BaseWidget):
     def _get_figure_widget(self):
         config = Config()
         trace = go.Box(
-            y=self.data_source.data[self.column_select.value],
+            y=self.data_source.column(self.column_select.value),
             boxmean="sd",
             boxpoints=self.box_point_select.value,
             jitter=0.5,
@@ -123,7 +134,7 @@ class BoxPlotWidget(BaseWidget):
 
     def _on_column_change(self, change):
         self.figure_widget.data[0].update(
-            {"y": self.data_source.data[self.column_select.value]}
+            {"y": self.data_source.column(self.column_select.value)}
         )
 
     def _on_box_point_change(self, change):
@@ -1,8 +1,11 @@
 import math
 
 import ipywidgets as widgets
+import numpy as np
+import pandas as pd
 
 from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils.selection import Selection
 from pandas_visual_analysis.widgets import BaseWidget, register_widget
 
 
@@ -12,10 +15,15 @@ class BrushSummaryWidget(BaseWidget):
 
     The BrushSummaryWidget displays how a metric changes for the selection compared to the whole data.
     It shows all of the data as the baseline and displays the change in absolute values and as a percentage value.
+    If the full data is kept for a sample, the metrics are computed on the full data.
     In addition it also displays arrows indicating the change with both color and direction.
     The magnitude of the change is illustrated as the size of the arrow to see the sensitivity at a glance.
     """
 
+    brush_update_cache_size = 16
+    aggregates_full_data = True
+    progressive = True
+
     def __init__(
         self,
         data_source: DataSource,
@@ -62,7 +70,7 @@ class BrushSummaryWidget(BaseWidget):
         self.grid = widgets.GridspecLayout(self.num_grid_rows, self.num_grid_columns)
         self.grid.layout.height = "calc(100% - 40px)"
 
-        self.base_metrics = self.data_source.data[self.columns].describe(include="all")
+        self.base_metrics = self._get_base_metrics()
         self.brushed_metrics = self._get_brushed_metrics()
 
         self.pos_change_color = "red"
@@ -78,15 +86,45 @@ class BrushSummaryWidget(BaseWidget):
 
     def build(self) -> widgets.Widget:
         root = widgets.VBox(
-            [self.metric_select, self.grid], layout=widgets.Layout(overflow="auto")
+            [widgets.HBox([self.metric_select, self.progress]), self.grid],
+            layout=widgets.Layout(overflow="auto"),
         )
         return self.apply_size_constraints(root)
 
-    def observe_brush_indices_change(self, sender):
-        self.brushed_metrics = self._get_brushed_metrics()
+    def compute_brush_update(self, selection: Selection):
+        return self._get_brushed_metrics(selection)
+
+    def apply_brush_update(self, result):
+        self.remember_brush_update(result)
+        self.apply_sampled_update(result)
+
+    def compute_sampled_update(self, selection: Selection, sample: Selection):
+        metrics = self._get_brushed_metrics(selection & sample)
+        # the count of the sample is scaled to estimate the count of all rows
+        metrics.loc["count"] *= sample.len / max(sample.count, 1)
+        return metrics
+
+    def apply_sampled_update(self, result):
+        self.brushed_metrics = result
         self._update_brushed_metrics()
 
+    def refinement_distance(self, previous, result) -> float:
+        previous = previous.astype("float64").values
+        result = result.astype("float64").values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = np.abs(result - previous) / np.abs(previous)
+        change[(result == previous) | (np.isnan(previous) & np.isnan(result))] = 0.0
+        change[np.isnan(change)] = float("inf")
+        return float(change.max()) if change.size > 0 else 0.0
+
+    def observe_rows_appended(self, sender, rows, evicted=0):
+        super().observe_rows_appended(sender, rows, evicted)
+        # the brushed metrics follow with the notification of the extended selection
+        self.base_metrics = self._get_base_metrics()
+        self._update_base_metrics()
+
     def _observe_metric_change(self, obj):
+        self.base_metrics = self._get_base_metrics()
         self._update_base_metrics()
         self._update_brushed_metrics()
 
@@ -107,7 +145,7 @@ class BrushSummaryWidget(BaseWidget):
         brush_count = int(self.brushed_metrics.iloc[:, 0]["count"])
         with self.grid.hold_trait_notifications():
             self.grid[0, 2].value = self._get_metric_html_content(
-                brush_count, brush_count / self.data_source.len - 1
+                brush_count, brush_count / self.data_source.aggregates.len - 1
             )
 
             for i, col in enumerate(self.columns):
@@ -124,7 +162,7 @@ class BrushSummaryWidget(BaseWidget):
 
         with self.grid.hold_trait_notifications():
             self.grid[0, 1].value = self._get_metric_html_content(
-                self.data_source.len, None
+                self.data_source.aggregates.len, None
             )
             self.grid[0, 3].value = ""
 
@@ -182,5 +220,29 @@ class BrushSummaryWidget(BaseWidget):
             result = target_min
         return result
 
-    def _get_brushed_metrics(self):
-        return self.data_source.brushed_data[self.columns].describe(include="all")
+    def _get_base_metrics(self) -> pd.DataFrame:
+        # the profiles of the columns are cached by the column store until rows are appended
+        column_store = self.data_source.aggregates.column_store
+        moments = self.data_source.moments if self.data_source.full_data is None else {}
+        profiles = {}
+        for col in self.columns:
+            running = moments.get(col)
+            if running is not None and self.metric_select.value == "mean":
+                # running moments are kept up to date while rows are appended, so the column is not described
+                profiles[col] = pd.Series(
+                    [float(running.count), running.mean], index=["count", "mean"]
+                )
+            else:
+                profiles[col] = column_store.profile(col)
+        return pd.DataFrame(profiles, columns=self.columns)
+
+    def _get_brushed_metrics(self, selection: Selection = None):
+        aggregates = self.data_source.aggregates
+        if selection is None:
+            selection = aggregates.selection
+        # described by the backend of the column store, memory-mapped columns chunk by chunk
+        column_store = aggregates.column_store
+        return pd.DataFrame(
+            {col: column_store.profile(col, selection) for col in self.columns},
+            columns=self.columns,
+        )
@@ -1,8 +1,16 @@
+import typing
+
 import ipywidgets as widgets
+import numpy as np
+import pandas as pd
 import plotly.graph_objs as go
 
 from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils.aggregates import BinCounts
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.dispatch import ProgressiveDispatcher
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.util import extend_values
 from pandas_visual_analysis.widgets import BaseWidget, register_widget
 
 
@@ -12,8 +20,18 @@ class HistogramWidget(BaseWidget):
 
     The HistogramWidget displays a single dimension of the data as a histogram where the brush selection
     is overlaid to see the distribution of both the underlying data and the selection.
+    If the full data is kept for a sample, the histogram counts the full data. The bins are then computed in
+    Python and only their counts are sent to the plot, which also allows to refine the counts of the selection
+    progressively. The bins are also computed in Python if the data source uses a
+    :class:`pandas_visual_analysis.utils.dispatch.ProgressiveDispatcher` when the widget is created, so that the
+    counts of the selection are refined progressively. Numerical columns with running bin counts, e.g. of a
+    :class:`pandas_visual_analysis.rolling_data_source.RollingDataSource`, show them for all rows.
     """
 
+    aggregates_full_data = True
+    # number of bins of numerical and time based columns if the bins are computed in Python
+    bins = 50
+
     def __init__(
         self,
         data_source: DataSource,
@@ -47,8 +65,18 @@ class HistogramWidget(BaseWidget):
             value=False, description="Normalize", indent=False
         )
 
-        self.data = self.data_source.data
-        self.brushed_data = self.data_source.brushed_data
+        column_store = self.data_source.aggregates.column_store
+        # memory-mapped columns are counted chunk by chunk instead of passing all values to the figure and
+        # the counts of a sample can only be scaled if they are not counted by the figure
+        self.pre_binned = (
+            self.data_source.full_data is not None
+            or len(self.data_source.bin_counts) > 0
+            or isinstance(self.data_source.dispatcher, ProgressiveDispatcher)
+            or any(column_store.is_mapped(col) for col in self.data_source.columns)
+        )
+        self.progressive = self.pre_binned
+        # the categories of categorical columns in the order of the bars
+        self._edges: typing.Dict[str, np.ndarray] = {}
 
         self.figure_widget = self._get_figure_widget()
 
@@ -59,41 +87,83 @@ class HistogramWidget(BaseWidget):
 
     def build(self) -> widgets.Widget:
         root = widgets.VBox(
-            [widgets.HBox([self.column_select, self.normalize]), self.figure_widget]
+            [
+                widgets.HBox([self.column_select, self.normalize, self.progress]),
+                self.figure_widget,
+            ]
         )
         return self.apply_size_constraints(root)
 
-    def observe_brush_indices_change(self, sender):
-        self.brushed_data = self.data_source.brushed_data
-        if len(self.brushed_data) == len(self.data):
+    def compute_brush_update(self, selection: Selection):
+        col = self.column_select.value
+        if self.pre_binned:
+            return selection, col, self._bin(col, selection)
+        brushed_values = self.data_source.aggregates.brushed_column(col, selection)
+        return selection, col, brushed_values
+
+    def compute_sampled_update(self, selection: Selection, sample: Selection):
+        col = self.column_select.value
+        # the counts of the sample are scaled to estimate the counts of all rows
+        scale = sample.len / max(sample.count, 1)
+        return selection, col, self._bin(col, selection & sample, scale)
+
+    def refinement_distance(self, previous, result) -> float:
+        if previous[1] != result[1]:
+            return float("inf")
+        previous_counts = np.asarray(previous[2]["y"], dtype=np.float64)
+        counts = np.asarray(result[2]["y"], dtype=np.float64)
+        return float(np.abs(counts - previous_counts).sum() / max(counts.sum(), 1e-12))
+
+    def apply_brush_update(self, result):
+        selection, col, brushed_values = result
+        if self.pre_binned:
+            self._apply_pre_binned(selection, col, brushed_values)
+            return
+        if selection.count == self.data_source.aggregates.len:
             self.figure_widget.data[0].visible = False
         else:
             self.figure_widget.data[0].visible = True
 
         # empty selection for histogram does not work
-        if len(self.brushed_data) == 0:
+        if selection.count == 0:
             self.figure_widget.data[1].visible = False
         else:
             self.figure_widget.data[1].visible = True
 
-        self.figure_widget.data[
-            1
-        ].selectedpoints = (
-            self.data_source.brushed_indices
+        self.figure_widget.data[1].selectedpoints = (
+            selection.positions
         )  # set selected points so that double click works
-        self._redraw_plot()
+        if col != self.column_select.value:  # column was changed during the computation
+            brushed_values = self.data_source.brushed_column(
+                self.column_select.value, selection
+            )
+        with self.figure_widget.batch_update():
+            self.figure_widget.data[1].x = brushed_values
+
+    def observe_rows_appended(self, sender, rows, evicted=0):
+        super().observe_rows_appended(sender, rows, evicted)
+        if self.pre_binned:
+            self._edges.clear()
+            self._redraw_plot(only_brushed=False)
+            return
+        trace = self.figure_widget.data[0]
+        with self.figure_widget.batch_update():
+            trace.x = extend_values(trace.x, rows[self.column_select.value], evicted)
 
     # issue: selection does not work for histogram: https://github.com/plotly/plotly.py/issues/2698
     def on_selection(self, trace, points, state):
         pass
 
     def on_deselection(self, trace, points):
-        self.data_source.reset_selection()
+        self.data_source.reset_selection(dimension=self)
 
     def _on_column_change(self, change):
         self._redraw_plot(only_brushed=False)
 
     def _on_normalize_change(self, change):
+        if self.pre_binned:
+            self._redraw_plot(only_brushed=False)
+            return
         use_norm = self.normalize.value
         hist_norm = "probability" if use_norm else ""
         with self.figure_widget.batch_update():
@@ -104,12 +174,14 @@ class HistogramWidget(BaseWidget):
         return go.FigureWidget(self._get_histograms())
 
     def _get_histograms(self):
+        if self.pre_binned:
+            return self._get_bars()
         col = self.column_select.value
         config = Config()
         fig = go.Figure(layout=go.Layout(margin=dict(l=5, r=5, b=5, t=5, pad=2)))
         fig.add_trace(
             go.Histogram(
-                x=self.data[col],
+                x=self.data_source.aggregates.column(col),
                 opacity=max(config.alpha, 0.75),
                 marker={"color": "rgb(%d,%d,%d)" % config.deselect_color},
                 selected={"marker": {"color": "rgb(%d,%d,%d)" % config.deselect_color}},
@@ -121,7 +193,7 @@ class HistogramWidget(BaseWidget):
         )
         fig.add_trace(
             go.Histogram(
-                x=self.brushed_data[col],
+                x=self.data_source.brushed_column(col),
                 opacity=1.0,
                 # mode='markers',
                 marker={"color": "rgb(%d,%d,%d)" % config.select_color},
@@ -137,7 +209,112 @@ class HistogramWidget(BaseWidget):
 
     def _redraw_plot(self, only_brushed=True):
         col = self.column_select.value
+        if self.pre_binned:
+            selection = self.data_source.aggregates.selection
+            with self.figure_widget.batch_update():
+                self.figure_widget.data[1].update(self._bin(col, selection))
+                if not only_brushed:
+                    self.figure_widget.data[0].update(self._bin(col))
+            return
+        brushed_values = self.data_source.aggregates.brushed_column(col)
         with self.figure_widget.batch_update():
-            self.figure_widget.data[1].x = self.brushed_data[col]
+            self.figure_widget.data[1].x = brushed_values
             if not only_brushed:
-                self.figure_widget.data[0].x = self.data[col]
+                self.figure_widget.data[0].x = self.data_source.aggregates.column(col)
+
+    def _apply_pre_binned(self, selection: Selection, col: str, bars: dict):
+        if col != self.column_select.value:  # column was changed during the computation
+            col = self.column_select.value
+            bars = self._bin(col, selection)
+        with self.figure_widget.batch_update():
+            self.figure_widget.data[0].visible = (
+                selection.count != self.data_source.aggregates.len
+            )
+            self.figure_widget.data[1].visible = selection.count != 0
+            self.figure_widget.data[1].update(bars)
+
+    def _get_bars(self):
+        col = self.column_select.value
+        config = Config()
+        fig = go.Figure(layout=go.Layout(margin=dict(l=5, r=5, b=5, t=5, pad=2)))
+        fig.add_trace(
+            go.Bar(
+                opacity=max(config.alpha, 0.75),
+                marker={"color": "rgb(%d,%d,%d)" % config.deselect_color},
+                hoverinfo="skip",
+                **self._bin(col)
+            )
+        )
+        fig.add_trace(
+            go.Bar(
+                opacity=1.0,
+                marker={"color": "rgb(%d,%d,%d)" % config.select_color},
+                hoverinfo="skip",
+                **self._bin(col, self.data_source.aggregates.selection)
+            )
+        )
+        fig.update_layout(
+            barmode="overlay", bargap=0, showlegend=False, dragmode="select"
+        )
+        return fig
+
+    def _bin(
+        self, col: str, selection: typing.Optional[Selection] = None, scale: float = 1.0
+    ) -> dict:
+        """
+        Counts the rows per bin of a numerical or time based column or per category of a categorical column.
+        The bins and the categories of the rows are determined once by the column store, so the rows of a selection
+        are only counted.
+
+        :param col: Name of the column.
+        :param selection: The rows to count. Defaults to all rows.
+        :param scale: Factor for the counts, e.g. to estimate the counts of all rows from a sample.
+        :return: The x, y and width properties of a bar trace showing the counts.
+        """
+        column_store = self.data_source.aggregates.column_store
+        if selection is not None and selection.count == selection.len:
+            selection = None
+        if col in self.data_source.categorical_columns:
+            categories = self._edges.get(col)
+            if categories is None:
+                categories = (
+                    pd.Series(self.data_source.aggregates.column(col))
+                    .value_counts()
+                    .index.values
+                )
+                self._edges[col] = categories
+            counts = column_store.value_counts(col, selection).reindex(
+                categories, fill_value=0
+            )
+            return dict(
+                x=categories, y=self._normalized(counts.values * scale), width=None
+            )
+        running = (
+            self.data_source.bin_counts.get(col)
+            if self.data_source.full_data is None
+            else None
+        )
+        if running is None:
+            edges, counts = column_store.bin_counts(col, self.bins, selection)
+        elif selection is None:
+            # kept up to date while rows are appended and evicted
+            edges, counts = running.edges, running.counts
+        else:
+            edges = running.edges
+            counts = BinCounts(edges, column_store.gather(col, selection)).counts
+        centers = (edges[:-1] + edges[1:]) / 2
+        widths = np.diff(edges)
+        if col in self.data_source.time_columns:
+            if pd.api.types.is_timedelta64_dtype(
+                self.data_source.aggregates.column(col)
+            ):
+                centers = pd.to_timedelta(centers).astype(str)
+            else:
+                centers = pd.to_datetime(centers)
+                widths = widths / 1e6  # plotly expects the width of dates in ms
+        return dict(x=centers, y=self._normalized(counts * scale), width=widths)
+
+    def _normalized(self, counts: np.ndarray) -> np.ndarray:
+        if not self.normalize.value or counts.sum() == 0:
+            return counts
+        return counts / counts.sum()
@@ -4,6 +4,8 @@ import numpy as np
 
 from pandas_visual_analysis import DataSource
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.util import extend_values
 from pandas_visual_analysis.widgets import BaseWidget, register_widget
 from pandas_visual_analysis.widgets.helpers.multi_select import HasMultiSelect
 
@@ -62,21 +64,29 @@ class ParallelCategoriesWidget(BaseWidget, HasMultiSelect):
     def apply_size_constraints(self, widget):
         return super().apply_size_constraints(widget)
 
-    def observe_brush_indices_change(self, sender):
-        new_indices = list(self.data_source.brushed_indices)
+    def compute_brush_update(self, selection: Selection):
+        return selection.mask.astype("uint8")
 
-        new_color = np.zeros(self.data_source.len, dtype="uint8")
-        new_color[new_indices] = 1
+    def apply_brush_update(self, result):
         with self.figure_widget.batch_update(), self.figure_widget.hold_trait_notifications():
-            self.figure_widget.data[0].line.color = new_color
+            self.figure_widget.data[0].line.color = result
 
     def set_observers(self):
         self.data_source.on_indices_changed.connect(self.observe_brush_indices_change)
+        self.data_source.on_rows_appended.connect(self.observe_rows_appended)
         if self.use_multi_select:
             self.multi_select.on_selected_options_changed.connect(
                 self._on_selected_columns_changed
             )
 
+    def observe_rows_appended(self, sender, rows, evicted=0):
+        super().observe_rows_appended(sender, rows, evicted)
+        with self.figure_widget.batch_update():
+            for dimension in self.figure_widget.data[0].dimensions:
+                dimension["values"] = extend_values(
+                    dimension["values"], rows[dimension["label"]], evicted
+                )
+
     def on_selection(self, trace, points, state):
         new_color = np.zeros(self.data_source.len, dtype="uint8")
         new_color[points.point_inds] = 1
@@ -92,7 +102,7 @@ class ParallelCategoriesWidget(BaseWidget, HasMultiSelect):
         config = Config()
         trace = go.Parcats(
             dimensions=[
-                {"label": col, "values": self.data_source.data[col]}
+                {"label": col, "values": self.data_source.column(col)}
                 for col in self.selected_columns
             ],
             line=dict(
@@ -122,11 +132,10 @@ class ParallelCategoriesWidget(BaseWidget, HasMultiSelect):
 
     def _redraw_plot(self):
         new_dims = [
-            {"label": col, "values": self.data_source.data[col]}
+            {"label": col, "values": self.data_source.column(col)}
             for col in self.selected_columns
         ]
         self.figure_widget.data[0].dimensions = new_dims
-        new_color = np.zeros(self.data_source.len, dtype="uint8")
-        new_color[list(self.data_source.brushed_indices)] = 1
+        new_color = self.data_source.selection.mask.astype("uint8")
         with self.figure_widget.batch_update(), self.figure_widget.hold_trait_notifications():
             self.figure_widget.data[0].line.color = new_color
@@ -1,14 +1,17 @@
 import numbers
+import typing
 
 import ipywidgets as widgets
 import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
-from plotly.callbacks import Points
 
 from pandas_visual_analysis import DataSource
 from pandas_visual_analysis.data_source import SelectionType
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.predicate import And, Between, Or, Predicate
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.util import extend_values
 from pandas_visual_analysis.widgets import BaseWidget, register_widget
 from pandas_visual_analysis.widgets.helpers.multi_select import (
     HasMultiSelect,
@@ -82,8 +85,14 @@ class ParallelCoordinatesWidget(BaseWidget, HasMultiSelect):
     def build(self):
         return self.apply_size_constraints(self.root)
 
-    def observe_brush_indices_change(self, sender):
-        if not self.change_initiated:
+    def compute_brush_update(self, selection: Selection):
+        return selection.mask.astype("uint8")
+
+    def apply_brush_update(self, result):
+        # in crossfilter mode the constraint ranges are the filter of this widget and are kept
+        if not self.change_initiated and not self.data_source.crossfilter.has_filter(
+            self
+        ):
             # shortly disable selection behaviour to reset constraint ranges
             self.figure_widget.data[0].on_change(self.pass_func, "dimensions")
             with self.figure_widget.batch_update(), self.figure_widget.hold_trait_notifications():
@@ -96,33 +105,53 @@ class ParallelCoordinatesWidget(BaseWidget, HasMultiSelect):
 
         self.change_initiated = False
 
-        new_indices = list(self.data_source.brushed_indices)
-        new_color = np.zeros(self.data_source.len, dtype="uint8")
-        new_color[new_indices] = 1
         with self.figure_widget.batch_update(), self.figure_widget.hold_trait_notifications():
-            self.figure_widget.data[0].line.color = new_color
+            self.figure_widget.data[0].line.color = result
 
     def set_observers(self):
         self.data_source.on_indices_changed.connect(self.observe_brush_indices_change)
+        self.data_source.on_rows_appended.connect(self.observe_rows_appended)
         if self.use_multi_select:
             self.multi_select.on_selected_options_changed.connect(
                 self._on_selected_columns_changed
             )
 
+    def observe_rows_appended(self, sender, rows, evicted=0):
+        super().observe_rows_appended(sender, rows, evicted)
+        # shortly disable selection behaviour, the constraint ranges do not change
+        self.figure_widget.data[0].on_change(self.pass_func, "dimensions")
+        with self.figure_widget.batch_update(), self.figure_widget.hold_trait_notifications():
+            for dimension in self.figure_widget.data[0].dimensions:
+                new_values = rows[dimension["label"]]
+                dimension["values"] = extend_values(
+                    dimension["values"], new_values, evicted
+                )
+                dimension["range"] = [
+                    min(dimension["range"][0], new_values.min()),
+                    max(dimension["range"][1], new_values.max()),
+                ]
+        self.figure_widget.data[0].on_change(self._on_selection_helper, "dimensions")
+
     def on_selection(self, trace, points, state):
+        self._brush(points.point_inds)
+
+    def _brush(
+        self,
+        point_inds: typing.Union[typing.List[int], Selection],
+        predicate: typing.Optional[Predicate] = None,
+    ):
         self.change_initiated = True
         if self.data_source.selection_type in {
             SelectionType.ADDITIVE,
             SelectionType.SUBTRACTIVE,
         }:
-            self.change_initiated = False  # we want to remove constraint ranges in observe_brush_indices_change
+            self.change_initiated = False  # we want to remove constraint ranges in apply_brush_update
 
-        new_color = np.zeros(self.data_source.len, dtype="uint8")
-        new_color[points.point_inds] = 1
+        selection = Selection.from_indices(point_inds, self.data_source.len)
         with self.figure_widget.batch_update(), self.figure_widget.hold_trait_notifications():
-            self.figure_widget.data[0].line.color = new_color
+            self.figure_widget.data[0].line.color = selection.mask.astype("uint8")
 
-        self.data_source.brushed_indices = points.point_inds
+        self.data_source.brush(selection, dimension=self, predicate=predicate)
 
     def _on_selection_helper(self, obj, dimensions):
         old_ranges = self.constraint_ranges
@@ -136,29 +165,30 @@ class ParallelCoordinatesWidget(BaseWidget, HasMultiSelect):
         if len(list(self.constraint_ranges.keys())) == 0:
             self.on_deselection(None, None)
             return
-        mask = self._get_constraint_mask(self.constraint_ranges)
-        points = np.arange(self.data_source.len)[mask].tolist()
-        self.on_selection(None, Points(point_inds=points), None)
+        predicate = self._get_constraint_predicate(self.constraint_ranges)
+        self._brush(self.data_source.where(predicate), predicate)
 
     def _get_constraint_mask(self, constraint_ranges: dict) -> np.array:
-        cols = list(constraint_ranges.keys())
-        mask: np.array = np.full(self.data_source.len, fill_value=True, dtype=bool)
-        for col in cols:
-            range_tuple = constraint_ranges[col]
+        return self.data_source.where(
+            self._get_constraint_predicate(constraint_ranges)
+        ).mask
+
+    def _get_constraint_predicate(self, constraint_ranges: dict) -> Predicate:
+        """
+        Several constraint ranges in one dimension are combined with or, the dimensions are combined with and.
+        The rows in the ranges are found with the sorted indexes of the columns.
+        """
+        dimension_predicates = []
+        for col, range_tuple in constraint_ranges.items():
             if all(isinstance(x, numbers.Number) for x in range_tuple):
                 range_tuple = (range_tuple,)
-            intermediate_mask: np.array = np.full(
-                self.data_source.len, fill_value=False, dtype=bool
-            )  # for several constraints in one dimension
-            for ranges in range_tuple:
-                intermediate_mask |= (
-                    self.data_source.data[col].between(ranges[0], ranges[1])
-                ).values
-            mask &= intermediate_mask
-        return mask
+            dimension_predicates.append(
+                Or(*[Between(col, ranges[0], ranges[1]) for ranges in range_tuple])
+            )
+        return And(*dimension_predicates)
 
     def on_deselection(self, trace, points):
-        self.data_source.reset_selection()
+        self.data_source.reset_selection(dimension=self)
 
     def _get_par_coords(self) -> go.Parcoords:
         config = Config()
@@ -190,8 +220,10 @@ class ParallelCoordinatesWidget(BaseWidget, HasMultiSelect):
         return trace, figure_widget
 
     def _get_dimension_dict(self, col: str) -> dict:
-        series: pd.Series = self.data_source.data[col]
-        return dict(range=[series.min(), series.max()], label=col, values=series)
+        # before the values are accessed, so that lazily loaded data computes the range in the database
+        summary = self.data_source.column_store.summary(col)
+        series: pd.Series = self.data_source.column(col)
+        return dict(range=[summary["min"], summary["max"]], label=col, values=series)
 
     # def _toggle_multi_select(self, obj):
     #     if self.multi_select:
@@ -1,8 +1,14 @@
+import typing
+
 import ipywidgets as widgets
 import plotly.graph_objs as go
+from plotly.callbacks import BoxSelector, LassoSelector
 
 from pandas_visual_analysis import DataSource
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.predicate import Between, InPolygon, Predicate
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.util import extend_values
 from pandas_visual_analysis.widgets.base_widget import BaseWidget
 from pandas_visual_analysis.widgets.registry import register_widget
 
@@ -77,8 +83,8 @@ class ScatterWidget(BaseWidget):
     def _get_scatter(self):
         config = Config()
         return go.Scatter(
-            x=self.data_source.data[self.x_selection.value],
-            y=self.data_source.data[self.y_selection.value],
+            x=self.data_source.column(self.x_selection.value),
+            y=self.data_source.column(self.y_selection.value),
             opacity=config.alpha,
             mode="markers",
             marker={"color": "rgb(%d,%d,%d)" % config.deselect_color},
@@ -91,19 +97,52 @@ class ScatterWidget(BaseWidget):
         root = widgets.VBox([self._get_controls(), self.figure_widget])
         return self.apply_size_constraints(root)
 
-    def observe_brush_indices_change(self, sender):
-        new_indices = self.data_source.brushed_indices
+    def compute_brush_update(self, selection: Selection):
+        return selection.positions
+
+    def apply_brush_update(self, result):
         # noinspection SpellCheckingInspection
-        self.figure_widget.data[0].selectedpoints = new_indices
+        self.figure_widget.data[0].selectedpoints = result
 
     def set_observers(self):
         self.data_source.on_indices_changed.connect(self.observe_brush_indices_change)
+        self.data_source.on_rows_appended.connect(self.observe_rows_appended)
+
+    def observe_rows_appended(self, sender, rows, evicted=0):
+        super().observe_rows_appended(sender, rows, evicted)
+        trace = self.figure_widget.data[0]
+        with self.figure_widget.batch_update():
+            trace.x = extend_values(trace.x, rows[self.x_selection.value], evicted)
+            trace.y = extend_values(trace.y, rows[self.y_selection.value], evicted)
+            if self.size_selection.value != "None":
+                trace.marker["size"] = extend_values(
+                    trace.marker["size"], rows[self.size_selection.value], evicted
+                )
 
     def on_selection(self, trace, points, state):
-        self.data_source.brushed_indices = points.point_inds
+        self.data_source.brush(
+            points.point_inds, dimension=self, predicate=self._selector_predicate(state)
+        )
+
+    def _selector_predicate(self, selector) -> typing.Optional[Predicate]:
+        """
+        Describes a box or lasso selection of two numerical axes as a predicate,
+        so that it can be translated to the full data of a sample.
+        """
+        x, y = self.x_selection.value, self.y_selection.value
+        numerical_columns = self.data_source.numerical_columns
+        if x not in numerical_columns or y not in numerical_columns:
+            return None
+        if isinstance(selector, BoxSelector):
+            return Between(x, *sorted(selector.xrange)) & Between(
+                y, *sorted(selector.yrange)
+            )
+        if isinstance(selector, LassoSelector):
+            return InPolygon(x, y, selector.xs, selector.ys)
+        return None
 
     def on_deselection(self, trace, points):
-        self.data_source.reset_selection()
+        self.data_source.reset_selection(dimension=self)
 
     def on_axis_change(self, change):
         description = change["owner"].description.replace(":", "")
@@ -1,8 +1,14 @@
+import asyncio
+
+import numpy as np
 import pytest
 import pandas as pd
 
 from pandas_visual_analysis import DataSource
 from pandas_visual_analysis.data_source import SelectionType
+from pandas_visual_analysis.utils.predicate import Between, InPolygon, IsIn
+from pandas_visual_analysis.utils.selection import Selection
+from pandas_visual_analysis.utils.shared_frame import SharedFrame
 from tests import sample_dataframes
 
 df_size = 1000
@@ -134,12 +140,62 @@ class TestIndicesData:
         bs = DataSource(small_df_index, None)
         assert len(bs.brushed_indices) == len(bs.brushed_data)
 
+    def test_selection_accessors(self, small_df):
+        bs = DataSource(small_df, None)
+        bs.brushed_indices = [3, 1]
+        assert bs.selection.count == 2
+        assert list(bs.selection.positions) == [1, 3]
+        assert list(bs.selection.mask) == [False, True, False, True, False]
+
+    def test_brushed_indices_from_mask_selection(self, small_df):
+        bs = DataSource(small_df, None)
+        bs.brushed_indices = Selection.from_mask(small_df["e"].values)
+        assert bs.brushed_indices == {0, 1, 4}
+
     def test_data_source_bool_col_not_in_cat_cols(self, small_df):
         assert "bool" in str(small_df["e"].dtype)
         with pytest.raises(ValueError):
             DataSource(small_df, categorical_columns=["b"])
 
 
+class TestBrushedColumns:
+    def test_brushed_column(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [3, 1]
+        assert list(ds.brushed_column("a")) == [2, 4]
+
+    def test_brushed_column_all_selected_no_copy(self, small_df):
+        ds = DataSource(small_df, None)
+        assert ds.brushed_column("c") is ds.brushed_column("c")
+        assert len(ds.brushed_column("c")) == len(small_df)
+
+    def test_brushed_column_cache_invalidated(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [0]
+        assert list(ds.brushed_column("a")) == [1]
+        ds.brushed_indices = [4]
+        assert list(ds.brushed_column("a")) == [5]
+
+    def test_brushed_column_unknown(self, small_df):
+        ds = DataSource(small_df, None)
+        with pytest.raises(KeyError):
+            ds.brushed_column("unknown")
+
+    def test_brushed_columns(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [2]
+        columns = ds.brushed_columns(["a", "b"])
+        assert list(columns.keys()) == ["a", "b"]
+        assert list(columns["b"]) == ["X"]
+
+    def test_brushed_data_ascending_order(self, small_df_index):
+        ds = DataSource(small_df_index, None)
+        ds.brushed_indices = [4, 0, 2]
+        assert list(ds.brushed_data.index) == ["a_one", "c_three", "e_five"]
+        assert list(ds.brushed_data.columns) == list(small_df_index.columns)
+        assert list(ds.brushed_data.dtypes) == list(small_df_index.dtypes)
+
+
 class TestObserve:
     def test_brush_selection_observe_brushed_indices(self, small_df_index):
         ds = DataSource(small_df_index, None)
@@ -160,6 +216,379 @@ class TestObserve:
         ds._brushed_indices = [0]
 
 
+class TestSelectionChange:
+    def test_standard_change(self, small_df):
+        ds = DataSource(small_df, None)
+        changes = []
+        ds.on_selection_changed.connect(
+            lambda sender, change: changes.append(change), weak=False
+        )
+        ds.brushed_indices = [1, 2]
+
+        change = changes[0]
+        assert change.selection_type == SelectionType.STANDARD
+        assert list(change.added) == []
+        assert list(change.removed) == [0, 3, 4]
+        assert change.previous_count == 5
+        assert change.count == 2
+
+    def test_additive_change(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1, 2]
+        ds.selection_type = SelectionType.ADDITIVE
+        ds.brushed_indices = [2, 3]
+
+        change = ds.last_change
+        assert change.selection_type == SelectionType.ADDITIVE
+        assert list(change.added) == [3]
+        assert list(change.removed) == []
+        assert (change.previous_count, change.count) == (2, 3)
+
+    def test_subtractive_change(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1, 2]
+        ds.selection_type = SelectionType.SUBTRACTIVE
+        ds.brushed_indices = [2, 3]
+
+        change = ds.last_change
+        assert list(change.added) == []
+        assert list(change.removed) == [2]
+        assert change.count == 1
+
+    def test_reset_change(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1, 2]
+        ds.reset_selection()
+
+        assert list(ds.last_change.added) == [0, 3, 4]
+        assert list(ds.last_change.removed) == []
+
+    def test_version_increases(self, small_df):
+        ds = DataSource(small_df, None)
+        assert ds.selection_version == 0
+        ds.brushed_indices = [1]
+        ds.brushed_indices = [1]
+        assert ds.selection_version == 2
+        assert ds.last_change.version == 2
+
+
+class TestBatch:
+    def test_batch_single_notification(self, small_df):
+        ds = DataSource(small_df, None)
+        changes = []
+        ds.on_selection_changed.connect(
+            lambda sender, change: changes.append(change), weak=False
+        )
+        with ds.batch():
+            ds.brushed_indices = [1, 2]
+            ds.selection_type = SelectionType.ADDITIVE
+            ds.brushed_indices = [3]
+            assert ds.brushed_indices == {1, 2, 3}
+            assert len(changes) == 0
+
+        assert len(changes) == 1
+        assert list(changes[0].removed) == [0, 4]
+        assert changes[0].count == 3
+
+    def test_batch_brushed_data_up_to_date(self, small_df):
+        ds = DataSource(small_df, None)
+        with ds.batch():
+            ds.brushed_indices = [1]
+            assert len(ds.brushed_data) == 1
+            ds.brushed_indices = [1, 2]
+            assert len(ds.brushed_data) == 2
+
+    def test_nested_batch(self, small_df):
+        ds = DataSource(small_df, None)
+        with ds.batch():
+            with ds.batch():
+                ds.brushed_indices = [1]
+            assert ds.selection_version == 0
+        assert ds.selection_version == 1
+
+    def test_batch_no_net_change(self, small_df):
+        ds = DataSource(small_df, None)
+        with ds.batch():
+            ds.brushed_indices = [1]
+            ds.reset_selection()
+        assert ds.selection_version == 0
+
+    def test_coalesce_without_event_loop(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.coalesce_interval = 0.03
+        ds.brushed_indices = [1]
+        assert ds.selection_version == 1
+
+    def test_coalesce_with_event_loop(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.coalesce_interval = 0.03
+
+        async def brush():
+            ds.brushed_indices = [1]
+            ds.brushed_indices = [2]
+            assert ds.selection_version == 0
+            await asyncio.sleep(0.1)
+
+        asyncio.run(brush())
+        assert ds.selection_version == 1
+        assert list(ds.last_change.removed) == [0, 1, 3, 4]
+
+
+class TestHistory:
+    def test_undo_redo(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1, 2]
+        ds.brushed_indices = [3]
+
+        assert ds.undo()
+        assert ds.brushed_indices == {1, 2}
+        assert ds.undo()
+        assert ds.brushed_indices == set(range(len(small_df)))
+        assert not ds.undo()
+        assert ds.redo()
+        assert ds.brushed_indices == {1, 2}
+
+    def test_undo_notifies(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1, 2]
+        ds.brushed_indices = [3]
+        changes = []
+        ds.on_selection_changed.connect(
+            lambda sender, change: changes.append(change), weak=False
+        )
+        ds.undo()
+
+        assert len(changes) == 1
+        assert changes[0].restored
+        assert list(changes[0].added) == [1, 2]
+        assert list(changes[0].removed) == [3]
+
+    def test_selection_key(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1, 2]
+        key = ds.selection_key
+        ds.brushed_indices = [3]
+        assert ds.selection_key != key
+
+        ds.undo()
+        assert ds.selection_key == key
+        assert ds.selection_version == 3
+        assert ds.last_change.restored
+
+    def test_new_selection_discards_redo(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1, 2]
+        ds.undo()
+        ds.brushed_indices = [3]
+        assert not ds.redo()
+
+    def test_undo_flushes_batch(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1]
+        with ds.batch():
+            ds.brushed_indices = [2]
+        ds.undo()
+        assert ds.brushed_indices == {1}
+
+
+class TestSelectWhere:
+    def test_select_range(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.select_where("a", 2, 4)
+        assert ds.brushed_indices == {1, 2, 3}
+
+    def test_open_range(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.select_where("c", lo=4)
+        assert ds.brushed_indices == {3, 4}
+
+    def test_compound_predicate(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.select_where((Between("a", 1, 2) | Between("a", 5, 5)) & ~Between("c", hi=2))
+        assert ds.brushed_indices == {1, 4}
+
+    def test_selection_type(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [0]
+        ds.selection_type = SelectionType.ADDITIVE
+        ds.select_where("a", 5, None)
+        assert ds.brushed_indices == {0, 4}
+
+    def test_where_keeps_selection(self, small_df):
+        ds = DataSource(small_df, None)
+        selection = ds.where(Between("a", hi=1))
+        assert selection.indices == {0}
+        assert ds.brushed_indices == set(range(len(small_df)))
+
+    def test_datetime_column(self, small_df):
+        df = small_df.copy()
+        df["d"] = pd.date_range("2020-01-01", periods=len(df), freq="H")
+        ds = DataSource(df, None)
+        ds.select_where("d", "2020-01-01 01:00", "2020-01-01 02:00")
+        assert ds.brushed_indices == {1, 2}
+
+    def test_categorical_column_error(self, small_df):
+        ds = DataSource(small_df, None)
+        with pytest.raises(ValueError):
+            ds.select_where("b", 1, 2)
+
+    def test_polygon(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.select_where(InPolygon("a", "c", [1.5, 5, 5], [2, 2, 6]))
+        assert ds.brushed_indices == {1, 2, 3}
+
+
+class TestCategories:
+    def test_rows_for_category(self, small_df):
+        ds = DataSource(small_df, None)
+        assert ds.rows_for_category("e", False).indices == {2, 3}
+        assert ds.rows_for_category("b", ["v", "Z"]).indices == {0, 4}
+        assert ds.brushed_indices == set(range(len(small_df)))
+
+    def test_select_category(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.select_where(IsIn("e", True) & Between("a", 2, None))
+        assert ds.brushed_indices == {1, 4}
+
+    def test_category_counts(self, small_df):
+        ds = DataSource(small_df, None)
+        assert ds.category_counts("e").to_dict() == {True: 3, False: 2}
+        ds.brushed_indices = [0, 2]
+        assert ds.category_counts("e", ds.selection).to_dict() == {True: 1, False: 1}
+
+
+class TestCrossfilter:
+    def test_intersection_of_dimensions(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.selection_type = SelectionType.CROSSFILTER
+        ds.brush([0, 1, 2], dimension="x")
+        ds.brush([1, 2, 3], dimension="y")
+        assert ds.brushed_indices == {1, 2}
+        assert ds.selection_for("x").indices == {1, 2, 3}
+        assert ds.selection_for("y").indices == {0, 1, 2}
+        assert ds.selection_for("z").indices == {1, 2}
+
+    def test_change_delta(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.selection_type = SelectionType.CROSSFILTER
+        ds.brush([0, 1, 2], dimension="x")
+        ds.brush([1, 2, 3], dimension="y")
+        ds.brush([2, 3], dimension="x")
+        change = ds.last_change
+        assert change.selection_type == SelectionType.CROSSFILTER
+        assert list(change.added) == [3]
+        assert list(change.removed) == [1]
+
+    def test_reset_dimension(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.selection_type = SelectionType.CROSSFILTER
+        ds.brush([0, 1, 2], dimension="x")
+        ds.brush([1, 2, 3], dimension="y")
+        ds.reset_selection(dimension="y")
+        assert ds.brushed_indices == {0, 1, 2}
+        ds.reset_selection()
+        assert ds.brushed_indices == set(range(len(small_df)))
+        assert ds.crossfilter.dimensions == []
+
+    def test_switch_type_keeps_selection(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [0, 1, 2]
+        ds.selection_type = SelectionType.CROSSFILTER
+        ds.brush([1, 2, 3], dimension="x")
+        assert ds.brushed_indices == {1, 2}
+        ds.selection_type = SelectionType.STANDARD
+        assert ds.brushed_indices == {1, 2}
+        assert ds.crossfilter.dimensions == []
+
+    def test_brushed_indices_filter(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.selection_type = SelectionType.CROSSFILTER
+        ds.brush([1, 2, 3], dimension="x")
+        ds.select_where("a", 3, None)
+        assert ds.brushed_indices == {2, 3}
+
+    def test_undo(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.selection_type = SelectionType.CROSSFILTER
+        ds.brush([0, 1, 2], dimension="x")
+        ds.brush([1, 2, 3], dimension="y")
+        ds.undo()
+        assert ds.brushed_indices == {0, 1, 2}
+        assert not ds.crossfilter.has_filter("x")
+        ds.brush([4], dimension="y")
+        assert ds.brushed_indices == set()
+
+    def test_brush_other_types(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brush([1], dimension="x")
+        assert ds.brushed_indices == {1}
+        assert ds.selection_for("x") is ds.selection
+
+
+class TestAppend:
+    def test_append_selected(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1]
+        ds.append(small_df.iloc[:2])
+        assert ds.len == len(small_df) + 2
+        assert len(ds.data) == len(small_df) + 2
+        assert ds.brushed_indices == {1, 5, 6}
+        assert ds.indices == set(range(7))
+
+    def test_append_unselected(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.append_policy = False
+        ds.append(small_df.iloc[:2])
+        assert ds.brushed_indices == set(range(5))
+
+    def test_append_predicate(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [0]
+        ds.append(small_df.iloc[:3], policy=Between("a", 2, None))
+        assert ds.brushed_indices == {0, 6, 7}
+
+    def test_append_signals(self, small_df):
+        ds = DataSource(small_df, None)
+        events = []
+        ds.on_rows_appended.connect(
+            lambda sender, rows, evicted: events.append(("rows", len(rows))), weak=False
+        )
+        ds.on_selection_changed.connect(
+            lambda sender, change: events.append(("change", list(change.added))),
+            weak=False,
+        )
+        ds.append(small_df.iloc[:2])
+        assert events == [("rows", 2), ("change", [5, 6])]
+
+    def test_append_updates_data(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [4]
+        ds.append(small_df.iloc[:1], policy=False)
+        assert list(ds.brushed_column("a")) == [5]
+        ds.brushed_indices = [4, 5]
+        assert list(ds.brushed_data["a"]) == [5, 1]
+        assert ds.rows_for_category("b", "v").indices == {0, 5}
+
+    def test_append_clears_history(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.brushed_indices = [1]
+        ds.append(small_df.iloc[:1])
+        assert not ds.undo()
+
+    def test_append_crossfilter(self, small_df):
+        ds = DataSource(small_df, None)
+        ds.selection_type = SelectionType.CROSSFILTER
+        ds.brush([1, 2], dimension="x")
+        ds.append(small_df.iloc[:1], policy=False)
+        ds.brush([2, 3], dimension="y")
+        assert ds.brushed_indices == {2}
+
+    def test_append_wrong_type(self, small_df):
+        ds = DataSource(small_df, None)
+        with pytest.raises(TypeError):
+            ds.append([1, 2])
+
+
 class TestDataParameter:
     # noinspection PyTypeChecker
     def test_brush_selection_wrong_df(self):
@@ -194,6 +623,10 @@ class TestSample:
         with pytest.raises(TypeError):
             DataSource(small_df, None, "0.4")
 
+    def test_sample_same_rows(self, small_df):
+        ds = DataSource(small_df, None, 3, seed=4)
+        pd.testing.assert_frame_equal(ds.data, small_df.sample(n=3, random_state=4))
+
 
 class TestSeed:
     def test_seed_normal(self, small_df):
@@ -218,6 +651,146 @@ class TestSeed:
             DataSource(small_df, seed="ten")
 
 
+class TestFullData:
+    @pytest.fixture
+    def full_df(self):
+        return pd.DataFrame({"x": np.arange(100.0), "y": np.arange(100.0) % 10})
+
+    def test_no_full_data(self, full_df):
+        assert DataSource(full_df, keep_full_data=True).full_data is None
+        ds = DataSource(full_df, sample=10)
+        assert ds.full_data is None
+        assert ds.aggregates is ds
+
+    def test_sample_rows(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        assert ds.aggregates is ds.full_data
+        assert ds.full_data.len == 100
+        assert list(ds.full_data.data["x"].iloc[ds.full_data.sample_positions]) == list(
+            ds.data["x"]
+        )
+
+    def test_predicate_brush(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        ds.select_where("x", 10, 29)
+        assert ds.full_data.selection.indices == set(range(10, 30))
+        assert ds.full_data.exact
+        assert set(ds.data["x"].iloc[ds.selection.positions]) <= set(range(10, 30))
+
+    def test_brush_without_predicate(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        ds.brushed_indices = [0, 1]
+        assert ds.full_data.selection.indices == set(
+            ds.full_data.sample_positions[[0, 1]]
+        )
+        assert not ds.full_data.exact
+        ds.select_where("x", 0, 9)
+        assert ds.full_data.exact
+
+    def test_additive_and_subtractive(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        ds.select_where("x", 0, 9)
+        ds.selection_type = SelectionType.ADDITIVE
+        ds.select_where("x", 90, None)
+        ds.selection_type = SelectionType.SUBTRACTIVE
+        ds.select_where("y", 0, 0)
+        expected = set(range(1, 10)) | set(range(91, 100))
+        assert ds.full_data.selection.indices == expected
+
+    def test_reset(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        ds.brushed_indices = [0]
+        ds.reset_selection()
+        assert ds.full_data.selection.count == 100
+        assert ds.full_data.exact
+
+    def test_crossfilter(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        ds.selection_type = SelectionType.CROSSFILTER
+        a, b = object(), object()
+        ds.brush(ds.where(Between("x", 0, 49)), a, Between("x", 0, 49))
+        ds.brush(ds.where(Between("y", 0, 4)), b, Between("y", 0, 4))
+        assert ds.full_data.selection.count == 25
+        assert ds.aggregates.selection_for(a).count == 50
+        ds.reset_selection(dimension=b)
+        assert ds.full_data.selection.count == 50
+
+    def test_undo(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        ds.brushed_indices = [3]
+        ds.select_where("x", 0, 49)
+        ds.undo()
+        assert ds.full_data.selection.indices == {ds.full_data.sample_positions[3]}
+
+    def test_append(self, full_df):
+        ds = DataSource(full_df, sample=10, seed=1, keep_full_data=True)
+        ds.select_where("x", 0, 49)
+        ds.append(pd.DataFrame({"x": [100.0, 101.0], "y": [0.0, 1.0]}), policy=False)
+        assert ds.len == 12
+        assert ds.full_data.len == 102
+        assert ds.full_data.selection.count == 50
+        assert list(ds.full_data.sample_positions[-2:]) == [100, 101]
+
+
+class TestOptimizeMemory:
+    @pytest.fixture
+    def repeated_df(self, small_df):
+        return pd.concat([small_df] * 4, ignore_index=True)
+
+    def test_optimize_memory(self, repeated_df):
+        ds = DataSource(repeated_df, optimize_memory=True)
+        assert ds.data["a"].dtype == np.int8
+        assert ds.data["b"].dtype == "category"
+        assert ds.data["c"].dtype == np.float32
+        assert ds.memory_saved > 0
+        assert ds.categorical_columns == DataSource(repeated_df).categorical_columns
+        assert repeated_df["b"].dtype == object
+
+    def test_no_optimize_memory(self, repeated_df):
+        ds = DataSource(repeated_df)
+        assert ds.data["b"].dtype == object
+        assert ds.memory_saved == 0
+
+    def test_optimize_memory_select(self, repeated_df):
+        ds = DataSource(repeated_df, optimize_memory=True)
+        ds.select_where(IsIn("b", ["v", "Z"]) & Between("c", 1.5, 4.5))
+        assert ds.brushed_indices == {0, 5, 10, 15}
+        assert ds.category_counts("b").to_dict() == {k: 4 for k in repeated_df["b"]}
+
+    def test_optimize_memory_append(self, repeated_df):
+        ds = DataSource(repeated_df, optimize_memory=True)
+        ds.append(repeated_df.iloc[:2])
+        assert ds.data["a"].dtype == np.int8
+        assert ds.data["b"].dtype == "category"
+        ds.append(repeated_df.iloc[:1].assign(b="new"))
+        assert list(ds.data["b"])[-1] == "new"
+        assert ds.len == len(repeated_df) + 3
+
+    def test_optimize_memory_full_data(self):
+        df = pd.DataFrame({"x": np.arange(100.0), "y": np.arange(100) % 10})
+        ds = DataSource(df, sample=10, keep_full_data=True, optimize_memory=True)
+        assert ds.full_data.data["x"].dtype == np.float32
+        assert ds.data["y"].dtype == np.int8
+
+
+class TestDiskCache:
+    def test_cache(self, small_df, tmpdir):
+        ds = DataSource(small_df, cache=str(tmpdir))
+        ds.select_where(Between("a", 2, 4))
+        assert ds.brushed_indices == {1, 2, 3}
+        assert ds.column_store.cache.size > 0
+        other = DataSource(small_df, cache=ds.column_store.cache)
+        other.select_where(Between("a", 2, 4))
+        assert other.brushed_indices == {1, 2, 3}
+
+    def test_no_cache(self, small_df):
+        assert DataSource(small_df).column_store.cache is None
+
+    def test_invalid_cache(self, small_df):
+        with pytest.raises(TypeError):
+            DataSource(small_df, cache=1)
+
+
 class TestSelectionType:
     def test_standard_is_default(self, small_df):
         ds = DataSource(small_df)
@@ -270,7 +843,47 @@ class TestReadMethods:
         assert isinstance(ds.data, pd.DataFrame)
         assert len(ds.data) == len(small_df)
 
-    @pytest.mark.parametrize("extension", ["xlsx", "xls", "html", "txt"])
+    @pytest.mark.parametrize("sample", [5, 0.5])
+    def test_read_csv_sampled(self, sample_csv_filepath, small_df, sample):
+        ds = DataSource.read_csv(
+            sample_csv_filepath, sample=sample, seed=1, chunksize=2
+        )
+        assert len(ds.data) <= len(small_df)
+        assert ds.file_rows == len(small_df)
+        assert ds.file_summary["a"]["min"] == small_df["a"].min()
+        assert ds.file_summary["a"]["max"] == small_df["a"].max()
+        assert ds.file_summary["a"]["count"] == len(small_df)
+        other = DataSource.read(sample_csv_filepath, sample=sample, seed=1, chunksize=2)
+        pd.testing.assert_frame_equal(ds.data, other.data)
+
+    def test_read_tsv_sampled(self, sample_tsv_filepath, small_df):
+        ds = DataSource.read_tsv(sample_tsv_filepath, sample=3, seed=1, chunksize=2)
+        assert len(ds.data) == 3
+        assert ds.file_rows == len(small_df)
+
+    @pytest.mark.parametrize("lines", [True, False])
+    def test_read_json_sampled(self, tmpdir, small_df, lines):
+        path = str(tmpdir.join("temp.json"))
+        small_df.to_json(path, orient="records", lines=lines)
+        ds = DataSource.read_json(
+            path, orient="records", sample=3, seed=1, lines=lines, chunksize=2
+        )
+        assert len(ds.data) == 3
+        assert ds.file_rows == len(small_df)
+        assert ds.file_summary["a"]["max"] == small_df["a"].max()
+
+    def test_read_sampled_invalid(self, small_df):
+        with pytest.raises(ValueError):
+            DataSource.read_sampled([small_df], sample=-1)
+        with pytest.raises(TypeError):
+            DataSource.read_sampled([small_df], sample=2, seed="1")
+
+    def test_read_not_sampled(self, sample_csv_filepath):
+        ds = DataSource.read_csv(sample_csv_filepath)
+        assert ds.file_summary is None
+        assert ds.file_rows is None
+
+    @pytest.mark.parametrize("extension", ["xlsx", "xls", "html", "txt", "orc"])
     def test_read_unsupported(self, extension):
         with pytest.raises(ValueError):
             DataSource.read("./path/to/file.%s" % extension)
@@ -302,6 +915,28 @@ class TestReadMethods:
         assert len(ds.data) == len(small_df)
 
 
+class TestAttach:
+    def test_attach(self, small_df):
+        with SharedFrame.publish(small_df) as published:
+            ds = DataSource.attach(published.name, sample=3, seed=1)
+            assert ds.shared_frame is not None
+            assert ds.len == 3
+            assert ds.categorical_columns == DataSource(small_df).categorical_columns
+            ds.select_where(Between("a", 3, None))
+            assert len(ds.brushed_data) == (ds.data["a"] >= 3).sum()
+            ds.shared_frame.close()
+
+    def test_close_attached(self, small_df):
+        with SharedFrame.publish(small_df) as published:
+            ds = DataSource.attach(published.name)
+            ds.shared_frame.close()
+            ds.select_where(Between("a", 3, None))
+            assert ds.selection.count == 3
+
+    def test_not_attached(self, small_df):
+        assert DataSource(small_df).shared_frame is None
+
+
 class TestContextManager:
     @pytest.mark.parametrize("header", [None, 0])
     def test_read_context_csv(self, sample_csv_filepath, small_df, header):
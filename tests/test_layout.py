@@ -148,3 +148,31 @@ class TestSelectionType:
         layout = AnalysisLayout([["Scatter"], ["Scatter"]], 400, ds)
         layout.selection_type_widget.value = "sub"
         assert layout.data_source.selection_type == SelectionType.SUBTRACTIVE
+
+    def test_change_to_cross(self, small_df):
+        ds = DataSource(small_df, None)
+        layout = AnalysisLayout([["Scatter"], ["Scatter"]], 400, ds)
+        layout.selection_type_widget.value = "cross"
+        assert layout.data_source.selection_type == SelectionType.CROSSFILTER
+
+
+class TestHistoryButtons:
+    def test_buttons_disabled_initially(self, small_df):
+        layout = AnalysisLayout([["Scatter"]], 400, DataSource(small_df, None))
+        assert layout.undo_button.disabled
+        assert layout.redo_button.disabled
+
+    def test_undo_redo_click(self, small_df):
+        ds = DataSource(small_df, None)
+        layout = AnalysisLayout([["Scatter"]], 400, ds)
+        ds.brushed_indices = [1]
+        assert not layout.undo_button.disabled
+
+        layout.undo_button.click()
+        assert ds.brushed_indices == set(range(len(small_df)))
+        assert layout.undo_button.disabled
+        assert not layout.redo_button.disabled
+
+        layout.redo_button.click()
+        assert ds.brushed_indices == {1}
+        assert layout.redo_button.disabled
@@ -0,0 +1,155 @@
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource, LinkRegistry
+from pandas_visual_analysis.data_source import SelectionType
+
+
+@pytest.fixture
+def customers():
+    return DataSource(
+        pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4],
+                "region": ["north", "south", "north", "east"],
+                "age": [30.0, 40.0, 50.0, 60.0],
+            }
+        )
+    )
+
+
+@pytest.fixture
+def orders():
+    return DataSource(
+        pd.DataFrame(
+            {
+                "customer_id": [1, 1, 2, 3, 3, 3, 5, np.nan],
+                "amount": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0],
+            }
+        )
+    )
+
+
+class TestLink:
+    def test_propagate(self, orders, customers):
+        registry = LinkRegistry()
+        link = registry.link(orders, customers, "customer_id", "id")
+        assert link.other(orders) is customers
+        assert link.propagate(orders, orders.selection).indices == {0, 1, 2}
+        assert link.propagate(customers, customers.selection).indices == set(range(6))
+
+    def test_invalid(self, orders, customers):
+        registry = LinkRegistry()
+        with pytest.raises(ValueError):
+            registry.link(orders, orders, "customer_id")
+        with pytest.raises(ValueError):
+            registry.link(orders, customers, "customer_id")
+        with pytest.raises(ValueError):
+            registry.link(orders, customers, ["customer_id", "amount"], "id")
+        with pytest.raises(ValueError):
+            registry.link(orders, customers, "customer_id", "id").other(
+                DataSource(pd.DataFrame({"id": [1], "age": [20.0]}))
+            )
+
+    def test_multiple_key_columns(self):
+        left = DataSource(pd.DataFrame({"a": ["x", "x", "y"], "b": [1, 2, 1]}))
+        right = DataSource(pd.DataFrame({"a": ["y", "x", "x"], "b": [1, 1, 1]}))
+        registry = LinkRegistry()
+        registry.link(left, right, ["a", "b"])
+        left.brush([0])
+        assert right.selection.indices == {1, 2}
+        right.brush([0])
+        assert left.selection.indices == {2}
+
+
+class TestLinkRegistry:
+    def test_both_directions(self, orders, customers):
+        registry = LinkRegistry()
+        registry.link(orders, customers, "customer_id", "id")
+        orders.brush([2, 6, 7])
+        assert customers.selection.indices == {1}
+        assert orders.selection.indices == {2, 6, 7}
+
+        customers.brush([0, 2])
+        assert orders.selection.indices == {0, 1, 3, 4, 5}
+        assert customers.selection.indices == {0, 2}
+
+        customers.reset_selection()
+        assert orders.selection.count == len(orders)
+
+    def test_no_feedback(self, orders, customers):
+        registry = LinkRegistry()
+        registry.link(orders, customers, "customer_id", "id")
+        versions = orders.selection_version, customers.selection_version
+        orders.brush([0])
+        assert orders.selection_version == versions[0] + 1
+        assert customers.selection_version == versions[1] + 1
+
+    def test_chain(self, orders, customers):
+        regions = DataSource(
+            pd.DataFrame({"region": ["east", "north", "south"], "size": [1, 2, 3]})
+        )
+        registry = LinkRegistry()
+        registry.link(orders, customers, "customer_id", "id")
+        registry.link(customers, regions, "region")
+        assert len(registry.links_of(customers)) == 2
+
+        orders.brush([2])
+        assert customers.selection.indices == {1}
+        assert regions.selection.indices == {2}
+
+    def test_crossfilter(self, orders, customers):
+        registry = LinkRegistry()
+        link = registry.link(orders, customers, "customer_id", "id")
+        orders.selection_type = SelectionType.CROSSFILTER
+        orders.brush([0, 1, 2, 3], dimension="amount")
+
+        customers.brush([0, 1])
+        assert orders.crossfilter.has_filter(link)
+        assert orders.selection.indices == {0, 1, 2}
+
+        # the link receives the selection of all other filters of the orders
+        orders.brush([6], dimension="amount")
+        assert orders.selection.count == 0
+        assert customers.selection.count == 0
+        orders.reset_selection(dimension="amount")
+        assert customers.selection.count == len(customers)
+
+        registry.unlink(link)
+        assert not orders.crossfilter.has_filter(link)
+        assert len(registry.links) == 0
+        customers.brush([3])
+        assert orders.selection.count == len(orders)
+
+    def test_batch(self, orders, customers):
+        registry = LinkRegistry()
+        registry.link(orders, customers, "customer_id", "id")
+        with customers.batch():
+            orders.brush([2])
+            assert customers.selection.indices == {1}
+            version = orders.selection_version
+        # the deferred notification of the customers is not propagated back to the orders
+        assert orders.selection_version == version
+        assert orders.selection.indices == {2}
+
+    def test_append(self, orders, customers):
+        registry = LinkRegistry()
+        registry.link(orders, customers, "customer_id", "id")
+        customers.append(pd.DataFrame({"id": [5], "region": ["west"], "age": [70.0]}))
+        orders.brush([6])
+        assert customers.selection.indices == {4}
+
+        orders.append(pd.DataFrame({"customer_id": [4.0], "amount": [90.0]}))
+        customers.brush([3])
+        assert orders.selection.indices == {8}
+
+    def test_weak_reference(self, orders, customers):
+        registry = LinkRegistry()
+        registry.link(orders, customers, "customer_id", "id")
+        del registry
+        gc.collect()
+        orders.brush([2])
+        assert customers.selection.count == len(customers)
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import RollingDataSource
+from pandas_visual_analysis.utils.predicate import Between
+
+
+@pytest.fixture
+def stream_df():
+    return pd.DataFrame(
+        {
+            "t": pd.date_range("2020-01-01", periods=6, freq="min"),
+            "v": np.arange(6.0),
+            "c": list("abcabc"),
+        }
+    )
+
+
+class TestInit:
+    def test_max_rows(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=4)
+        assert ds.len == 4
+        assert list(ds.data["v"]) == [2.0, 3.0, 4.0, 5.0]
+        assert ds.max_rows == 4
+
+    def test_time_window(self, stream_df):
+        ds = RollingDataSource(stream_df, 100, time_column="t", window="2min")
+        assert list(ds.data["v"]) == [3.0, 4.0, 5.0]
+
+    def test_window_without_time_column(self, stream_df):
+        with pytest.raises(ValueError):
+            RollingDataSource(stream_df, 10, window="2min")
+
+    def test_time_column_not_time_based(self, stream_df):
+        with pytest.raises(ValueError):
+            RollingDataSource(stream_df, 10, time_column="v", window="2min")
+
+
+class TestAppend:
+    def test_evicts_oldest(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=5)
+        ds.append(stream_df.iloc[:2])
+        assert ds.len == 5
+        assert list(ds.data["v"]) == [3.0, 4.0, 5.0, 0.0, 1.0]
+
+    def test_remaps_selection(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=5)
+        ds.brushed_indices = [0, 3]
+        ds.append(stream_df.iloc[:2], policy=False)
+        assert ds.brushed_indices == {1}
+        assert list(ds.brushed_column("v")) == [4.0]
+
+    def test_time_window_eviction(self, stream_df):
+        ds = RollingDataSource(stream_df, 100, time_column="t", window="2min")
+        chunk = pd.DataFrame(
+            {"t": [pd.Timestamp("2020-01-01 00:06")], "v": [6.0], "c": ["a"]}
+        )
+        ds.append(chunk)
+        assert list(ds.data["v"]) == [4.0, 5.0, 6.0]
+
+    def test_chunk_larger_than_window(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=3)
+        ds.append(stream_df, policy=Between("v", 4, None))
+        assert list(ds.data["v"]) == [3.0, 4.0, 5.0]
+        assert ds.brushed_indices == {1, 2}
+
+    def test_evicted_signal(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=5)
+        events = []
+        ds.on_rows_appended.connect(
+            lambda sender, rows, evicted: events.append((len(rows), evicted)),
+            weak=False,
+        )
+        ds.append(stream_df.iloc[:2])
+        assert events == [(2, 2)]
+
+    def test_aggregates(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=4, bins=4)
+        for i in range(3):
+            ds.append(stream_df.iloc[i : i + 2])
+        values = ds.data["v"]
+        assert ds.moments["v"].count == len(values)
+        assert ds.moments["v"].mean == pytest.approx(values.mean())
+        assert ds.moments["v"].std == pytest.approx(values.std())
+        edges = ds.bin_counts["v"].edges
+        clipped = np.clip(
+            values, edges[0], edges[-1]
+        )  # outside values count in the outer bins
+        assert list(ds.bin_counts["v"].counts) == list(
+            np.histogram(clipped, bins=edges)[0]
+        )
+
+    def test_constant_memory(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=4)
+        for i in range(20):
+            ds.append(stream_df.iloc[i % 6 : i % 6 + 1])
+        assert ds.len == 4
+        assert len(ds._buffer._columns["v"]) == 2 * 4
+
+    def test_wrong_columns(self, stream_df):
+        ds = RollingDataSource(stream_df, max_rows=4)
+        with pytest.raises(ValueError):
+            ds.append(stream_df[["t", "v"]])
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource, SharedData
+from pandas_visual_analysis.utils.predicate import Between
+from tests import sample_dataframes
+
+
+@pytest.fixture
+def small_df():
+    return sample_dataframes.small_df()
+
+
+@pytest.fixture
+def full_df():
+    return pd.DataFrame({"x": np.arange(100.0), "y": np.arange(100) % 10})
+
+
+class TestInit:
+    def test_shared_data(self, small_df):
+        shared_data = SharedData(small_df)
+        pd.testing.assert_frame_equal(shared_data.data, small_df)
+        assert np.shares_memory(shared_data.data["a"].values, small_df["a"].values)
+        assert shared_data.columns == list(small_df.columns)
+        assert shared_data.sample_positions is None
+        assert shared_data.full_data is None
+        assert len(shared_data) == len(small_df)
+
+    def test_sample(self, small_df):
+        shared_data = SharedData(small_df, sample=3, seed=4)
+        pd.testing.assert_frame_equal(
+            shared_data.data, small_df.sample(n=3, random_state=4)
+        )
+        assert len(shared_data.sample_positions) == 3
+
+    def test_keep_full_data(self, full_df):
+        shared_data = SharedData(full_df, sample=10, keep_full_data=True)
+        pd.testing.assert_frame_equal(shared_data.full_data, full_df)
+        assert shared_data.full_column_store is not None
+
+    def test_invalid(self, small_df):
+        with pytest.raises(TypeError):
+            SharedData([1, 2])
+        with pytest.raises(ValueError):
+            SharedData(small_df, sample=100)
+        with pytest.raises(ValueError):
+            SharedData(small_df[["a"]])
+
+
+class TestDataSource:
+    def test_shared_rows(self, small_df):
+        shared_data = SharedData(small_df, sample=4, seed=1)
+        first, second = DataSource(shared_data), DataSource(shared_data)
+        assert first.data is second.data
+        assert first.shared_data is shared_data
+        assert first.len == second.len == 4
+
+    def test_private_selection(self, small_df):
+        shared_data = SharedData(small_df)
+        first, second = DataSource(shared_data), DataSource(shared_data)
+        first.brushed_indices = [0, 1]
+        assert second.brushed_indices == set(range(len(small_df)))
+        second.select_where(Between("a", 3, None))
+        assert first.brushed_indices == {0, 1}
+        assert second.brushed_indices == {2, 3, 4}
+
+    def test_shared_indexes(self, small_df):
+        shared_data = SharedData(small_df)
+        first, second = DataSource(shared_data), DataSource(shared_data)
+        first.select_where(Between("a", 3, None))
+        assert second.column_store.sorted_index("a") is first.column_store.sorted_index(
+            "a"
+        )
+
+    def test_private_column_iterators(self, small_df):
+        shared_data = SharedData(small_df)
+        first, second = DataSource(shared_data), DataSource(shared_data)
+        assert (
+            first.column_store.next_numerical() == second.column_store.next_numerical()
+        )
+
+    def test_append_copy_on_write(self, small_df):
+        shared_data = SharedData(small_df)
+        first, second = DataSource(shared_data), DataSource(shared_data)
+        second.select_where(Between("a", 3, None))
+        first.append(small_df.iloc[:2])
+        assert first.len == len(small_df) + 2
+        assert second.len == len(shared_data.data) == len(small_df)
+        second.select_where(Between("a", 1, 2))
+        assert second.brushed_indices == {0, 1}
+        assert DataSource(shared_data).len == len(small_df)
+
+    def test_shared_full_data(self, full_df):
+        shared_data = SharedData(full_df, sample=10, seed=2, keep_full_data=True)
+        first, second = DataSource(shared_data), DataSource(shared_data)
+        assert first.full_data is not second.full_data
+        assert first.full_data.column_store.sorted_index(
+            "x"
+        ) is second.full_data.column_store.sorted_index("x")
+        first.select_where(Between("x", None, 49.5))
+        assert first.full_data.selection.count == 50
+        assert second.full_data.selection.count == 100
+        first.append(full_df.iloc[:5])
+        assert first.full_data.len == 105
+        assert second.full_data.len == 100
+
+    def test_read_only(self, full_df):
+        shared_data = SharedData(full_df, sample=10, seed=2, keep_full_data=True)
+        ds = DataSource(shared_data)
+        index = ds.column_store.sorted_index("x")
+        with pytest.raises(ValueError):
+            shared_data.data.iloc[0, 0] = -1.0
+        with pytest.raises(ValueError):
+            shared_data.full_data.loc[0, "x"] = -1.0
+        with pytest.raises(ValueError):
+            ds.data["y"].values[0] = -1
+        with pytest.raises(ValueError):
+            index.order[0] = 0
+        with pytest.raises(ValueError):
+            shared_data.full_column_store.bins("x", 10)[1][0] = 0
+        with pytest.raises(ValueError):
+            shared_data.sample_positions[0] = 0
+
+        ds.append(full_df.iloc[:2])
+        assert not ds.column_store.read_only
+        assert shared_data.column_store.read_only
+
+    def test_input_stays_writeable(self, small_df):
+        DataSource(small_df)
+        SharedData(small_df)
+        small_df.loc[0, "a"] = 5
+        small_df["a"] += 1
+        small_df.iloc[1, 2] = 7
+        assert small_df.loc[0, "a"] == 6
+        assert small_df.iloc[1, 2] == 7
+
+    def test_parameters_with_shared_data(self, small_df):
+        shared_data = SharedData(small_df)
+        with pytest.raises(ValueError):
+            DataSource(shared_data, sample=2)
+        with pytest.raises(ValueError):
+            DataSource(shared_data, optimize_memory=True)
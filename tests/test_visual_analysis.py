@@ -1,6 +1,6 @@
 import pytest
 
-from pandas_visual_analysis import VisualAnalysis, DataSource
+from pandas_visual_analysis import VisualAnalysis, DataSource, SharedData
 from tests import sample_dataframes
 
 
@@ -30,6 +30,12 @@ class TestInit:
         ds = DataSource(small_df, None)
         assert VisualAnalysis(data=ds)
 
+    def test_init_with_shared_data(self, small_df):
+        shared_data = SharedData(small_df, sample=3, seed=1)
+        first, second = VisualAnalysis(shared_data), VisualAnalysis(shared_data)
+        assert first.data_source is not second.data_source
+        assert first.data_source.data is second.data_source.data
+
     def test_data_type_error(self):
         with pytest.raises(TypeError):
             VisualAnalysis(data=[1, 2, 3])
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis.utils.aggregates import BinCounts, Moments
+
+
+class TestMoments:
+    def test_moments(self):
+        values = np.array([1.0, 2.0, 4.0, np.nan])
+        moments = Moments(values)
+        assert moments.count == 3
+        assert moments.mean == pytest.approx(np.nanmean(values))
+        assert moments.std == pytest.approx(np.nanstd(values, ddof=1))
+
+    def test_remove(self):
+        moments = Moments(np.array([1.0, 2.0, 4.0]))
+        moments.add(np.array([8.0]))
+        moments.remove(np.array([1.0, 2.0]))
+        assert moments.count == 2
+        assert moments.mean == pytest.approx(6.0)
+        assert moments.var == pytest.approx(8.0)
+
+    def test_large_offset(self):
+        rng = np.random.default_rng(0)
+        values = 1e8 + rng.standard_normal(10000)
+        moments = Moments(values[:1000])
+        # a rolling window over the stream
+        for start in range(0, 9000, 100):
+            moments.add(values[start + 1000 : start + 1100])
+            moments.remove(values[start : start + 100])
+        window = values[9000:]
+        assert moments.count == len(window)
+        assert moments.mean == pytest.approx(window.mean(), abs=1e-6)
+        assert moments.var == pytest.approx(window.var(ddof=1), rel=1e-6)
+
+    def test_empty(self):
+        moments = Moments()
+        assert np.isnan(moments.mean)
+        assert np.isnan(moments.var)
+
+    def test_nullable(self):
+        moments = Moments(pd.Series([1, None, 3], dtype="Int64").values)
+        assert moments.count == 2
+        assert moments.mean == pytest.approx(2.0)
+
+
+class TestBinCounts:
+    def test_counts(self):
+        values = np.array([0.0, 0.5, 1.0, 1.5, 2.0])
+        edges = np.histogram_bin_edges(values, bins=2)
+        bin_counts = BinCounts(edges, values)
+        assert list(bin_counts.counts) == list(np.histogram(values, bins=edges)[0])
+
+    def test_outside_values_clipped(self):
+        bin_counts = BinCounts([0.0, 1.0, 2.0], np.array([-5.0, 5.0, np.nan]))
+        assert list(bin_counts.counts) == [1, 1]
+
+    def test_remove(self):
+        bin_counts = BinCounts([0.0, 1.0, 2.0], np.array([0.5, 1.5, 1.5]))
+        bin_counts.remove(np.array([1.5]))
+        assert list(bin_counts.counts) == [1, 1]
+
+    def test_edges_error(self):
+        with pytest.raises(ValueError):
+            BinCounts([0.0])
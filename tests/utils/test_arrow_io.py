@@ -0,0 +1,86 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils import arrow_io
+from pandas_visual_analysis.utils.predicate import Between, InPolygon, IsIn
+from tests import sample_dataframes
+
+
+@pytest.fixture(scope="module")
+def small_df():
+    return sample_dataframes.small_df()
+
+
+class TestToFilters:
+    def test_between(self):
+        assert arrow_io.to_filters(Between("a", 1, 2)) == [
+            [("a", ">=", 1), ("a", "<=", 2)]
+        ]
+        assert arrow_io.to_filters(Between("a", None, 2)) == [[("a", "<=", 2)]]
+
+    def test_is_in(self):
+        assert arrow_io.to_filters(IsIn("b", "x")) == [[("b", "in", ["x"])]]
+        assert arrow_io.to_filters(IsIn("b", ("x", "y"))) == [[("b", "in", ["x", "y"])]]
+
+    def test_combined(self):
+        predicate = (Between("a", 1, None) | IsIn("b", ["x"])) & Between("c", 0, None)
+        assert arrow_io.to_filters(predicate) == [
+            [("a", ">=", 1), ("c", ">=", 0)],
+            [("b", "in", ["x"]), ("c", ">=", 0)],
+        ]
+
+    def test_all_rows(self):
+        assert arrow_io.to_filters(Between("a") | IsIn("b", ["x"])) is None
+
+    @pytest.mark.parametrize(
+        "predicate", [~Between("a", 1, 2), InPolygon("a", "c", [0, 1, 1], [0, 0, 1])]
+    )
+    def test_unsupported(self, predicate):
+        with pytest.raises(ValueError):
+            arrow_io.to_filters(predicate)
+
+
+def test_missing_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError):
+        arrow_io.read_arrow("./path/to/file.arrow")
+
+
+class TestRead:
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_read_parquet(self, small_df, tmpdir):
+        pytest.importorskip("pyarrow.parquet")
+        path = str(tmpdir.join("temp.parquet"))
+        small_df.to_parquet(path, row_group_size=2)
+        df = arrow_io.read_parquet(path, columns=["a", "b"], filters=Between("a", 2, 3))
+        assert list(df.columns) == ["a", "b"]
+        assert list(df["a"]) == [2, 3]
+        ds = DataSource.read(path, filters=[[("b", "in", ["X", "Y"])]])
+        assert list(ds.data["b"]) == ["X", "Y"]
+        assert len(ds.columns) == len(small_df.columns)
+
+    def test_read_feather(self, small_df, tmpdir):
+        path = str(tmpdir.join("temp.feather"))
+        small_df.to_feather(path)
+        ds = DataSource.read(path, columns=["a", "c"])
+        pd.testing.assert_frame_equal(ds.data, small_df[["a", "c"]])
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_read_arrow(self, small_df, tmpdir, pyarrow, stream):
+        import pyarrow.ipc as ipc
+
+        path = str(tmpdir.join("temp.arrow"))
+        table = pyarrow.Table.from_pandas(small_df, preserve_index=False)
+        new = ipc.new_stream if stream else ipc.new_file
+        with new(path, table.schema) as writer:
+            writer.write_table(table)
+        ds = DataSource.read(path, columns=["c", "a"])
+        pd.testing.assert_frame_equal(ds.data, small_df[["c", "a"]])
+        df = arrow_io.read_arrow(path, memory_map=False)
+        pd.testing.assert_frame_equal(df, small_df)
@@ -0,0 +1,151 @@
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource, SharedData
+from pandas_visual_analysis.utils.backend import (
+    ArrowBackend,
+    Backend,
+    PolarsBackend,
+    get_backend,
+)
+from pandas_visual_analysis.utils.column_files import write_columns
+from pandas_visual_analysis.utils.predicate import Between, IsIn
+
+
+@pytest.fixture(params=["pandas", "pyarrow", "polars"])
+def backend(request):
+    if request.param != "pandas":
+        pytest.importorskip(request.param)
+    return get_backend(request.param)
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "x": rng.normal(0.0, 1.0, 1000),
+            "n": rng.integers(0, 10, 1000),
+            "t": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 10 ** 6, 1000), unit="s"),
+            "c": pd.Categorical(rng.choice(list("abc"), 1000)),
+        }
+    )
+    df.loc[::9, "x"] = np.nan
+    df.loc[::11, "t"] = pd.NaT
+    return df
+
+
+class TestBackend:
+    def test_range_mask(self, backend, df):
+        values = df["x"].values
+        expected = (values >= -0.5) & (values <= 0.5)
+        assert (backend.range_mask(values, -0.5, 0.5) == expected).all()
+        assert (backend.range_mask(values, None, 0.5) == (values <= 0.5)).all()
+        assert (backend.range_mask(values) == ~np.isnan(values)).all()
+
+    def test_range_mask_time(self, backend, df):
+        values = df["t"].values
+        hi = np.datetime64("2020-01-05", "ns")
+        expected = ~np.isnat(values) & (values <= hi)
+        assert (backend.range_mask(values, None, hi) == expected).all()
+
+    def test_range_mask_integers(self, backend, df):
+        values = df["n"].values
+        assert (
+            backend.range_mask(values, 2.5, 5) == ((values > 2) & (values <= 5))
+        ).all()
+
+    def test_isin_mask(self, backend):
+        codes = np.array([0, 1, 2, -1, 1, 0])
+        assert list(backend.isin_mask(codes, [1, 2])) == list(np.isin(codes, [1, 2]))
+
+    def test_count(self, backend):
+        codes = np.array([0, 2, 2, -1, 0, 2])
+        assert list(backend.count(codes, 4)) == [2, 0, 3, 0]
+        assert list(backend.count(codes, 4, np.array([1, 3, 4]))) == [1, 0, 1, 0]
+        assert list(backend.count(codes[:0], 2)) == [0, 0]
+
+    def test_take(self, backend, df):
+        positions = np.array([1, 5, 9, 11])
+        for col in df.columns:
+            values = df[col].values
+            taken = backend.take(values, positions)
+            assert taken.dtype == values.dtype
+            assert pd.Series(taken).equals(pd.Series(values[positions]))
+
+    def test_describe(self, backend, df):
+        positions = np.arange(0, 1000, 3)
+        for col in ["x", "n"]:
+            for p in [None, positions]:
+                expected = df[col] if p is None else df[col].iloc[p]
+                result = backend.describe(df[col], p)
+                assert list(result.index) == list(expected.describe().index)
+                assert np.allclose(result, expected.describe())
+
+    def test_describe_empty(self, backend):
+        result = backend.describe(pd.Series([np.nan, np.nan]))
+        assert result["count"] == 0
+        assert np.isnan(result["mean"])
+
+
+class TestGetBackend:
+    def test_default(self):
+        assert type(get_backend(None)) is Backend
+        assert type(get_backend("pandas")) is Backend
+
+    def test_instance(self):
+        backend = Backend()
+        assert get_backend(backend) is backend
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            get_backend("spark")
+        with pytest.raises(TypeError):
+            get_backend(1)
+
+    @pytest.mark.parametrize(
+        "name, backend_class", [("pyarrow", ArrowBackend), ("polars", PolarsBackend)]
+    )
+    def test_missing_package(self, name, backend_class, monkeypatch):
+        monkeypatch.setitem(sys.modules, name, None)
+        with pytest.raises(ImportError):
+            get_backend(name)
+
+
+class TestDataSource:
+    def test_backend(self, backend, df):
+        ds = DataSource(df, backend=backend)
+        expected = DataSource(df)
+        assert ds.column_store.backend is backend
+        for data_source in [ds, expected]:
+            data_source.select_where(Between("x", 0, 1) & IsIn("c", ["a", "b"]))
+        assert ds.selection == expected.selection
+        assert list(ds.category_counts("c", ds.selection)) == list(
+            expected.category_counts("c", expected.selection)
+        )
+        assert list(ds.brushed_column("n")) == list(expected.brushed_column("n"))
+        assert np.allclose(
+            ds.column_store.profile("x", ds.selection),
+            expected.column_store.profile("x", expected.selection),
+            equal_nan=True,
+        )
+        edges, counts = ds.column_store.bin_counts("t", 10, ds.selection)
+        expected_edges, expected_counts = expected.column_store.bin_counts(
+            "t", 10, expected.selection
+        )
+        assert list(counts) == list(expected_counts)
+
+    def test_mapped_columns(self, backend, df, tmpdir):
+        write_columns(str(tmpdir), df)
+        ds = DataSource.read_mapped(str(tmpdir), backend=backend)
+        expected = DataSource(df)
+        for predicate in [Between("t", None, "2020-01-05"), IsIn("c", "a")]:
+            assert predicate.evaluate(ds) == predicate.evaluate(expected)
+
+    def test_shared_data(self, df):
+        with pytest.raises(ValueError):
+            DataSource(SharedData(df), backend="pandas")
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils.column_files import (
+    is_memory_mapped,
+    open_columns,
+    write_columns,
+)
+from pandas_visual_analysis.utils.column_store import ColumnStore
+from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.predicate import Between, IsIn
+from pandas_visual_analysis.widgets import BrushSummaryWidget, HistogramWidget
+from tests import sample_dataframes
+
+
+@pytest.fixture(scope="module")
+def small_df():
+    return sample_dataframes.small_df()
+
+
+@pytest.fixture
+def populated_config():
+    config = Config()
+    config.alpha = 0.75
+    config.select_color = (0, 0, 0)
+    config.deselect_color = (0, 0, 0)
+
+
+@pytest.fixture
+def mixed_df():
+    return pd.DataFrame(
+        {
+            "float": [1.5, np.nan, 3.0, 4.5],
+            "int": [1, 2, 3, 4],
+            "bool": [True, False, True, True],
+            "str": ["a", "b", None, "a"],
+            "cat": pd.Categorical([3, 1, 3, 2]),
+            "time": pd.date_range("2020-01-01", periods=4, freq="D"),
+            "time_tz": pd.date_range("2020-01-01", periods=4, freq="D", tz="UTC"),
+            "delta": pd.to_timedelta([1, 2, 3, 4], unit="s"),
+        }
+    )
+
+
+class TestColumnFiles:
+    def test_round_trip(self, mixed_df, tmpdir):
+        assert write_columns(str(tmpdir), mixed_df) == 4
+        df = open_columns(str(tmpdir))
+        assert list(df.columns) == list(mixed_df.columns)
+        assert df["str"].dtype == "category"
+        pd.testing.assert_frame_equal(
+            df.astype({"str": object}), mixed_df, check_categorical=False
+        )
+        assert all(is_memory_mapped(df[col]) for col in df.columns)
+
+    def test_chunks(self, tmpdir):
+        chunks = [
+            pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]}),
+            pd.DataFrame({"a": [3.0], "b": ["z"]}),
+        ]
+        assert write_columns(str(tmpdir), iter(chunks)) == 3
+        df = open_columns(str(tmpdir))
+        assert list(df["a"]) == [1.0, 2.0, 3.0]
+        assert list(df["b"]) == ["x", "y", "z"]
+        assert list(df["b"].cat.categories) == ["x", "y", "z"]
+
+    def test_chunks_with_different_types(self, tmpdir):
+        chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1.5]})]
+        with pytest.raises(TypeError):
+            write_columns(str(tmpdir), chunks)
+
+    def test_chunks_with_different_columns(self, tmpdir):
+        chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"b": [1]})]
+        with pytest.raises(ValueError):
+            write_columns(str(tmpdir), chunks)
+
+    def test_unsupported_type(self, tmpdir):
+        with pytest.raises(TypeError):
+            write_columns(str(tmpdir), pd.DataFrame({"a": [1, None]}, dtype="Int64"))
+
+    def test_empty(self, tmpdir):
+        write_columns(str(tmpdir), pd.DataFrame({"a": [], "b": []}))
+        assert open_columns(str(tmpdir)).shape == (0, 2)
+        with pytest.raises(ValueError):
+            write_columns(str(tmpdir), [])
+
+    def test_is_memory_mapped(self, small_df, tmpdir):
+        write_columns(str(tmpdir), small_df)
+        df = open_columns(str(tmpdir))
+        assert is_memory_mapped(df["a"].iloc[1:3])
+        assert not is_memory_mapped(df["a"].copy())
+        assert not is_memory_mapped(small_df["a"])
+
+
+class TestDataSource:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr(ColumnStore, "chunk_rows", 2)
+
+    def test_read_mapped(self, small_df, tmpdir):
+        write_columns(str(tmpdir), small_df)
+        ds = DataSource.read_mapped(str(tmpdir))
+        expected = DataSource(small_df)
+        assert ds.columns == expected.columns
+        assert ds.numerical_columns == expected.numerical_columns
+        assert ds.categorical_columns == expected.categorical_columns
+        assert ds.time_columns == expected.time_columns
+
+    def test_select_where(self, small_df, tmpdir):
+        write_columns(str(tmpdir), small_df)
+        ds = DataSource.read_mapped(str(tmpdir))
+        expected = DataSource(small_df)
+        for predicate in [
+            Between("c", 2, 4),
+            IsIn("b", ["v", "X"]),
+            Between("d", None, "2020-01-01"),
+        ]:
+            ds.select_where(predicate)
+            expected.select_where(predicate)
+            assert ds.brushed_indices == expected.brushed_indices
+
+    def test_widgets(self, small_df, tmpdir, populated_config):
+        write_columns(str(tmpdir), small_df)
+        ds = DataSource.read_mapped(str(tmpdir))
+        expected = DataSource(small_df)
+        summary = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
+        expected_summary = BrushSummaryWidget(expected, 0, 0, 1.0, 400)
+        histogram = HistogramWidget(ds, 0, 0, 1.0, 400)
+        assert histogram.pre_binned
+        for data_source in [ds, expected]:
+            data_source.brushed_indices = [0, 2, 3]
+        metrics = ["count", "mean", "min", "max"]
+        assert np.allclose(
+            summary.brushed_metrics.loc[metrics].astype(float),
+            expected_summary.brushed_metrics.loc[metrics].astype(float),
+        )
+        assert sum(histogram.figure_widget.data[0].y) == 5
+        assert sum(histogram.figure_widget.data[1].y) == 3
+
+    def test_brushed_data(self, small_df, tmpdir):
+        write_columns(str(tmpdir), small_df)
+        ds = DataSource.read_mapped(str(tmpdir))
+        ds.brushed_indices = [0, 2]
+        assert list(ds.brushed_data["c"]) == list(small_df["c"].iloc[[0, 2]])
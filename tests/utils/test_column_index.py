@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis.utils.column_index import (
+    CategoryIndex,
+    CategoryScan,
+    RangeScan,
+    SortedIndex,
+)
+from pandas_visual_analysis.utils.selection import Selection
+from tests import sample_dataframes
+
+
+class TestSortedIndex:
+    @pytest.mark.parametrize("lo, hi", [(2, 5), (1.5, 5), (None, 3), (4, None), (6, 7)])
+    def test_matches_between(self, lo, hi):
+        series = pd.Series([5, 1, 3, 2, 4, 3])
+        index = SortedIndex(series)
+        expected = series.between(
+            -np.inf if lo is None else lo, np.inf if hi is None else hi
+        )
+        assert set(index.range_positions(lo, hi)) == set(np.flatnonzero(expected))
+        assert index.range_selection(lo, hi).mask.tolist() == expected.tolist()
+
+    def test_random_floats(self):
+        series = sample_dataframes.random_float_df(1000, 1)["A"]
+        index = SortedIndex(series)
+        assert index.range_count(2.5, 7.5) == series.between(2.5, 7.5).sum()
+
+    def test_missing_values_never_match(self):
+        index = SortedIndex(pd.Series([np.nan, 1.0, np.nan, 3.0]))
+        assert set(index.range_positions()) == {1, 3}
+        assert index.min == 1.0 and index.max == 3.0
+
+    def test_nullable_integers(self):
+        index = SortedIndex(pd.Series([3, None, 1], dtype="Int64"))
+        assert set(index.range_positions(1, 2)) == {2}
+
+    def test_datetime(self):
+        series = pd.Series(pd.date_range("2020-01-01", periods=5, freq="D"))
+        index = SortedIndex(series)
+        assert set(index.range_positions("2020-01-02", "2020-01-03")) == {1, 2}
+
+    def test_datetime_tz(self):
+        series = pd.Series(
+            pd.date_range("2020-01-01", periods=5, freq="D", tz="Europe/Berlin")
+        )
+        index = SortedIndex(series)
+        assert set(index.range_positions("2020-01-02", "2020-01-03")) == {1, 2}
+        assert set(
+            index.range_positions(pd.Timestamp("2020-01-01 23:00", tz="UTC"))
+        ) == {1, 2, 3, 4}
+
+    def test_timedelta(self):
+        index = SortedIndex(pd.Series(pd.to_timedelta([3, 1, 2], unit="h")))
+        assert set(index.range_positions("1h", "2h")) == {1, 2}
+
+    def test_empty_range(self):
+        index = SortedIndex(pd.Series([1, 2, 3]))
+        assert index.range_selection(3, 1).count == 0
+
+
+class TestCategoryIndex:
+    def test_positions(self):
+        index = CategoryIndex(pd.Series(["x", "y", "x", "z", "x"]))
+        assert list(index.positions("x")) == [0, 2, 4]
+        assert list(index.positions("z")) == [3]
+        assert len(index.positions("w")) == 0
+
+    def test_selection(self):
+        index = CategoryIndex(pd.Series(["x", "y", "x", "z", "x"]))
+        assert index.selection(["y", "z"]).indices == {1, 3}
+        assert index.selection("x").indices == {0, 2, 4}
+        assert index.selection([]).count == 0
+        assert index.count(["x", "z", "w"]) == 4
+
+    def test_categorical_dtype(self):
+        series = pd.Series(["b", "a", "b"], dtype="category").cat.add_categories("c")
+        index = CategoryIndex(series)
+        assert index.selection("b").indices == {0, 2}
+        assert index.value_counts().to_dict() == {"a": 1, "b": 2, "c": 0}
+
+    def test_missing_values(self):
+        index = CategoryIndex(pd.Series(["x", None, "y", np.nan, "x"]))
+        assert list(index.positions("x")) == [0, 4]
+        assert list(index.positions("y")) == [2]
+        assert index.value_counts().sum() == 3
+
+    def test_bool(self):
+        index = CategoryIndex(pd.Series([True, True, False]))
+        assert index.selection(False).indices == {2}
+
+    def test_value_counts_selection(self):
+        series = pd.Series(list("xyxzx"))
+        index = CategoryIndex(series)
+        selection = Selection.from_indices([0, 1, 2], 5)
+        assert index.value_counts(selection).to_dict() == {"x": 2, "y": 1, "z": 0}
+        assert index.value_counts().to_dict() == series.value_counts().to_dict()
+
+
+class TestRangeScan:
+    @pytest.mark.parametrize(
+        "lo, hi", [(2, 5), (None, 3), (4, None), (None, None), (6, 7)]
+    )
+    def test_matches_sorted_index(self, lo, hi):
+        series = pd.Series([5, 1, np.nan, 3, 2, 4, 3])
+        scan = RangeScan(series, chunk_rows=2)
+        index = SortedIndex(series)
+        assert list(scan.range_positions(lo, hi)) == sorted(
+            index.range_positions(lo, hi)
+        )
+        assert scan.range_selection(lo, hi) == index.range_selection(lo, hi)
+        assert scan.range_count(lo, hi) == index.range_count(lo, hi)
+
+    def test_min_max(self):
+        scan = RangeScan(pd.Series([np.nan, 3.0, 1.0, np.nan, 2.0]), chunk_rows=2)
+        assert scan.min == 1.0 and scan.max == 3.0
+        assert scan.num_valid == 3
+        empty = RangeScan(pd.Series([np.nan, np.nan]), chunk_rows=1)
+        assert empty.min is None and empty.max is None
+
+    def test_datetime_tz(self):
+        series = pd.Series(
+            pd.date_range("2020-01-01", periods=5, freq="D", tz="Europe/Berlin")
+        )
+        scan = RangeScan(series, chunk_rows=3)
+        assert set(scan.range_positions("2020-01-02", "2020-01-03")) == {1, 2}
+
+
+class TestCategoryScan:
+    @pytest.mark.parametrize(
+        "series",
+        [
+            pd.Series(list("xyxzx") + [None], dtype="category"),
+            pd.Series([True, False, True, True, False]),
+        ],
+    )
+    def test_matches_category_index(self, series):
+        scan = CategoryScan(series, chunk_rows=2)
+        index = CategoryIndex(series)
+        assert list(scan.categories) == list(index.categories)
+        assert list(scan.counts) == list(index.counts)
+        for value in index.categories:
+            assert list(scan.positions(value)) == list(index.positions(value))
+        values = list(index.categories[:2])
+        assert scan.selection(values) == index.selection(values)
+        assert scan.count(values) == index.count(values)
+
+    def test_value_counts(self):
+        series = pd.Series(list("xyxzxyyx"), dtype="category")
+        scan = CategoryScan(series, chunk_rows=3)
+        sparse = Selection.from_indices([1], 8)
+        dense = Selection.from_indices([0, 1, 2, 3, 4], 8)
+        for selection in [None, sparse, dense]:
+            assert scan.value_counts(selection).equals(
+                CategoryIndex(series).value_counts(selection)
+            )
+
+    def test_missing_category(self):
+        scan = CategoryScan(pd.Series(list("xy"), dtype="category"))
+        assert len(scan.positions("z")) == 0
+        assert scan.selection(["z"]).count == 0
@@ -1,6 +1,13 @@
+import numpy as np
+import pandas as pd
 import pytest
 
+import pandas_visual_analysis.utils.column_store as column_store
+from pandas_visual_analysis.utils.column_files import open_columns, write_columns
+from pandas_visual_analysis.utils.column_index import CategoryScan, RangeScan
 from pandas_visual_analysis.utils.column_store import ColumnIterator, ColumnStore
+from pandas_visual_analysis.utils.disk_cache import DiskCache
+from pandas_visual_analysis.utils.selection import Selection
 from tests import sample_dataframes
 
 
@@ -74,3 +81,171 @@ class TestColumnStore:
         #  test second pass
         col_list = [col_store.next_prefer_categorical() for _ in range(len(small_df))]
         assert set(col_list) == set(small_df.columns.values)
+
+    def test_sorted_index_cached(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        index = col_store.sorted_index("a")
+        assert col_store.sorted_index("a") is index
+        assert set(index.range_positions(2, 3)) == {1, 2}
+
+    def test_sorted_index_categorical_error(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        with pytest.raises(ValueError):
+            col_store.sorted_index("b")
+
+    def test_category_index_cached(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        index = col_store.category_index("b")
+        assert col_store.category_index("b") is index
+        assert list(index.positions("W")) == [1]
+
+    def test_category_index_numerical_error(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        with pytest.raises(ValueError):
+            col_store.category_index("a")
+
+    def test_append(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        index = col_store.sorted_index("a")
+        df = col_store.append(small_df.iloc[:1])
+        assert len(df) == len(small_df) + 1
+        assert col_store.sorted_index("a") is not index
+        assert col_store.sorted_index("a").range_count(1, 1) == 2
+
+    def test_append_new_category(self):
+        df = pd.DataFrame({"a": [1.0, 2.0], "b": pd.Categorical(["x", "y"])})
+        col_store = ColumnStore(df, df.columns.values, ["b"])
+        col_store.category_index("b")
+        appended = col_store.append(
+            pd.DataFrame({"a": [3.0], "b": pd.Categorical(["z"])})
+        )
+        assert appended["b"].dtype == "category"
+        assert list(appended["b"].cat.categories) == ["x", "y", "z"]
+        assert list(appended["b"]) == ["x", "y", "z"]
+        assert list(col_store.category_index("b").positions("z")) == [2]
+        appended = col_store.append(pd.DataFrame({"a": [4.0], "b": ["w"]}))
+        assert list(appended["b"].cat.categories) == ["x", "y", "z", "w"]
+        assert list(df["b"].cat.categories) == ["x", "y"]
+
+    def test_append_continues_index(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        df = col_store.append(small_df.iloc[:2])
+        assert isinstance(df.index, pd.RangeIndex)
+        assert list(df.index) == list(range(len(small_df) + 2))
+        assert df.index.is_unique
+
+    def test_append_wrong_columns(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        with pytest.raises(ValueError):
+            col_store.append(small_df[["a", "b"]])
+
+    def test_view(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        col_store.next_numerical()
+        view = col_store.view()
+        assert (
+            view.next_numerical()
+            == ColumnStore(small_df, small_df.columns.values, None).next_numerical()
+        )
+        assert view.sorted_index("a") is col_store.sorted_index("a")
+        view.append(small_df.iloc[:1])
+        assert len(col_store._df) == len(small_df)
+        assert col_store.sorted_index("a").range_count(1, 1) == 1
+        assert view.sorted_index("a").range_count(1, 1) == 2
+
+    def test_profile(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        profile = col_store.profile("c")
+        assert profile["min"] == 1.5
+        assert profile["max"] == 5.5
+        assert col_store.profile("c") is profile
+        with pytest.raises(ValueError):
+            col_store.profile("x")
+
+    def test_bins(self):
+        df = pd.DataFrame({"a": [0.0, 1.0, 2.5, np.nan, 10.0], "b": list("vwxyz")})
+        col_store = ColumnStore(df, list(df.columns), None)
+        edges, assignments = col_store.bins("a", 4)
+        counts, expected_edges = np.histogram(df["a"].dropna(), bins=4)
+        assert list(edges) == list(expected_edges)
+        assert list(assignments) == [0, 0, 1, -1, 3]
+        assert list(np.bincount(assignments[assignments >= 0], minlength=4)) == list(
+            counts
+        )
+        with pytest.raises(ValueError):
+            col_store.bins("b", 4)
+
+    def test_bins_time(self, small_df):
+        col_store = ColumnStore(small_df, small_df.columns.values, None)
+        edges, assignments = col_store.bins("d", 3)
+        assert len(edges) == 4
+        assert assignments.min() >= 0
+
+    def test_disk_cache(self, small_df, tmpdir, monkeypatch):
+        cache = DiskCache(str(tmpdir))
+        col_store = ColumnStore(small_df, small_df.columns.values, None, cache)
+        order = col_store.sorted_index("a").order
+        col_store.category_index("b")
+        col_store.profile("c")
+        assert cache.size > 0
+
+        def not_computed(*args, **kwargs):
+            raise AssertionError("the artifact has to be loaded from the cache")
+
+        # the artifacts of a copy of the data are loaded from the cache
+        monkeypatch.setattr(column_store, "SortedIndex", not_computed)
+        monkeypatch.setattr(column_store, "CategoryIndex", not_computed)
+        monkeypatch.setattr(pd.Series, "describe", not_computed)
+        other = ColumnStore(small_df.copy(), small_df.columns.values, None, cache)
+        assert list(other.sorted_index("a").order) == list(order)
+        assert list(other.category_index("b").categories) == list("vWXYZ")
+        assert other.profile("c")["max"] == 5.5
+
+    def test_disk_cache_append(self, small_df, tmpdir):
+        cache = DiskCache(str(tmpdir))
+        col_store = ColumnStore(small_df, small_df.columns.values, None, cache)
+        col_store.append(small_df.iloc[:1])
+        col_store.sorted_index("a")
+        assert col_store.cache is None
+        assert cache.size == 0
+
+    def test_mapped_columns(self, tmpdir, monkeypatch):
+        monkeypatch.setattr(ColumnStore, "chunk_rows", 100)
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "A": rng.permutation(np.linspace(0.0, 10.0, 1000)),
+                "B": rng.uniform(0.0, 10.0, 1000),
+                "C": pd.Series(list("xyz") * 333 + ["x"], dtype="category"),
+            }
+        )
+        df.loc[::7, "A"] = np.nan
+        write_columns(str(tmpdir), df)
+        mapped = ColumnStore(open_columns(str(tmpdir)), list(df.columns), None)
+        in_memory = ColumnStore(df, list(df.columns), None)
+        assert mapped.is_mapped("A") and not in_memory.is_mapped("A")
+        assert isinstance(mapped.sorted_index("A"), RangeScan)
+        assert isinstance(mapped.category_index("C"), CategoryScan)
+        assert mapped.summary("A").equals(in_memory.summary("A"))
+
+        selection = Selection.from_mask(df["B"].values > 5)
+        for s in [None, selection]:
+            edges, counts = mapped.bin_counts("A", 10, s)
+            expected_edges, expected_counts = in_memory.bin_counts("A", 10, s)
+            assert np.allclose(edges, expected_edges)
+            assert list(counts) == list(expected_counts)
+
+            profile = mapped.profile("A", s)
+            expected = in_memory.profile("A", s)
+            assert list(profile.index) == list(expected.index)
+            assert profile["count"] == expected["count"]
+            assert np.allclose(
+                profile[["mean", "std", "min", "max"]],
+                expected[["mean", "std", "min", "max"]],
+            )
+            # the quartiles are estimated from a histogram
+            assert np.allclose(
+                profile[["25%", "50%", "75%"]],
+                expected[["25%", "50%", "75%"]],
+                atol=0.05,
+            )
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from pandas_visual_analysis.utils.crossfilter import Crossfilter
+from pandas_visual_analysis.utils.selection import Selection
+
+
+def selection(indices, length=10):
+    return Selection.from_indices(indices, length)
+
+
+def test_intersection_of_filters():
+    crossfilter = Crossfilter(10)
+    crossfilter.filter("x", selection(range(0, 6)))
+    crossfilter.filter("y", selection(range(4, 10)))
+    assert crossfilter.selection().indices == {4, 5}
+    assert crossfilter.selection_excluding("x").indices == set(range(4, 10))
+    assert crossfilter.selection_excluding("y").indices == set(range(0, 6))
+
+
+def test_delta():
+    crossfilter = Crossfilter(10)
+    added, removed = crossfilter.filter("x", selection(range(0, 6)))
+    assert len(added) == 0
+    assert sorted(removed) == [6, 7, 8, 9]
+    crossfilter.filter("y", selection(range(4, 10)))
+
+    # rows 6 and 7 enter the filter of x, but only 6 and 7 also pass y
+    added, removed = crossfilter.filter("x", selection(range(2, 8)))
+    assert sorted(added) == [6, 7]
+    assert len(removed) == 0  # rows 0 and 1 were already filtered out by y
+
+
+def test_full_selection_removes_filter():
+    crossfilter = Crossfilter(10)
+    crossfilter.filter("x", selection([1]))
+    assert crossfilter.has_filter("x")
+    added, removed = crossfilter.filter("x", Selection.full(10))
+    assert sorted(added) == [0] + list(range(2, 10))
+    assert not crossfilter.has_filter("x")
+    assert crossfilter.dimensions == []
+    assert crossfilter.selection().count == 10
+
+
+def test_clear():
+    crossfilter = Crossfilter(10)
+    crossfilter.filter("x", selection([1]))
+    crossfilter.clear()
+    assert crossfilter.selection().count == 10
+    assert crossfilter.filter_of("x").count == 10
+
+
+def test_max_dimensions():
+    crossfilter = Crossfilter(10)
+    for dimension in range(Crossfilter.max_dimensions):
+        crossfilter.filter(dimension, selection([1, 2]))
+    with pytest.raises(ValueError):
+        crossfilter.filter("too many", selection([1]))
+    crossfilter.filter(0, Selection.full(10))
+    crossfilter.filter("reused bit", selection([1]))
+    assert crossfilter.selection().indices == {1}
+
+
+def test_random_matches_intersection():
+    random = np.random.RandomState(0)
+    crossfilter = Crossfilter(1000)
+    filters = {}
+    for _ in range(50):
+        dimension = random.randint(5)
+        filters[dimension] = Selection.from_mask(random.uniform(size=1000) > 0.2)
+        crossfilter.filter(dimension, filters[dimension])
+    expected = Selection.full(1000)
+    for s in filters.values():
+        expected = expected & s
+    assert crossfilter.selection() == expected
+
+
+def test_excluding_cached():
+    crossfilter = Crossfilter(10)
+    crossfilter.filter("x", selection([1, 2, 3]))
+    crossfilter.filter("y", selection([2, 3, 4]))
+    excluding_x = crossfilter.selection_excluding("x")
+    excluding_y = crossfilter.selection_excluding("y")
+    assert crossfilter.selection_excluding("x") is excluding_x
+
+    # the rows passing all filters except the one of x do not depend on it
+    crossfilter.filter("x", selection([3]))
+    assert crossfilter.selection_excluding("x") is excluding_x
+    assert crossfilter.selection_excluding("y") is not excluding_y
+    assert crossfilter.selection_excluding("y").indices == {3}
+    assert crossfilter.selection().indices == {3}
+
+
+def test_random_excluding_matches_intersection():
+    random = np.random.RandomState(1)
+    crossfilter = Crossfilter(1000)
+    filters = {}
+    for _ in range(50):
+        dimension = random.randint(4)
+        density = random.choice([0.01, 0.8, 1.0])
+        filters[dimension] = Selection.from_mask(random.uniform(size=1000) < density)
+        crossfilter.filter(dimension, filters[dimension])
+        for excluded in range(4):
+            expected = Selection.full(1000)
+            for other, s in filters.items():
+                if other != excluded:
+                    expected = expected & s
+            assert crossfilter.selection_excluding(excluded) == expected
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis.utils.disk_cache import DiskCache, fingerprint
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return DiskCache(str(tmpdir.join("cache")), max_bytes=10000)
+
+
+def test_fingerprint():
+    series = pd.Series(np.arange(100.0), name="a")
+    assert fingerprint(series) == fingerprint(series.copy())
+    assert fingerprint(series) != fingerprint(series.rename("b"))
+    assert fingerprint(series) != fingerprint(series.astype(np.float32))
+    changed = series.copy()
+    changed[50] = -1.0
+    assert fingerprint(series) != fingerprint(changed)
+
+
+def test_fingerprint_categories():
+    series = pd.Series(pd.Categorical(["x", "y", "x"], categories=["x", "y"]))
+    reordered = series.cat.reorder_categories(["y", "x"])
+    assert fingerprint(series) == fingerprint(series.copy())
+    assert fingerprint(series) != fingerprint(reordered)
+    assert fingerprint(series) != fingerprint(series.cat.as_ordered())
+    assert fingerprint(series) != fingerprint(series.cat.add_categories(["z"]))
+
+
+def test_fingerprint_unhashable():
+    assert fingerprint(pd.Series([[1], [2]])) is None
+
+
+def test_put_get(cache):
+    key = DiskCache.key("profile", "abc")
+    assert cache.get(key) is None
+    assert key not in cache
+    cache.put(key, {"min": 1})
+    assert key in cache
+    assert cache.get(key) == {"min": 1}
+    assert DiskCache(cache.directory).get(key) == {"min": 1}
+
+
+def test_key():
+    assert DiskCache.key("profile", "abc") != DiskCache.key("sorted_index", "abc")
+
+
+def test_evict_least_recently_used(cache):
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, np.zeros(400))
+        os.utime(cache._path(key), (i, i))
+    cache.get("a")
+    cache.put("d", np.zeros(400))
+    assert "a" in cache and "d" in cache
+    assert "b" not in cache
+    assert cache.size <= cache.max_bytes
+
+
+def test_too_large(cache):
+    cache.put("a", np.zeros(10000))
+    assert "a" not in cache
+
+
+def test_corrupted_file(cache):
+    with open(cache._path("a"), "wb") as f:
+        f.write(b"no pickle")
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+
+def test_clear(cache):
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_invalid_max_bytes(tmpdir):
+    with pytest.raises(ValueError):
+        DiskCache(str(tmpdir), max_bytes=-1)
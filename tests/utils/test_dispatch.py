@@ -0,0 +1,273 @@
+import asyncio
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils.dispatch import (
+    AsyncDispatcher,
+    Dispatcher,
+    ParallelDispatcher,
+    ProgressiveDispatcher,
+    StratifiedSample,
+)
+from tests import sample_dataframes
+
+
+@pytest.fixture(scope="module")
+def small_df():
+    return sample_dataframes.small_df()
+
+
+class RecordingWidget:
+    def __init__(self, data_source):
+        self.data_source = data_source
+        self.applied = []
+        self.apply_threads = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def observe(self, sender):
+        self.data_source.dispatcher.submit(
+            self, sender.selection, sender.selection_version
+        )
+
+    def compute_brush_update(self, selection):
+        self.release.wait(timeout=1)
+        return selection.indices
+
+    def apply_brush_update(self, result):
+        self.applied.append(result)
+        self.apply_threads.append(threading.current_thread())
+
+
+def test_submit_without_event_loop(small_df):
+    ds = DataSource(small_df)
+    ds.dispatcher = AsyncDispatcher()
+    widget = RecordingWidget(ds)
+    ds.on_indices_changed.connect(widget.observe)
+
+    ds.brushed_indices = [1]
+    assert widget.applied == [{1}]
+
+
+def test_submit_applies_on_event_loop(small_df):
+    ds = DataSource(small_df)
+    ds.dispatcher = AsyncDispatcher()
+    widget = RecordingWidget(ds)
+    ds.on_indices_changed.connect(widget.observe)
+
+    async def brush():
+        ds.brushed_indices = [1]
+        assert widget.applied == []
+        await asyncio.sleep(0.1)
+
+    asyncio.run(brush())
+    assert widget.applied == [{1}]
+    assert widget.apply_threads == [threading.main_thread()]
+
+
+def test_latest_selection_wins(small_df):
+    ds = DataSource(small_df)
+    ds.dispatcher = AsyncDispatcher()
+    widget = RecordingWidget(ds)
+    ds.on_indices_changed.connect(widget.observe)
+
+    async def brush():
+        widget.release.clear()  # keep the first computation running
+        ds.brushed_indices = [1]
+        await asyncio.sleep(0.01)
+        ds.brushed_indices = [2]
+        ds.brushed_indices = [3]
+        widget.release.set()
+        await asyncio.sleep(0.1)
+        assert ds.dispatcher.pending == 0
+
+    asyncio.run(brush())
+    assert widget.applied == [{3}]
+
+
+def test_cancel(small_df):
+    ds = DataSource(small_df)
+    ds.dispatcher = AsyncDispatcher()
+    widget = RecordingWidget(ds)
+    ds.on_indices_changed.connect(widget.observe)
+
+    async def brush():
+        ds.brushed_indices = [1]
+        assert ds.dispatcher.pending == 1
+        ds.dispatcher.cancel()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(brush())
+    assert widget.applied == []
+
+
+def test_dispatcher_synchronous(small_df):
+    ds = DataSource(small_df)
+    ds.dispatcher = Dispatcher()
+    widget = RecordingWidget(ds)
+    ds.on_indices_changed.connect(widget.observe)
+
+    ds.brushed_indices = [1]
+    assert widget.applied == [{1}]
+
+
+class LayoutWidget(RecordingWidget):
+    def __init__(self, data_source, row, index, barrier, apply_order):
+        super().__init__(data_source)
+        self.row = row
+        self.index = index
+        self.barrier = barrier
+        self.apply_order = apply_order
+
+    def compute_brush_update(self, selection):
+        self.barrier.wait()  # only passes if all computations run concurrently
+        return threading.current_thread()
+
+    def apply_brush_update(self, result):
+        super().apply_brush_update(result)
+        self.apply_order.append((self.row, self.index))
+
+
+class TestParallelDispatcher:
+    def test_concurrent_compute_ordered_apply(self, small_df):
+        ds = DataSource(small_df)
+        ds.dispatcher = ParallelDispatcher(max_workers=3)
+        barrier = threading.Barrier(3, timeout=1)
+        apply_order = []
+        widgets = [
+            LayoutWidget(ds, row, index, barrier, apply_order)
+            for row, index in [(1, 0), (0, 1), (0, 0)]
+        ]
+        for widget in widgets:
+            ds.on_indices_changed.connect(widget.observe)
+
+        ds.brushed_indices = [1]
+
+        assert apply_order == [(0, 0), (0, 1), (1, 0)]
+        for widget in widgets:
+            assert widget.applied[0] is not threading.main_thread()
+            assert widget.apply_threads == [threading.main_thread()]
+        ds.dispatcher.shutdown()
+
+    def test_submit_outside_notification(self, small_df):
+        ds = DataSource(small_df)
+        ds.dispatcher = ParallelDispatcher(max_workers=1)
+        widget = RecordingWidget(ds)
+
+        ds.dispatcher.submit(widget, ds.selection, ds.selection_version)
+        assert widget.applied == [set(range(len(small_df)))]
+        ds.dispatcher.shutdown()
+
+    def test_error_applies_other_widgets(self, small_df):
+        ds = DataSource(small_df)
+        ds.dispatcher = ParallelDispatcher(max_workers=2)
+        failing = RecordingWidget(ds)
+        failing.compute_brush_update = lambda selection: 1 / 0
+        widget = RecordingWidget(ds)
+        ds.on_indices_changed.connect(failing.observe)
+        ds.on_indices_changed.connect(widget.observe)
+
+        with pytest.raises(ZeroDivisionError):
+            ds.brushed_indices = [1]
+        assert widget.applied == [{1}]
+        ds.dispatcher.shutdown()
+
+
+class TestStratifiedSample:
+    def test_nested(self):
+        sample = StratifiedSample(10000, seed=1)
+        small, large = sample.sample(0.01), sample.sample(0.1)
+        assert (small - large).count == 0
+        assert large.count == pytest.approx(1000, abs=40)
+
+    def test_strata_covered(self):
+        sample = StratifiedSample(1000, strata_size=100, seed=1).sample(0.1)
+        assert list(np.bincount(sample.positions // 100)) == [10] * 10
+
+    def test_full(self):
+        assert StratifiedSample(10).sample(1.0).count == 10
+
+
+class ProgressiveWidget(RecordingWidget):
+    progressive = True
+
+    def __init__(self, data_source):
+        super().__init__(data_source)
+        self.progress_values = []
+
+    def compute_sampled_update(self, selection, sample):
+        return (selection & sample).count * sample.len / sample.count
+
+    def compute_brush_update(self, selection):
+        return float(selection.count)
+
+    def apply_sampled_update(self, result):
+        self.apply_brush_update(result)
+
+    def refinement_distance(self, previous, result):
+        return abs(result - previous) / max(result, 1)
+
+    def show_progress(self, fraction):
+        self.progress_values.append(fraction)
+
+
+class TestProgressiveDispatcher:
+    @pytest.fixture
+    def large_df(self):
+        return pd.DataFrame({"a": np.arange(100000), "b": np.arange(100000) % 7})
+
+    def test_fractions(self):
+        dispatcher = ProgressiveDispatcher(initial_rows=100, growth=10)
+        assert dispatcher.fractions(100000) == pytest.approx([0.001, 0.01, 0.1])
+        assert dispatcher.fractions(50) == []
+
+    def test_refines(self, large_df):
+        ds = DataSource(large_df)
+        ds.dispatcher = ProgressiveDispatcher(initial_rows=1000, min_change=0, seed=1)
+        widget = ProgressiveWidget(ds)
+        ds.on_indices_changed.connect(widget.observe)
+
+        async def brush():
+            ds.select_where("a", 0, 49999)
+            await asyncio.sleep(0.5)
+
+        asyncio.run(brush())
+        assert widget.applied[0] == pytest.approx(50000, rel=0.05)
+        assert widget.applied[-1] == 50000.0
+        assert widget.progress_values[0] == pytest.approx(0.01, rel=0.05)
+        assert widget.progress_values[-1] == 1.0
+
+    def test_skips_small_changes(self, large_df):
+        ds = DataSource(large_df)
+        ds.dispatcher = ProgressiveDispatcher(initial_rows=1000, min_change=0.5, seed=1)
+        widget = ProgressiveWidget(ds)
+        ds.on_indices_changed.connect(widget.observe)
+
+        async def brush():
+            ds.select_where("a", 0, 49999)
+            await asyncio.sleep(0.5)
+
+        asyncio.run(brush())
+        assert len(widget.applied) == 1
+        assert len(widget.progress_values) == 3
+
+    def test_not_progressive(self, large_df):
+        ds = DataSource(large_df)
+        ds.dispatcher = ProgressiveDispatcher(initial_rows=1000)
+        widget = RecordingWidget(ds)
+        ds.on_indices_changed.connect(widget.observe)
+
+        async def brush():
+            ds.brushed_indices = [1]
+            await asyncio.sleep(0.1)
+
+        asyncio.run(brush())
+        assert widget.applied == [{1}]
+
+    def test_invalid_growth(self):
+        with pytest.raises(ValueError):
+            ProgressiveDispatcher(growth=1.0)
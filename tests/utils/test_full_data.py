@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis.utils.full_data import FullData
+from pandas_visual_analysis.utils.predicate import Between
+from pandas_visual_analysis.utils.selection import Selection
+
+
+@pytest.fixture
+def full_data():
+    df = pd.DataFrame({"a": np.arange(10.0), "b": list("pqpqpqpqpq")})
+    return FullData(df, ["a", "b"], None, np.array([7, 2, 5]))
+
+
+def test_from_sample(full_data):
+    assert full_data.from_sample(Selection.from_indices([0, 2], 3)).indices == {7, 5}
+    assert full_data.from_sample(Selection.full(3)).count == 10
+    assert full_data.from_sample(Selection.empty(3)).count == 0
+
+
+def test_translate_predicate(full_data):
+    selection = full_data.translate(Selection.from_indices([1], 3), Between("a", 1, 3))
+    assert selection.indices == {1, 2, 3}
+    assert full_data.exact
+
+
+def test_translate_without_predicate(full_data):
+    full_data.translate(Selection.from_indices([1], 3), None)
+    assert not full_data.exact
+    full_data.reset()
+    assert full_data.exact
+
+
+def test_selection_for(full_data):
+    dimension = object()
+    full_data.filter(dimension, Selection.from_indices([1, 2], 10))
+    full_data.filter(None, Selection.from_indices([2, 3], 10))
+    assert full_data.selection.indices == {2}
+    assert full_data.selection_for(dimension).indices == {2, 3}
+
+
+def test_append(full_data):
+    full_data.append(
+        pd.DataFrame({"a": [10.0, 11.0], "b": ["p", "q"]}), Between("a", 11), False
+    )
+    assert full_data.len == 12
+    assert list(full_data.sample_positions) == [7, 2, 5, 10, 11]
+    assert full_data.selection.indices == set(range(10)) | {11}
+
+
+def test_brushed_column(full_data):
+    selection = Selection.from_indices([0, 9], 10)
+    assert list(full_data.brushed_column("a", selection)) == [0.0, 9.0]
+    assert len(full_data.brushed_column("a")) == 10
@@ -0,0 +1,71 @@
+import pytest
+
+from pandas_visual_analysis.utils.history import SelectionHistory
+from pandas_visual_analysis.utils.selection import Selection
+
+
+def selection(*indices):
+    return Selection.from_indices(indices, 1000)
+
+
+class TestInit:
+    def test_empty(self):
+        history = SelectionHistory()
+        assert len(history) == 0
+        assert history.current is None
+        assert not history.can_undo
+        assert not history.can_redo
+
+    @pytest.mark.parametrize("max_steps, max_bytes", [(0, 100), (10, -1)])
+    def test_invalid_limits(self, max_steps, max_bytes):
+        with pytest.raises(ValueError):
+            SelectionHistory(max_steps, max_bytes)
+
+
+class TestUndoRedo:
+    def test_undo_redo(self):
+        history = SelectionHistory()
+        history.push(selection(1), 1)
+        history.push(selection(2), 2)
+
+        assert history.undo() == (selection(1), 1)
+        assert history.undo() is None
+        assert history.redo() == (selection(2), 2)
+        assert history.redo() is None
+
+    def test_push_discards_redo(self):
+        history = SelectionHistory()
+        history.push(selection(1), 1)
+        history.push(selection(2), 2)
+        history.undo()
+        history.push(selection(3), 3)
+
+        assert history.keys == [1, 3]
+        assert not history.can_redo
+
+    def test_clear(self):
+        history = SelectionHistory()
+        history.push(selection(1), 1)
+        history.clear()
+        assert len(history) == 0
+
+
+class TestLimits:
+    def test_max_steps(self):
+        history = SelectionHistory(max_steps=2)
+        for key in range(5):
+            history.push(selection(key), key)
+        assert history.keys == [3, 4]
+        assert history.position == 1
+
+    def test_max_bytes(self):
+        history = SelectionHistory(max_bytes=10)
+        history.push(selection(1, 2), 1)  # 8 bytes
+        history.push(selection(3, 4), 2)
+        assert history.keys == [2]
+        assert history.nbytes == 8
+
+    def test_current_kept_above_budget(self):
+        history = SelectionHistory(max_bytes=0)
+        history.push(selection(1, 2), 1)
+        assert history.current == (selection(1, 2), 1)
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis.utils.join_index import JoinIndex, factorize_keys
+from pandas_visual_analysis.utils.selection import Selection
+
+
+def test_rows_of_keys():
+    index = JoinIndex(np.array([2, 0, -1, 2, 1, 0]), 4)
+    assert list(index.offsets) == [0, 2, 3, 5, 5]
+    assert list(index.rows(np.array([0, 2]))) == [1, 5, 0, 3]
+    assert len(index.rows(np.array([3]))) == 0
+    assert len(index.rows(np.array([], dtype=np.int64))) == 0
+    assert index.selection(np.array([1, 2])).indices == {0, 3, 4}
+
+
+def test_keys_of_selection():
+    index = JoinIndex(np.array([2, 0, -1, 2, 1, 0]), 4)
+    assert list(index.keys(Selection.from_indices([0, 2, 3], 6))) == [2]
+    assert list(index.keys(Selection.full(6))) == [0, 1, 2]
+
+
+def test_factorize_keys():
+    left = pd.Series([1, 2, 3, np.nan])
+    right = pd.Series([3, 3, 4, 1], dtype="int64")
+    left_codes, right_codes, num_keys = factorize_keys([left], [right])
+    assert num_keys == 4
+    assert left_codes[3] == -1
+    assert right_codes[0] == right_codes[1] == left_codes[2]
+    assert right_codes[3] == left_codes[0]
+    assert right_codes[2] not in left_codes
+
+
+def test_factorize_multiple_columns():
+    left = [pd.Series(["a", "a", "b", None]), pd.Series([1, 2, 1, 1])]
+    right = [pd.Series(["a", "b", "b"]), pd.Series([2, 1, 2])]
+    left_codes, right_codes, num_keys = factorize_keys(left, right)
+    assert left_codes[3] == -1
+    assert right_codes[0] == left_codes[1]
+    assert right_codes[1] == left_codes[2]
+    assert right_codes[2] not in left_codes
+    assert num_keys == 4
+
+    with pytest.raises(ValueError):
+        factorize_keys(left, right[:1])
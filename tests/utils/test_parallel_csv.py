@@ -0,0 +1,153 @@
+import bz2
+import gzip
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils.parallel_csv import CsvSchema, read_csv_parallel
+
+
+@pytest.fixture(scope="module")
+def csv_df():
+    n = 200
+    return pd.DataFrame(
+        {
+            "x": np.linspace(0.0, 1.0, n),
+            "cylinders": np.arange(n) % 4 + 4,
+            "id": np.arange(n),
+            "origin": np.array(["usa", "europe", "japan", "usa"] * (n // 4)),
+            "name": ["car %d" % i for i in range(n)],
+            "date": pd.date_range("2020-01-01", periods=n, freq="H"),
+            "flag": np.arange(n) % 2 == 0,
+        }
+    )
+
+
+@pytest.fixture
+def csv_path(csv_df, tmpdir):
+    path = str(tmpdir.join("temp.csv"))
+    csv_df.to_csv(path, index=False)
+    return path
+
+
+def assert_read_equal(df, csv_df):
+    assert list(df.columns) == list(csv_df.columns)
+    assert df["origin"].dtype == "category"
+    pd.testing.assert_frame_equal(
+        df.astype({"origin": object}), csv_df, check_dtype=False
+    )
+
+
+class TestCsvSchema:
+    def test_infer(self, csv_df):
+        schema = CsvSchema.infer(csv_df.astype({"date": str}))
+        assert schema.dtypes == {
+            "x": "float64",
+            "origin": "category",
+            "name": "object",
+            "date": "object",
+        }
+        assert schema.date_columns == ["date"]
+        assert schema.categorical_columns == ["cylinders", "origin", "name", "flag"]
+
+    def test_infer_no_words_as_dates(self):
+        df = pd.DataFrame({"month": ["Jan", "Feb", "Mar"], "x": [1.0, 2.0, 3.0]})
+        assert CsvSchema.infer(df).date_columns == []
+
+    def test_parse(self, csv_df):
+        schema = CsvSchema.infer(csv_df.astype({"date": str}))
+        df = schema.parse(
+            b"0.5,4,1,usa,a,2020-01-01,True\n1.5,5,2,peru,b,never,False\n"
+        )
+        assert df["origin"].dtype == "category"
+        assert df["date"].isna().tolist() == [False, True]
+        empty = schema.parse(b"")
+        assert list(empty.columns) == list(csv_df.columns)
+        assert len(empty) == 0
+
+    def test_concat(self):
+        schema = CsvSchema(["a", "b"], {"b": "category"}, [], ["b"])
+        df = schema.concat([schema.parse(b"1,x\n"), schema.parse(b"2,y\n3,x\n")])
+        assert df["b"].dtype == "category"
+        assert list(df["b"]) == ["x", "y", "x"]
+        assert list(df.index) == [0, 1, 2]
+
+
+class TestReadCsvParallel:
+    @pytest.mark.parametrize("chunk_bytes", [1, 100, 2 ** 20])
+    def test_chunks(self, csv_path, csv_df, chunk_bytes):
+        df, schema = read_csv_parallel(csv_path, processes=1, chunk_bytes=chunk_bytes)
+        assert_read_equal(df, csv_df)
+        assert schema.date_columns == ["date"]
+
+    def test_executor(self, csv_path, csv_df):
+        with ThreadPoolExecutor(2) as executor:
+            df, _ = read_csv_parallel(csv_path, executor=executor, chunk_bytes=500)
+        assert_read_equal(df, csv_df)
+
+    def test_processes(self, csv_path, csv_df):
+        df, _ = read_csv_parallel(csv_path, processes=2, chunk_bytes=1000)
+        assert_read_equal(df, csv_df)
+
+    @pytest.mark.parametrize(
+        "extension, open_file", [("gz", gzip.open), ("bz2", bz2.open)]
+    )
+    def test_compressed(self, csv_df, tmpdir, extension, open_file):
+        path = str(tmpdir.join("temp.csv." + extension))
+        with open_file(path, "wt") as f:
+            csv_df.to_csv(f, index=False)
+        df, _ = read_csv_parallel(path, processes=1, chunk_bytes=300)
+        assert_read_equal(df, csv_df)
+
+    def test_zstd(self, csv_df, tmpdir):
+        zstandard = pytest.importorskip("zstandard")
+        path = str(tmpdir.join("temp.csv.zst"))
+        data = csv_df.to_csv(index=False).encode()
+        with open(path, "wb") as f:
+            f.write(zstandard.ZstdCompressor().compress(data))
+        df, _ = read_csv_parallel(path, processes=1, chunk_bytes=300)
+        assert_read_equal(df, csv_df)
+
+    def test_missing_zstandard(self, tmpdir, monkeypatch):
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        with pytest.raises(ImportError):
+            read_csv_parallel(str(tmpdir.join("temp.csv.zst")))
+
+    def test_no_header(self, csv_df, tmpdir):
+        path = str(tmpdir.join("temp.tsv"))
+        csv_df.to_csv(path, index=False, header=False, sep="\t")
+        df, _ = read_csv_parallel(path, sep="\t", header=None, processes=1)
+        assert list(df.columns) == list(range(len(csv_df.columns)))
+        assert len(df) == len(csv_df)
+
+    def test_only_header(self, tmpdir):
+        path = str(tmpdir.join("temp.csv"))
+        with open(path, "w") as f:
+            f.write("a,b\n")
+        df, _ = read_csv_parallel(path, processes=1)
+        assert list(df.columns) == ["a", "b"]
+        assert len(df) == 0
+
+    def test_invalid(self, csv_path):
+        with pytest.raises(ValueError):
+            read_csv_parallel(csv_path, chunk_bytes=0)
+        with pytest.raises(ValueError):
+            read_csv_parallel(csv_path, compression="zip")
+
+
+class TestDataSource:
+    def test_read_csv_parallel(self, csv_path, csv_df):
+        ds = DataSource.read_csv_parallel(csv_path, processes=1, chunk_bytes=100)
+        assert_read_equal(ds.data, csv_df)
+        assert set(ds.categorical_columns) == {"cylinders", "origin", "name", "flag"}
+        assert ds.time_columns == ["date"]
+
+    def test_read_compressed(self, csv_df, tmpdir):
+        path = str(tmpdir.join("temp.tsv.gz"))
+        csv_df.to_csv(path, index=False, sep="\t")
+        ds = DataSource.read(path, processes=1)
+        assert_read_equal(ds.data, csv_df)
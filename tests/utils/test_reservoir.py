@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis.utils.reservoir import ReservoirSample
+
+
+def chunked(df, size):
+    return [df.iloc[i : i + size] for i in range(0, len(df), size)]
+
+
+@pytest.fixture(scope="module")
+def stream_df():
+    return pd.DataFrame(
+        {
+            "a": np.arange(1000),
+            "b": np.linspace(-5.0, 5.0, 1000),
+            "c": ["x", "y", "z", None] * 250,
+        }
+    )
+
+
+def test_reservoir_size(stream_df):
+    reservoir = ReservoirSample(50, seed=1)
+    for chunk in chunked(stream_df, 64):
+        reservoir.add(chunk)
+    assert len(reservoir.sample) == 50
+    assert reservoir.rows == 1000
+    assert list(reservoir.sample.columns) == ["a", "b", "c"]
+    assert reservoir.sample["a"].is_unique
+    assert reservoir.sample["a"].is_monotonic_increasing
+
+
+def test_reservoir_size_larger_than_stream(stream_df):
+    reservoir = ReservoirSample(5000)
+    for chunk in chunked(stream_df, 64):
+        reservoir.add(chunk)
+    pd.testing.assert_frame_equal(reservoir.sample, stream_df)
+
+
+def test_reservoir_fraction(stream_df):
+    reservoir = ReservoirSample(0.2, seed=2)
+    for chunk in chunked(stream_df, 64):
+        reservoir.add(chunk)
+    assert 100 < len(reservoir.sample) < 300
+    assert reservoir.sample["a"].is_monotonic_increasing
+
+
+def test_reservoir_seed(stream_df):
+    samples = []
+    for _ in range(2):
+        reservoir = ReservoirSample(20, seed=3)
+        for chunk in chunked(stream_df, 100):
+            reservoir.add(chunk)
+        samples.append(list(reservoir.sample["a"]))
+    assert samples[0] == samples[1]
+
+
+def test_reservoir_uniform():
+    df = pd.DataFrame({"a": np.arange(20)})
+    counts = np.zeros(20)
+    for seed in range(300):
+        reservoir = ReservoirSample(5, seed=seed)
+        for chunk in chunked(df, 3):
+            reservoir.add(chunk)
+        counts[reservoir.sample["a"].values] += 1
+    # every row is expected 75 times
+    assert counts[:10].sum() == pytest.approx(counts[10:].sum(), rel=0.2)
+    assert counts.min() > 40
+
+
+def test_reservoir_summary(stream_df):
+    reservoir = ReservoirSample(10)
+    for chunk in chunked(stream_df, 64):
+        reservoir.add(chunk)
+    summary = reservoir.summary()
+    assert list(summary.index) == ["count", "min", "max"]
+    assert list(summary["a"]) == [1000, 0, 999]
+    assert list(summary["b"]) == [1000, -5.0, 5.0]
+    assert list(summary["c"]) == [750, "x", "z"]
+
+
+def test_reservoir_summary_incomparable():
+    reservoir = ReservoirSample(10)
+    reservoir.add(pd.DataFrame({"a": [1, 2]}, dtype=object))
+    reservoir.add(pd.DataFrame({"a": ["x", "y"]}, dtype=object))
+    assert list(reservoir.summary()["a"]) == [4, None, None]
+
+
+def test_reservoir_empty():
+    reservoir = ReservoirSample(10)
+    with pytest.raises(ValueError):
+        reservoir.sample
+    with pytest.raises(ValueError):
+        reservoir.summary()
+
+
+@pytest.mark.parametrize("size", [-1, 1.5, -0.5])
+def test_reservoir_invalid_size(size):
+    with pytest.raises(ValueError):
+        ReservoirSample(size)
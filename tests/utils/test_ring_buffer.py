@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis.utils.ring_buffer import RingBuffer
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "a": np.arange(5),
+            "b": list("vwxyz"),
+            "c": pd.Series(list("ppqqp"), dtype="category"),
+            "d": pd.date_range("2020-01-01", periods=5, freq="D", tz="Europe/Berlin"),
+        }
+    )
+
+
+def test_keeps_last_rows(df):
+    buffer = RingBuffer(df, 3)
+    assert len(buffer) == 3
+    assert list(buffer.column("a")) == [2, 3, 4]
+
+
+def test_append_evicts(df):
+    buffer = RingBuffer(df.iloc[:2], 3)
+    evicted = buffer.append(df.iloc[2:4])
+    assert list(evicted["a"]) == [0]
+    assert list(buffer.column("a")) == [1, 2, 3]
+    evicted = buffer.append(df.iloc[4:])
+    assert list(evicted["b"]) == ["w"]
+    assert list(buffer.column("b")) == ["x", "y", "z"]
+
+
+def test_chunk_larger_than_capacity(df):
+    buffer = RingBuffer(df.iloc[:1], 2)
+    evicted = buffer.append(df)
+    assert list(evicted["a"]) == [0]
+    assert list(buffer.column("a")) == [3, 4]
+
+
+def test_pop_front(df):
+    buffer = RingBuffer(df, 5)
+    evicted = buffer.pop_front(2)
+    assert list(evicted["a"]) == [0, 1]
+    assert len(buffer) == 3
+    assert len(buffer.pop_front(10)["a"]) == 3
+    assert len(buffer) == 0
+
+
+def test_to_frame_keeps_types(df):
+    buffer = RingBuffer(df.iloc[:3], 4)
+    buffer.append(df.iloc[3:])
+    frame = buffer.to_frame()
+    pd.testing.assert_frame_equal(frame, df.iloc[1:], check_categorical=False)
+    assert list(frame.dtypes) == list(df.dtypes)
+
+
+def test_to_frame_views_columns(df):
+    buffer = RingBuffer(df.iloc[:2], 3)
+    frame = buffer.to_frame()
+    assert np.shares_memory(frame["a"].values, buffer._columns["a"])
+    assert np.shares_memory(frame["c"].cat.codes.values, buffer._columns["c"])
+    # the rows are moved to new columns, so the earlier frame keeps its rows
+    for i in range(2, 5):
+        buffer.append(df.iloc[i : i + 1])
+    assert list(frame["a"]) == [0, 1]
+    assert list(buffer.to_frame()["a"]) == [2, 3, 4]
+
+
+def test_categories(df):
+    buffer = RingBuffer(df.iloc[:2], 2)
+    chunk = pd.DataFrame(
+        {
+            "a": [5, 6],
+            "b": ["u", "u"],
+            "c": pd.Series(["r", "r"], dtype="category"),
+            "d": list(df["d"].iloc[:2]),
+        }
+    )
+    evicted = buffer.append(chunk)
+    assert list(evicted["c"]) == ["p", "p"]
+    assert list(buffer.to_frame()["c"]) == ["r", "r"]
+    buffer.append(chunk)
+    # unused categories are dropped when the rows are moved
+    assert list(buffer.to_frame()["c"].cat.categories) == ["r"]
+
+
+def test_capacity_error(df):
+    with pytest.raises(ValueError):
+        RingBuffer(df, 0)
@@ -0,0 +1,184 @@
+import numpy as np
+import pytest
+
+from pandas_visual_analysis.utils.selection import CompressedSelection, Selection
+
+
+class TestCreation:
+    def test_full(self):
+        selection = Selection.full(10)
+        assert selection.count == 10
+        assert selection.indices == set(range(10))
+
+    def test_empty(self):
+        selection = Selection.empty(10)
+        assert selection.count == 0
+        assert not selection.mask.any()
+
+    def test_from_indices_duplicates(self):
+        selection = Selection.from_indices([3, 1, 3], 10)
+        assert list(selection.positions) == [1, 3]
+        assert selection.count == 2
+
+    def test_from_indices_set(self):
+        selection = Selection.from_indices({4, 2}, 10)
+        assert list(selection.positions) == [2, 4]
+
+    def test_from_mask(self):
+        mask = np.array([True, False, True, False])
+        selection = Selection.from_mask(mask)
+        assert list(selection.positions) == [0, 2]
+        mask[1] = True
+        assert selection.count == 2  # mask is copied
+
+    @pytest.mark.parametrize("indices", [[-1], [10]])
+    def test_from_indices_out_of_bounds(self, indices):
+        with pytest.raises(IndexError):
+            Selection.from_indices(indices, 10)
+
+    def test_from_selection_wrong_length(self):
+        with pytest.raises(ValueError):
+            Selection.from_indices(Selection.full(5), 10)
+
+
+class TestStorage:
+    def test_small_selection_sparse(self):
+        selection = Selection.from_indices([5], 1000)
+        assert selection.is_sparse
+        assert selection.positions.dtype == np.int32
+
+    def test_large_selection_dense(self):
+        selection = Selection.from_indices(range(500), 1000)
+        assert not selection.is_sparse
+
+    def test_accessors_read_only(self):
+        selection = Selection.from_indices(range(500), 1000)
+        with pytest.raises(ValueError):
+            selection.mask[0] = False
+        with pytest.raises(ValueError):
+            selection.positions[0] = 1
+
+    def test_packed(self):
+        selection = Selection.from_indices([0, 9], 10)
+        assert len(selection.packed) == 2
+        assert np.array_equal(np.unpackbits(selection.packed)[:10], selection.mask)
+
+
+class TestOperations:
+    @pytest.mark.parametrize("length", [10, 1000])
+    def test_union(self, length):
+        a = Selection.from_indices([1, 2], length)
+        b = Selection.from_indices([2, 3], length)
+        assert (a | b).indices == {1, 2, 3}
+
+    @pytest.mark.parametrize("length", [10, 1000])
+    def test_difference(self, length):
+        a = Selection.from_indices([1, 2], length)
+        b = Selection.from_indices([2, 3], length)
+        assert (a - b).indices == {1}
+
+    def test_intersection_mixed_storage(self):
+        a = Selection.from_indices([1, 2], 1000)
+        b = Selection.from_indices(range(2, 900), 1000)
+        assert (a & b).indices == {2}
+        assert (b & a).indices == {2}
+
+    def test_union_switches_to_dense(self):
+        a = Selection.from_indices(range(0, 30), 1000)
+        b = Selection.from_indices(range(30, 60), 1000)
+        assert a.is_sparse and b.is_sparse
+        assert not (a | b).is_sparse
+
+    def test_different_lengths_error(self):
+        with pytest.raises(ValueError):
+            Selection.full(5) | Selection.full(6)
+
+    @pytest.mark.parametrize("length", [10, 1000])
+    def test_update(self, length):
+        selection = Selection.from_indices([1, 2, 5], length)
+        updated = selection.update(np.array([7, 0]), np.array([2]))
+        assert updated.indices == {0, 1, 5, 7}
+        assert updated.count == 4
+        assert selection.indices == {1, 2, 5}
+        assert selection.update(np.array([], dtype=int), []) is selection
+
+    def test_update_dense(self):
+        selection = Selection.full(100)
+        updated = selection.update(np.array([], dtype=int), np.arange(90))
+        assert updated.count == 10
+        assert updated == Selection.from_indices(range(90, 100), 100)
+        assert selection.count == 100
+
+
+class TestComparison:
+    def test_equal_independent_of_storage(self):
+        mask = np.zeros(1000, dtype=bool)
+        mask[[1, 2]] = True
+        dense = Selection(1000, mask=mask)
+        assert dense == Selection.from_indices([1, 2], 1000)
+
+    def test_equal_set(self):
+        assert Selection.from_indices([1, 2], 10) == {1, 2}
+
+    def test_contains(self):
+        selection = Selection.from_indices([1, 2], 10)
+        assert 1 in selection
+        assert 3 not in selection
+        assert 11 not in selection
+
+    def test_len_iter(self):
+        selection = Selection.from_indices([2, 1], 10)
+        assert len(selection) == 2
+        assert list(selection) == [1, 2]
+
+
+class TestCompression:
+    @pytest.mark.parametrize(
+        "selection, encoding",
+        [
+            (Selection.from_indices([3, 7], 1000), CompressedSelection.POSITIONS),
+            (Selection.from_indices(range(100, 900), 1000), CompressedSelection.RUNS),
+            (Selection.full(1000), CompressedSelection.RUNS),
+            (
+                Selection.from_indices(range(0, 10000, 2), 10000),
+                CompressedSelection.PACKED,
+            ),
+        ],
+    )
+    def test_round_trip(self, selection, encoding):
+        compressed = selection.compress()
+        assert compressed.encoding == encoding
+        assert compressed.count == selection.count
+        assert compressed.decompress() == selection
+
+    def test_random_round_trip(self):
+        mask = np.random.RandomState(0).uniform(size=5000) > 0.3
+        selection = Selection.from_mask(mask)
+        assert selection.compress().decompress() == selection
+
+    def test_smaller_than_mask(self):
+        selection = Selection.from_indices(range(100, 900), 1000)
+        assert selection.compress().nbytes < selection.mask.nbytes
+
+
+class TestExtend:
+    @pytest.mark.parametrize("length", [10, 1000])
+    def test_extend(self, length):
+        selection = Selection.from_indices([1, 2], length).extend([True, False, True])
+        assert selection.len == length + 3
+        assert selection.indices == {1, 2, length, length + 2}
+
+    def test_extend_switches_to_dense(self):
+        selection = Selection.from_indices([1], 100).extend(np.ones(100, dtype=bool))
+        assert not selection.is_sparse
+        assert selection.count == 101
+
+    @pytest.mark.parametrize("length", [10, 1000])
+    def test_drop_first(self, length):
+        selection = Selection.from_indices([1, 2, 5], length).drop_first(2)
+        assert selection.len == length - 2
+        assert selection.indices == {0, 3}
+
+    def test_drop_first_all(self):
+        selection = Selection.full(10).drop_first(20)
+        assert selection.len == 0
@@ -0,0 +1,124 @@
+import gc
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils.predicate import Between
+from pandas_visual_analysis.utils.shared_frame import SharedFrame
+from tests import sample_dataframes
+
+
+@pytest.fixture
+def small_df():
+    df = sample_dataframes.small_df()
+    df["tz"] = pd.date_range("2020-01-01", periods=len(df), tz="Europe/Vienna")
+    df["td"] = pd.to_timedelta(np.arange(len(df)), unit="s")
+    return df
+
+
+@pytest.fixture
+def published(small_df):
+    with SharedFrame.publish(small_df) as shared_frame:
+        yield shared_frame
+
+
+def test_publish(small_df, published):
+    assert published.owner
+    expected = small_df.astype({"b": "category"})
+    pd.testing.assert_frame_equal(published.data, expected)
+
+
+def test_attach(small_df, published):
+    with SharedFrame.attach(published.name) as attached:
+        assert not attached.owner
+        pd.testing.assert_frame_equal(attached.data, published.data)
+
+
+def test_attach_read_only(published):
+    with SharedFrame.attach(published.name) as attached:
+        values = attached.data["c"].values
+        assert not values.flags.writeable
+        assert not values.flags.owndata
+        with pytest.raises(ValueError):
+            values[0] = 1.0
+
+
+def test_close_while_data_source_attached(published):
+    attached = SharedFrame.attach(published.name)
+    ds = DataSource(attached.data)
+    attached.close()
+    assert attached.data is None
+    assert not attached.closed
+    ds.select_where(Between("a", 3, None))
+    assert ds.selection.count == 3
+
+    del ds
+    gc.collect()
+    assert attached.closed
+    assert attached._shm._mmap is None
+
+
+def test_close(published):
+    attached = SharedFrame.attach(published.name)
+    attached.close()
+    assert attached.closed
+    assert attached._shm.buf is None and attached._shm._mmap is None
+    with pytest.raises(ValueError):
+        attached.unlink()
+
+
+def test_unlink(small_df):
+    published = SharedFrame.publish(small_df)
+    values = published.data["a"].values
+    published.unlink()
+    assert not published.closed
+    del values
+    gc.collect()
+    assert published.closed
+
+
+def test_index(small_df):
+    df = sample_dataframes.small_df_non_int_index()
+    with SharedFrame.publish(df) as published:
+        with SharedFrame.attach(published.name) as attached:
+            assert list(attached.data.index) == list(df.index)
+
+
+def test_empty():
+    df = pd.DataFrame({"a": np.array([], dtype=np.float64), "b": []})
+    with SharedFrame.publish(df) as published:
+        assert len(published.data) == 0
+        assert list(published.data.columns) == ["a", "b"]
+
+
+def test_unsupported_column():
+    with pytest.raises(TypeError):
+        SharedFrame.publish(pd.DataFrame({"a": [[1], [2]], "b": [1, 2]}))
+    with pytest.raises(TypeError):
+        SharedFrame.publish(pd.DataFrame({"a": pd.array([1, None]), "b": [1, 2]}))
+
+
+def test_attach_other_process(small_df, published):
+    code = (
+        "from pandas_visual_analysis.utils.shared_frame import SharedFrame\n"
+        "shared_frame = SharedFrame.attach(%r)\n"
+        "print(shared_frame.data['a'].sum(), list(shared_frame.data['b']))\n"
+        "shared_frame.close()\n" % published.name
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    assert output.strip() == "%d %s" % (small_df["a"].sum(), list(small_df["b"]))
+    # the block still exists after the other process exited
+    with SharedFrame.attach(published.name) as attached:
+        assert len(attached.data) == len(small_df)
@@ -0,0 +1,159 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from pandas_visual_analysis import DataSource
+from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.predicate import Between
+from pandas_visual_analysis.utils.sql_source import LazyFrame, SqlTable
+from pandas_visual_analysis.widgets.scatter import ScatterWidget
+from tests import sample_dataframes
+
+
+@pytest.fixture(scope="module")
+def small_df():
+    return sample_dataframes.small_df()
+
+
+@pytest.fixture
+def populated_config():
+    config = Config()
+    config.alpha = 0.75
+    config.select_color = (0, 0, 0)
+    config.deselect_color = (0, 0, 0)
+
+
+@pytest.fixture
+def connection(small_df):
+    connection = sqlite3.connect(":memory:")
+    small_df.to_sql("cars", connection, index=False)
+    yield connection
+    connection.close()
+
+
+class TestSqlTable:
+    def test_schema(self, connection):
+        table = SqlTable(connection, "cars")
+        assert table.len == 5
+        assert table.columns == ["a", "b", "c", "d", "e"]
+        assert table.date_columns == ["d"]
+        assert table.prototype["d"].dtype == "datetime64[ns]"
+        assert table.prototype["c"].dtype == "float64"
+        assert len(table.prototype) == 0
+
+    def test_columns(self, connection):
+        table = SqlTable(connection, "cars", columns=["c", "a"])
+        assert table.columns == ["c", "a"]
+
+    def test_load(self, connection, small_df):
+        df = SqlTable(connection, "cars").load(["d", "b"])
+        assert list(df.columns) == ["d", "b"]
+        assert list(df["b"]) == list(small_df["b"])
+        assert df["d"].dtype == "datetime64[ns]"
+
+    def test_query(self, connection):
+        table = SqlTable(
+            connection, "SELECT a, b FROM cars WHERE a > 2 ORDER BY a DESC;"
+        )
+        assert table.len == 3
+        assert list(table.load(["a"])["a"]) == [5, 4, 3]
+
+    def test_summary(self, connection):
+        table = SqlTable(connection, "cars")
+        assert list(table.summary("c")) == [5, 1.5, 5.5]
+        assert isinstance(table.summary("d")["min"], pd.Timestamp)
+        with pytest.raises(ValueError):
+            table.summary("x")
+
+    def test_changed_rows(self, connection, small_df):
+        table = SqlTable(connection, "cars")
+        small_df.to_sql("cars", connection, index=False, if_exists="append")
+        with pytest.raises(ValueError):
+            table.load(["a"])
+
+
+class TestLazyFrame:
+    def test_load_on_access(self, connection, small_df):
+        df = LazyFrame(SqlTable(connection, "cars"))
+        assert len(df) == 5
+        assert df.loaded_columns == []
+        assert list(df["c"]) == list(small_df["c"])
+        assert df.loaded_columns == ["c"]
+        assert list(df[["a", "c"]].columns) == ["a", "c"]
+        assert set(df.loaded_columns) == {"a", "c"}
+
+    def test_unknown_column(self, connection):
+        df = LazyFrame(SqlTable(connection, "cars"))
+        df.load(["a", "x"])
+        assert df.loaded_columns == ["a"]
+        with pytest.raises(KeyError):
+            df["x"]
+
+    def test_to_frame(self, connection, small_df):
+        df = LazyFrame(SqlTable(connection, "cars"))
+        df["c"]
+        frame = df.to_frame()
+        assert type(frame) is pd.DataFrame
+        assert list(frame.columns) == list(small_df.columns)
+        assert frame.describe().shape[1] > 0
+        assert list(frame.select_dtypes(include=["number"]).columns) == [
+            "a",
+            "c",
+            "e",
+        ]
+        assert df.to_frame() is frame
+
+
+class TestDataSource:
+    def test_read_sql(self, connection):
+        ds = DataSource.read_sql(connection, "cars")
+        assert ds.columns == ["a", "b", "c", "d", "e"]
+        assert set(ds.numerical_columns) == {"a", "c", "e"}
+        assert ds.categorical_columns == ["b"]
+        assert ds.time_columns == ["d"]
+        assert ds.shared_data.data.loaded_columns == []
+
+    def test_aggregates_in_database(self, connection):
+        ds = DataSource.read_sql(connection, "cars")
+        assert ds.column_store.summary("a")["max"] == 5
+        assert ds.shared_data.data.loaded_columns == []
+        ds.select_where(Between("c", 2, 4))
+        assert ds.brushed_indices == {1, 2}
+        assert ds.shared_data.data.loaded_columns == ["c"]
+
+    def test_widget_loads_shown_columns(self, connection, populated_config):
+        ds = DataSource.read_sql(connection, "cars", columns=["a", "b", "c", "d"])
+        ScatterWidget(ds, 0, 0, 1.0, 400).build()
+        assert 0 < len(ds.shared_data.data.loaded_columns) < 4
+
+    def test_brushed_data(self, connection, small_df):
+        ds = DataSource.read_sql(connection, "cars")
+        ds.brushed_indices = [0, 2]
+        assert list(ds.brushed_data.columns) == list(small_df.columns)
+        assert list(ds.brushed_data["b"]) == ["v", "X"]
+
+    def test_data_loads_all_columns(self, connection, small_df):
+        ds = DataSource.read_sql(connection, "cars")
+        assert ds.column("c").tolist() == small_df["c"].tolist()
+        assert ds.shared_data.data.loaded_columns == ["c"]
+        data = ds.data
+        assert type(data) is pd.DataFrame
+        assert list(data.columns) == list(small_df.columns)
+        assert data.describe().shape[1] > 0
+
+    def test_brushed_data_all_selected(self, connection, small_df):
+        ds = DataSource.read_sql(connection, "cars")
+        assert list(ds.brushed_data.columns) == list(small_df.columns)
+        assert len(ds.brushed_data) == len(small_df)
+
+    def test_append(self, connection, small_df):
+        ds = DataSource.read_sql(connection, "cars")
+        ds.data["c"]
+        ds.append(pd.read_sql("SELECT * FROM cars LIMIT 2", connection))
+        assert ds.len == 7
+        assert list(ds.data.columns) == list(small_df.columns)
+
+    def test_sample(self, connection):
+        with pytest.raises(ValueError):
+            DataSource(LazyFrame(SqlTable(connection, "cars")), sample=2)
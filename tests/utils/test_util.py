@@ -1,5 +1,9 @@
+import asyncio
 import time
+from datetime import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from pandas_visual_analysis.utils.util import (
@@ -8,6 +12,10 @@ from pandas_visual_analysis.utils.util import (
     timing,
     Timer,
     text_color,
+    get_running_loop,
+    extend_values,
+    compact_dtypes,
+    cast_to_dtypes,
 )
 
 
@@ -88,3 +96,87 @@ def test_timer():
 def test_text_color_white():
     col = text_color((255, 255, 255))
     assert col == (0, 0, 0)
+
+
+def test_get_running_loop_none():
+    assert get_running_loop() is None
+
+
+def test_get_running_loop():
+    async def get_loop():
+        return get_running_loop()
+
+    assert asyncio.run(get_loop()) is not None
+
+
+class TestExtendValues:
+    def test_extend(self):
+        values = extend_values(np.array([1, 2]), pd.Series([3]))
+        assert list(values) == [1, 2, 3]
+
+    def test_extend_none(self):
+        assert list(extend_values(None, pd.Series([3]))) == [3]
+
+    def test_extend_datetime(self):
+        values = extend_values(
+            np.array([datetime(2020, 1, 1)], dtype=object),
+            pd.Series(pd.date_range("2021-01-01", periods=1)),
+        )
+        assert list(values) == [datetime(2020, 1, 1), datetime(2021, 1, 1)]
+
+    def test_extend_evicted(self):
+        values = extend_values(np.array([1, 2, 3]), pd.Series([4]), evicted=2)
+        assert list(values) == [3, 4]
+
+
+class TestCompactDtypes:
+    @pytest.fixture
+    def wide_df(self):
+        return pd.DataFrame(
+            {
+                "s": ["a", "b", "a", None],
+                "f": [0.5, 1.5, np.nan, np.inf],
+                "big": [1e300, 0.0, 1.0, 2.0],
+                "precise": [0.1, 0.5, np.nan, 2.0],
+                "i": [1, 2, 300, -4],
+                "u": [1, 2, 3, 4],
+                "l": [[1], [2], [3], [4]],
+                "b": [True, False, True, False],
+            }
+        )
+
+    def test_compact_dtypes(self, wide_df):
+        df = compact_dtypes(wide_df)
+        assert df["s"].dtype == "category"
+        assert list(df["s"].cat.categories) == ["a", "b"]
+        assert df["f"].dtype == np.float32
+        assert df["big"].dtype == np.float64
+        assert df["precise"].dtype == np.float64
+        assert df["i"].dtype == np.int16
+        assert df["u"].dtype == np.int8
+        assert df["l"].dtype == object
+        assert df["b"].dtype == bool
+        assert wide_df["i"].dtype == np.int64
+        assert list(df["i"]) == list(wide_df["i"])
+
+    def test_cast_to_dtypes(self, wide_df):
+        dtypes = dict(compact_dtypes(wide_df).dtypes)
+        chunk = pd.DataFrame({"s": ["b", None], "u": [5, 6], "i": [1, 2]})
+        df = cast_to_dtypes(chunk, dtypes)
+        assert df["s"].dtype == dtypes["s"]
+        assert df["u"].dtype == np.int8
+        assert df["i"].dtype == np.int16
+
+    def test_cast_to_dtypes_lossy(self, wide_df):
+        dtypes = dict(compact_dtypes(wide_df).dtypes)
+        chunk = pd.DataFrame({"s": ["c"], "u": [1000], "f": [1e300]})
+        df = cast_to_dtypes(chunk, dtypes)
+        assert df["s"].dtype == object
+        assert df["u"].dtype == np.int64
+        assert df["f"].dtype == np.float64
+        chunk = pd.DataFrame({"f": [0.1, np.nan], "i": [1, 2]})
+        assert cast_to_dtypes(chunk, dtypes)["f"].dtype == np.float64
+        chunk = pd.DataFrame({"f": [2 ** 24 + 1, 2], "i": [1, 2]})
+        assert cast_to_dtypes(chunk, dtypes)["f"].dtype == np.int64
+        chunk = pd.DataFrame({"f": [2 ** 24, 2], "i": [1, 2]})
+        assert cast_to_dtypes(chunk, dtypes)["f"].dtype == np.float32
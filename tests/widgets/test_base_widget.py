@@ -29,3 +29,25 @@ def test_base_widget_abstract_methods(small_df):
 def test_validate_data_source(small_df):
     with pytest.raises(TypeError):
         BaseWidget(small_df, 0, 0, 0.3, 100)
+
+
+def test_show_progress(small_df):
+    BaseWidget.__abstractmethods__ = set()
+    widget = BaseWidget(DataSource(small_df), 0, 0, 1.0, 400)
+    widget.show_progress(0.25)
+    assert widget.progress.value == 0.25
+    assert widget.progress.bar_style == "info"
+    widget.show_progress(1.0)
+    assert widget.progress.bar_style == ""
+
+
+def test_sampled_update_defaults_to_brush_update(small_df):
+    BaseWidget.__abstractmethods__ = set()
+
+    class Counting(BaseWidget):
+        def compute_brush_update(self, selection):
+            return selection.count
+
+    ds = DataSource(small_df)
+    widget = Counting(ds, 0, 0, 1.0, 400)
+    assert widget.compute_sampled_update(ds.selection, ds.selection) == len(small_df)
@@ -74,7 +74,7 @@ class TestBrushIndicesChange:
         bp.build()
         ds.brushed_indices = [1, 2, 3]
 
-        assert bp.figure_widget.data[0].selectedpoints == ds.brushed_indices
+        assert list(bp.figure_widget.data[0].selectedpoints) == [1, 2, 3]
 
     def test_brush_indices_change_deselect(self, small_df, populated_config):
         ds = DataSource(small_df, None)
@@ -83,7 +83,7 @@ class TestBrushIndicesChange:
         bp.build()
         ds.reset_selection()
 
-        assert bp.figure_widget.data[0].selectedpoints == ds.indices
+        assert list(bp.figure_widget.data[0].selectedpoints) == sorted(ds.indices)
 
 
 class TestSelectUI:
@@ -99,3 +99,16 @@ class TestSelectUI:
         bp.box_point_select.value = "outliers"
 
         assert bp.figure_widget.data[0].boxpoints == "outliers"
+
+
+class TestAppendRows:
+    def test_extends_trace(self, small_df, populated_config):
+        ds = DataSource(small_df, None)
+        bw = BoxPlotWidget(ds, 0, 0, 1.0, 400)
+        column = bw.column_select.value
+        ds.append(small_df.iloc[:2], policy=False)
+
+        assert list(bw.figure_widget.data[0].y) == list(small_df[column]) + list(
+            small_df[column][:2]
+        )
+        assert set(bw.figure_widget.data[0].selectedpoints) == set(range(5))
@@ -1,10 +1,14 @@
+import asyncio
 import math
 
+import numpy as np
 import pytest
 import ipywidgets
 
-from pandas_visual_analysis import DataSource
+from pandas_visual_analysis import DataSource, RollingDataSource
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.dispatch import AsyncDispatcher
+from pandas_visual_analysis.utils.selection import Selection
 from pandas_visual_analysis.widgets import BrushSummaryWidget
 from tests import sample_dataframes
 
@@ -66,6 +70,34 @@ class TestChanges:
         assert bs.brushed_metrics["a"]["count"] == 1.0
         assert bs.brushed_metrics["c"]["count"] == 1.0
 
+    def test_indices_changed_async(self, small_df, populated_config):
+        ds = DataSource(small_df, None)
+        ds.dispatcher = AsyncDispatcher()
+        bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
+
+        async def brush():
+            ds.brushed_indices = [0]
+            ds.brushed_indices = [1, 2]
+            await asyncio.sleep(0.1)
+
+        asyncio.run(brush())
+        assert bs.brushed_metrics["a"]["count"] == 2.0
+        assert bs.brushed_metrics.loc["mean"]["a"] == 2.5
+
+    def test_undo_uses_cached_metrics(self, small_df, populated_config):
+        ds = DataSource(small_df, None)
+        bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
+        ds.brushed_indices = [0]
+        metrics = bs.brushed_metrics
+        ds.brushed_indices = [1, 2]
+
+        def fail(selection):
+            raise AssertionError("metrics should not be computed again")
+
+        bs.compute_brush_update = fail
+        ds.undo()
+        assert bs.brushed_metrics is metrics
+
     def test_metric_changed_basic(self, small_df):
         ds = DataSource(small_df, None)
         bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
@@ -97,3 +129,50 @@ class TestSelection:
         ds = DataSource(small_df, None)
         bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
         bs.on_deselection(None, None)
+
+
+class TestFullData:
+    def test_metrics_full_data(self, rand_float_df, populated_config):
+        ds = DataSource(rand_float_df, sample=100, seed=2, keep_full_data=True)
+        bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
+        assert bs.base_metrics["A"]["count"] == 1000
+        ds.select_where("A", hi=5.0)
+        assert bs.brushed_metrics["A"]["count"] == (rand_float_df["A"] <= 5.0).sum()
+        assert bs.brushed_metrics["A"]["max"] <= 5.0
+
+    def test_sampled_update(self, rand_float_df, populated_config):
+        ds = DataSource(rand_float_df, sample=100, seed=2, keep_full_data=True)
+        bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
+        sample = Selection.from_indices(np.arange(0, 1000, 4), 1000)
+        estimate = bs.compute_sampled_update(ds.full_data.selection, sample)
+        assert estimate["A"]["count"] == 1000
+        bs.apply_sampled_update(estimate)
+        assert len(bs._brush_update_cache) == 0
+        exact = bs.compute_brush_update(ds.full_data.selection)
+        assert bs.refinement_distance(exact, exact) == 0.0
+        assert 0.0 < bs.refinement_distance(estimate, exact) < 0.5
+
+
+class TestAppend:
+    def test_append_updates_base_metrics(self, rand_float_df, populated_config):
+        ds = DataSource(rand_float_df.iloc[:500])
+        bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
+        assert bs.base_metrics["A"]["count"] == 500
+        ds.append(rand_float_df.iloc[500:], policy=False)
+        assert bs.base_metrics["A"]["count"] == 1000
+        assert bs.base_metrics["A"]["mean"] == pytest.approx(rand_float_df["A"].mean())
+        assert bs.base_metrics["A"]["max"] == rand_float_df["A"].max()
+        assert bs.brushed_metrics["A"]["count"] == 500
+        assert bs.grid[1, 1].value == bs._get_metric_html_content(
+            rand_float_df["A"].mean()
+        )
+
+    def test_running_moments(self, rand_float_df, populated_config):
+        ds = RollingDataSource(rand_float_df, max_rows=500)
+        bs = BrushSummaryWidget(ds, 0, 0, 1.0, 400)
+        ds.moments["A"].add(np.array([1e6]))  # only visible if the moments are used
+        ds.append(rand_float_df.iloc[:10])
+        assert bs.base_metrics["A"]["mean"] == ds.moments["A"].mean
+        bs.metric_select.value = "max"
+        assert bs.base_metrics["A"]["max"] == ds.data["A"].max()
+
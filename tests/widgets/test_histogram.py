@@ -1,8 +1,13 @@
+import numpy as np
+import pandas as pd
 import pytest
 import ipywidgets as widgets
 
-from pandas_visual_analysis import DataSource
+from pandas_visual_analysis import DataSource, RollingDataSource
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.dispatch import ProgressiveDispatcher
+from pandas_visual_analysis.utils.predicate import Between
+from pandas_visual_analysis.utils.selection import Selection
 from pandas_visual_analysis.widgets import HistogramWidget
 from tests import sample_dataframes
 
@@ -69,7 +74,7 @@ class TestBrushIndicesChange:
         hw.build()
         ds.brushed_indices = [1, 2, 3]
 
-        assert hw.figure_widget.data[1].selectedpoints == ds.brushed_indices
+        assert list(hw.figure_widget.data[1].selectedpoints) == [1, 2, 3]
         assert hw.figure_widget.data[0].visible
 
     def test_brush_indices_change_deselect(self, small_df, populated_config):
@@ -79,7 +84,7 @@ class TestBrushIndicesChange:
         hw.build()
         ds.reset_selection()
 
-        assert hw.figure_widget.data[1].selectedpoints == ds.indices
+        assert list(hw.figure_widget.data[1].selectedpoints) == sorted(ds.indices)
         assert not hw.figure_widget.data[0].visible
 
     def test_plot_invisible_with_no_data(self, small_df, populated_config):
@@ -115,3 +120,108 @@ class TestSelectUI:
 
         assert hw.figure_widget.data[0].histnorm == ""
         assert hw.figure_widget.data[1].histnorm == ""
+
+
+class TestAppendRows:
+    def test_extends_trace(self, small_df, populated_config):
+        ds = DataSource(small_df, None)
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "a"
+        ds.append(small_df.iloc[:2], policy=False)
+
+        assert list(hw.figure_widget.data[0].x) == [1, 2, 3, 4, 5, 1, 2]
+        assert list(hw.figure_widget.data[1].x) == [1, 2, 3, 4, 5]
+        assert hw.figure_widget.data[0].visible
+
+
+class TestFullData:
+    @pytest.fixture
+    def ds(self):
+        df = pd.DataFrame(
+            {
+                "x": np.arange(1000.0),
+                "t": pd.date_range("2020-01-01", periods=1000, freq="H"),
+                "c": np.array(["p", "q"])[np.arange(1000) % 2],
+            }
+        )
+        return DataSource(df, sample=50, seed=3, keep_full_data=True)
+
+    def test_counts_full_data(self, ds, populated_config):
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "x"
+        assert sum(hw.figure_widget.data[0].y) == 1000
+        ds.select_where("x", 0, 99.5)
+        assert sum(hw.figure_widget.data[1].y) == 100
+        assert hw.figure_widget.data[0].visible
+
+    def test_categorical_column(self, ds, populated_config):
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "c"
+        assert list(hw.figure_widget.data[0].y) == [500, 500]
+
+    def test_time_column(self, ds, populated_config):
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "t"
+        assert sum(hw.figure_widget.data[0].y) == 1000
+
+    def test_normalize(self, ds, populated_config):
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "x"
+        hw.normalize.value = True
+        assert sum(hw.figure_widget.data[0].y) == pytest.approx(1.0)
+
+    def test_append_rows(self, ds, populated_config):
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "x"
+        ds.append(ds.data.iloc[:5])
+        assert sum(hw.figure_widget.data[0].y) == 1005
+
+    def test_sampled_update(self, ds, populated_config):
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "x"
+        selection = Between("x", 0, 499).evaluate(ds.full_data)
+        sample = Selection.from_indices(np.arange(0, 1000, 10), 1000)
+        estimate = hw.compute_sampled_update(selection, sample)
+        exact = hw.compute_brush_update(selection)
+        assert sum(estimate[2]["y"]) == pytest.approx(500)
+        assert hw.refinement_distance(estimate, exact) < 0.1
+        assert hw.refinement_distance(exact, exact) == 0.0
+        assert hw.progressive
+        assert hw.progress in hw.build().children[0].children
+
+
+class TestProgressive:
+    def test_progressive_dispatcher(self, populated_config):
+        df = pd.DataFrame({"x": np.arange(1000.0), "c": np.arange(1000) % 3})
+        ds = DataSource(df)
+        ds.dispatcher = ProgressiveDispatcher(initial_rows=100)
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "x"
+        assert hw.pre_binned
+        assert hw.progressive
+        assert sum(hw.figure_widget.data[0].y) == 1000
+
+        selection = Selection.from_indices(range(500), 1000)
+        sample = Selection.from_indices(np.arange(0, 1000, 10), 1000)
+        estimate = hw.compute_sampled_update(selection, sample)
+        assert sum(estimate[2]["y"]) == pytest.approx(500)
+
+    def test_not_progressive(self, small_df, populated_config):
+        hw = HistogramWidget(DataSource(small_df), 0, 0, 1.0, 400)
+        assert not hw.progressive
+
+
+class TestRolling:
+    def test_running_bin_counts(self, populated_config):
+        df = pd.DataFrame({"x": np.arange(100.0), "y": np.arange(100) % 7})
+        ds = RollingDataSource(df, max_rows=100, bins=10)
+        hw = HistogramWidget(ds, 0, 0, 1.0, 400)
+        hw.column_select.value = "x"
+        assert hw.pre_binned
+        assert list(hw.figure_widget.data[0].y) == [10] * 10
+
+        ds.append(df.iloc[:20], policy=False)
+        assert list(hw.figure_widget.data[0].y) == list(ds.bin_counts["x"].counts)
+        ds.brushed_indices = [0, 1, 99]
+        assert list(hw.figure_widget.data[1].y) == [0, 1, 2, 0, 0, 0, 0, 0, 0, 0]
+
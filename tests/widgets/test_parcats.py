@@ -89,3 +89,14 @@ class TestMultiSelect:
         ds = DataSource(rand_cat_df, None)
         ps = ParallelCategoriesWidget(ds, 0, 0, 0.2, 400)
         ps.multi_select.selected_options = ["A", "B"]
+
+
+class TestAppendRows:
+    def test_extends_dimensions(self, small_df, populated_config):
+        ds = DataSource(small_df, None)
+        pc = ParallelCategoriesWidget(ds, 0, 0, 1.0, 400)
+        ds.append(small_df.iloc[:1])
+
+        for dimension in pc.figure_widget.data[0].dimensions:
+            assert len(dimension["values"]) == len(small_df) + 1
+        assert len(pc.figure_widget.data[0].line.color) == len(small_df) + 1
@@ -6,6 +6,7 @@ import ipywidgets as widgets
 from pandas_visual_analysis import DataSource
 from pandas_visual_analysis.data_source import SelectionType
 from pandas_visual_analysis.utils.config import Config
+from pandas_visual_analysis.utils.predicate import Between
 from pandas_visual_analysis.widgets import ParallelCoordinatesWidget
 from tests import sample_dataframes
 
@@ -118,6 +119,19 @@ class TestOnSelectionHelper:
 
         assert len(ds.brushed_indices) == ds.len
 
+    def test_on_selection_helper_colors(self, small_df, populated_config):
+        ds = DataSource(small_df, None)
+        ps = ParallelCoordinatesWidget(ds, 0, 0, 1.0, 400)
+        dimensions = fill_sample_constraint_range(
+            ps.figure_widget.data[0].dimensions, "a", [2, 5]
+        )
+        ps._on_selection_helper(None, dimensions)
+
+        assert ds.selection == ds.where(Between("a", 2, 5))
+        assert list(ps.figure_widget.data[0].line.color) == list(
+            ds.selection.mask.astype("uint8")
+        )
+
 
 class TestOnSelection:
     def test_on_selection(self, small_df, populated_config):
@@ -157,6 +171,21 @@ class TestOnSelection:
 
         assert ps.constraint_ranges == {}
 
+    def test_crossfilter_keeps_constraint_ranges(self, small_df, populated_config):
+        ds = DataSource(small_df)
+        ds.selection_type = SelectionType.CROSSFILTER
+        ps = ParallelCoordinatesWidget(ds, 0, 0, 1.0, 400)
+
+        dimensions = ps.figure_widget.data[0].dimensions
+        dimensions = fill_sample_constraint_range(dimensions, "a", [2, 5])
+        ps._on_selection_helper(None, dimensions)
+        ds.brush([0, 1], dimension="other")
+
+        assert ps.constraint_ranges == {"a": (2, 5)}
+        assert ds.brushed_indices == {1}
+        # the lines show the rows passing the filters of the other dimensions
+        assert list(ps.figure_widget.data[0].line.color) == [1, 1, 0, 0, 0]
+
 
 class TestBrushIndicesChange:
     def test_brush_indices_change(self, small_df, populated_config):
@@ -214,3 +243,19 @@ class TestMultiSelect:
         ds = DataSource(rand_float_df, None)
         ps = ParallelCoordinatesWidget(ds, 0, 0, 0.2, 400)
         ps.multi_select.selected_options = ["A", "B"]
+
+
+class TestAppendRows:
+    def test_extends_dimensions(self, small_df, populated_config):
+        ds = DataSource(small_df)
+        ps = ParallelCoordinatesWidget(ds, 0, 0, 1.0, 400)
+        chunk = small_df.iloc[:1].copy()
+        chunk["a"] = 10
+        ds.append(chunk, policy=False)
+
+        dimension = [
+            dim for dim in ps.figure_widget.data[0].dimensions if dim["label"] == "a"
+        ][0]
+        assert list(dimension["values"]) == [1, 2, 3, 4, 5, 10]
+        assert list(dimension["range"]) == [1, 10]
+        assert list(ps.figure_widget.data[0].line.color) == [1, 1, 1, 1, 1, 0]
@@ -1,7 +1,10 @@
 import pytest
 import numpy as np
+import pandas as pd
+from plotly.callbacks import BoxSelector, LassoSelector
 
-from pandas_visual_analysis import DataSource
+from pandas_visual_analysis import DataSource, RollingDataSource
+from pandas_visual_analysis.data_source import SelectionType
 from pandas_visual_analysis.utils.config import Config
 from pandas_visual_analysis.widgets import ScatterWidget
 from tests import sample_dataframes
@@ -94,3 +97,69 @@ def test_redraw_plot_with_none(small_df, populated_config):
     ds = DataSource(small_df, None)
     scatter_widget = ScatterWidget(ds, 0, 0, 1.0, 400)
     scatter_widget._redraw_plot(None)
+
+
+def test_crossfilter_dimension(small_df, populated_config):
+    ds = DataSource(small_df, None)
+    ds.selection_type = SelectionType.CROSSFILTER
+    scatter_widget = ScatterWidget(ds, 0, 0, 1.0, 400)
+    other_widget = ScatterWidget(ds, 0, 0, 1.0, 400)
+
+    class Points:
+        point_inds = [0, 1]
+
+    scatter_widget.on_selection(None, Points(), None)
+    Points.point_inds = [1, 2]
+    other_widget.on_selection(None, Points(), None)
+
+    assert ds.brushed_indices == {1}
+    assert set(scatter_widget.figure_widget.data[0].selectedpoints) == {1, 2}
+    assert set(other_widget.figure_widget.data[0].selectedpoints) == {0, 1}
+
+    scatter_widget.on_deselection(None, None)
+    assert ds.brushed_indices == {1, 2}
+
+
+def test_append_rows(small_df, populated_config):
+    ds = DataSource(small_df, None)
+    scatter_widget = ScatterWidget(ds, 0, 0, 1.0, 400)
+    scatter_widget.x_selection.value = "d"
+    scatter_widget.size_selection.value = "c"
+    ds.brushed_indices = [1]
+    ds.append(small_df.iloc[:2])
+
+    trace = scatter_widget.figure_widget.data[0]
+    assert len(trace.x) == len(trace.y) == len(trace.marker.size) == 7
+    assert list(trace.marker.size)[5:] == [1.5, 2.5]
+    assert set(trace.selectedpoints) == {1, 5, 6}
+
+
+def test_append_rows_evicted(small_df, populated_config):
+    ds = RollingDataSource(small_df, max_rows=5)
+    scatter_widget = ScatterWidget(ds, 0, 0, 1.0, 400)
+    scatter_widget.x_selection.value = "a"
+    ds.append(small_df.iloc[:2])
+
+    trace = scatter_widget.figure_widget.data[0]
+    assert list(trace.x) == [3, 4, 5, 1, 2]
+    assert len(trace.y) == 5
+
+
+def test_selector_predicate(populated_config):
+    df = pd.DataFrame({"x": np.arange(100.0), "y": np.arange(100.0)})
+    ds = DataSource(df, sample=20, seed=5, keep_full_data=True)
+    scatter_widget = ScatterWidget(ds, 0, 0, 1.0, 400)
+    scatter_widget.x_selection.value = "x"
+    scatter_widget.y_selection.value = "y"
+
+    class Points:
+        point_inds = list(np.flatnonzero(ds.data["x"].values <= 49))
+
+    scatter_widget.on_selection(None, Points(), BoxSelector([-1, 49.5], [-1, 49.5]))
+    assert ds.full_data.selection.indices == set(range(50))
+
+    lasso = LassoSelector([-1, 60, -1], [-1, -1, 60])
+    scatter_widget.on_selection(None, Points(), lasso)
+    assert ds.full_data.selection.indices == set(
+        np.flatnonzero(np.arange(100.0) * 2 < 59)
+    )